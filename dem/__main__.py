@@ -5,14 +5,35 @@ from dem import __command__
 from dem.cli.console import stderr, stdout
 from dem.core.exceptions import RegistryError, ContainerEngineError, InternalError
 import dem.cli.main
-import docker.errors
+import os, sys
 from dem.core.core import Core
 from dem.core.platform import Platform
 from dem.cli.tui.tui_user_output import TUIUserOutput
 
+def _is_docker_exception(exception: Exception) -> bool:
+    """ Check whether the exception was raised by the docker package.
+
+        The docker package is imported lazily, so it can only be the source of the exception if it
+        has already been loaded.
+
+        Args:
+            exception -- the exception to check
+    """
+    docker_errors = sys.modules.get("docker.errors")
+    return docker_errors is not None and isinstance(exception, docker_errors.DockerException)
+
+def _is_completion_mode() -> bool:
+    """ Check whether the shell invoked the CLI to complete the command line."""
+    return "_" + __command__.upper() + "_COMPLETE" in os.environ
+
 def main() -> None:
     """ Entry point for the CLI application"""
 
+    # The completions are served from the completion index, so the Platform is not needed.
+    if _is_completion_mode():
+        dem.cli.main.typer_cli(prog_name=__command__)
+        return
+
     # Create the Development Platform
     dem.cli.main.platform = Platform()
 
@@ -25,7 +46,12 @@ def main() -> None:
         stderr.print("[red]" + str(e) + "[/]")
     except RegistryError as e:
         stderr.print("[red]" + str(e) + "\nUsing local tool images only![/]")
-    except docker.errors.DockerException as e:
+    except (ContainerEngineError, InternalError) as e:
+        stderr.print("[red]" + str(e) + "[/]")
+    except Exception as e:
+        if not _is_docker_exception(e):
+            raise
+
         stderr.print("[red]" + str(e) + "[/]")
 
         if "Permission denied" in str(e):
@@ -34,8 +60,6 @@ def main() -> None:
             stdout.print("\nHint: The input repository might not exist in the registry.")
         elif "400" in str(e):
             stdout.print("\nHint: The input parameters might not be valid.")
-    except (ContainerEngineError, InternalError) as e:
-        stderr.print("[red]" + str(e) + "[/]")
 
 # Call the main() when run as `python -m`
 if __name__ == "__main__":
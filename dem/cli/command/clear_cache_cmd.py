@@ -0,0 +1,42 @@
+"""clear-cache CLI command implementation."""
+# dem/cli/command/clear_cache_cmd.py
+
+from dem.core.platform import Platform
+from dem.cli.console import stdout, stderr
+
+def execute(platform: Platform, dev_env_name: str, volume: str | None = None) -> None:
+    """ Remove the cache volumes of the Dev Env. The next dem run starts with empty caches.
+
+        Args:
+            platform -- the platform
+            dev_env_name -- name of the Development Environment
+            volume -- the cache volume to clear, all of them if None
+    """
+    dev_env = platform.get_dev_env_by_name(dev_env_name)
+    if dev_env is None:
+        stderr.print("[red]Error: Unknown Development Environment: " + dev_env_name + "[/]")
+        return
+
+    volumes = [cache_volume for cache_volumes in dev_env.cache_volumes.values() 
+               for cache_volume in cache_volumes]
+    if volume is not None:
+        if volume not in volumes:
+            stderr.print("[red]Error: The " + dev_env_name + " has no cache volume named " + 
+                         volume + ".[/]")
+            return
+        volumes = [volume]
+
+    if not volumes:
+        stdout.print("[yellow]The " + dev_env_name + " has no cache volumes.[/]")
+        return
+
+    # The warm containers of the Dev Env keep the cache volumes in use.
+    platform.container_engine.remove_warm_containers(dev_env.name)
+    failed_volume_names = platform.container_engine.remove_volumes(
+        [dev_env.get_cache_volume_name(volume) for volume in volumes]
+    )
+    if failed_volume_names:
+        stderr.print("[red]Error: Failed to clear the cache volumes: " + 
+                     ", ".join(failed_volume_names) + "[/]")
+    else:
+        stdout.print("[green]The cache volumes have been cleared.[/]")
@@ -34,11 +34,8 @@ def execute(platform: Platform, dev_env_name: str) -> None:
         stderr.print("[red]Error: No Development Environment Catalogs are available to clone from![/]")
         return
 
-    for catalog in platform.dev_env_catalogs.catalogs:
-        catalog_dev_env = catalog.get_dev_env_by_name(dev_env_name)
-        if catalog_dev_env:
-            break
-    else:
+    catalog_dev_env = platform.dev_env_catalogs.get_dev_env_by_name(dev_env_name)
+    if catalog_dev_env is None:
         stderr.print("[red]Error: The input Development Environment is not available.[/]")
         return
 
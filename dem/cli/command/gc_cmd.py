@@ -0,0 +1,93 @@
+"""gc CLI command implementation."""
+# dem/cli/command/gc_cmd.py
+
+from dem.core.platform import Platform, PlatformError
+from dem.cli.console import stderr, stdout
+from rich.filesize import decimal
+from rich.table import Table
+import re, time
+
+size_units = {
+    "": 1,
+    "B": 1,
+    "K": 1000, "KB": 1000, "KIB": 1024,
+    "M": 1000 ** 2, "MB": 1000 ** 2, "MIB": 1024 ** 2,
+    "G": 1000 ** 3, "GB": 1000 ** 3, "GIB": 1024 ** 3,
+    "T": 1000 ** 4, "TB": 1000 ** 4, "TIB": 1024 ** 4,
+}
+
+def parse_size(size: str) -> int:
+    """ Parse a size like 500MB, 20GiB or 1000000.
+
+        Args:
+            size -- the size with an optional unit
+
+        Return with the size in bytes. Raise a ValueError if the size is invalid.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*", size)
+    if match is None or match.group(2).upper() not in size_units:
+        raise ValueError(f"Invalid size: {size}")
+    return int(float(match.group(1)) * size_units[match.group(2).upper()])
+
+def print_evictions(evictions: list[dict]) -> None:
+    """ Print the tool images to evict, with the bytes reclaimed by their removal.
+
+        Args:
+            evictions -- the tool images to evict
+    """
+    table = Table()
+    table.add_column("Image")
+    table.add_column("Last used")
+    table.add_column("Reclaimed", justify="right")
+    for eviction in evictions:
+        if eviction["last_used"] is None:
+            last_used = "unknown"
+        else:
+            last_used = time.strftime("%Y-%m-%d %H:%M", time.localtime(eviction["last_used"]))
+        table.add_row(eviction["tool_image"], last_used, decimal(eviction["size"]))
+    stdout.print(table)
+
+def execute(platform: Platform, budget: str | None, min_free: str | None, dry_run: bool) -> None:
+    """ Evict the least recently used tool images that no installed Dev Env requires.
+
+        Args:
+            platform -- the platform
+            budget -- the maximum total size of the image layers
+            min_free -- the minimum free space of the container engine's storage
+            dry_run -- only print the tool images that would be evicted
+    """
+    if budget is None and min_free is None:
+        stderr.print("[red]Error: Set the disk budget or the minimum free space.[/]")
+        return
+
+    try:
+        budget_size = parse_size(budget) if budget is not None else None
+        min_free_size = parse_size(min_free) if min_free is not None else None
+    except ValueError as e:
+        stderr.print(f"[red]Error: {e}[/]")
+        return
+
+    try:
+        # The disk usage is requested only once, because it takes a while for the daemon.
+        layers_size, images = platform.get_image_disk_usage()
+        evictions = platform.select_gc_evictions(platform.get_gc_candidates(images), layers_size,
+                                                 images, budget_size, min_free_size)
+    except PlatformError as e:
+        stderr.print(f"[red]Error: {e}[/]")
+        return
+
+    if not evictions:
+        stdout.print("Nothing to evict.")
+        return
+
+    print_evictions(evictions)
+    reclaimed = decimal(sum(eviction["size"] for eviction in evictions))
+    if dry_run:
+        stdout.print(f"Would reclaim at least {reclaimed}.")
+        return
+
+    failed_tool_images = platform.collect_garbage(evictions)
+    if failed_tool_images:
+        stderr.print(f"[red]Error: Failed to evict: {', '.join(failed_tool_images)}[/]")
+    else:
+        stdout.print(f"[green]Reclaimed at least {reclaimed}.[/]")
@@ -26,16 +26,17 @@ def print_info(dev_env: (DevEnv | DevEnv)) -> None:
     stdout.print(tool_info_table)
 
 def execute(platform: Platform, arg_dev_env_name: str) -> None:
+    # Only the tool images of the Dev Env get checked, so there is no need to crawl the registries.
+    Platform.update_tool_images_on_instantiation = False
     dev_env = platform.get_dev_env_by_name(arg_dev_env_name)
 
     if dev_env is None:
-        for catalog in platform.dev_env_catalogs.catalogs:
-            dev_env = catalog.get_dev_env_by_name(arg_dev_env_name)
-            if dev_env is not None:
-                dev_env.check_image_availability(platform.tool_images)
-                print_info(dev_env)
+        dev_env = platform.dev_env_catalogs.get_dev_env_by_name(arg_dev_env_name)
+        if dev_env is not None:
+            dev_env.check_image_availability(platform.tool_images, update_tool_image_store=True)
+            print_info(dev_env)
     else:
-        dev_env.check_image_availability(platform.tool_images)
+        dev_env.check_image_availability(platform.tool_images, update_tool_image_store=True)
         print_info(dev_env)
 
     if dev_env is None:
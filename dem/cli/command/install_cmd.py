@@ -2,26 +2,60 @@
 # dem/cli/command/install_cmd.py
 
 from dem.core.dev_env import DevEnv
+from dem.core.install_plan import InstallPlan
 from dem.core.platform import Platform, PlatformError
 from dem.cli.console import stderr, stdout
+from rich.filesize import decimal
+from rich.table import Table
 
-def execute(platform: Platform, dev_env_name: str) -> None:
+def print_install_plan(install_plan: InstallPlan) -> None:
+    """ Print the download of each tool image in pull order and the deduplicated total.
+    
+        Args:
+            install_plan -- the install plan to print
+    """
+    install_plan_table = Table()
+    install_plan_table.add_column("Image")
+    install_plan_table.add_column("Layers to download", justify="right")
+    install_plan_table.add_column("Download", justify="right")
+    install_plan_table.add_column("Shared with other tools", justify="right")
+    for tool_image in install_plan.get_pull_order():
+        install_plan_table.add_row(tool_image, str(install_plan.get_layer_count(tool_image)),
+                                   decimal(install_plan.get_download_size(tool_image)),
+                                   decimal(install_plan.get_shared_size(tool_image)))
+    stdout.print(install_plan_table)
+
+    for tool_image in install_plan.unavailable_tool_images:
+        stderr.print(f"[red]Error: The layers of {tool_image} are not available.[/]")
+
+    stdout.print(f"Total download: {decimal(install_plan.download_size)} in "
+                 f"{len(install_plan.layers)} layers ({install_plan.shared_layer_count} shared by "
+                 f"several tools, {install_plan.local_layer_count} already available locally)")
+
+def execute(platform: Platform, dev_env_name: str, update: bool = False, plan: bool = False) -> None:
     """
         Install the given Development Environment.
         
         Args:
             platform -- the platform
             dev_env_name -- the name of the Development Environment to install
+            update -- pull the tool images that have changed in the registries, the Dev Env can 
+                      already be installed
+            plan -- only print the layers to download, without installing the Dev Env
     """
+    # Only the tool images of the Dev Env get checked, so there is no need to crawl the registries.
+    Platform.update_tool_images_on_instantiation = False
     dev_env_to_install: DevEnv | None = platform.get_dev_env_by_name(dev_env_name)
 
     if dev_env_to_install is None:
         stderr.print(f"[red]Error: The {dev_env_name} Development Environment does not exist.[/]")
-    elif dev_env_to_install.is_installed == True:
+    elif plan:
+        print_install_plan(platform.get_install_plan(dev_env_to_install))
+    elif dev_env_to_install.is_installed == True and not update:
         stderr.print(f"[red]Error: The {dev_env_name} Development Environment is already installed.[/]")
     else:
         try:
-            platform.install_dev_env(dev_env_to_install)            
+            platform.install_dev_env(dev_env_to_install, update)
         except PlatformError as e:
             stderr.print(f"[red]Error: {e}[/]")
         else:
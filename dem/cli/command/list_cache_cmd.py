@@ -0,0 +1,43 @@
+"""list-cache CLI command implementation."""
+# dem/cli/command/list_cache_cmd.py
+
+from dem.core.platform import Platform
+from dem.core.exceptions import ContainerEngineError
+from dem.cli.console import stdout, stderr
+from rich.filesize import decimal
+from rich.table import Table
+
+def execute(platform: Platform, dev_env_name: str) -> None:
+    """ List the cache volumes of the Dev Env with their sizes.
+
+        Args:
+            platform -- the platform
+            dev_env_name -- name of the Development Environment
+    """
+    dev_env = platform.get_dev_env_by_name(dev_env_name)
+    if dev_env is None:
+        stderr.print("[red]Error: Unknown Development Environment: " + dev_env_name + "[/]")
+        return
+
+    if not dev_env.cache_volumes:
+        stdout.print("[yellow]The " + dev_env_name + " has no cache volumes.[/]")
+        return
+
+    volume_names = [dev_env.get_cache_volume_name(volume) 
+                    for volumes in dev_env.cache_volumes.values() for volume in volumes]
+    try:
+        volume_sizes = platform.container_engine.get_volume_sizes(volume_names)
+    except ContainerEngineError as e:
+        stderr.print(f"[red]Error: {e}[/]")
+        return
+
+    table = Table()
+    table.add_column("Tool type")
+    table.add_column("Volume")
+    table.add_column("Path")
+    table.add_column("Size", justify="right")
+    for tool_type, volumes in dev_env.cache_volumes.items():
+        for volume, path in volumes.items():
+            size = volume_sizes.get(dev_env.get_cache_volume_name(volume))
+            table.add_row(tool_type, volume, path, "-" if size is None else decimal(size))
+    stdout.print(table)
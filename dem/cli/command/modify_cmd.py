@@ -23,19 +23,8 @@ def get_tool_image_list(tool_images: ToolImages) -> list[list[str]]:
     Args:
         tool_images -- all the tool images
     """
-    tool_image_list = []
-
-    for tool_image in tool_images.registry.elements:
-        if tool_image in tool_images.local.elements:
-            tool_image_list.append([tool_image, tool_image_statuses[ToolImages.LOCAL_AND_REGISTRY]])
-        else:
-            tool_image_list.append([tool_image, tool_image_statuses[ToolImages.REGISTRY_ONLY]])
-
-    for tool_image in tool_images.local.elements:
-        if tool_image not in tool_images.registry.elements:
-            tool_image_list.append([tool_image, tool_image_statuses[ToolImages.LOCAL_ONLY]])
-
-    return tool_image_list
+    return [[tool_image, tool_image_statuses[status]] 
+            for tool_image, status in tool_images.get_tool_image_statuses().items()]
 
 def handle_tool_type_selector_panel(tool_type_selector_panel: ToolTypeSelectorPanel, 
                                     dev_env_name: str) -> list[str]:
@@ -164,6 +153,7 @@ def handle_user_confirm(confirmation: str, dev_env_local: DevEnv, platform: Plat
             stderr.print("[red]The Development Environment already exist.")
             raise(typer.Abort())
 
+    platform.local_dev_envs.update_references(dev_env_local)
     platform.flush_descriptors()
 
 def execute(platform: Platform, dev_env_name: str) -> None:
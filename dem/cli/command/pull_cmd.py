@@ -34,25 +34,31 @@ def create_dev_env(local_dev_env: DevEnv | None, catalog_dev_env: DevEnv,
 
     return local_dev_env
 
-def execute(platform: Platform, dev_env_name: str) -> None:
+def execute(platform: Platform, dev_env_name: str, update: bool = False) -> None:
+    """ Pull the Dev Env from the catalogs and install it.
+
+        Args:
+            platform -- the platform
+            dev_env_name -- the name of the Development Environment to pull
+            update -- pull the tool images that have changed in the registries
+    """
     catalog_dev_env: DevEnv | None = None
+    # Only the tool images of the Dev Env get checked, so there is no need to crawl the registries.
+    Platform.update_tool_images_on_instantiation = False
 
     if not platform.dev_env_catalogs.catalogs:
         stderr.print("[red]Error: No Development Environment Catalogs are available to pull the image from![/]")
         return
 
-    for catalog in platform.dev_env_catalogs.catalogs:
-        catalog_dev_env = catalog.get_dev_env_by_name(dev_env_name)
-        if catalog_dev_env is not None:
-            break
-    else:
+    catalog_dev_env = platform.dev_env_catalogs.get_dev_env_by_name(dev_env_name)
+    if catalog_dev_env is None:
         stderr.print("[red]Error: The input Development Environment is not available for the organization.[/]")
         return
 
     local_dev_env = create_dev_env(platform.get_dev_env_by_name(catalog_dev_env.name), 
                                             catalog_dev_env, platform)
 
-    platform.install_dev_env(local_dev_env)
+    platform.install_dev_env(local_dev_env, update)
     # Check image availability.
     image_statuses: list = local_dev_env.check_image_availability(platform.tool_images, 
                                                                   update_tool_image_store=True)
@@ -8,7 +8,7 @@ def execute(platform: Platform, dev_env_name_to_rename: str, new_dev_env_name: s
     dev_env_to_rename = platform.get_dev_env_by_name(dev_env_name_to_rename)
 
     if dev_env_to_rename is not None:
-        dev_env_to_rename.name = new_dev_env_name
+        platform.local_dev_envs.rename(dev_env_to_rename, new_dev_env_name)
         platform.flush_descriptors()
     else:
         stderr.print("[red]Error: The input Development Environment does not exist.[/]")
\ No newline at end of file
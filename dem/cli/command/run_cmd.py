@@ -24,13 +24,15 @@ def handle_missing_tool_images(missing_tool_images: set[str], dev_env_local: Dev
     platform.install_dev_env(dev_env_local)
     stdout.print("[green]DEM fixed the " + dev_env_local.name + "![/]")
 
-def execute(platform: Platform, dev_env_name: str, container_arguments: list[str]) -> None:
+def execute(platform: Platform, dev_env_name: str, container_arguments: list[str],
+            fresh: bool = False) -> None:
     """ Execute the run command in the given Dev Env context. If something is wrong with the Dev 
         Env the DEM can try to fix it.
 
         Args:
             dev_env_name -- name of the Development Environment
             container_arguments -- arguments passed to the container
+            fresh -- replace the warm container of the Dev Env with a new one
     """
     
     dev_env_local = platform.get_dev_env_by_name(dev_env_name)
@@ -41,17 +43,38 @@ def execute(platform: Platform, dev_env_name: str, container_arguments: list[str
     else:
         # Update the tool images manually.
         Platform.update_tool_images_on_instantiation = False
-        # Only the local images are needed.
-        platform.tool_images.local.update()
 
-        missing_tool_images = set()
-        for tool in dev_env_local.tools:
-            tool_image = tool["image_name"] + ":" + tool["image_version"]
-            # Check if the required tool image exists locally.
-            if tool_image not in platform.tool_images.local.elements:
-                missing_tool_images.add(tool_image)
+        # Nothing to check if the tool images haven't changed since the Dev Env has been locked.
+        if not platform.is_dev_env_lock_valid(dev_env_local):
+            # Only the tool images of the Dev Env need to exist locally, so only these get 
+            # inspected.
+            tool_images = dev_env_local.get_tool_images()
+            missing_tool_images = set(tool_images) - \
+                platform.container_engine.resolve_local_images(tool_images)
 
-        if missing_tool_images:
-            handle_missing_tool_images(missing_tool_images, dev_env_local, platform)
+            if missing_tool_images:
+                # The fix reinstalls the Dev Env, which locks it again.
+                handle_missing_tool_images(missing_tool_images, dev_env_local, platform)
+            else:
+                platform.lock_dev_env(dev_env_local)
+                platform.flush_descriptors()
 
-        platform.container_engine.run(container_arguments)
\ No newline at end of file
+        platform.record_tool_image_usage(dev_env_local.get_tool_images())
+
+        # The Dev Env's defaults come first, so the options given by the user override them.
+        container_arguments = dev_env_local.run_options + container_arguments
+        cache_volumes = dev_env_local.get_cache_volume_mounts()
+        # By default, the output of the container goes straight to the binary streams, because 
+        # rendering it line by line would throttle the verbose tools, like the compilers.
+        passthrough = platform.config_file.passthrough_output
+        if platform.config_file.warm_containers:
+            exit_code = platform.container_engine.run_warm(container_arguments, dev_env_local.name,
+                                                           platform.config_file.warm_container_idle_timeout,
+                                                           fresh, passthrough=passthrough, 
+                                                           cache_volumes=cache_volumes)
+        else:
+            exit_code = platform.container_engine.run(container_arguments, passthrough=passthrough,
+                                                      cache_volumes=cache_volumes)
+
+        if exit_code:
+            raise typer.Exit(exit_code)
@@ -5,13 +5,14 @@ from dem.core.dev_env import DevEnv
 from dem.core.platform import Platform, PlatformError
 from dem.cli.console import stderr, stdout
 
-def execute(platform: Platform, dev_env_name: str) -> None:
+def execute(platform: Platform, dev_env_name: str, prune: bool = False) -> None:
     """
         Uninstall the given Development Environment.
         
         Args:
             platform -- the platform
             dev_env_name -- the name of the Development Environment to uninstall
+            prune -- remove the dangling images after the uninstall
     """
     dev_env_to_uninstall: DevEnv | None = platform.get_dev_env_by_name(dev_env_name)
 
@@ -21,7 +22,7 @@ def execute(platform: Platform, dev_env_name: str) -> None:
         stderr.print(f"[red]Error: The {dev_env_name} Development Environment is not installed.[/]")
     else:
         try:
-            platform.uninstall_dev_env(dev_env_to_uninstall)
+            platform.uninstall_dev_env(dev_env_to_uninstall, prune)
         except PlatformError as e:
             stderr.print(f"[red]Error: {e}[/]")
         else:
@@ -6,18 +6,33 @@ from typing import Generator
 from typing_extensions import Annotated
 import os
 from dem import __command__, __app_name__
-from dem.cli.command import cp_cmd, info_cmd, list_cmd, pull_cmd, create_cmd, modify_cmd, delete_cmd, \
-                            rename_cmd, run_cmd, export_cmd, load_cmd, clone_cmd, add_reg_cmd, \
-                            list_reg_cmd, del_reg_cmd, add_cat_cmd, list_cat_cmd, del_cat_cmd, \
-                            add_host_cmd, uninstall_cmd, install_cmd, assign_cmd, list_host_cmd, del_host_cmd
 from dem.cli.console import stdout
 from dem.core.platform import Platform
+from dem.core.registry import Registry
+from dem.core.dev_env_catalog import DevEnvCatalog
+from dem.core.data_management import CompletionIndexFile
 from dem.core.exceptions import InternalError
 
 typer_cli: typer.Typer = typer.Typer(rich_markup_mode="rich")
 platform: Platform | None = None
 
+# The command modules get imported by the commands themselves, so only the invoked command's
+# dependencies are loaded at startup.
+
 # Autocomplete functions
+# The completions are served from the completion index, so the Platform is not needed for them.
+def _autocomplete(key: str, incomplete: str) -> Generator:
+    """ 
+    Return with the indexed names that start with the incomplete parameter by a Generator.
+
+    Args:
+        key -- the key of the names in the completion index
+        incomplete -- the parameter the user supplied so far when the tab was pressed
+    """
+    for name in CompletionIndexFile().get_names(key):
+        if name.startswith(incomplete) or (incomplete == ""):
+            yield name
+
 def autocomplete_dev_env_name(incomplete: str) -> Generator:
     """ 
     Autocomplete the input Dev Env name with the available matching local Dev Envs.
@@ -27,9 +42,7 @@ def autocomplete_dev_env_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    for dev_env in platform.local_dev_envs:
-        if dev_env.name.startswith(incomplete) or (incomplete == ""):
-            yield dev_env.name
+    yield from _autocomplete("dev_envs", incomplete)
 
 def autocomplete_cat_name(incomplete: str) -> Generator:
     """ 
@@ -40,9 +53,7 @@ def autocomplete_cat_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    for catalog_config in platform.dev_env_catalogs.list_catalog_configs():
-        if catalog_config["name"].startswith(incomplete) or (incomplete == ""):
-            yield catalog_config["name"]
+    yield from _autocomplete("catalogs", incomplete)
 
 def autocomplete_reg_name(incomplete: str) -> Generator:
     """ 
@@ -53,9 +64,7 @@ def autocomplete_reg_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    for registry_config in platform.registries.list_registry_configs():
-        if registry_config["name"].startswith(incomplete) or (incomplete == ""):
-            yield registry_config["name"]
+    yield from _autocomplete("registries", incomplete)
 
 def autocomplete_host_name(incomplete: str) -> Generator:
     """ 
@@ -66,9 +75,7 @@ def autocomplete_host_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    for host_config in platform.hosts.list_configs():
-        if host_config["name"].startswith(incomplete) or (incomplete == ""):
-            yield host_config["name"]
+    yield from _autocomplete("hosts", incomplete)
 
 # DEM commands
 @typer_cli.command("list") # "list" is a Python keyword
@@ -89,6 +96,7 @@ def list_(local: Annotated[bool, typer.Option(help="Scope is the local host.")]
 
         --all --tool -> List the tool images available in the axemsolutions registry.
     """
+    from dem.cli.command import list_cmd
     if platform:
         list_cmd.execute(platform, local, all, env, tool)
     else:
@@ -102,19 +110,22 @@ def info(dev_env_name: Annotated[str, typer.Argument(help="Name of the Developme
 
     Note: Autocomplete only works with the locally avialable Dev Envs.
     """
+    from dem.cli.command import info_cmd
     if platform:
         info_cmd.execute(platform, dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
 @typer_cli.command()
-def pull(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to install.")]) -> None:
+def pull(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to install.")],
+         update: Annotated[bool, typer.Option(help="Pull the tool images that have changed in the registries.")] = False) -> None:
     """
     Pull all the required tool images from the registry and install the Development Environment
     locally.
     """
+    from dem.cli.command import pull_cmd
     if platform:
-        pull_cmd.execute(platform, dev_env_name)
+        pull_cmd.execute(platform, dev_env_name, update)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
@@ -125,6 +136,7 @@ def cp(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development
     """
     Create a copy of a local Dev Env.
     """
+    from dem.cli.command import cp_cmd
     if platform:
         cp_cmd.execute(platform, dev_env_name, new_dev_env_name)
     else:
@@ -135,6 +147,7 @@ def create(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     """
     Create a new Development Environment.
     """
+    from dem.cli.command import create_cmd
     if platform:
         create_cmd.execute(platform, dev_env_name)
     else:
@@ -147,6 +160,7 @@ def export(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     """
     Export the Development Environment.
     """
+    from dem.cli.command import export_cmd
     if platform:
         export_cmd.execute(platform, dev_env_name,path_to_export)
     else:
@@ -157,6 +171,7 @@ def load(path_to_dev_env: Annotated[str, typer.Argument(help="Path to the Dev En
     """
     Import the Development Environment.
     """
+    from dem.cli.command import load_cmd
     if platform:
         load_cmd.execute(platform, path_to_dev_env)
     else:
@@ -167,6 +182,7 @@ def clone(dev_env_name: Annotated[str, typer.Argument(help="Name of the Dev Env
     """
     Copy the Dev Env's descriptor from the catalog to the local descriptor storage.
     """
+    from dem.cli.command import clone_cmd
     if platform:
         clone_cmd.execute(platform, dev_env_name)
     else:
@@ -179,6 +195,7 @@ def rename(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     """
     Rename the Development Environment.
     """
+    from dem.cli.command import rename_cmd
     if platform:
         rename_cmd.execute(platform, dev_env_name,new_dev_env_name)
     else:
@@ -190,6 +207,7 @@ def modify(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     """
     Modify the tool types and required tool images for an existing Development Environment.
     """
+    from dem.cli.command import modify_cmd
     if platform:
         modify_cmd.execute(platform, dev_env_name)
     else:
@@ -202,6 +220,7 @@ def delete(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     Delete the Dev Env descriptor from the local descriptor storage.
     If the Dev Env is installed, the user will be asked whether they want to uninstall it. 
     """
+    from dem.cli.command import delete_cmd
     if platform:
         delete_cmd.execute(platform, dev_env_name)
     else:
@@ -209,27 +228,74 @@ def delete(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
 
 @typer_cli.command()
 def install(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to install.",
-                                                       autocompletion=autocomplete_dev_env_name)]) -> None:
+                                                       autocompletion=autocomplete_dev_env_name)],
+            update: Annotated[bool, typer.Option(help="Pull the tool images that have changed in the registries.")] = False,
+            plan: Annotated[bool, typer.Option(help="Only print the layers to download and the total download size.")] = False) -> None:
     """
     Install the Development Environment from the local setup.
     """
+    from dem.cli.command import install_cmd
     if platform is not None:
-        install_cmd.execute(platform, dev_env_name)
+        install_cmd.execute(platform, dev_env_name, update, plan)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
     
 @typer_cli.command()
 def uninstall(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to uninstall.",
-                                                       autocompletion=autocomplete_dev_env_name)]) -> None:
+                                                       autocompletion=autocomplete_dev_env_name)],
+              prune: Annotated[bool, typer.Option(help="Remove the dangling images after the uninstall.")] = False) -> None:
     """
     Uninstall the Development Environment from the local setup. If a tool image is not required
     anymore by any of the available local Development Environments, the DEM will delete it.
     """
+    from dem.cli.command import uninstall_cmd
     if platform:
-        uninstall_cmd.execute(platform, dev_env_name)
+        uninstall_cmd.execute(platform, dev_env_name, prune)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")  
 
+@typer_cli.command()
+def gc(budget: Annotated[str, typer.Option(help="Maximum total size of the image layers, e.g. 20GB.")] = None,
+       min_free: Annotated[str, typer.Option(help="Minimum free space of the container engine's storage, e.g. 10GiB.")] = None,
+       dry_run: Annotated[bool, typer.Option(help="Only print the tool images that would be evicted.")] = False) -> None:
+    """
+    Evict the least recently used tool images that no installed Development Environment requires, 
+    until the disk budget and the minimum free space are met.
+    """
+    from dem.cli.command import gc_cmd
+    if platform:
+        gc_cmd.execute(platform, budget, min_free, dry_run)
+    else:
+        raise InternalError("Error: The platform hasn't been initialized properly!")
+
+@typer_cli.command()
+def list_cache(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment.",
+                                                           autocompletion=autocomplete_dev_env_name)]) -> None:
+    """
+    List the cache volumes of the Development Environment with their sizes.
+    """
+    from dem.cli.command import list_cache_cmd
+    if platform:
+        list_cache_cmd.execute(platform, dev_env_name)
+    else:
+        raise InternalError("Error: The platform hasn't been initialized properly!")
+
+@typer_cli.command()
+def clear_cache(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment.",
+                                                            autocompletion=autocomplete_dev_env_name)],
+                volume: Annotated[str, typer.Argument(help="Name of the cache volume to clear. All of them are cleared if not set.")] = None) -> None:
+    """
+    Clear the cache volumes of the Development Environment.
+
+    The warm containers of the Development Environment get removed too, because they use the cache 
+    volumes.
+    """
+    from dem.cli.command import clear_cache_cmd
+    if platform:
+        clear_cache_cmd.execute(platform, dev_env_name, volume)
+    else:
+        raise InternalError("Error: The platform hasn't been initialized properly!")
+
 @typer_cli.command()
 def assign(dev_env_name: Annotated[str, typer.Argument(help="Name of the Dev Env that should be assign to the project.",
                                                        autocompletion=autocomplete_dev_env_name)],
@@ -239,6 +305,7 @@ def assign(dev_env_name: Annotated[str, typer.Argument(help="Name of the Dev Env
 
     If the project path is not specified, the current working directory will be used.
     """
+    from dem.cli.command import assign_cmd
     if platform:
         assign_cmd.execute(platform, dev_env_name, project_path)
     else:
@@ -247,7 +314,8 @@ def assign(dev_env_name: Annotated[str, typer.Argument(help="Name of the Dev Env
 @typer_cli.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})
 def run(dev_env_name: Annotated[str, typer.Argument(help="Run the container in this Development Environment context",
                                                     autocompletion=autocomplete_dev_env_name)],
-        ctx: Annotated[typer.Context, typer.Option()]) -> None:
+        ctx: Annotated[typer.Context, typer.Option()],
+        fresh: Annotated[bool, typer.Option(help="Replace the warm container of the Development Environment with a new one")] = False) -> None:
     """
     Run the `docker run` command in the Development Environment's context with the given parameters.  
 
@@ -257,8 +325,9 @@ def run(dev_env_name: Annotated[str, typer.Argument(help="Run the container in t
 
     See the documentation for the list of currently supported docker run parameters.
     """
+    from dem.cli.command import run_cmd
     if platform:
-        run_cmd.execute(platform, dev_env_name, ctx.args)
+        run_cmd.execute(platform, dev_env_name, ctx.args, fresh)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
@@ -276,6 +345,7 @@ def add_reg(name: Annotated[str, typer.Argument(help="Name of the registry to ad
     The URL should point to the registry's REST API. For the Docker Hub its 
     https://registry.hub.docker.com, or it can be http://localhost:5000 for a self-hosted one.
     """
+    from dem.cli.command import add_reg_cmd
     if platform:
         add_reg_cmd.execute(platform, name, url)
     else:
@@ -286,6 +356,7 @@ def list_reg() -> None:
     """
     List the available registries.
     """
+    from dem.cli.command import list_reg_cmd
     if platform:
         list_reg_cmd.execute(platform)
     else:
@@ -297,6 +368,7 @@ def del_reg(registry_name: Annotated[str, typer.Argument(help="Name or IP addres
     """
     Delete a registry.
     """
+    from dem.cli.command import del_reg_cmd
     if platform:
         del_reg_cmd.execute(platform, registry_name)
     else:
@@ -312,6 +384,7 @@ def add_cat(name: Annotated[str, typer.Argument(help="Name of the Development En
     
     The URL must point to an HTTP(S) server where the Catalog json file is available.
     """
+    from dem.cli.command import add_cat_cmd
     if platform:
         add_cat_cmd.execute(platform, name, url)
     else:
@@ -322,6 +395,7 @@ def list_cat() -> None:
     """
     List the available catalogs.
     """
+    from dem.cli.command import list_cat_cmd
     if platform:
         list_cat_cmd.execute(platform)
     else:
@@ -333,6 +407,7 @@ def del_cat(catalog_name: Annotated[str, typer.Argument(help="Name of the Develo
     """
     Delete a catalog.
     """
+    from dem.cli.command import del_cat_cmd
     if platform:
         del_cat_cmd.execute(platform, catalog_name)
     else:
@@ -344,6 +419,7 @@ def add_host(name: Annotated[str, typer.Argument(help="Name of the host")],
     """
     Add a new host.
     """
+    from dem.cli.command import add_host_cmd
     if platform:
         add_host_cmd.execute(platform, name, address)
     else:
@@ -354,6 +430,7 @@ def list_host() -> None:
     """
     List the available hosts.
     """
+    from dem.cli.command import list_host_cmd
     if platform is not None:
         list_host_cmd.execute(platform)
     else:
@@ -365,6 +442,7 @@ def del_host(host_name: Annotated[str, typer.Argument(help="Name of the host to
     """
     Delete a host.
     """
+    from dem.cli.command import del_host_cmd
     if platform:
         del_host_cmd.execute(platform, host_name)
     else:
@@ -390,6 +468,16 @@ def main(
         help="Show the dem version.",
         callback=_version_callback,
         is_eager=True,
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore the registry cache and crawl the registries again.",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Use the saved snapshots of the catalogs instead of downloading them.",
     )) -> None:
     """
     Development Environment Manager (dem)
@@ -401,4 +489,7 @@ def main(
     ❗ Always put the input text into double quotation marks (""), if it contains whitespaces.
 
     """
-    return
+    if refresh:
+        Registry.refresh_cache = True
+    if offline:
+        DevEnvCatalog.offline = True
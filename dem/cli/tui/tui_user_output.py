@@ -10,7 +10,11 @@ from rich.progress import Progress, TaskID, TextColumn, BarColumn, TaskProgressC
 from rich.status import Status
 
 class PullProgressBar():
-    """ Visualize the status of the pull command on a progress bar."""
+    """ Visualize the status of the pull command on a progress bar.
+    
+        The items of parallel pulls are tagged with the "image" key. The progress bars are keyed by
+        the image and the layer id, so the streams of several pulls can be shown in one view.
+    """
     def __init__(self, generator: Generator) -> None:
         """ Init the class
         
@@ -20,6 +24,18 @@ class PullProgressBar():
         self.tasks = {}
         self.generator = generator
 
+    @staticmethod
+    def _get_label(image: str | None, id: str) -> str:
+        """ Get the label of the layer.
+        
+            Args:
+                image -- the image the layer belongs to (None for a single pull)
+                id -- layer id
+        """
+        if image is None:
+            return str(id)
+        return image + " " + str(id)
+
     def _update_progress_bar(self, id: str, item: dict, status: str) -> None:
         """ Update the progress bar of the image pull.
         
@@ -28,11 +44,12 @@ class PullProgressBar():
                 item -- current item from the generator
                 status -- which process's status the progress bar shows
         """
-        task = self.tasks.get(id)
+        image = item.get("image")
+        task = self.tasks.get((image, id))
 
         if task is None:
-            task = self.progress.add_task(str(id), id=id)
-            self.tasks[id] = task
+            task = self.progress.add_task(str(id), id=self._get_label(image, id))
+            self.tasks[(image, id)] = task
 
         progress_detail = item.get("progressDetail")
         current = None
@@ -53,13 +70,16 @@ class PullProgressBar():
             """
         status = item.get("status")
         id = item.get("id")
+        image = item.get("image")
 
         if status:
             if id:
                 if item.get("progressDetail"):
                     self._update_progress_bar(id, item, status)
                 else:
-                    self.progress.console.print(str(id) + ": " + str(status))
+                    self.progress.console.print(self._get_label(image, id) + ": " + str(status))
+            elif image:
+                self.progress.console.print(image + ": " + str(status))
             else:
                 self.progress.console.print(str(status))
 
@@ -3,28 +3,282 @@
 
 from dem.core.core import Core
 from dem.core.exceptions import ContainerEngineError
-import docker
+from dem.core.data_management import LocalImageIndexFile, WarmContainersFile
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Generator, Iterable
+from dem.core.lazy_import import lazy_import
+import hashlib, json, os, queue, shlex, shutil, sys, threading, time
+
+docker = lazy_import("docker")
+
+def get_chain_ids(diff_ids: list[str]) -> list[str]:
+    """ Get the chain IDs of the layers.
+
+        The container engine stores a layer by its chain ID, that depends on the layer and all the 
+        layers below it. So a layer is only reused if the layers below it are the same too.
+
+        Args:
+            diff_ids -- the digests of the uncompressed layers, from the bottom to the top
+    """
+    chain_ids: list[str] = []
+    for diff_id in diff_ids:
+        if chain_ids:
+            diff_id = "sha256:" + hashlib.sha256((chain_ids[-1] + " " + diff_id).encode()).hexdigest()
+        chain_ids.append(diff_id)
+    return chain_ids
 
 class ContainerEngine(Core):
-    """ Operations on the Docker Container Engine."""
+    """ Operations on the Docker Container Engine.
+    
+        Class variables:
+            _pull_poll_interval -- the time in seconds to wait for a progress item of the parallel 
+                                   pulls before checking the state of the pulls
+            _image_event_actions -- the image events that can change the local tool images
+            _event_buffer_size -- the number of events the Docker daemon keeps, if this many events
+                                  arrive, some of them might have been lost
+            _local_image_index_max_age -- the time in seconds after the local image index gets 
+                                          rebuilt from a full listing anyway
+            _max_inspect_workers -- the maximum number of simultaneous image inspections
+            _max_remove_workers -- the maximum number of simultaneous image removals
+            _warm_container_keepalive -- the shell script that keeps the warm container running 
+                                         until no command has run in it for the idle timeout ($1),
+                                         checking it in every interval ($2)
+            _warm_container_keepalive_interval -- the time in seconds between the idle checks of 
+                                                  the warm container
+            _output_flush_interval -- the maximum time in seconds the passthrough output is held 
+                                      back in the write buffers, while the container produces it
+            _exec_options -- the run options that a warm container applies to each exec
+    """
+    _pull_poll_interval = 0.1
+    _image_event_actions = ("pull", "tag", "untag", "delete", "import", "load")
+    _event_buffer_size = 256
+    _local_image_index_max_age = 24 * 60 * 60
+    _max_inspect_workers = 8
+    _max_remove_workers = 4
+    _warm_container_keepalive = """idle=0
+while [ "$idle" -lt "$1" ]; do
+    sleep "$2"
+    idle=$((idle + $2))
+    for process in /proc/[0-9]*; do
+        case "${process#/proc/}" in
+            1|$$) ;;
+            *) idle=0 ;;
+        esac
+    done
+done"""
+    _warm_container_keepalive_interval = 10
+    _output_flush_interval = 0.1
+    _exec_options = ("environment", "working_dir")
 
-    def __init__(self) -> None:
-        """ Init the class."""
+    def __init__(self, local_image_index: LocalImageIndexFile | None = None,
+                 warm_containers_file: WarmContainersFile | None = None) -> None:
+        """ Init the class.
+        
+            Args:
+                local_image_index -- the persisted index of the local images (all the images get 
+                                     listed every time if None)
+                warm_containers_file -- the warm containers and their last use (required by 
+                                        run_warm())
+        """
         self._docker_client = docker.from_env()
+        self._local_image_index = local_image_index
+        self._warm_containers_file = warm_containers_file
+
+    def _list_local_images(self) -> dict[str, list[str]]:
+        """ List all the local images.
+
+            Return with the tags of the images by image ID.
+        """
+        return {image.id: [tag for tag in image.tags if tag] 
+                for image in self._docker_client.images.list()}
+
+    def _update_indexed_image(self, images: dict[str, list[str]], reference: str) -> None:
+        """ Update one image of the index by inspecting it.
+
+            Args:
+                images -- the tags of the images by image ID
+                reference -- the ID or the tag of the image
+        """
+        try:
+            image = self._docker_client.images.get(reference)
+        except docker.errors.ImageNotFound:
+            if reference in images:
+                del images[reference]
+            else:
+                for tags in images.values():
+                    if reference in tags:
+                        tags.remove(reference)
+            return
+
+        tags = [tag for tag in image.tags if tag]
+        # A tag can only belong to one image, so it gets removed from the previous one.
+        for image_id, image_tags in images.items():
+            if image_id != image.id:
+                image_tags[:] = [tag for tag in image_tags if tag not in tags]
+        images[image.id] = tags
+
+    def _sync_local_image_index(self) -> dict[str, list[str]]:
+        """ Apply the image events since the last synchronization to the local image index.
+
+            The images are fully listed only if the index is missing, invalid, belongs to another 
+            container engine, got too old, or some events might have been lost. The index file is 
+            only written if any events arrived or the images got listed.
+
+            Return with the tags of the images by image ID.
+        """
+        index = self._local_image_index.deserialized
+        docker_host = self._docker_client.api.base_url
+        # The events are requested until a fixed time, so the request doesn't block.
+        sync_time = int(time.time())
+
+        images: dict[str, list[str]] | None = None
+        if index.get("docker_host") == docker_host and \
+                isinstance(index.get("synced_at"), int) and isinstance(index.get("images"), dict) and \
+                sync_time - index.get("built_at", 0) < self._local_image_index_max_age:
+            events = [event for event in self._docker_client.events(since=index["synced_at"], 
+                                                                    until=sync_time, 
+                                                                    filters={"type": "image"}, 
+                                                                    decode=True)]
+            if not events:
+                # Nothing changed, so the index file isn't rewritten. The next synchronization 
+                # requests the events since the same time.
+                return index["images"]
+            if len(events) < self._event_buffer_size:
+                images = index["images"]
+                references = dict.fromkeys(event["Actor"]["ID"] for event in events
+                                           if event.get("Action") in self._image_event_actions)
+                for reference in references:
+                    self._update_indexed_image(images, reference)
+
+        if images is None:
+            images = self._list_local_images()
+            index["built_at"] = sync_time
+
+        index["docker_host"] = docker_host
+        index["synced_at"] = sync_time
+        index["images"] = {image_id: tags for image_id, tags in images.items() if tags}
+        self._local_image_index.flush()
+        return index["images"]
 
     def get_local_tool_images(self) -> list[str]:
         """ Get local tool images.
+
+            If the local image index is used, only the changes since the last call get obtained
+            from the container engine.
         
             Return with the list of the locally avialable tool image names.
         """
-        local_image_tags = []
+        if self._local_image_index is not None:
+            images = self._sync_local_image_index()
+        else:
+            images = self._list_local_images()
+
+        return [tag for tags in images.values() for tag in tags]
+
+    def _inspect_image(self, reference: str) -> dict | None:
+        """ Inspect a local image.
+
+            Args:
+                reference -- the image in the repo:tag format
+
+            Return with None if the image doesn't exist locally.
+        """
+        try:
+            return self._docker_client.api.inspect_image(reference)
+        except docker.errors.ImageNotFound:
+            return None
+
+    def _inspect_local_images(self, references: list[str]) -> dict[str, dict]:
+        """ Inspect the images one by one, concurrently.
+
+            Args:
+                references -- the images in the repo:tag format
+
+            Return with the inspection results of the locally available images.
+        """
+        references = list(dict.fromkeys(references))
+        if not references:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self._max_inspect_workers, 
+                                                len(references))) as executor:
+            return {reference: attrs for reference, attrs 
+                    in zip(references, executor.map(self._inspect_image, references))
+                    if attrs is not None}
+
+    def resolve_local_images(self, references: list[str]) -> set[str]:
+        """ Check which of the images exist locally, without listing all the local images.
+
+            The images get inspected one by one, concurrently, so the cost depends on the number of
+            the references and not on the number of the local images.
+
+            Args:
+                references -- the images in the repo:tag format
+
+            Return with the locally available images.
+        """
+        return set(self._inspect_local_images(references))
+
+    def get_local_image_ids(self, references: list[str]) -> dict[str, str]:
+        """ Get the content digests (the image IDs) of the local images.
+
+            If the local image index is used, the IDs are read from the synchronized index, 
+            otherwise the images get inspected.
+
+            Args:
+                references -- the images in the repo:tag format
+
+            Return with the IDs of the locally available images.
+        """
+        if self._local_image_index is None:
+            return {reference: attrs["Id"] 
+                    for reference, attrs in self._inspect_local_images(references).items()}
+
+        image_ids = {tag: image_id 
+                     for image_id, tags in self._sync_local_image_index().items() for tag in tags}
+        return {reference: image_ids[reference] for reference in references 
+                if reference in image_ids}
+
+    def get_repo_digests(self, references: list[str]) -> dict[str, list[str]]:
+        """ Get the manifest digests the local images were pulled by.
+
+            Args:
+                references -- the images in the repo:tag format
+
+            Return with the digests of the locally available images. The list is empty if the 
+            image has never been pulled from or pushed to a registry.
+        """
+        return {reference: [repo_digest.partition("@")[2] 
+                            for repo_digest in attrs.get("RepoDigests") or []]
+                for reference, attrs in self._inspect_local_images(references).items()}
 
-        for image in self._docker_client.images.list():
-            for tag in image.tags:
-                if tag:
-                    local_image_tags.append(tag)
+    def get_local_layer_chain_ids(self) -> set[str]:
+        """ Get the chain IDs of the layers of all the local images.
 
-        return local_image_tags
+            The images are taken from the local image index if it is used, otherwise they are 
+            listed by ID only. Then they get inspected concurrently.
+
+            Return with the chain IDs of all the layers of the local images.
+        """
+        if self._local_image_index is not None:
+            image_ids = list(self._sync_local_image_index())
+        else:
+            image_ids = self._docker_client.api.images(quiet=True)
+
+        return {chain_id for attrs in self._inspect_local_images(image_ids).values() 
+                for chain_id in get_chain_ids(attrs.get("RootFS", {}).get("Layers") or [])}
+
+    def get_fingerprint(self, image_ids: dict[str, str]) -> str:
+        """ Get the fingerprint of the images in the local image store.
+
+            The fingerprint changes if any of the images gets removed or points to another content,
+            or if another container engine is used.
+
+            Args:
+                image_ids -- the IDs of the images by reference
+        """
+        content = json.dumps([self._docker_client.api.base_url, sorted(image_ids.items())])
+        return hashlib.sha256(content.encode()).hexdigest()
 
     def pull(self, repository: str) -> None:
         """ Pull a repository from the axemsolutions registry.
@@ -35,71 +289,567 @@ class ContainerEngine(Core):
         resp = self._docker_client.api.pull(repository, stream=True, decode=True)
         self.user_output.progress_generator(resp)
 
-    def run(self, container_arguments: list[str]) -> None:
-        """ Run the container. 
+    def _pull_to_queue(self, repository: str, progress_queue: queue.Queue, 
+                       cancel_event: threading.Event, 
+                       pull_times: dict[str, float] | None = None) -> None:
+        """ Pull a repository and put the progress items tagged with the repository to the queue.
+
+            Args:
+                repository -- repository to pull
+                progress_queue -- the progress items get passed through this queue
+                cancel_event -- stop the pull if set
+                pull_times -- if set, the time of the completed pull in seconds gets stored in it
+        """
+        if cancel_event.is_set():
+            return
+
+        start_time = time.perf_counter()
+        try:
+            resp = self._docker_client.api.pull(repository, stream=True, decode=True)
+            try:
+                for item in resp:
+                    if cancel_event.is_set():
+                        break
+                    if "error" in item:
+                        raise ContainerEngineError(repository + ": " + str(item["error"]))
+                    item["image"] = repository
+                    progress_queue.put(item)
+            finally:
+                resp.close()
+        except Exception:
+            # Don't start the pulls waiting in the queue.
+            cancel_event.set()
+            raise
+
+        if pull_times is not None and not cancel_event.is_set():
+            pull_times[repository] = time.perf_counter() - start_time
+
+    def _get_parallel_pull_progress(self, repositories: list[str], max_workers: int,
+                                    pull_times: dict[str, float] | None = None) -> Generator:
+        """ Generator function for pulling the repositories in parallel.
+
+            The progress items of all the pulls get yielded as they arrive. If a pull fails, the 
+            pending pulls get cancelled and the running ones stopped, then a ContainerEngineError 
+            is raised.
+
+            Args:
+                repositories -- repositories to pull
+                max_workers -- the maximum number of simultaneous pulls
+                pull_times -- if set, the time of each completed pull in seconds gets stored in it
+        """
+        progress_queue = queue.Queue()
+        cancel_event = threading.Event()
+        failure: BaseException | None = None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: set[Future] = {executor.submit(self._pull_to_queue, repository, 
+                                                    progress_queue, cancel_event, pull_times) 
+                                    for repository in repositories}
+
+            try:
+                while pending or not progress_queue.empty():
+                    try:
+                        item = progress_queue.get(timeout=self._pull_poll_interval)
+                    except queue.Empty:
+                        pass
+                    else:
+                        if not cancel_event.is_set():
+                            yield item
+
+                    for future in [future for future in pending if future.done()]:
+                        pending.remove(future)
+                        if future.cancelled() or future.exception() is None or failure is not None:
+                            continue
+
+                        failure = future.exception()
+                        cancel_event.set()
+                        for pending_future in pending:
+                            pending_future.cancel()
+            finally:
+                # If the consumer stops early (e.g. Ctrl-C), the executor mustn't wait for all the 
+                # pulls to finish.
+                cancel_event.set()
+                for pending_future in pending:
+                    pending_future.cancel()
+
+        if isinstance(failure, ContainerEngineError):
+            raise failure
+        elif failure is not None:
+            raise ContainerEngineError(str(failure)) from failure
+
+    def pull_images(self, repositories: list[str], max_workers: int,
+                    pull_times: dict[str, float] | None = None) -> None:
+        """ Pull several repositories in parallel.
+
+            The progress of all the pulls is presented in one view.
         
-            The function converts the Docker CLI commands to Docker Engine API call parameters.
+            Args:
+                repositories -- repositories to pull
+                max_workers -- the maximum number of simultaneous pulls
+                pull_times -- if set, the time of each completed pull in seconds gets stored in it
+        """
+        self.user_output.progress_generator(self._get_parallel_pull_progress(repositories, 
+                                                                             max_workers,
+                                                                             pull_times))
 
-            The container always gets started in detach mode. If the -d option is enabled the 
-            function returns after the container has been started. If not enabled the DEM streams 
-            the logs from the container to the user output while it is running. This effectively 
-            results in the same behaviour as the docker run command's -d option.
+    def _parse_run_option(self, run_config: dict, option: str, value: str | None) -> None:
+        """ Convert a docker run option with argument to the Docker Engine API call parameters.
 
             Args:
-                container_arguments -- list of arguments to pass to the API call
+                run_config -- the run config to update
+                option -- the option
+                value -- the argument of the option, None if the option doesn't take one
+        """
+        options = run_config["options"]
+        try:
+            match option:
+                case "-p" | "--publish":
+                    try:
+                        host_port, container_port = value.split(":")
+                    except ValueError:
+                        raise ContainerEngineError("The option -p has invalid argument: " + value)
+                    run_config["ports"][container_port] = int(host_port)
+                case "--name":
+                    run_config["name"] = value
+                case "-v" | "--volume":
+                    run_config["volumes"].append(value)
+                case "-e" | "--env":
+                    # Like the docker CLI, a variable without value is taken from the host, and
+                    # it is not set at all if the host doesn't have it either.
+                    if "=" not in value:
+                        if value not in os.environ:
+                            return
+                        value += "=" + os.environ[value]
+                    options.setdefault("environment", []).append(value)
+                case "-w" | "--workdir":
+                    options["working_dir"] = value
+                case "--cpus":
+                    options["nano_cpus"] = int(float(value) * 1e9)
+                case "-c" | "--cpu-shares":
+                    options["cpu_shares"] = int(value)
+                case "--cpuset-cpus":
+                    options["cpuset_cpus"] = value
+                case "--cpuset-mems":
+                    options["cpuset_mems"] = value
+                case "-m" | "--memory":
+                    options["mem_limit"] = value
+                case "--memory-swap":
+                    options["memswap_limit"] = value
+                case "--memory-reservation":
+                    options["mem_reservation"] = value
+                case "--shm-size":
+                    options["shm_size"] = value
+                case "--tmpfs":
+                    path, _, tmpfs_options = value.partition(":")
+                    options.setdefault("tmpfs", {})[path] = tmpfs_options
+                case "--ulimit":
+                    name, _, limits = value.partition("=")
+                    soft, _, hard = limits.partition(":")
+                    options.setdefault("ulimits", []).append({"name": name, "soft": int(soft),
+                                                              "hard": int(hard or soft)})
+                case "--pids-limit":
+                    options["pids_limit"] = int(value)
+                case "--network":
+                    options["network_mode"] = value
+                case "--ipc":
+                    options["ipc_mode"] = value
+                case _:
+                    raise ContainerEngineError("The input parameter " + option + " is not supported!")
+        except ValueError:
+            raise ContainerEngineError("The option " + option + " has invalid argument: " + value)
+
+    def _parse_run_arguments(self, container_arguments: list[str]) -> dict:
+        """ Convert the Docker CLI arguments to the Docker Engine API call parameters.
+
+            Args:
+                container_arguments -- the arguments of the docker run command
+
+            Return with the run config: "image", "command", "ports", "name", "volumes", 
+            "privileged", "auto_remove", "stream_logs" and "options". The "options" are the 
+            resource and environment settings, as keyword arguments of the containers.run() call.
         """
         container_arguments_iter = iter(container_arguments)
 
-        image = ""
-        ports = {}
-        name = ""
-        volumes = []
-        command = ""
-        privileged = False
-        auto_remove = False
-        stream_logs = True
+        run_config = {
+            "image": "",
+            "command": "",
+            "ports": {},
+            "name": "",
+            "volumes": [],
+            "privileged": False,
+            "auto_remove": False,
+            "stream_logs": True,
+            "options": {},
+        }
 
         try:
             for argument in container_arguments_iter:
                 if argument.startswith("-"):
                     match argument:
-                        case "-p":
-                            port_binding = next(container_arguments_iter)
-                            try:
-                                host_port, container_port = port_binding.split(":")
-                            except ValueError:
-                                raise ContainerEngineError("The option -p has invalid argument: " + port_binding)
-                            ports[container_port] = int(host_port)
-                        case "--name":
-                            name = next(container_arguments_iter)
-                        case "-v":
-                            volumes.append(next(container_arguments_iter))
                         case "--privileged":
-                            privileged = True
+                            run_config["privileged"] = True
                         case "--rm":
-                            auto_remove = True
-                        case "-d":
-                            stream_logs = False
+                            run_config["auto_remove"] = True
+                        case "-d" | "--detach":
+                            run_config["stream_logs"] = False
                         case _:
-                            raise ContainerEngineError("The input parameter " + argument + " is not supported!")
+                            # The long options can get their argument as --option=value too.
+                            if argument.startswith("--") and "=" in argument:
+                                option, value = argument.split("=", 1)
+                            else:
+                                option, value = argument, next(container_arguments_iter)
+                            self._parse_run_option(run_config, option, value)
                 else:
-                    image = argument
-                    for argument in container_arguments_iter:
-                        command += argument + " "
-                    command = command[:-1]
+                    run_config["image"] = argument
+                    run_config["command"] = " ".join(container_arguments_iter)
         except StopIteration:
             raise ContainerEngineError("Invalid input parameter!")
 
-        run_result = self._docker_client.containers.run(image, command=command, 
-                                                        auto_remove=auto_remove, 
-                                                        privileged=privileged, volumes=volumes,
-                                                        ports=ports, name=name, stderr=True, 
-                                                        detach=True)
+        return run_config
+
+    def _write_output(self, output: Iterable[tuple[bytes | None, bytes | None]]) -> None:
+        """ Write the demultiplexed output of the container to the binary stdout and stderr.
+
+            The chunks are written unchanged. The streams are flushed when the output switches 
+            between them, to keep their order, and at least every _output_flush_interval seconds.
+
+            Args:
+                output -- the (stdout, stderr) chunks of the container's output
+        """
+        # The text already printed must precede the container's output.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        stdout_buffer = sys.stdout.buffer
+        stderr_buffer = sys.stderr.buffer
+
+        last_stream = None
+        last_flush = time.monotonic()
+        try:
+            for stdout_chunk, stderr_chunk in output:
+                for stream, chunk in ((stdout_buffer, stdout_chunk), (stderr_buffer, stderr_chunk)):
+                    if not chunk:
+                        continue
+                    if last_stream is not None and stream is not last_stream:
+                        last_stream.flush()
+                    stream.write(chunk)
+                    last_stream = stream
+
+                now = time.monotonic()
+                if now - last_flush >= self._output_flush_interval:
+                    stdout_buffer.flush()
+                    stderr_buffer.flush()
+                    last_flush = now
+        finally:
+            stdout_buffer.flush()
+            stderr_buffer.flush()
+
+    def _add_cache_volumes(self, run_config: dict, 
+                           cache_volumes: dict[str, dict[str, str]] | None) -> None:
+        """ Add the cache volumes of the image to the volumes of the run config. A cache volume is
+            not mounted if the user mounts something else to its path.
+
+            Args:
+                run_config -- the parsed run arguments
+                cache_volumes -- the volume names and their mount paths by tool image
+        """
+        if not cache_volumes:
+            return
+
+        image = run_config["image"]
+        if ":" not in image.rsplit("/", 1)[-1] and "@" not in image:
+            image += ":latest"
+
+        mounted_paths = {volume.split(":")[1] for volume in run_config["volumes"] 
+                         if volume.count(":") >= 1}
+        for volume_name, path in cache_volumes.get(image, {}).items():
+            if path not in mounted_paths:
+                run_config["volumes"].append(volume_name + ":" + path)
+
+    def run(self, container_arguments: list[str], passthrough: bool = False, 
+            cache_volumes: dict[str, dict[str, str]] | None = None) -> int | None:
+        """ Run the container. 
+        
+            The function converts the Docker CLI commands to Docker Engine API call parameters.
+
+            The container always gets started in detach mode. If the -d option is enabled the 
+            function returns after the container has been started. If not enabled the DEM streams 
+            the logs from the container to the user output while it is running. This effectively 
+            results in the same behaviour as the docker run command's -d option.
+
+            In passthrough mode the container's stdout and stderr get written unchanged to the 
+            process's stdout and stderr, and the container's exit code is returned. A container 
+            started with --rm gets removed after its exit code has been read.
+
+            Args:
+                container_arguments -- list of arguments to pass to the API call
+                passthrough -- write the raw output of the container to the binary streams
+                cache_volumes -- the cache volumes to mount and their paths by tool image
+
+            Return with the exit code of the container in passthrough mode, None otherwise.
+        """
+        run_config = self._parse_run_arguments(container_arguments)
+        self._add_cache_volumes(run_config, cache_volumes)
+
+        if passthrough and run_config["stream_logs"]:
+            container = self._docker_client.containers.run(run_config["image"], 
+                                                           command=run_config["command"], 
+                                                           auto_remove=False, 
+                                                           privileged=run_config["privileged"], 
+                                                           volumes=run_config["volumes"],
+                                                           ports=run_config["ports"], 
+                                                           name=run_config["name"], stderr=True, 
+                                                           detach=True, **run_config["options"])
+            try:
+                self._write_output(container.attach(stdout=True, stderr=True, stream=True, 
+                                                    logs=True, demux=True))
+                return container.wait()["StatusCode"]
+            finally:
+                if run_config["auto_remove"]:
+                    container.remove(force=True)
 
-        if stream_logs:
+        run_result = self._docker_client.containers.run(run_config["image"], 
+                                                        command=run_config["command"], 
+                                                        auto_remove=run_config["auto_remove"], 
+                                                        privileged=run_config["privileged"], 
+                                                        volumes=run_config["volumes"],
+                                                        ports=run_config["ports"], 
+                                                        name=run_config["name"], stderr=True, 
+                                                        detach=True, **run_config["options"])
+
+        if run_config["stream_logs"]:
             for line in run_result.logs(stream=True):
                 self.user_output.msg(line.decode().strip())
 
+    def _get_warm_container_key(self, dev_env_name: str, run_config: dict) -> str:
+        """ Get the key of the warm container that can run the command.
+
+            The Dev Env, the image and everything that is set when the container gets created must
+            match. The command and the options that only affect a single run don't count.
+
+            Args:
+                dev_env_name -- the name of the Dev Env
+                run_config -- the parsed run arguments
+        """
+        container_config = {key: value for key, value in run_config.items() 
+                            if key not in ("command", "name", "auto_remove", "stream_logs", 
+                                           "options")}
+        container_config["options"] = self._get_warm_container_options(run_config)
+        return hashlib.sha256(json.dumps([dev_env_name, container_config], 
+                                         sort_keys=True).encode()).hexdigest()
+
+    def _get_warm_container_options(self, run_config: dict) -> dict:
+        """ Get the options to create the warm container with. The environment and the working 
+            directory are set for each exec instead.
+
+            Args:
+                run_config -- the parsed run arguments
+        """
+        return {option: value for option, value in run_config["options"].items()
+                if option not in self._exec_options}
+
+    def _is_warm_container_busy(self, container_id: str) -> bool:
+        """ Check whether a command is still running in the warm container.
+
+            Args:
+                container_id -- the ID of the warm container
+        """
+        exec_ids = self._docker_client.api.inspect_container(container_id).get("ExecIDs") or []
+        return any(self._docker_client.api.exec_inspect(exec_id).get("Running") 
+                   for exec_id in exec_ids)
+
+    def _remove_warm_container(self, container_id: str) -> None:
+        """ Remove the warm container, if it still exists.
+
+            Args:
+                container_id -- the ID of the warm container
+        """
+        try:
+            self._docker_client.api.remove_container(container_id, force=True)
+        except docker.errors.NotFound:
+            pass
+
+    def _reap_idle_warm_containers(self, idle_timeout: int, now: float) -> None:
+        """ Remove the warm containers that haven't been used for the idle timeout. The warm 
+            containers file must be locked and up to date.
+
+            Args:
+                idle_timeout -- the time in seconds after an idle warm container gets removed
+                now -- the current time
+        """
+        warm_containers = self._warm_containers_file.deserialized
+        for key, warm_container in list(warm_containers.items()):
+            if now - warm_container["last_used"] < idle_timeout:
+                continue
+            try:
+                if self._is_warm_container_busy(warm_container["id"]):
+                    continue
+            except docker.errors.NotFound:
+                pass
+            self._remove_warm_container(warm_container["id"])
+            del warm_containers[key]
+
+    def _get_warm_container(self, key: str, dev_env_name: str, run_config: dict, 
+                            idle_timeout: int, fresh: bool) -> str | None:
+        """ Get the running warm container of the key, or start a new one. The warm containers 
+            file must be locked and up to date.
+
+            Args:
+                key -- the key of the warm container
+                dev_env_name -- the name of the Dev Env
+                run_config -- the parsed run arguments
+                idle_timeout -- the time in seconds after a new warm container stops if idle
+                fresh -- replace the existing warm container with a new one
+
+            Return with the ID of the warm container, or None if a new one couldn't be started.
+        """
+        warm_container = self._warm_containers_file.deserialized.get(key)
+        if warm_container is not None:
+            if fresh:
+                self._remove_warm_container(warm_container["id"])
+            else:
+                try:
+                    if self._docker_client.api.inspect_container(warm_container["id"])["State"]["Running"]:
+                        return warm_container["id"]
+                except docker.errors.NotFound:
+                    pass
+                self._remove_warm_container(warm_container["id"])
+
+        return self._start_warm_container(key, dev_env_name, run_config, idle_timeout)
+
+    def _start_warm_container(self, key: str, dev_env_name: str, run_config: dict, 
+                              idle_timeout: int) -> str | None:
+        """ Start a new warm container.
+
+            The warm container's entrypoint is a shell loop, that exits when no other process has
+            been running in the container for the idle timeout, so the container gets removed by
+            the daemon even if dem doesn't run again. The image needs the sh and sleep commands. 
+            If the container can't be started or exits immediately, it gets removed.
+
+            Args:
+                key -- the key of the warm container
+                dev_env_name -- the name of the Dev Env
+                run_config -- the parsed run arguments
+                idle_timeout -- the time in seconds after the container stops if idle
+
+            Return with the ID of the warm container, or None if it couldn't be started.
+        """
+        container = self._docker_client.containers.create(run_config["image"], 
+                                                          entrypoint=["sh", "-c", 
+                                                                      self._warm_container_keepalive,
+                                                                      "dem-keepalive", 
+                                                                      str(idle_timeout),
+                                                                      str(self._warm_container_keepalive_interval)],
+                                                          auto_remove=True,
+                                                          privileged=run_config["privileged"], 
+                                                          volumes=run_config["volumes"],
+                                                          ports=run_config["ports"], 
+                                                          labels={"dem.dev_env": dev_env_name,
+                                                                  "dem.warm_key": key},
+                                                          **self._get_warm_container_options(run_config))
+        try:
+            container.start()
+            container.reload()
+        except docker.errors.APIError:
+            pass
+        else:
+            if container.status == "running":
+                return container.id
+
+        self._remove_warm_container(container.id)
+        return None
+
+    def _get_exec_command(self, image: str, command: str) -> list[str]:
+        """ Get the command to execute in the warm container.
+
+            The warm container's entrypoint only keeps it running, so the image's entrypoint and 
+            default command are applied here, like the docker run command would do.
+
+            Args:
+                image -- the image of the warm container
+                command -- the command of the run
+        """
+        image_config = self._docker_client.api.inspect_image(image).get("Config") or {}
+        if command:
+            exec_command = shlex.split(command)
+        else:
+            exec_command = image_config.get("Cmd") or []
+        return (image_config.get("Entrypoint") or []) + exec_command
+
+    def _touch_warm_container(self, key: str, container_id: str) -> None:
+        """ Record the current time as the last use of the warm container.
+
+            Args:
+                key -- the key of the warm container
+                container_id -- the ID of the warm container
+        """
+        with self._warm_containers_file.lock():
+            self._warm_containers_file.update()
+            self._warm_containers_file.deserialized[key] = {"id": container_id, 
+                                                            "last_used": time.time()}
+            self._warm_containers_file.flush()
+
+    def run_warm(self, container_arguments: list[str], dev_env_name: str, idle_timeout: int,
+                 fresh: bool = False, passthrough: bool = False, 
+                 cache_volumes: dict[str, dict[str, str]] | None = None) -> int | None:
+        """ Run the command in a long-lived warm container of the Dev Env.
+
+            The first run starts a warm container, and the later runs with the same image, volumes,
+            ports and privileges execute their commands in it, so no container has to be created
+            and removed. A warm container idle for longer than the timeout stops and gets removed
+            by itself, or by the next warm run. The --name and --rm options are ignored. If the warm
+            container can't be started, e.g. the image has no shell, the container is run normally.
+
+            Args:
+                container_arguments -- the arguments of the docker run command
+                dev_env_name -- the name of the Dev Env
+                idle_timeout -- the time in seconds after an idle warm container gets removed
+                fresh -- replace the warm container with a new one
+                passthrough -- write the raw output of the command to the binary streams
+                cache_volumes -- the cache volumes to mount and their paths by tool image
+
+            Return with the exit code of the command in passthrough mode, None otherwise.
+        """
+        run_config = self._parse_run_arguments(container_arguments)
+        self._add_cache_volumes(run_config, cache_volumes)
+        key = self._get_warm_container_key(dev_env_name, run_config)
+
+        with self._warm_containers_file.lock():
+            self._warm_containers_file.update()
+            now = time.time()
+            self._reap_idle_warm_containers(idle_timeout, now)
+            container_id = self._get_warm_container(key, dev_env_name, run_config, idle_timeout, 
+                                                    fresh)
+            if container_id is not None:
+                self._warm_containers_file.deserialized[key] = {"id": container_id, 
+                                                                "last_used": now}
+            self._warm_containers_file.flush()
+
+        if container_id is None:
+            self.user_output.msg("[yellow]The warm container couldn't be started, the image needs the sh and sleep commands. The container is run without a warm container.[/]")
+            return self.run(container_arguments, passthrough, cache_volumes)
+
+        if run_config["name"] or run_config["auto_remove"]:
+            self.user_output.msg("[yellow]The --name and --rm options are ignored by the warm containers.[/]")
+
+        exec_id = self._docker_client.api.exec_create(container_id, 
+                                                      self._get_exec_command(run_config["image"], 
+                                                                             run_config["command"]),
+                                                      environment=run_config["options"].get("environment"),
+                                                      workdir=run_config["options"].get("working_dir"))["Id"]
+        exit_code = None
+        if not run_config["stream_logs"]:
+            self._docker_client.api.exec_start(exec_id, detach=True)
+        elif passthrough:
+            self._write_output(self._docker_client.api.exec_start(exec_id, stream=True, demux=True))
+            exit_code = self._docker_client.api.exec_inspect(exec_id)["ExitCode"]
+        else:
+            for line in self._docker_client.api.exec_start(exec_id, stream=True):
+                self.user_output.msg(line.decode().strip())
+
+        # The idle time starts when the command has finished.
+        self._touch_warm_container(key, container_id)
+        return exit_code
+
     def remove(self, image: str) -> None:
         """ Remove a tool image.
 
@@ -119,15 +869,131 @@ class ContainerEngine(Core):
         else:
             self.user_output.msg(f"[green]Successfully removed the {image}![/]\n")
 
-    def search(self, registry: str) -> list[str]:
-        """ Search repository in the axemsolutions registry.
+    def _try_remove(self, image: str) -> bool:
+        """ Remove a tool image without raising an exception.
+        
+            Args: 
+                image -- the tool image to remove
+
+            Return with True if the removal was successful.
+        """
+        try:
+            self.remove(image)
+        except ContainerEngineError:
+            return False
+        return True
+
+    def remove_images(self, images: list[str]) -> list[str]:
+        """ Remove the tool images concurrently.
+
+            Every removal is attempted, even if some of them fail.
         
+            Args: 
+                images -- the tool images to remove
+
+            Return with the tool images that couldn't be removed.
+        """
+        if not images:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self._max_remove_workers, len(images))) as executor:
+            return [image for image, is_removed in zip(images, executor.map(self._try_remove, images)) 
+                    if not is_removed]
+
+    def get_image_disk_usage(self) -> tuple[int, dict[str, dict]]:
+        """ Get the disk usage of the local images with a single request to the daemon.
+
+            An image's layers shared with other images are not reclaimed by removing it. If the 
+            image has several tags, its size is only reclaimed when all of them are removed.
+
+            Return with the total size of the image layers, and the tags ("tags") and the unshared
+            size ("size") of each tagged image by image ID, in bytes.
+        """
+        try:
+            disk_usage = self._docker_client.df()
+        except docker.errors.APIError as e:
+            raise ContainerEngineError("Failed to get the disk usage: " + str(e))
+
+        images = {}
+        for image in disk_usage.get("Images") or []:
+            repo_tags = image.get("RepoTags") or []
+            if repo_tags:
+                images[image["Id"]] = {
+                    "tags": repo_tags,
+                    "size": image["Size"] - max(image.get("SharedSize", 0), 0),
+                }
+        return disk_usage.get("LayersSize") or 0, images
+
+    def get_free_space(self) -> int:
+        """ Get the free space of the filesystem the daemon stores its data on.
+
+            Only available if the daemon runs on this machine.
+
+            Return with the free space in bytes.
+        """
+        try:
+            docker_root_dir = self._docker_client.info()["DockerRootDir"]
+            return shutil.disk_usage(docker_root_dir).free
+        except (docker.errors.APIError, KeyError, OSError) as e:
+            raise ContainerEngineError("Failed to get the free space of the container engine's storage: " + str(e))
+
+    def get_volume_sizes(self, volume_names: list[str]) -> dict[str, int | None]:
+        """ Get the disk usage of the volumes with a single request to the daemon.
+
             Args:
-                registry -- registry to search
+                volume_names -- the names of the volumes
+
+            Return with the size of each volume in bytes, None if the volume doesn't exist or its 
+            size is unknown.
+        """
+        try:
+            disk_usage = self._docker_client.df()
+        except docker.errors.APIError as e:
+            raise ContainerEngineError("Failed to get the disk usage: " + str(e))
+
+        volume_sizes: dict[str, int | None] = dict.fromkeys(volume_names)
+        for volume in disk_usage.get("Volumes") or []:
+            if volume["Name"] in volume_sizes:
+                size = (volume.get("UsageData") or {}).get("Size", -1)
+                volume_sizes[volume["Name"]] = size if size >= 0 else None
+        return volume_sizes
+
+    def remove_volumes(self, volume_names: list[str]) -> list[str]:
+        """ Remove the volumes. A volume that doesn't exist counts as removed.
+
+            Args:
+                volume_names -- the names of the volumes
+
+            Return with the volumes that couldn't be removed.
         """
-        local_registryimagelist = []
+        failed_volume_names = []
+        for volume_name in volume_names:
+            try:
+                self._docker_client.api.remove_volume(volume_name)
+            except docker.errors.NotFound:
+                pass
+            except docker.errors.APIError as e:
+                self.user_output.error(f"[red]Error: Unable to remove the {volume_name}: {e}[/]\n")
+                failed_volume_names.append(volume_name)
+        return failed_volume_names
+
+    def remove_warm_containers(self, dev_env_name: str) -> None:
+        """ Remove the warm containers of the Dev Env. The next warm run starts a new one.
 
-        for repositories in self._docker_client.images.search(registry):
-            local_registryimagelist.append(repositories['name'])
+            Args:
+                dev_env_name -- the name of the Dev Env
+        """
+        for container in self._docker_client.containers.list(all=True, 
+                                                              filters={"label": "dem.dev_env=" + dev_env_name}):
+            self._remove_warm_container(container.id)
 
-        return local_registryimagelist
\ No newline at end of file
+    def prune_images(self) -> int:
+        """ Remove the dangling images with a single request to the daemon.
+
+            Return with the reclaimed disk space in bytes.
+        """
+        try:
+            prune_result = self._docker_client.images.prune(filters={"dangling": True})
+        except docker.errors.APIError as e:
+            raise ContainerEngineError("Failed to prune the dangling images: " + str(e))
+        return prune_result.get("SpaceReclaimed") or 0
@@ -4,8 +4,12 @@
 from dem.core.core import Core
 from dem.core.properties import __config_dir_path__
 from pathlib import PurePath
+from typing import Generator, TextIO
+import contextlib
 import os
 import json
+import hashlib
+import fcntl
 
 class BaseJSON(Core):
     """ This class acts as an abstracted buffer over a json file. 
@@ -17,10 +21,32 @@ class BaseJSON(Core):
             _config_dir -- points to the json files' directory
             _path -- path to the json file (must be set in the descending classes)
             _default_json -- default json content
+            _content_hash -- hash of the json file's content as last read or written
         """
     _config_dir = os.path.expanduser('~') + __config_dir_path__
     _path = ""
     _default_json = ""
+    _content_hash = None
+
+    @staticmethod
+    def _get_content_hash(content: str) -> str:
+        """ Return with the hash of the serialized json content.
+        
+            Args:
+                content -- the serialized json content
+        """
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _load(self, json_file: TextIO) -> dict:
+        """ Deserialize the opened json file and remember the hash of its content.
+        
+            Args:
+                json_file -- the opened json file
+        """
+        content = json_file.read()
+        deserialized = json.loads(content)
+        self._content_hash = self._get_content_hash(content)
+        return deserialized
 
     def _create_default_json(self) -> dict:
         """ If the .json doesn't exist, then create the default one.
@@ -52,7 +78,7 @@ class BaseJSON(Core):
             self.deserialized = self._create_default_json()
         else:
             try:
-                self.deserialized = json.load(json_file)
+                self.deserialized = self._load(json_file)
             except json.decoder.JSONDecodeError:
                 self.user_output.get_confirm("[red]Error: invalid json format.[/]", 
                                              "Restore the original json file?")
@@ -61,10 +87,43 @@ class BaseJSON(Core):
                 json_file.close()
 
     def flush(self) -> None:
-        """ Write the buffer content to the json file."""
-        json_file = open(self._path, "w")
-        json.dump(self.deserialized, json_file, indent=4)
-        json_file.close()
+        """ Write the buffer content to the json file.
+        
+            The content is written to a temporary file first, which then replaces the json file, so
+            the json file never gets truncated. The write is skipped if the content hasn't changed.
+        """
+        content = json.dumps(self.deserialized, indent=4)
+        content_hash = self._get_content_hash(content)
+        if content_hash == self._content_hash:
+            return
+
+        tmp_path = f"{self._path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as tmp_file:
+                tmp_file.write(content)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._content_hash = content_hash
+
+    @contextlib.contextmanager
+    def lock(self) -> Generator:
+        """ Hold an exclusive advisory lock on the json file while the context is active.
+
+            Concurrent dem processes can use it to serialize their read-modify-write cycles.
+        """
+        os.makedirs(self._config_dir, exist_ok=True)
+        with open(f"{self._path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 class LocalDevEnvJSON(BaseJSON):
     """ Serialize and deserialize the dev_env.json file."""
@@ -80,8 +139,27 @@ class LocalDevEnvJSON(BaseJSON):
 """
         super().__init__()
 
+    def flush(self) -> None:
+        """ Write the buffer content to the json file and update the completion index."""
+        super().flush()
+        completion_index_file = CompletionIndexFile()
+        completion_index_file.index_dev_env_json(self.deserialized)
+        completion_index_file.flush()
+
 class ConfigFile(BaseJSON):
-    """ Serialize and deserialize the config.json file."""
+    """ Serialize and deserialize the config.json file.
+    
+        Class attributes:
+            _default_max_parallel_pulls -- the number of simultaneous pulls if the config file 
+                                           doesn't set the "max_parallel_pulls" key
+            _default_warm_container_idle_timeout -- the time in seconds after an idle warm 
+                                                    container gets removed, if the config file 
+                                                    doesn't set the "warm_container_idle_timeout"
+                                                    key
+    """
+    _default_max_parallel_pulls = 4
+    _default_warm_container_idle_timeout = 900
+
     def __init__(self) -> None:
         """ Init the class."""
         self._path = PurePath(self._config_dir + "/config.json")
@@ -97,11 +175,176 @@ class ConfigFile(BaseJSON):
             "name": "axem",
             "url": "https://axemsolutions.io/dem/dev_env_org.json"
         }
-    ]
+    ],
     "hosts": []
 }"""
         super().__init__()
 
         self.registries: list[dict] = self.deserialized.get("registries", [])
         self.catalogs: list[dict] = self.deserialized.get("catalogs", [])
-        self.hosts: list[dict] = self.deserialized.get("hosts", [])
\ No newline at end of file
+        self.hosts: list[dict] = self.deserialized.get("hosts", [])
+        self.max_parallel_pulls: int = self.deserialized.get("max_parallel_pulls", 
+                                                             self._default_max_parallel_pulls)
+        self.warm_containers: bool = self.deserialized.get("warm_containers", False)
+        self.warm_container_idle_timeout: int = self.deserialized.get("warm_container_idle_timeout",
+                                                                      self._default_warm_container_idle_timeout)
+        self.passthrough_output: bool = self.deserialized.get("passthrough_output", True)
+
+    def flush(self) -> None:
+        """ Write the buffer content to the json file and update the completion index."""
+        super().flush()
+        completion_index_file = CompletionIndexFile()
+        completion_index_file.index_config(self.deserialized)
+        completion_index_file.flush()
+
+class ResettableJSON(BaseJSON):
+    """ A json file that can be restored anytime from its source, e.g. a cache or an index. 
+    
+        A missing or invalid file gets reset without asking the user.
+    """
+    _default_json = "{}"
+
+    def _reset(self) -> dict:
+        """ Reset the json file to its default content.
+        
+            Return with the deserialized content of the reset json file.
+        """
+        return self._create_default_json()
+
+    def update(self) -> None:
+        """ Update the buffer with the content from the json file."""
+        try:
+            with open(self._path, "r") as json_file:
+                self.deserialized = self._load(json_file)
+        except (FileNotFoundError, json.decoder.JSONDecodeError):
+            self.deserialized = self._reset()
+
+class RegistryCacheFile(ResettableJSON):
+    """ Serialize and deserialize the registry_cache.json file.
+    
+        The file stores the repo:tag listings of the registries alongside with the time of the 
+        crawl and the validators (ETag, Last-Modified) of the tag endpoint responses.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/registry_cache.json")
+        super().__init__()
+
+class CatalogCacheFile(ResettableJSON):
+    """ Serialize and deserialize the catalog_cache.json file.
+    
+        The file stores a snapshot of each catalog alongside with its ETag and the time of the 
+        download.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/catalog_cache.json")
+        super().__init__()
+
+class LocalImageIndexFile(ResettableJSON):
+    """ Serialize and deserialize the local_image_index.json file.
+    
+        The file stores the tags of the local images by image ID, alongside with the container 
+        engine's address and the time of the last synchronization.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/local_image_index.json")
+        super().__init__()
+
+class ToolImageUsageFile(ResettableJSON):
+    """ Serialize and deserialize the tool_image_usage.json file.
+    
+        The file stores the time each tool image was last used by the run or the install command. 
+        The least recently used tool images get evicted first by the gc command.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/tool_image_usage.json")
+        super().__init__()
+
+class WarmContainersFile(ResettableJSON):
+    """ Serialize and deserialize the warm_containers.json file.
+    
+        The file stores the ID and the time of the last use of each warm container by its key.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/warm_containers.json")
+        super().__init__()
+
+class CompletionIndexFile(ResettableJSON):
+    """ Serialize and deserialize the completion_index.json file.
+    
+        The shell completion offers the names stored in this small file, so it doesn't need to load
+        the dev_env.json and the config.json. The index gets updated whenever those are flushed.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/completion_index.json")
+        super().__init__()
+
+    def _is_valid_source(self, file_name: str) -> bool:
+        """ Check that a source json file of the index is missing or has a valid json format.
+        
+            Args:
+                file_name -- the name of the source json file in the config directory
+        """
+        try:
+            with open(PurePath(self._config_dir + "/" + file_name), "r") as json_file:
+                json.load(json_file)
+        except FileNotFoundError:
+            return True
+        except json.decoder.JSONDecodeError:
+            return False
+        return True
+
+    def _reset(self) -> dict:
+        """ Rebuild the index from the dev_env.json and the config.json without asking the user.
+
+            An invalid source file is left untouched and its names are left out of the index, 
+            because the shell completion can't ask the user to restore it. Such an incomplete 
+            index is not stored, so it gets rebuilt once the source file is valid again.
+
+            Return with the deserialized content of the rebuilt index.
+        """
+        self.deserialized = {}
+        is_complete = True
+        if self._is_valid_source("dev_env.json"):
+            self.index_dev_env_json(LocalDevEnvJSON().deserialized)
+        else:
+            is_complete = False
+        if self._is_valid_source("config.json"):
+            self.index_config(ConfigFile().deserialized)
+        else:
+            is_complete = False
+
+        if is_complete:
+            self.flush()
+        return self.deserialized
+
+    def index_dev_env_json(self, dev_env_json: dict) -> None:
+        """ Store the names of the local Development Environments.
+        
+            Args:
+                dev_env_json -- the deserialized dev_env.json
+        """
+        self.deserialized["dev_envs"] = [dev_env_descriptor["name"] for dev_env_descriptor 
+                                         in dev_env_json.get("development_environments", [])]
+
+    def index_config(self, config: dict) -> None:
+        """ Store the names of the registries, catalogs and hosts.
+        
+            Args:
+                config -- the deserialized config.json
+        """
+        for key in ("registries", "catalogs", "hosts"):
+            self.deserialized[key] = [item_config["name"] for item_config in config.get(key, [])]
+
+    def get_names(self, key: str) -> list[str]:
+        """ Get the indexed names.
+        
+            Args:
+                key -- "dev_envs", "registries", "catalogs" or "hosts"
+        """
+        return self.deserialized.get(key, [])
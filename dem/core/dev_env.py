@@ -3,13 +3,15 @@
 
 from dem.core.core import Core
 from dem.core.tool_images import ToolImages
-import json, os
+from typing import Iterable, SupportsIndex
+import json, os, re
 
 class DevEnv(Core):
     """ A Development Environment.
         
         Class variables:
             supported_tool_types -- supported tool types
+            cache_volume_prefix -- the prefix of the cache volume names
     """ 
     supported_tool_types = ( 
         "build system",
@@ -19,6 +21,7 @@ class DevEnv(Core):
         "test framework",
         "CI/CD server",
     )
+    cache_volume_prefix = "dem-cache"
 
     def __init__(self, descriptor: dict | None = None, 
                  dev_env_to_copy: "DevEnv | None" = None) -> None:
@@ -33,6 +36,11 @@ class DevEnv(Core):
         if descriptor:
             self.name: str = descriptor["name"]
             self.tools: str = descriptor["tools"]
+            self.lock: dict | None = descriptor.get("lock")
+            # The default docker run options of the Dev Env's containers.
+            self.run_options: list[str] = descriptor.get("run_options", [])
+            # The cache volumes by tool type, with their mount paths by name.
+            self.cache_volumes: dict[str, dict[str, str]] = descriptor.get("cache_volumes", {})
             if "True" == descriptor["installed"]:
                 self.is_installed = True
             else:
@@ -40,6 +48,40 @@ class DevEnv(Core):
         else:
             self.name = dev_env_to_copy.name
             self.tools = dev_env_to_copy.tools
+            self.lock = None
+            self.run_options = list(dev_env_to_copy.run_options)
+            self.cache_volumes = {tool_type: dict(volumes) for tool_type, volumes 
+                                  in dev_env_to_copy.cache_volumes.items()}
+            self.is_installed = False
+
+    def get_tool_images(self) -> list[str]:
+        """ Get the tool images of the Dev Env.
+
+            Return with the tool images in the repo:tag format.
+        """
+        return [tool["image_name"] + ":" + tool["image_version"] for tool in self.tools]
+
+    def get_cache_volume_name(self, volume: str) -> str:
+        """ Get the name of the container engine's volume for the Dev Env's cache volume.
+
+            Args:
+                volume -- the name of the cache volume in the descriptor
+        """
+        return re.sub(r"[^a-zA-Z0-9_.-]", "_", 
+                      "-".join((self.cache_volume_prefix, self.name, volume)))
+
+    def get_cache_volume_mounts(self) -> dict[str, dict[str, str]]:
+        """ Get the cache volumes to mount for each tool image of the Dev Env.
+
+            Return with the container engine's volume names and their mount paths by tool image.
+        """
+        cache_volume_mounts: dict[str, dict[str, str]] = {}
+        for tool in self.tools:
+            mounts = cache_volume_mounts.setdefault(tool["image_name"] + ":" + tool["image_version"], 
+                                                    {})
+            for volume, path in self.cache_volumes.get(tool["type"], {}).items():
+                mounts[self.get_cache_volume_name(volume)] = path
+        return cache_volume_mounts
 
     def check_image_availability(self, all_tool_images: ToolImages, 
                                  update_tool_image_store: bool = False,
@@ -49,6 +91,9 @@ class DevEnv(Core):
             Updates the "image_status" key for the tool dictionary.
             Returns with the statuses of the Dev Env tool images.
 
+            Only the Dev Env's own tool images get checked in the registries, so the registries 
+            don't need to be crawled.
+
             Args:
                 all_tool_images -- the images the Dev Envs can access
                 update_tool_images -- update the list of available tool images
@@ -57,26 +102,12 @@ class DevEnv(Core):
         if update_tool_image_store == True:
             all_tool_images.local.update()
             if local_only is False:
-                all_tool_images.registry.update()
-
-        local_tool_images = all_tool_images.local.elements
-
-        if local_only is True:
-            registry_tool_images = []
-        else:
-            registry_tool_images = all_tool_images.registry.elements
+                all_tool_images.registry.update(self.get_tool_images())
 
         image_statuses = []
         for tool in self.tools:
             tool_image_name = tool["image_name"] + ':' + tool["image_version"]
-            if (tool_image_name in local_tool_images) and (tool_image_name in registry_tool_images):
-                image_status = ToolImages.LOCAL_AND_REGISTRY
-            elif (tool_image_name in local_tool_images):
-                image_status = ToolImages.LOCAL_ONLY
-            elif (tool_image_name in registry_tool_images):
-                image_status = ToolImages.REGISTRY_ONLY
-            else:
-                image_status = ToolImages.NOT_AVAILABLE
+            image_status = all_tool_images.get_tool_image_status(tool_image_name, local_only)
             image_statuses.append(image_status)
             tool["image_status"] = image_status
 
@@ -105,6 +136,11 @@ class DevEnv(Core):
             "name": self.name,
             "tools": self.tools
         }
+
+        if self.run_options:
+            dev_env_json_deserialized["run_options"] = self.run_options
+        if self.cache_volumes:
+            dev_env_json_deserialized["cache_volumes"] = self.cache_volumes
         
         if omit_is_installed is False:
             if self.is_installed:
@@ -112,6 +148,10 @@ class DevEnv(Core):
             else:
                 dev_env_json_deserialized["installed"] = "False"
 
+            # The lock record is only valid on this machine.
+            if self.lock is not None:
+                dev_env_json_deserialized["lock"] = self.lock
+
         return dev_env_json_deserialized
 
     def export(self, path: str) -> None:
@@ -121,4 +161,184 @@ class DevEnv(Core):
                 path -- the path of the file to export the Dev Env to
         """
         with open(path, "w") as file:
-            json.dump(self.get_deserialized(True), file, indent=4)
\ No newline at end of file
+            json.dump(self.get_deserialized(True), file, indent=4)
+
+class DevEnvList(list):
+    """ List of Development Environments indexed by their names.
+
+        The name index gets updated by the list operations, so a Dev Env can be looked up in 
+        constant time. Rename the Dev Envs in the list with rename(), so the index can follow the 
+        change. If the names are not unique, the first Dev Env with the name is indexed.
+
+        The number of installed Dev Envs referencing each tool image is maintained as well. The 
+        list operations update the reference counts, but the install, the uninstall and the
+        modification of a Dev Env in the list must be followed by update_references().
+    """
+    def __init__(self, dev_envs: Iterable[DevEnv] = ()) -> None:
+        """ Init the list with the Dev Envs.
+        
+            Args:
+                dev_envs -- the initial Dev Envs
+        """
+        super().__init__(dev_envs)
+        self._index: dict[str, DevEnv] = {}
+        self._reindex()
+        self._reference_counts: dict[str, int] = {}
+        self._referenced_tool_images: dict[int, frozenset[str]] = {}
+        self._recount_references()
+
+    def _reindex(self) -> None:
+        """ Rebuild the whole index."""
+        self._index = {}
+        for dev_env in self:
+            self._index.setdefault(dev_env.name, dev_env)
+
+    def _reindex_name(self, name: str) -> None:
+        """ Index the first Dev Env with the name again, after one of them left the list.
+        
+            Args:
+                name -- the name to index
+        """
+        self._index.pop(name, None)
+        for dev_env in self:
+            if dev_env.name == name:
+                self._index[name] = dev_env
+                break
+
+    def _reference(self, dev_env: DevEnv) -> None:
+        """ Count the references of the Dev Env to its tool images, if it is installed.
+        
+            Args:
+                dev_env -- the Dev Env that joined the list or changed
+        """
+        tool_images = frozenset(dev_env.get_tool_images()) if dev_env.is_installed else frozenset()
+        self._referenced_tool_images[id(dev_env)] = tool_images
+        for tool_image in tool_images:
+            self._reference_counts[tool_image] = self._reference_counts.get(tool_image, 0) + 1
+
+    def _dereference(self, dev_env: DevEnv) -> None:
+        """ Drop the references the Dev Env had when it was last counted.
+        
+            Args:
+                dev_env -- the Dev Env that left the list or changed
+        """
+        for tool_image in self._referenced_tool_images.pop(id(dev_env), frozenset()):
+            self._reference_counts[tool_image] -= 1
+            if self._reference_counts[tool_image] == 0:
+                del self._reference_counts[tool_image]
+
+    def _recount_references(self) -> None:
+        """ Count all the references again."""
+        self._reference_counts = {}
+        self._referenced_tool_images = {}
+        for dev_env in self:
+            self._reference(dev_env)
+
+    def append(self, dev_env: DevEnv) -> None:
+        super().append(dev_env)
+        self._index.setdefault(dev_env.name, dev_env)
+        self._reference(dev_env)
+
+    def extend(self, dev_envs: Iterable[DevEnv]) -> None:
+        for dev_env in dev_envs:
+            self.append(dev_env)
+
+    def insert(self, index: SupportsIndex, dev_env: DevEnv) -> None:
+        super().insert(index, dev_env)
+        self._reindex()
+        self._reference(dev_env)
+
+    def remove(self, dev_env: DevEnv) -> None:
+        super().remove(dev_env)
+        self._reindex_name(dev_env.name)
+        self._dereference(dev_env)
+
+    def pop(self, index: SupportsIndex = -1) -> DevEnv:
+        dev_env = super().pop(index)
+        self._reindex_name(dev_env.name)
+        self._dereference(dev_env)
+        return dev_env
+
+    def clear(self) -> None:
+        super().clear()
+        self._index = {}
+        self._recount_references()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+        self._recount_references()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._reindex()
+        self._recount_references()
+
+    def __iadd__(self, dev_envs: Iterable[DevEnv]) -> "DevEnvList":
+        self.extend(dev_envs)
+        return self
+
+    def update_references(self, dev_env: DevEnv) -> None:
+        """ Count the references of a Dev Env of the list again, after it has been installed, 
+            uninstalled or modified. The Dev Envs not in the list are ignored.
+        
+            Args:
+                dev_env -- the Dev Env that changed
+        """
+        if id(dev_env) not in self._referenced_tool_images:
+            return
+        self._dereference(dev_env)
+        self._reference(dev_env)
+
+    def get_reference_count(self, tool_image: str) -> int:
+        """ Get the number of installed Dev Envs that require the tool image.
+        
+            Args:
+                tool_image -- the tool image in the repo:tag format
+        """
+        return self._reference_counts.get(tool_image, 0)
+
+    def get_unreferenced_tool_images(self, dev_env: DevEnv) -> list[str]:
+        """ Get the tool images of the Dev Env that no other installed Dev Env requires.
+
+            Only the tool images of the Dev Env get checked, so the cost doesn't depend on the 
+            number of the Dev Envs.
+        
+            Args:
+                dev_env -- the Dev Env of the list
+
+            Return with the tool images in the repo:tag format.
+        """
+        own_references = self._referenced_tool_images.get(id(dev_env), frozenset())
+        return [tool_image for tool_image in dict.fromkeys(dev_env.get_tool_images())
+                if self.get_reference_count(tool_image) == (tool_image in own_references)]
+
+    def get_by_name(self, name: str) -> DevEnv | None:
+        """ Get the Dev Env by name.
+        
+            Args:
+                name -- name of the Dev Env to get
+
+            If the name is missing from the index or it indexes a Dev Env with another name, a Dev 
+            Env may have been renamed directly instead of with rename(), so the index gets rebuilt 
+            and checked again.
+
+            Return with the Dev Env, or None if it's not in the list.
+        """
+        dev_env = self._index.get(name)
+        if dev_env is None or dev_env.name != name:
+            self._reindex()
+            dev_env = self._index.get(name)
+        return dev_env
+
+    def rename(self, dev_env: DevEnv, new_name: str) -> None:
+        """ Rename a Dev Env of the list.
+        
+            Args:
+                dev_env -- the Dev Env to rename
+                new_name -- the new name
+        """
+        old_name = dev_env.name
+        dev_env.name = new_name
+        self._reindex_name(old_name)
+        self._index.setdefault(new_name, dev_env)
@@ -1,24 +1,169 @@
 """Development Environment Catalog."""
 # dem/core/dev_env_catalog.py
 
-from dem.core.dev_env import DevEnv
-from dem.core.data_management import ConfigFile
+from dem.core.dev_env import DevEnv, DevEnvList
+from dem.core.data_management import ConfigFile, CatalogCacheFile
 from dem.core.core import Core
-import requests
+from dem.core.exceptions import CatalogError
+from dem.core.lazy_import import lazy_import
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+requests = lazy_import("requests")
 
 class DevEnvCatalog():
-    """ Development Environment Catalog. """
-    def __init__(self, catalog_config: dict) -> None:
-        """ Init the class with the DevEnvs available in the catalog. 
+    """ Development Environment Catalog. 
+    
+        The downloaded catalog is saved as a snapshot to the cache file (if given). The snapshot is
+        revalidated with a conditional request, and it's used if the catalog can't be reached or 
+        the offline mode is set.
+
+        Class variables:
+            _default_timeout -- the timeout of a request in seconds, if the catalog config doesn't
+                                set the "timeout" key
+            _default_retries -- the number of retries after a connection error or timeout, if the 
+                                catalog config doesn't set the "retries" key
+            offline -- use only the snapshots without accessing the network
+    """
+    _default_timeout = 1
+    _default_retries = 1
+    offline = False
+
+    def __init__(self, catalog_config: dict, session: "requests.Session | None" = None, 
+                 cache_file: CatalogCacheFile | None = None) -> None:
+        """ Init the class with the catalog config. The DevEnvs available in the catalog get 
+            downloaded by update().
 
             Args:
-                url -- the url of the catalog
+                catalog_config -- the catalog's config
+                session -- the HTTP session to use for the requests
+                cache_file -- stores the snapshots of the catalogs
         """
         self.config: dict = catalog_config
         self.url: str = catalog_config["url"]
-        self.dev_envs: list[DevEnv] = []
-        for dev_env_descriptor in requests.get(self.url, timeout=1).json()["development_environments"]:
-            self.dev_envs.append(DevEnv(descriptor=dev_env_descriptor))
+        self._session = session if session is not None else requests.Session()
+        self._cache_file = cache_file
+        self._timeout: float = catalog_config.get("timeout", self._default_timeout)
+        self._retries: int = catalog_config.get("retries", self._default_retries)
+        self._set_dev_env_descriptors([])
+
+    def _set_dev_env_descriptors(self, dev_env_descriptors: list[dict]) -> None:
+        """ Set the descriptors of the DevEnvs and index them by name.
+
+            Args:
+                dev_env_descriptors -- the descriptors from the catalog
+        """
+        self._dev_env_descriptors = dev_env_descriptors
+        self._dev_env_descriptors_by_name: dict[str, dict] = {}
+        for dev_env_descriptor in dev_env_descriptors:
+            self._dev_env_descriptors_by_name.setdefault(dev_env_descriptor["name"], 
+                                                         dev_env_descriptor)
+        self._dev_envs: DevEnvList | None = None
+        self._dev_envs_by_name: dict[str, DevEnv] = {}
+
+    @property
+    def dev_envs(self) -> DevEnvList:
+        """ The DevEnvs available in the catalog indexed by their names.
+        
+            The DevEnvs get created only at the first access.
+        """
+        if self._dev_envs is None:
+            self._dev_envs = DevEnvList(self._get_dev_env(dev_env_descriptor) 
+                                        for dev_env_descriptor in self._dev_env_descriptors)
+        return self._dev_envs
+
+    @dev_envs.setter
+    def dev_envs(self, dev_envs: list[DevEnv]) -> None:
+        if not isinstance(dev_envs, DevEnvList):
+            dev_envs = DevEnvList(dev_envs)
+        self._dev_envs = dev_envs
+
+    def _get_dev_env(self, dev_env_descriptor: dict) -> DevEnv:
+        """ Return with the DevEnv of the descriptor. Every DevEnv gets created only once."""
+        name = dev_env_descriptor["name"]
+        if name not in self._dev_envs_by_name:
+            self._dev_envs_by_name[name] = DevEnv(descriptor=dev_env_descriptor)
+        return self._dev_envs_by_name[name]
+
+    def _get_snapshot(self) -> dict | None:
+        """ Return with the stored snapshot of the catalog, or None if there is no snapshot."""
+        if self._cache_file is None:
+            return None
+        return self._cache_file.deserialized.get(self.url)
+
+    def _request_catalog(self, snapshot: dict | None) -> "requests.Response":
+        """ Request the catalog. If a snapshot is available, the request is conditional.
+        
+            Args:
+                snapshot -- the stored snapshot of the catalog
+        """
+        headers = {}
+        if snapshot is not None and snapshot.get("etag"):
+            headers["If-None-Match"] = snapshot["etag"]
+
+        for attempt in range(self._retries + 1):
+            try:
+                return self._session.get(self.url, headers=headers, timeout=self._timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == self._retries:
+                    raise
+
+    def _parse_catalog(self, response: "requests.Response") -> dict:
+        """ Parse and validate the downloaded catalog.
+
+            Args:
+                response -- the response to the catalog request
+
+            Raise a ValueError if the response is not a valid catalog.
+        """
+        catalog = response.json()
+        if not isinstance(catalog, dict) or \
+           not isinstance(catalog.get("development_environments"), list) or \
+           not all(isinstance(dev_env_descriptor, dict) and "name" in dev_env_descriptor
+                   for dev_env_descriptor in catalog["development_environments"]):
+            raise ValueError(f"Invalid catalog: {self.url}")
+        return catalog
+
+    def update(self) -> None:
+        """ Update the DevEnvs available in the catalog.
+
+            The snapshot is only replaced by a successfully downloaded and valid catalog.
+        
+            Exceptions:
+                CatalogError -- if the catalog is not available and there is no snapshot of it
+        """
+        snapshot = self._get_snapshot()
+
+        if self.offline:
+            if snapshot is None:
+                raise CatalogError(f"Error: No snapshot of the {self.url} catalog is available in offline mode.")
+            catalog = snapshot["catalog"]
+        else:
+            try:
+                response = self._request_catalog(snapshot)
+                if snapshot is not None and response.status_code == requests.codes.not_modified:
+                    catalog = snapshot["catalog"]
+                else:
+                    if response.status_code != requests.codes.ok:
+                        raise requests.exceptions.HTTPError(f"{response.status_code} response from {self.url}",
+                                                            response=response)
+                    # The requests' JSONDecodeError is a ValueError too.
+                    catalog = self._parse_catalog(response)
+                    snapshot = {
+                        "catalog": catalog,
+                        "etag": response.headers.get("ETag"),
+                    }
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, 
+                    requests.exceptions.HTTPError, ValueError) as e:
+                if snapshot is None:
+                    raise CatalogError(f"Error: The {self.url} catalog is not available.") from e
+                catalog = snapshot["catalog"]
+            else:
+                if self._cache_file is not None:
+                    snapshot["fetched_at"] = time.time()
+                    self._cache_file.deserialized[self.url] = snapshot
+
+        self._set_dev_env_descriptors(catalog["development_environments"])
 
     def get_dev_env_by_name(self, dev_env_name: str) -> DevEnv | None:
         """ Get the Development Environment by name.
@@ -28,31 +173,87 @@ class DevEnvCatalog():
             Return with the instance representing the Development Environment. If the Development 
             Environment doesn't exist in the catalog, return with None.
         """
-        for dev_env in self.dev_envs:
-            if dev_env.name == dev_env_name:
-                return dev_env
+        if self._dev_envs is not None:
+            return self._dev_envs.get_by_name(dev_env_name)
+
+        # Only the requested DevEnv gets created.
+        dev_env_descriptor = self._dev_env_descriptors_by_name.get(dev_env_name)
+        if dev_env_descriptor is not None:
+            return self._get_dev_env(dev_env_descriptor)
+
+    def get_dev_env_names(self) -> list[str]:
+        """ Return with the names of the DevEnvs available in the catalog."""
+        if self._dev_envs is not None:
+            return [dev_env.name for dev_env in self._dev_envs]
+        return list(self._dev_env_descriptors_by_name)
 
 class DevEnvCatalogs(Core):
-    """ List of the available Development Environment Catalogs. """
-    def __init__(self, config_file: ConfigFile) -> None:
+    """ List of the available Development Environment Catalogs. 
+    
+        The catalogs are downloaded concurrently over a shared HTTP session, so the connections can
+        be reused.
+
+        Class variables:
+            _max_workers -- the maximum number of catalogs downloaded at the same time
+    """
+    _max_workers = 8
+
+    def __init__(self, config_file: ConfigFile, cache_file: CatalogCacheFile | None = None) -> None:
         """ Init the class with the catalogs from the config file.
 
             Args:
                 config_file -- contains the catalog descriptions
+                cache_file -- stores the snapshots of the catalogs
             """
         self._config_file: ConfigFile = config_file
+        self._cache_file = cache_file
+        self._session = self._create_session()
+        self._dev_env_index: dict[str, DevEnvCatalog] | None = None
         self.catalogs: list[DevEnvCatalog] = []
-        for catalog_config in config_file.catalogs:
-            self._try_to_add_catalog(catalog_config)
+
+        catalogs = [DevEnvCatalog(catalog_config, self._session, self._cache_file) 
+                    for catalog_config in config_file.catalogs]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [executor.submit(catalog.update) for catalog in catalogs]
+
+        # Keep the order of the config file.
+        for catalog, future in zip(catalogs, futures):
+            try:
+                future.result()
+            except Exception as e:
+                self._report_catalog_error(e)
+            else:
+                self.catalogs.append(catalog)
+
+        self._flush_cache()
+
+    def _flush_cache(self) -> None:
+        """ Save the snapshots of the catalogs."""
+        if self._cache_file is not None and not DevEnvCatalog.offline:
+            self._cache_file.flush()
+
+    def _create_session(self) -> "requests.Session":
+        """ Create the HTTP session shared by the catalogs."""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self._max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _report_catalog_error(self, exception: Exception) -> None:
+        self.user_output.error(str(exception))
+        self.user_output.error("Error: Couldn't add this Development Environment Catalog.")
 
     def _try_to_add_catalog(self, catalog_config: dict) -> bool:
         try:
-            self.catalogs.append(DevEnvCatalog(catalog_config))
+            catalog = DevEnvCatalog(catalog_config, self._session, self._cache_file)
+            catalog.update()
         except Exception as e:
-            self.user_output.error(str(e))
-            self.user_output.error("Error: Couldn't add this Development Environment Catalog.")
+            self._report_catalog_error(e)
             return False
         else:
+            self.catalogs.append(catalog)
+            self._dev_env_index = None
             return True
 
     def add_catalog(self, catalog_config: dict) -> None:
@@ -64,6 +265,28 @@ class DevEnvCatalogs(Core):
         if self._try_to_add_catalog(catalog_config):
             self._config_file.catalogs.append(catalog_config)
             self._config_file.flush()
+            self._flush_cache()
+
+    def get_dev_env_by_name(self, dev_env_name: str) -> DevEnv | None:
+        """ Get the Development Environment by name from the catalogs.
+
+            The catalogs are searched in the order of the config file. The merged index of the 
+            catalogs' DevEnv names is built at the first lookup.
+
+            Args:
+                dev_env_name -- name of the Development Environment to get
+            Return with the instance representing the Development Environment. If the Development 
+            Environment doesn't exist in any of the catalogs, return with None.
+        """
+        if self._dev_env_index is None:
+            self._dev_env_index = {}
+            for catalog in self.catalogs:
+                for name in catalog.get_dev_env_names():
+                    self._dev_env_index.setdefault(name, catalog)
+
+        catalog = self._dev_env_index.get(dev_env_name)
+        if catalog is not None:
+            return catalog.get_dev_env_by_name(dev_env_name)
 
     def list_catalog_configs(self) -> list[dict]:
         """ List the catalog configs. (As stored in the config file.)
@@ -81,6 +304,11 @@ class DevEnvCatalogs(Core):
         for catalog in self.catalogs.copy():
             if catalog.config == catalog_config:
                 self.catalogs.remove(catalog)
+        self._dev_env_index = None
 
         self._config_file.catalogs.remove(catalog_config)
-        self._config_file.flush()
\ No newline at end of file
+        self._config_file.flush()
+
+        if self._cache_file is not None and \
+            self._cache_file.deserialized.pop(catalog_config["url"], None) is not None:
+            self._cache_file.flush()
\ No newline at end of file
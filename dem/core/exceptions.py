@@ -13,6 +13,10 @@ class RegistryError(Exception):
     """Raised when the communication with registry fails."""
     pass
 
+class CatalogError(Exception):
+    """Raised when a Development Environment Catalog is not available."""
+    pass
+
 class ContainerEngineError(Exception):
     """Raised when there is a problem with the container engine."""
 
@@ -0,0 +1,100 @@
+"""Download plan of the tool images."""
+# dem/core/install_plan.py
+
+from dem.core.container_engine import get_chain_ids
+
+class InstallPlan():
+    """ The layers to download for the tool images, deduplicated across the tools.
+
+        A layer is identified by the digest of its compressed blob. A layer doesn't need to be
+        downloaded if its chain ID is already present locally, so it is only reused if the layers
+        below it are the same too.
+    """
+    def __init__(self, image_layers: dict[str, list[dict]], local_chain_ids: set[str],
+                 unavailable_tool_images: list[str] | None = None) -> None:
+        """ Init the class.
+
+            Args:
+                image_layers -- the layers of the tool images to pull, as returned by the registries
+                local_chain_ids -- the chain IDs of the local layers
+                unavailable_tool_images -- the tool images whose layers couldn't be obtained
+        """
+        self.tool_images = list(image_layers)
+        self.unavailable_tool_images = unavailable_tool_images or []
+        # The layers to download by digest, with the tool images that need them.
+        self.layers: dict[str, dict] = {}
+        # The chain IDs of the needed layers that are already present locally.
+        self.local_chain_ids: set[str] = set()
+        self._image_layer_digests: dict[str, list[str]] = {}
+
+        for tool_image, layers in image_layers.items():
+            self._image_layer_digests[tool_image] = []
+            for layer, chain_id in zip(layers, get_chain_ids([layer["diff_id"] for layer in layers])):
+                if chain_id in local_chain_ids:
+                    self.local_chain_ids.add(chain_id)
+                    continue
+                planned_layer = self.layers.setdefault(layer["digest"], {"size": layer["size"],
+                                                                         "tool_images": []})
+                if tool_image not in planned_layer["tool_images"]:
+                    planned_layer["tool_images"].append(tool_image)
+                    self._image_layer_digests[tool_image].append(layer["digest"])
+
+    @property
+    def local_layer_count(self) -> int:
+        """ The number of the needed layers already present locally, each layer counted once."""
+        return len(self.local_chain_ids)
+
+    @property
+    def download_size(self) -> int:
+        """ The total number of bytes to download, each layer counted once."""
+        return sum(layer["size"] for layer in self.layers.values())
+
+    @property
+    def shared_layer_count(self) -> int:
+        """ The number of layers to download that are needed by several tools."""
+        return sum(1 for layer in self.layers.values() if len(layer["tool_images"]) > 1)
+
+    def get_layer_count(self, tool_image: str) -> int:
+        """ Get the number of the layers to download for the tool image.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+        """
+        return len(self._image_layer_digests[tool_image])
+
+    def get_download_size(self, tool_image: str) -> int:
+        """ Get the number of bytes to download for the tool image, including the shared layers.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+        """
+        return sum(self.layers[digest]["size"] for digest in self._image_layer_digests[tool_image])
+
+    def get_shared_size(self, tool_image: str) -> int:
+        """ Get the number of bytes of the tool image's layers that other tools need too.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+        """
+        return sum(self.layers[digest]["size"] for digest in self._image_layer_digests[tool_image]
+                   if len(self.layers[digest]["tool_images"]) > 1)
+
+    def _get_largest_unique_layer_size(self, tool_image: str) -> int:
+        """ Get the size of the tool image's largest layer that no other tool needs.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+        """
+        return max((self.layers[digest]["size"] for digest in self._image_layer_digests[tool_image]
+                    if len(self.layers[digest]["tool_images"]) == 1), default=0)
+
+    def get_pull_order(self) -> list[str]:
+        """ Get the order to start the pulls in.
+
+            The tool images with the largest unique layers are started first, so the longest
+            downloads don't end up at the tail of the install. The shared layers are downloaded
+            once, because the container engine joins the pulls that download the same layer.
+        """
+        return sorted(self.tool_images,
+                      key=lambda tool_image: (-self._get_largest_unique_layer_size(tool_image),
+                                              -self.get_download_size(tool_image), tool_image))
@@ -0,0 +1,25 @@
+"""Deferred import of the heavy third-party modules."""
+# dem/core/lazy_import.py
+
+import importlib.util, sys
+from types import ModuleType
+
+def lazy_import(name: str) -> ModuleType:
+    """ Import a module that gets executed only at the first attribute access.
+
+        The docker and requests packages take most of the CLI's startup time, but a lot of commands
+        never use them. If the module has already been imported, the loaded module is returned.
+
+        Args:
+            name -- the name of the module to import
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -1,17 +1,20 @@
 """Repesents the Development Platform. The platform resources can be accessed through this interface.  
 """
 
-import os
+import copy, os, time
 from typing import Any
 from dem.core.core import Core
 from dem.core.properties import __supported_dev_env_major_version__
 from dem.core.exceptions import InvalidDevEnvJson, PlatformError, ContainerEngineError
 from dem.core.dev_env_catalog import DevEnvCatalogs
-from dem.core.data_management import LocalDevEnvJSON, ConfigFile
+from dem.core.data_management import LocalDevEnvJSON, ConfigFile, RegistryCacheFile, CatalogCacheFile, \
+                                     LocalImageIndexFile, ToolImageUsageFile, \
+                                     WarmContainersFile
 from dem.core.container_engine import ContainerEngine
 from dem.core.registry import Registries
+from dem.core.install_plan import InstallPlan
 from dem.core.tool_images import ToolImages
-from dem.core.dev_env import DevEnv
+from dem.core.dev_env import DevEnv, DevEnvList
 from dem.core.hosts import Hosts
 
 class Platform(Core):
@@ -26,8 +29,26 @@ class Platform(Core):
             _regisitries -- managing the registries
             _config_file -- contains the DEM configuration
             update_tool_images_on_instantiation -- can be used to disable tool update if not needed
+            update_status_messages -- the reported result of the tool image update statuses
+            _tool_image_usage_resolution -- the tool image usage older than this many seconds gets
+                                            recorded again
     """
     update_tool_images_on_instantiation = True
+    _tool_image_usage_resolution = 3600
+    (
+        UP_TO_DATE,
+        UPDATE,
+        PULL,
+        UNKNOWN,
+        NOT_AVAILABLE,
+    ) = range(5)
+    update_status_messages = {
+        UP_TO_DATE: "up to date",
+        UPDATE: "updated",
+        PULL: "pulled",
+        UNKNOWN: "not checked, the digest is not available in the registries",
+        NOT_AVAILABLE: "[red]not available locally or in the registries[/]",
+    }
 
     def _dev_env_json_version_check(self) -> None:
         """ Check that the json file is supported.
@@ -40,21 +61,77 @@ class Platform(Core):
             raise InvalidDevEnvJson("The dev_env.json version v1.0 is not supported.")
 
     def __init__(self) -> None:
-        """ Init the class, by creating a list of the Development Environments."""
-
-        self.dev_env_json = LocalDevEnvJSON()
-        self.version: str = self.dev_env_json.deserialized["version"]
-        self._dev_env_json_version_check()
+        """ Init the class.
+        
+            The dev_env.json gets loaded only when the local Development Environments are first
+            accessed, so the commands that don't need them can start faster.
+        """
+        self._dev_env_json = None
+        self._version = None
+        self._local_dev_envs = None
         self._dev_env_catalogs = None
         self._tool_images = None
         self._container_engine = None
         self._registries = None
         self._config_file = None
         self._hosts = None
+        self._tool_image_usage = None
+        # The descriptors as last read or written by this process, to find its own changes.
+        self._flushed_descriptors: dict[str, dict] | None = None
+
+    def _load_dev_env_json(self) -> None:
+        """ Load the dev_env.json and create the list of the local Development Environments."""
+        self._dev_env_json = LocalDevEnvJSON()
+        self._version = self._dev_env_json.deserialized["version"]
+        self._dev_env_json_version_check()
+
+        self._local_dev_envs = DevEnvList(DevEnv(descriptor=dev_env_descriptor) for dev_env_descriptor 
+                                          in self._dev_env_json.deserialized["development_environments"])
+        self._flushed_descriptors = self._get_descriptors_by_name()
+
+    @property
+    def dev_env_json(self) -> LocalDevEnvJSON:
+        """ The dev_env.json file.
+
+            The dev_env.json gets loaded only at the first access.
+        """
+        if self._dev_env_json is None:
+            self._load_dev_env_json()
+        return self._dev_env_json
 
-        self.local_dev_envs: list[DevEnv] = []
-        for dev_env_descriptor in self.dev_env_json.deserialized["development_environments"]:
-            self.local_dev_envs.append(DevEnv(descriptor=dev_env_descriptor))
+    @dev_env_json.setter
+    def dev_env_json(self, dev_env_json: LocalDevEnvJSON) -> None:
+        self._dev_env_json = dev_env_json
+
+    @property
+    def version(self) -> str:
+        """ The version of the dev_env.json.
+
+            The dev_env.json gets loaded only at the first access.
+        """
+        if self._version is None:
+            self._load_dev_env_json()
+        return self._version
+
+    @version.setter
+    def version(self, version: str) -> None:
+        self._version = version
+
+    @property
+    def local_dev_envs(self) -> DevEnvList:
+        """ The local Development Environments indexed by their names.
+
+            The dev_env.json gets loaded only at the first access.
+        """
+        if self._local_dev_envs is None:
+            self._load_dev_env_json()
+        return self._local_dev_envs
+
+    @local_dev_envs.setter
+    def local_dev_envs(self, local_dev_envs: list[DevEnv]) -> None:
+        if not isinstance(local_dev_envs, DevEnvList):
+            local_dev_envs = DevEnvList(local_dev_envs)
+        self._local_dev_envs = local_dev_envs
 
     @property
     def tool_images(self) -> ToolImages:
@@ -74,7 +151,7 @@ class Platform(Core):
             The ContainerEngine() gets instantiated only at the first access.
         """
         if self._container_engine is None:
-            self._container_engine = ContainerEngine()
+            self._container_engine = ContainerEngine(LocalImageIndexFile(), WarmContainersFile())
 
         return self._container_engine
 
@@ -85,7 +162,8 @@ class Platform(Core):
             The Registries() gets instantiated only at the first access.
         """
         if self._registries is None:
-            self._registries = Registries(self.container_engine, self.config_file)
+            self._registries = Registries(self.container_engine, self.config_file, 
+                                          RegistryCacheFile())
 
         return self._registries
 
@@ -107,7 +185,7 @@ class Platform(Core):
             The DevEnvCatalogs() gets instantiated only at the first access.
         """
         if self._dev_env_catalogs is None:
-            self._dev_env_catalogs = DevEnvCatalogs(self.config_file)
+            self._dev_env_catalogs = DevEnvCatalogs(self.config_file, CatalogCacheFile())
 
         return self._dev_env_catalogs
 
@@ -122,6 +200,17 @@ class Platform(Core):
 
         return self._hosts
 
+    @property
+    def tool_image_usage(self) -> ToolImageUsageFile:
+        """ The time each tool image was last used.
+        
+            The ToolImageUsageFile() gets instantiated only at the first access.
+        """
+        if self._tool_image_usage is None:
+            self._tool_image_usage = ToolImageUsageFile()
+
+        return self._tool_image_usage
+
     def get_deserialized(self) -> dict:
             """ Create the deserialized json. 
             
@@ -145,59 +234,387 @@ class Platform(Core):
             Return with the instance representing the Development Environment. If the Development 
             Environment doesn't exist in the setup, return with None.
         """
-        for dev_env in self.local_dev_envs:
-            if dev_env.name == dev_env_name:
-                return dev_env
+        return self.local_dev_envs.get_by_name(dev_env_name)
+
+    def _get_tool_image_update_statuses(self, dev_env: DevEnv, 
+                                        check_times: dict[str, float] | None = None) -> dict[str, int]:
+        """ Compare the manifest digests of the tool images in the registries with the digests 
+            the local images were pulled by.
 
-    def install_dev_env(self, dev_env_to_install: DevEnv) -> None:
+            Args:
+                dev_env -- the Development Environment to check
+                check_times -- if set, the time of each tool image's check in seconds gets stored 
+                               in it
+
+            Return with the update status of each tool image: UP_TO_DATE, UPDATE, PULL, UNKNOWN if
+            the digest is not available in the registries, or NOT_AVAILABLE if the tool image is 
+            neither local nor in the registries.
+        """
+        tool_images = dev_env.get_tool_images()
+        remote_digests = self.registries.get_manifest_digests(tool_images, check_times)
+        local_digests = self.container_engine.get_repo_digests(tool_images)
+
+        statuses = {}
+        for tool_image in tool_images:
+            if tool_image not in local_digests:
+                if tool_image in remote_digests:
+                    statuses[tool_image] = self.PULL
+                else:
+                    statuses[tool_image] = self.NOT_AVAILABLE
+            elif tool_image not in remote_digests:
+                statuses[tool_image] = self.UNKNOWN
+            elif remote_digests[tool_image] in local_digests[tool_image]:
+                statuses[tool_image] = self.UP_TO_DATE
+            else:
+                statuses[tool_image] = self.UPDATE
+        return statuses
+
+    def get_install_plan(self, dev_env: DevEnv, 
+                         tool_images_to_pull: list[str] | None = None) -> InstallPlan:
+        """ Plan the download of the tool images without pulling them.
+
+            The layers of the tool images are obtained from the registries concurrently, and 
+            checked against the layers of all the local images.
+
+            Args:
+                dev_env -- the Development Environment to install
+                tool_images_to_pull -- the tool images to plan (the ones not available locally if 
+                                       None)
+        """
+        if tool_images_to_pull is None:
+            tool_images = dev_env.get_tool_images()
+            local_tool_images = self.container_engine.resolve_local_images(tool_images)
+            tool_images_to_pull = [tool_image for tool_image in tool_images 
+                                   if tool_image not in local_tool_images]
+
+        image_layers = self.registries.get_image_layers(tool_images_to_pull)
+        return InstallPlan(image_layers, self.container_engine.get_local_layer_chain_ids(), 
+                           [tool_image for tool_image in tool_images_to_pull 
+                            if tool_image not in image_layers])
+
+    def _order_pulls(self, dev_env: DevEnv, tool_images_to_pull: list[str]) -> list[str]:
+        """ Order the pulls by the install plan. 
+
+            The tool images whose layers couldn't be obtained are pulled last. If all the pulls 
+            get started at once, their order doesn't matter, so the install plan isn't obtained: 
+            its manifest requests would count towards the pull rate limit of the registries.
+
+            Args:
+                dev_env -- the Development Environment to install
+                tool_images_to_pull -- the tool images to pull
+        """
+        if len(tool_images_to_pull) <= self.config_file.max_parallel_pulls:
+            return tool_images_to_pull
+
+        install_plan = self.get_install_plan(dev_env, tool_images_to_pull)
+        return install_plan.get_pull_order() + install_plan.unavailable_tool_images
+
+    def install_dev_env(self, dev_env_to_install: DevEnv, update: bool = False) -> None:
         """ Install the Dev Env by pulling the required images.
+
+            The images get pulled in parallel. The maximum number of simultaneous pulls is set in 
+            the config file. If there are more pulls than that, they are started in the order of the 
+            install plan.
+
+            In update mode the local tool images are checked against the registries as well. Only 
+            the tool images whose manifest digest differs get pulled, and the result of each tool
+            gets reported with the time of its check and its pull. A tool image that is neither 
+            local nor in the registries is reported as not available, and doesn't get pulled.
+
+            Exceptions:
+                PlatformError -- if the install fails
         
             Args:
                 dev_env_to_install -- the Development Environment to install
+                update -- pull the tool images that have changed in the registries
         """
-        for tool_image in dev_env_to_install.get_registry_only_tool_images(self.tool_images, False):
-            self.user_output.msg(f"\nPulling image {tool_image}", is_title=True)            
-            try:                
-                self.container_engine.pull(tool_image)
-            except ContainerEngineError:
+        check_times: dict[str, float] = {}
+        pull_times: dict[str, float] = {}
+        if update:
+            update_statuses = self._get_tool_image_update_statuses(dev_env_to_install, check_times)
+            tool_images_to_pull = sorted(tool_image for tool_image, status in update_statuses.items() 
+                                         if status in (self.PULL, self.UPDATE))
+        else:
+            tool_images_to_pull = sorted(dev_env_to_install.get_registry_only_tool_images(self.tool_images, 
+                                                                                         True))
+
+        if tool_images_to_pull:
+            tool_images_to_pull = self._order_pulls(dev_env_to_install, tool_images_to_pull)
+            self.user_output.msg(f"\nPulling images: {', '.join(tool_images_to_pull)}", 
+                                 is_title=True)
+            try:
+                self.container_engine.pull_images(tool_images_to_pull, 
+                                                  self.config_file.max_parallel_pulls, pull_times)
+            except ContainerEngineError as e:
+                self.user_output.error(str(e))
                 raise PlatformError("Dev Env install failed.")
 
+        if update:
+            for tool_image, status in update_statuses.items():
+                durations = []
+                if tool_image in check_times:
+                    durations.append(f"checked in {check_times[tool_image]:.2f}s")
+                if tool_image in pull_times:
+                    durations.append(f"pulled in {pull_times[tool_image]:.2f}s")
+                report = f"{tool_image}: {self.update_status_messages[status]}"
+                if durations:
+                    report += " (" + ", ".join(durations) + ")"
+                self.user_output.msg(report)
+
         dev_env_to_install.is_installed = "True"
+        self.local_dev_envs.update_references(dev_env_to_install)
+        self.lock_dev_env(dev_env_to_install)
         self.flush_descriptors()
+        self.record_tool_image_usage(dev_env_to_install.get_tool_images())
+
+    def lock_dev_env(self, dev_env_to_lock: DevEnv) -> None:
+        """ Record the content digests of the Dev Env's tool images and the fingerprint of the local
+            image store, so later the Dev Env can be validated without inspecting its tool images.
+
+            The descriptors need to be flushed to persist the lock record.
+
+            Args:
+                dev_env_to_lock -- the Development Environment to lock
+        """
+        image_ids = self.container_engine.get_local_image_ids(dev_env_to_lock.get_tool_images())
+        dev_env_to_lock.lock = {
+            "digests": image_ids,
+            "fingerprint": self.container_engine.get_fingerprint(image_ids),
+        }
 
-    def uninstall_dev_env(self, dev_env_to_uninstall: DevEnv) -> None:
+    def is_dev_env_lock_valid(self, dev_env: DevEnv) -> bool:
+        """ Check whether all the tool images of the Dev Env are still the same as at the time of 
+            locking.
+
+            Args:
+                dev_env -- the Development Environment to check
+
+            Return with False if the Dev Env is not locked, its tools have changed, or the local
+            image store doesn't match the fingerprint.
+        """
+        if dev_env.lock is None:
+            return False
+
+        tool_images = dev_env.get_tool_images()
+        if set(dev_env.lock.get("digests", {})) != set(tool_images):
+            return False
+
+        image_ids = self.container_engine.get_local_image_ids(tool_images)
+        return self.container_engine.get_fingerprint(image_ids) == dev_env.lock.get("fingerprint")
+
+    def uninstall_dev_env(self, dev_env_to_uninstall: DevEnv, prune: bool = False) -> None:
         """ Uninstall the Dev Env by removing the images not required anymore.
 
+            The tool images not required by other installed Dev Envs are looked up in the reference
+            counts of the local Dev Envs, and removed concurrently.
+
             Exceptions:
                 PlatformError -- if the uninstall fails
         
             Args:
                 dev_env_to_uninstall -- the Development Environment to uninstall
+                prune -- remove the dangling images afterwards, with a single request
         """
-        all_required_tool_images = set()
-        for dev_env in self.local_dev_envs:
-            if (dev_env is not dev_env_to_uninstall) and dev_env.is_installed:
-                for tool in dev_env.tools:
-                    all_required_tool_images.add(tool["image_name"] + ":" + tool["image_version"])
+        tool_images_to_remove = self.local_dev_envs.get_unreferenced_tool_images(dev_env_to_uninstall)
 
-        for tool in dev_env_to_uninstall.tools:
-            tool_image = tool["image_name"] + ":" + tool["image_version"]
-            if tool_image in all_required_tool_images:
+        for tool_image in dict.fromkeys(dev_env_to_uninstall.get_tool_images()):
+            if tool_image not in tool_images_to_remove:
                 self.user_output.msg(f"\nThe tool image [bold]{tool_image}[/bold] is required by another Development Environment. It won't be deleted.")
+
+        if self.container_engine.remove_images(tool_images_to_remove):
+            raise PlatformError("Dev Env uninstall failed.")
+
+        if prune:
+            try:
+                space_reclaimed = self.container_engine.prune_images()
+            except ContainerEngineError as e:
+                self.user_output.error(str(e))
             else:
-                try:
-                    self.container_engine.remove(tool_image)
-                except ContainerEngineError:
-                    raise PlatformError("Dev Env uninstall failed.")
+                self.user_output.msg(f"\nPruned the dangling images. Reclaimed {space_reclaimed / 1e6:.1f} MB.")
             
         dev_env_to_uninstall.is_installed = False
+        dev_env_to_uninstall.lock = None
+        self.local_dev_envs.update_references(dev_env_to_uninstall)
         self.flush_descriptors()
 
+    def record_tool_image_usage(self, tool_images: list[str]) -> None:
+        """ Record the current time as the last use of the tool images.
+
+            The file is locked while it's updated, so the concurrent dem processes don't lose each 
+            other's records. The eviction order doesn't need a precise time, so the file is only 
+            written if a recorded usage is older than the resolution.
+
+            Args:
+                tool_images -- the used tool images in the repo:tag format
+        """
+        now = time.time()
+        if all(now - self.tool_image_usage.deserialized.get(tool_image, 0) < self._tool_image_usage_resolution
+               for tool_image in tool_images):
+            return
+
+        with self.tool_image_usage.lock():
+            self.tool_image_usage.update()
+            for tool_image in tool_images:
+                self.tool_image_usage.deserialized[tool_image] = now
+            self.tool_image_usage.flush()
+
+    def get_image_disk_usage(self) -> tuple[int, dict[str, dict]]:
+        """ Get the disk usage of the local images.
+
+            Exceptions:
+                PlatformError -- if the disk usage is not available
+
+            Return with the total size of the image layers, and the tags and the unshared size of 
+            each tagged image by image ID.
+        """
+        try:
+            return self.container_engine.get_image_disk_usage()
+        except ContainerEngineError as e:
+            raise PlatformError(str(e))
+
+    def get_gc_candidates(self, images: dict[str, dict]) -> list[dict]:
+        """ Get the local tool images no installed Dev Env requires, least recently used first.
+
+            Only the tool images known by dem are candidates: the ones with a recorded usage and 
+            the ones in the local Dev Envs. The tool images without a recorded usage come first.
+
+            Args:
+                images -- the tags and the unshared size of the local images by image ID
+
+            Return with the candidates, each with the "tool_image", the "last_used" time (None if 
+            unknown) and the "image_id".
+        """
+        known_tool_images = dict.fromkeys(self.tool_image_usage.deserialized)
+        for dev_env in self.local_dev_envs:
+            known_tool_images.update(dict.fromkeys(dev_env.get_tool_images()))
+
+        image_ids = {tag: image_id for image_id, image in images.items() for tag in image["tags"]}
+        candidates = [
+            {
+                "tool_image": tool_image,
+                "last_used": self.tool_image_usage.deserialized.get(tool_image),
+                "image_id": image_ids[tool_image],
+            }
+            for tool_image in known_tool_images 
+            if tool_image in image_ids and self.local_dev_envs.get_reference_count(tool_image) == 0
+        ]
+        return sorted(candidates, key=lambda candidate: candidate["last_used"] or 0)
+
+    def select_gc_evictions(self, candidates: list[dict], layers_size: int, images: dict[str, dict],
+                            budget: int | None = None, min_free: int | None = None) -> list[dict]:
+        """ Select the least recently used candidates to evict until the disk usage of the images
+            fits in the budget and the free space reaches the minimum.
+
+            Removing a tag of an image with several tags reclaims nothing, so an image's size is 
+            credited to the eviction of its last tag.
+
+            Exceptions:
+                PlatformError -- if the free space is not available
+
+            Args:
+                candidates -- the candidates in eviction order
+                layers_size -- the total size of the image layers in bytes
+                images -- the tags and the unshared size of the local images by image ID
+                budget -- the maximum total size of the image layers in bytes
+                min_free -- the minimum free space of the container engine's storage in bytes
+
+            Return with the evictions: the candidates with the bytes reclaimed by them ("size").
+        """
+        try:
+            free_space = self.container_engine.get_free_space() if min_free is not None else 0
+        except ContainerEngineError as e:
+            raise PlatformError(str(e))
+
+        remaining_tags = {image_id: set(image["tags"]) for image_id, image in images.items()}
+        evictions = []
+        reclaimed = 0
+        for candidate in candidates:
+            if (budget is None or layers_size - reclaimed <= budget) and \
+                (min_free is None or free_space + reclaimed >= min_free):
+                break
+            image_tags = remaining_tags[candidate["image_id"]]
+            image_tags.discard(candidate["tool_image"])
+            size = 0 if image_tags else images[candidate["image_id"]]["size"]
+            evictions.append(candidate | {"size": size})
+            reclaimed += size
+        return evictions
+
+    def collect_garbage(self, evictions: list[dict]) -> list[str]:
+        """ Remove the evicted tool images in bulk and forget their usage.
+
+            Args:
+                evictions -- the candidates to evict
+
+            Return with the tool images that couldn't be removed.
+        """
+        tool_images = [eviction["tool_image"] for eviction in evictions]
+        failed_tool_images = self.container_engine.remove_images(tool_images)
+
+        with self.tool_image_usage.lock():
+            self.tool_image_usage.update()
+            for tool_image in tool_images:
+                if tool_image not in failed_tool_images:
+                    self.tool_image_usage.deserialized.pop(tool_image, None)
+            self.tool_image_usage.flush()
+
+        return failed_tool_images
+
+    def _get_descriptors_by_name(self) -> dict[str, dict]:
+        """ Get a copy of the current descriptors of the local Dev Envs by name."""
+        return {descriptor["name"]: descriptor for descriptor 
+                in copy.deepcopy(self.get_deserialized()["development_environments"])}
+
+    def _merge_descriptors(self, file_descriptors: list[dict], 
+                           descriptors: dict[str, dict]) -> list[dict]:
+        """ Apply the Dev Env changes of this process to the descriptors read from the file.
+
+            The Dev Envs this process hasn't changed keep their descriptors from the file, so the 
+            changes of the other dem processes are preserved.
+
+            Args:
+                file_descriptors -- the descriptors in the dev_env.json
+                descriptors -- the current descriptors of this process by name
+
+            Return with the merged descriptors.
+        """
+        def is_changed(name: str) -> bool:
+            return descriptors[name] != self._flushed_descriptors.get(name)
+
+        merged_descriptors = []
+        for file_descriptor in file_descriptors:
+            name = file_descriptor["name"]
+            if name in descriptors:
+                merged_descriptors.append(descriptors[name] if is_changed(name) else file_descriptor)
+            elif name not in self._flushed_descriptors:
+                # Added by another process.
+                merged_descriptors.append(file_descriptor)
+
+        merged_names = {descriptor["name"] for descriptor in merged_descriptors}
+        merged_descriptors += [descriptor for name, descriptor in descriptors.items()
+                               if name not in merged_names and is_changed(name)]
+        return merged_descriptors
+
     def flush_descriptors(self) -> None:
-        """ Writes the deserialized json to the dev_env.json file."""
-        # Get the up-to-date deserialized data.
-        self.dev_env_json.deserialized = self.get_deserialized()
-        self.dev_env_json.flush()
+        """ Writes the deserialized json to the dev_env.json file.
+        
+            The dev_env.json is locked, read again and only the Dev Envs changed by this process 
+            get updated in it, so parallel dem processes don't overwrite each other's changes.
+        """
+        with self.dev_env_json.lock():
+            self.dev_env_json.update()
+            if self._flushed_descriptors is None:
+                # The Dev Envs haven't been loaded from the file, so all of them get written.
+                self.dev_env_json.deserialized = self.get_deserialized()
+            else:
+                descriptors = self._get_descriptors_by_name()
+                self.dev_env_json.deserialized = {
+                    "version": self.version,
+                    "development_environments": self._merge_descriptors(
+                        self.dev_env_json.deserialized["development_environments"], descriptors
+                    ),
+                }
+                self._flushed_descriptors = descriptors
+            self.dev_env_json.flush()
 
     def assign_dev_env(self, dev_env_to_assign: DevEnv, project_path: str) -> None:
         """ Assign the Development Environment to the project, by exporting the Dev Env's desriptor
@@ -3,28 +3,87 @@
 
 from dem.core.core import Core
 from dem.core.container_engine import ContainerEngine
-from dem.core.data_management import ConfigFile
-import requests
-from typing import Generator
+from dem.core.data_management import ConfigFile, RegistryCacheFile
+from dem.core.lazy_import import lazy_import
+import fnmatch, platform, re, threading, time, urllib.parse
+from typing import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from abc import ABC, abstractmethod
 
+requests = lazy_import("requests")
+
 class Registry(Core, ABC):
-    """ Abstract base class for a registry."""
-    def __init__(self, container_engine: ContainerEngine, registry_config: dict) -> None:
+    """ Abstract base class for a registry.
+    
+        Class variables:
+            _default_max_workers -- the number of concurrent tag requests if the registry config 
+                                    doesn't set the "max_workers" key
+            _default_cache_ttl -- the time in seconds while the cached repos are served without 
+                                  contacting the registry, if the registry config doesn't set the
+                                  "cache_ttl" key
+            refresh_cache -- ignore the cached repos and crawl the registry again
+            _default_max_tags_per_repo -- the maximum number of tags obtained from a repository if 
+                                          the registry config doesn't set the "max_tags_per_repo" 
+                                          key (None means no limit)
+            _tool_image_request_method -- the HTTP method used to check a single tool image
+            _tool_image_request_headers -- the headers used to check a single tool image
+            _manifest_media_types -- the accepted manifest types of the Registry HTTP API V2
+            _manifest_list_media_types -- the manifest types that list a manifest per platform
+            _architectures -- the registry's name of the machine's architecture
+    """
+    _default_max_workers = 8
+    _default_cache_ttl = 3600
+    refresh_cache = False
+    _default_max_tags_per_repo: int | None = None
+    _tool_image_request_method = "GET"
+    _tool_image_request_headers: dict[str, str] = {}
+    _manifest_media_types = [
+        "application/vnd.docker.distribution.manifest.v2+json",
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.manifest.v1+json",
+        "application/vnd.oci.image.index.v1+json",
+    ]
+    _manifest_list_media_types = [
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.index.v1+json",
+    ]
+    _architectures = {
+        "x86_64": "amd64",
+        "amd64": "amd64",
+        "aarch64": "arm64",
+        "arm64": "arm64",
+        "armv7l": "arm",
+    }
+
+    def __init__(self, container_engine: ContainerEngine, registry_config: dict, 
+                 cache_file: RegistryCacheFile | None = None) -> None:
         """ Init the class.
         
             Args:
                 container_engine -- the container engine
                 registry_config -- container the name of the registry and its URL
+                cache_file -- the registry cache (the cache is not used if None)
         """
         self._container_engine = container_engine
         self._registry_config = registry_config
+        self._max_workers: int = registry_config.get("max_workers", self._default_max_workers)
+        self._cache_file = cache_file
+        self._cache_ttl: int = registry_config.get("cache_ttl", self._default_cache_ttl)
+        self._max_tags_per_repo: int | None = registry_config.get("max_tags_per_repo", 
+                                                                  self._default_max_tags_per_repo)
+        self._tag_filter: str | None = registry_config.get("tag_filter")
+        self._session = self._create_session()
+        self._bearer_tokens: dict[str, str] = {}
+        self._scope_bearer_tokens: dict[str, str] = {}
+        self._bearer_token_lock = threading.Lock()
+        self._cached_repos: dict[str, dict] = {}
+        self._crawled_repos: dict[str, dict] = {}
         self._repos = []
 
     @abstractmethod
-    def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
-        """ Get the tags from the endpoint response. Save the tags alongside with the actual repo
-            in the private repo list.
+    def _get_repo_with_tags(self, endpoint_response: dict, repo: str) -> list[str]:
+        """ Get the tags from the endpoint response. Return with the tags alongside with the actual
+            repo in the repo:tag format.
         """
 
     @abstractmethod
@@ -32,36 +91,543 @@ class Registry(Core, ABC):
         """ Get the registry specific endpoint to obtain the tags."""
 
     @abstractmethod
-    def _list_repos_in_registry(self) -> Generator:
-        """ Generator function for listing the repos. """
+    def _get_repo_endpoint_url(self) -> str:
+        """ Get the registry specific endpoint to list the repositories."""
+
+    @abstractmethod
+    def _get_repos(self, endpoint_response: dict) -> list[str]:
+        """ Get the repositories from the endpoint response, prefixed with the registry's name."""
+
+    @abstractmethod
+    def _get_tool_image_endpoint_url(self, repo: str, tag: str) -> str:
+        """ Get the registry specific endpoint to check whether a single tool image exists."""
+
+    @abstractmethod
+    def _get_digest_from_response(self, response: "requests.Response") -> str | None:
+        """ Get the manifest digest from the response of the tool image endpoint."""
+
+    @abstractmethod
+    def _get_distribution_url(self) -> str:
+        """ Get the url of the registry's Registry HTTP API V2, that serves the manifests and the 
+            blobs.
+        """
+
+    @abstractmethod
+    def _get_distribution_repo(self, repo: str) -> str:
+        """ Get the name of the repository in the Registry HTTP API V2."""
+
+    def _create_session(self) -> "requests.Session":
+        """ Create the HTTP session of the registry. 
+        
+            The connections are kept alive and shared by the workers of the registry.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self._max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_next_page_url(self, endpoint_response: dict, response) -> str | None:
+        """ Get the url of the next page of the repositories or the tags. 
+
+            The lists are not paginated by default, override it for the paginated endpoints.
+
+            Args:
+                endpoint_response -- the decoded response from the endpoint
+                response -- the response object (the pagination might be in its headers)
+
+            Return with None if there is no more page.
+        """
+        return None
+
+    def _filter_tags(self, repo_with_tags: list[str]) -> list[str]:
+        """ Keep only the tags that match the "tag_filter" glob pattern of the registry config.
+
+            Args:
+                repo_with_tags -- the tags in the repo:tag format
+        """
+        if self._tag_filter is None:
+            return repo_with_tags
+        return [repo_with_tag for repo_with_tag in repo_with_tags 
+                if fnmatch.fnmatchcase(repo_with_tag.rpartition(":")[2], self._tag_filter)]
+
+    def _is_tag_limit_reached(self, repo_with_tags: list[str]) -> bool:
+        """ Check whether enough tags have been obtained from the repository.
+
+            Args:
+                repo_with_tags -- the tags obtained so far
+        """
+        return self._max_tags_per_repo is not None and \
+            len(repo_with_tags) >= self._max_tags_per_repo
 
-    def _list_tags(self, repo: str) -> None:
+    def _list_remaining_tag_pages(self, repo: str, endpoint_response: dict, response, 
+                                  repo_with_tags: list[str]) -> bool:
+        """ Follow the next page links of the tag endpoint and extend the tag list page by page.
+
+            The pagination stops as soon as the tag limit of the repo is reached.
+
+            Args:
+                repo -- the tags belong to this repository
+                endpoint_response -- the decoded first page
+                response -- the response object of the first page
+                repo_with_tags -- the tags of the first page, gets extended in place
+
+            Return with False if a page couldn't be obtained, so the tag list is incomplete.
+        """
+        next_page_url = self._get_next_page_url(endpoint_response, response)
+        while next_page_url is not None and not self._is_tag_limit_reached(repo_with_tags):
+            try:
+                response = self._session.get(next_page_url, timeout=1)
+            except Exception as e:
+                self.user_output.error(str(e))
+                return False
+
+            if response.status_code != requests.codes.ok:
+                self.user_output.error("Error in communication with the registry. Failed to retrieve tags. Response status code: " + str(response.status_code))
+                return False
+
+            endpoint_response = response.json()
+            repo_with_tags.extend(self._filter_tags(self._get_repo_with_tags(endpoint_response, 
+                                                                             repo)))
+            next_page_url = self._get_next_page_url(endpoint_response, response)
+
+        return True
+
+    def _get_conditional_headers(self, repo: str) -> dict[str, str]:
+        """ Get the headers for a conditional request based on the cached validators.
+
+            Args:
+                repo -- the repository to request the tags of
+        """
+        headers = {}
+        cached_repo = self._cached_repos.get(repo)
+        if cached_repo is not None:
+            if cached_repo.get("etag"):
+                headers["If-None-Match"] = cached_repo["etag"]
+            if cached_repo.get("last_modified"):
+                headers["If-Modified-Since"] = cached_repo["last_modified"]
+        return headers
+
+    def _list_tags(self, repo: str) -> list[str]:
         """ Get the tags from the respective endpoint and call the registry specific function to 
-            populate the private repo list.
+            process the response.
+
+            If the tags are cached, a conditional request is sent, so an unchanged tag list doesn't 
+            need to be transferred and parsed again.
+
+            Paginated tag lists are followed until the last page or the tag limit of the repo. If
+            a page is missing, the incomplete tag list is not revalidated from the cache later.
 
             Args:
                 repo -- get the tags of this repository
+
+            Return with the list of the repo:tag items. The list is empty if the tags couldn't be 
+            obtained.
         """
         try:
-            response = requests.get(self._get_tag_endpoint_url(repo), timeout=1)
+            response = self._session.get(self._get_tag_endpoint_url(repo), 
+                                         headers=self._get_conditional_headers(repo), timeout=1)
         except Exception as e:
             self.user_output.error(str(e))
         else:
-            if response.status_code == requests.codes.ok:
-                self._append_repo_with_tag(response.json(), repo)
-                return
+            if response.status_code == requests.codes.not_modified:
+                self._crawled_repos[repo] = self._cached_repos[repo]
+                return self._cached_repos[repo]["tags"]
+            elif response.status_code == requests.codes.ok:
+                endpoint_response = response.json()
+                repo_with_tags = self._filter_tags(self._get_repo_with_tags(endpoint_response, repo))
+                is_complete = self._list_remaining_tag_pages(repo, endpoint_response, response, 
+                                                             repo_with_tags)
+                if self._max_tags_per_repo is not None:
+                    del repo_with_tags[self._max_tags_per_repo:]
+                self._crawled_repos[repo] = {
+                    "tags": repo_with_tags,
+                    "etag": response.headers.get("ETag") if is_complete else None,
+                    "last_modified": response.headers.get("Last-Modified") if is_complete else None,
+                }
+                return repo_with_tags
             else:
                 self.user_output.error("Error in communication with the registry. Failed to retrieve tags. Response status code: " + str(response.status_code))
 
         self.user_output.msg("Skipping repository: " + repo)
-    
+        return []
+
+    def _search(self) -> Generator:
+        """ Generator function for searching the registry for the repositories.
+
+            The repositories are requested page by page and the repositories of a page are yielded
+            as soon as it has arrived, so the caller can start working on them while the next 
+            page is being fetched. If something bad happened, the rest of the registry is skipped.
+        """
+        next_page_url = self._get_repo_endpoint_url()
+
+        while next_page_url is not None:
+            try:
+                response = self._session.get(next_page_url, timeout=1)
+            except Exception as e:
+                self.user_output.error(str(e))
+                break
+
+            if response.status_code != requests.codes.ok:
+                self.user_output.error("Error in communication with the registry. Failed to retrieve the repositories. Response status code: " + str(response.status_code))
+                break
+
+            try:
+                endpoint_response = response.json()
+                repos = self._get_repos(endpoint_response)
+            except requests.exceptions.JSONDecodeError as e:
+                self.user_output.error("Invalid JSON format in response. " + str(e))
+                break
+            except Exception as e:
+                self.user_output.error(str(e))
+                break
+
+            yield from repos
+            next_page_url = self._get_next_page_url(endpoint_response, response)
+        else:
+            return
+
+        self.user_output.msg("Skipping registry: " + self._registry_config["name"])
+
+    def _list_repos_in_registry(self) -> Generator:
+        """ Generator function for listing the repos. """
+        yield from self._list_tags_concurrently(self._search())
+
+    def _list_tags_concurrently(self, repos: Iterable[str]) -> Generator:
+        """ Generator function for obtaining the tags of the repos on a bounded worker pool.
+
+            A status message is yielded as soon as the tags of a repo have arrived. The private 
+            repo list gets populated in the order of the input repos, independently of the order 
+            of the responses: the tags of a repo are appended as soon as they and the tags of all 
+            the previous repos have arrived. The tags are appended repo by repo instead of page 
+            by page, so the order of the list is deterministic and the tag cap of the repo is 
+            applied before its tags become visible.
+
+            Args:
+                repos -- get the tags of these repositories (if it is a generator, the tag requests 
+                         of the first repos run while the later ones are still being produced)
+        """
+        repo_order: list[str] = []
+        repo_tags: dict[str, list[str]] = {}
+        next_repo_idx = 0
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {}
+            for repo in repos:
+                repo_order.append(repo)
+                futures[executor.submit(self._list_tags, repo)] = repo
+
+            for future in as_completed(futures):
+                repo = futures[future]
+                repo_tags[repo] = future.result()
+                while next_repo_idx < len(repo_order) and repo_order[next_repo_idx] in repo_tags:
+                    self._repos.extend(repo_tags.pop(repo_order[next_repo_idx]))
+                    next_repo_idx += 1
+                yield "Loading image data from: " + repo
+
+    def _request_tool_image(self, tool_image: str) -> "requests.Response | None":
+        """ Request the tool image from the registry with a single request.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+
+            Return with None if the tool image doesn't exist or the registry can't be reached.
+        """
+        repo, _, tag = tool_image.rpartition(":")
+        try:
+            response = self._session.request(self._tool_image_request_method, 
+                                             self._get_tool_image_endpoint_url(repo, tag), 
+                                             headers=self._tool_image_request_headers, timeout=1)
+        except Exception as e:
+            self.user_output.error(str(e))
+            return None
+
+        if response.status_code == requests.codes.ok:
+            return response
+        elif response.status_code != requests.codes.not_found:
+            self.user_output.error("Error in communication with the registry. Failed to check " + tool_image + ". Response status code: " + str(response.status_code))
+        return None
+
+    def _is_tool_image_available(self, tool_image: str) -> bool:
+        """ Check whether the tool image exists in the registry with a single request.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+
+            Return with False if the tool image doesn't exist or the registry can't be reached.
+        """
+        return self._request_tool_image(tool_image) is not None
+
+    def _get_manifest_digest(self, tool_image: str) -> str | None:
+        """ Get the digest of the tool image's manifest with a single request.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+
+            Return with None if the digest couldn't be obtained.
+        """
+        response = self._request_tool_image(tool_image)
+        if response is None:
+            return None
+
+        try:
+            return self._get_digest_from_response(response)
+        except Exception as e:
+            self.user_output.error(str(e))
+            return None
+
+    def _get_timed_manifest_digest(self, tool_image: str) -> tuple[str | None, float]:
+        """ Get the digest of the tool image's manifest and the time of the check in seconds.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+        """
+        start_time = time.perf_counter()
+        digest = self._get_manifest_digest(tool_image)
+        return digest, time.perf_counter() - start_time
+
+    def get_manifest_digests(self, tool_images: Iterable[str], 
+                             check_times: dict[str, float] | None = None) -> dict[str, str]:
+        """ Get the manifest digests of the tool images concurrently.
+
+            Args:
+                tool_images -- the tool images in the repo:tag format
+                check_times -- if set, the time of each tool image's check in seconds gets stored 
+                               in it
+
+            Return with the digests of the tool images that could be obtained.
+        """
+        tool_images = list(dict.fromkeys(tool_images))
+        digests = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for tool_image, (digest, check_time) in zip(tool_images, 
+                                                        executor.map(self._get_timed_manifest_digest, 
+                                                                     tool_images)):
+                if check_times is not None:
+                    check_times[tool_image] = check_time
+                if digest is not None:
+                    digests[tool_image] = digest
+        return digests
+
+    def _get_bearer_token(self, challenge: str, rejected_token: str | None = None) -> str:
+        """ Get an anonymous token from the authorization service of the registry.
+
+            The tokens are cached by scope, and only one thread requests a token at a time, so the
+            concurrent requests of a scope share one token request.
+
+            Args:
+                challenge -- the WWW-Authenticate header of the unauthorized response
+                rejected_token -- the token the unauthorized request was sent with
+        """
+        params = dict(re.findall(r'(\w+)="([^"]*)"', challenge))
+        scope = params.get("scope", "")
+        with self._bearer_token_lock:
+            token = self._scope_bearer_tokens.get(scope)
+            # Another thread might have got a new token since the request was sent.
+            if token is None or token == rejected_token:
+                realm = params.pop("realm")
+                response = self._session.get(realm, params=params, timeout=10)
+                response.raise_for_status()
+                token_response = response.json()
+                token = token_response.get("token") or token_response["access_token"]
+                self._scope_bearer_tokens[scope] = token
+            return token
+
+    def _distribution_get(self, url: str, distribution_repo: str, 
+                          headers: dict[str, str] | None = None) -> "requests.Response":
+        """ Send a GET request to the Registry HTTP API V2.
+
+            If the registry requires a token, an anonymous pull token is obtained for the 
+            repository and reused by the later requests.
+
+            Args:
+                url -- the url to get
+                distribution_repo -- the repository in the Registry HTTP API V2
+                headers -- the headers of the request
+
+            Raise an exception if the request fails.
+        """
+        headers = dict(headers or {})
+        token = self._bearer_tokens.get(distribution_repo)
+        if token is not None:
+            headers["Authorization"] = "Bearer " + token
+        response = self._session.get(url, headers=headers, timeout=10)
+
+        challenge = response.headers.get("WWW-Authenticate", "")
+        if response.status_code == requests.codes.unauthorized and challenge.startswith("Bearer"):
+            token = self._get_bearer_token(challenge, token)
+            self._bearer_tokens[distribution_repo] = token
+            response = self._session.get(url, headers=headers | {"Authorization": "Bearer " + token}, 
+                                         timeout=10)
+
+        response.raise_for_status()
+        return response
+
+    def _select_platform_manifest(self, manifest_list: dict) -> str:
+        """ Select the manifest of the machine's platform from a manifest list.
+
+            Args:
+                manifest_list -- the manifest list or OCI index
+
+            Return with the digest of the selected manifest.
+        """
+        architecture = self._architectures.get(platform.machine().lower(), "amd64")
+        for manifest in manifest_list["manifests"]:
+            manifest_platform = manifest.get("platform", {})
+            if manifest_platform.get("os") == "linux" and \
+                manifest_platform.get("architecture") == architecture:
+                return manifest["digest"]
+        raise LookupError("No manifest for the linux/" + architecture + " platform.")
+
+    def _get_image_layers(self, tool_image: str) -> list[dict] | None:
+        """ Get the layers of the tool image from its manifest and its config.
+
+            Each layer has the "digest" and the "size" of the compressed blob, and the "diff_id" 
+            of the uncompressed layer, that is how the container engine identifies the layer.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+
+            Return with None if the layers couldn't be obtained.
+        """
+        repo, _, tag = tool_image.rpartition(":")
+        distribution_repo = self._get_distribution_repo(repo)
+        base_url = self._get_distribution_url() + "/v2/" + distribution_repo
+        headers = {"Accept": ", ".join(self._manifest_media_types)}
+
+        try:
+            manifest = self._distribution_get(base_url + "/manifests/" + tag, distribution_repo, 
+                                              headers).json()
+            if manifest.get("mediaType") in self._manifest_list_media_types or \
+                "manifests" in manifest:
+                manifest = self._distribution_get(base_url + "/manifests/" + 
+                                                  self._select_platform_manifest(manifest), 
+                                                  distribution_repo, headers).json()
+            config = self._distribution_get(base_url + "/blobs/" + manifest["config"]["digest"], 
+                                            distribution_repo).json()
+        except Exception as e:
+            self.user_output.error("Failed to get the layers of " + tool_image + ": " + str(e))
+            return None
+
+        return [{"digest": layer["digest"], "size": layer["size"], "diff_id": diff_id}
+                for layer, diff_id in zip(manifest["layers"], config["rootfs"]["diff_ids"])]
+
+    def get_image_layers(self, tool_images: Iterable[str]) -> dict[str, list[dict]]:
+        """ Get the layers of the tool images concurrently.
+
+            Args:
+                tool_images -- the tool images in the repo:tag format
+
+            Return with the layers of the tool images that could be obtained.
+        """
+        tool_images = list(dict.fromkeys(tool_images))
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return {tool_image: layers for tool_image, layers 
+                    in zip(tool_images, executor.map(self._get_image_layers, tool_images))
+                    if layers is not None}
+
+    def resolve_tool_images(self, tool_images: Iterable[str]) -> set[str]:
+        """ Check which of the tool images exist in the registry, without crawling the registry.
+
+            If the cached repos are still fresh, they are used. Otherwise the tool images get 
+            checked concurrently with one request per tool image.
+
+            Args:
+                tool_images -- the tool images in the repo:tag format
+
+            Return with the available tool images.
+        """
+        tool_images = list(dict.fromkeys(tool_images))
+        cache_entry = self._get_cache_entry()
+        available_tool_images: set[str] = set()
+        tool_images_to_check: list[str] = []
+
+        if self._is_cache_entry_fresh(cache_entry):
+            for tool_image in tool_images:
+                cached_repo = cache_entry["repos"].get(tool_image.rpartition(":")[0])
+                if cached_repo is None:
+                    tool_images_to_check.append(tool_image)
+                elif tool_image in cached_repo["tags"]:
+                    available_tool_images.add(tool_image)
+        else:
+            tool_images_to_check = tool_images
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for tool_image, is_available in zip(tool_images_to_check, 
+                                                executor.map(self._is_tool_image_available, 
+                                                             tool_images_to_check)):
+                if is_available:
+                    available_tool_images.add(tool_image)
+
+        return available_tool_images
+
+    def _is_cache_entry_fresh(self, cache_entry: dict | None) -> bool:
+        """ Check whether the cache entry can be served without contacting the registry.
+
+            Args:
+                cache_entry -- the cached data of the registry
+        """
+        return cache_entry is not None and not self.refresh_cache and \
+            time.time() - cache_entry["timestamp"] < self._cache_ttl
+
+    def _get_cache_settings(self) -> dict:
+        """ Get the registry config settings that determine the result of the crawl."""
+        return {
+            "tag_filter": self._tag_filter,
+            "max_tags_per_repo": self._max_tags_per_repo,
+        }
+
+    def _get_cache_entry(self) -> dict | None:
+        """ Get the cached data of the registry.
+        
+            Return with None if the cache is not used or there is no valid entry for the registry.
+            An entry crawled with other settings is not valid.
+        """
+        if self._cache_file is None:
+            return None
+
+        cache_entry = self._cache_file.deserialized.get(self._registry_config["name"])
+        if cache_entry is None or cache_entry.get("url") != self._registry_config["url"] or \
+                cache_entry.get("settings") != self._get_cache_settings():
+            return None
+
+        return cache_entry
+
+    def _store_cache_entry(self) -> None:
+        """ Save the result of the crawl to the cache. The cache file gets flushed by the owner."""
+        if self._cache_file is None or not self._crawled_repos:
+            return
+
+        self._cache_file.deserialized[self._registry_config["name"]] = {
+            "url": self._registry_config["url"],
+            "settings": self._get_cache_settings(),
+            "timestamp": time.time(),
+            "repos": {repo: self._crawled_repos[repo] for repo in self._crawled_repos},
+        }
+
     @property
     def repos(self) -> list[str]:
         """ Getter function for the repos in the registry.
+
+            The cached repos are served if they are younger than the cache TTL. Otherwise the 
+            registry gets crawled, and the cached tag listings are revalidated.
         
             Returns with list of the repos.
         """
+        cache_entry = self._get_cache_entry()
+        if self._is_cache_entry_fresh(cache_entry):
+            self._repos = [repo_with_tag for cached_repo in cache_entry["repos"].values() 
+                           for repo_with_tag in cached_repo["tags"]]
+            return self._repos
+
+        if cache_entry is not None and not self.refresh_cache:
+            self._cached_repos = cache_entry["repos"]
+        else:
+            self._cached_repos = {}
+        self._crawled_repos = {}
+        self._repos = []
         self.user_output.status_generator(self._list_repos_in_registry())
+        self._store_cache_entry()
         return self._repos
 
 class DockerHub(Registry):
@@ -71,20 +637,26 @@ class DockerHub(Registry):
             _docker_hub_domain -- the Docker Hub domain (used to determine if the config is for a 
                                   Docker Hub registry)
             _tag_endpoint_response_key -- used to obtain the tags from the endpoint response
+            _page_size -- the number of repositories or tags requested in a page (the maximum of 
+                          the Docker Hub)
+            _distribution_url -- the Registry HTTP API V2 of the Docker Hub (the Hub API doesn't 
+                                 serve the manifests and the blobs)
     """
     _docker_hub_domain = "registry.hub.docker.com"
     _tag_endpoint_response_key = "results"
+    _page_size = 100
+    _distribution_url = "https://registry-1.docker.io"
 
-    def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
-        """ Get the tags from the endpoint response. Save the tags alongside with the actual repo
-            in the private repo list.
+    def _get_repo_with_tags(self, endpoint_response: dict, repo: str) -> list[str]:
+        """ Get the tags from the endpoint response. Return with the tags alongside with the actual
+            repo in the repo:tag format.
 
             Args:
                 endpoint_response -- the response from the endpoint
-                repo -- append the tags of this repoistory
+                repo -- the tags belong to this repository
         """
-        for result in endpoint_response[self._tag_endpoint_response_key]:
-            self._repos.append(repo + ":" + result["name"])
+        return [repo + ":" + result["name"] 
+                for result in endpoint_response[self._tag_endpoint_response_key]]
 
     def _get_tag_endpoint_url(self, repo: str) -> str:
         """ Get the Docker Hub specific endpoint url to obtain the tags.
@@ -92,32 +664,102 @@ class DockerHub(Registry):
             Args:
                 repo -- we would like to get the tags for this repository
         """
-        return self._registry_config["url"] + "/v2/repositories/" + repo + "/tags/"
+        return self._registry_config["url"] + "/v2/repositories/" + repo + "/tags/?page_size=" + \
+            str(self._page_size)
 
-    def _list_repos_in_registry(self) -> Generator:
-        """ Generator function for listing the repos. """
-        for repo in self._container_engine.search(self._registry_config["name"]):
-            yield "Loading image data from: " + repo
-            self._list_tags(repo)
+    def _get_repo_endpoint_url(self) -> str:
+        """ Get the Docker Hub specific endpoint url to list the repositories of the namespace."""
+        return self._registry_config["url"] + "/v2/repositories/" + \
+            self._registry_config["name"] + "/?page_size=" + str(self._page_size)
+
+    def _get_repos(self, endpoint_response: dict) -> list[str]:
+        """ Get the repositories of the namespace from the endpoint response.
+
+            Args:
+                endpoint_response -- the response from the endpoint
+        """
+        return [self._registry_config["name"] + "/" + result["name"] 
+                for result in endpoint_response["results"]]
+
+    def _get_next_page_url(self, endpoint_response: dict, response) -> str | None:
+        """ Get the url of the next page from the Docker Hub response.
+
+            Args:
+                endpoint_response -- the decoded response from the endpoint
+                response -- the response object
+        """
+        return endpoint_response.get("next")
+
+    def _get_tool_image_endpoint_url(self, repo: str, tag: str) -> str:
+        """ Get the Docker Hub specific endpoint url of a single tag.
+            
+            Args:
+                repo -- the repository of the tool image
+                tag -- the tag of the tool image
+        """
+        return self._registry_config["url"] + "/v2/repositories/" + repo + "/tags/" + tag
+
+    def _get_digest_from_response(self, response: "requests.Response") -> str | None:
+        """ Get the manifest digest from the tag details of the Docker Hub.
+
+            Args:
+                response -- the response of the tool image endpoint
+        """
+        return response.json().get("digest")
+
+    def _get_distribution_url(self) -> str:
+        """ Get the url of the Docker Hub's Registry HTTP API V2."""
+        return self._distribution_url
+
+    def _get_distribution_repo(self, repo: str) -> str:
+        """ Get the name of the repository in the Registry HTTP API V2.
+
+            Args:
+                repo -- the repository in the namespace/name format
+        """
+        return repo
 
 class DockerRegistry(Registry):
     """ Docker Registry
     
         Class variables:
             _tag_endpoint_response_key -- used to obtain the tags from the endpoint response
+            _default_page_size -- the number of repositories or tags requested in a page if the 
+                                  registry config doesn't set the "page_size" key
     """
     _tag_endpoint_response_key = "tags"
+    _default_page_size = 100
+    # Only the existence of the manifest matters, so its content is not downloaded.
+    _tool_image_request_method = "HEAD"
+    _tool_image_request_headers = {"Accept": ", ".join(Registry._manifest_media_types)}
 
-    def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
-        """ Get the tags from the endpoint response. Save the tags alongside with the actual repo
-            in the private repo list.
+    def __init__(self, container_engine: ContainerEngine, registry_config: dict, 
+                 cache_file: RegistryCacheFile | None = None) -> None:
+        """ Init the class.
+        
+            Args:
+                container_engine -- the container engine
+                registry_config -- container the name of the registry and its URL
+                cache_file -- the registry cache (the cache is not used if None)
+        """
+        super().__init__(container_engine, registry_config, cache_file)
+        self._page_size: int = registry_config.get("page_size", self._default_page_size)
+
+    def _get_cache_settings(self) -> dict:
+        """ Get the registry config settings that determine the result of the crawl."""
+        return super()._get_cache_settings() | {"page_size": self._page_size}
+
+    def _get_repo_with_tags(self, endpoint_response: dict, repo: str) -> list[str]:
+        """ Get the tags from the endpoint response. Return with the tags alongside with the actual
+            repo in the repo:tag format.
 
             Args:
                 endpoint_response -- the response from the endpoint
-                repo -- append the tags of this repoistory
+                repo -- the tags belong to this repository
         """
-        for result in endpoint_response[self._tag_endpoint_response_key]:
-            self._repos.append(repo + ":" + result)
+        # A repository without tags has null instead of an empty list.
+        return [repo + ":" + result 
+                for result in endpoint_response[self._tag_endpoint_response_key] or []]
 
     def _get_tag_endpoint_url(self, repo: str) -> str:
         """ Get the Docker Registry specific endpoint url to obtain the tags.
@@ -125,51 +767,80 @@ class DockerRegistry(Registry):
             Args:
                 repo -- we would like to get the tags for this repository
         """
-        return self._registry_config["url"] + "/v2/" + repo.split("/")[1] + "/tags/list"
+        return self._registry_config["url"] + "/v2/" + repo.split("/", 1)[1] + "/tags/list?n=" + \
+            str(self._page_size)
 
-    def _search(self) -> list[str]:
-        """ Search the registry for the repositories
-        
-            Return with the repo list or an empty list if something bad happened.
+    def _get_next_page_url(self, endpoint_response: dict, response) -> str | None:
+        """ Get the url of the next page from the Link header of the response.
+
+            A relative link is resolved against the url of the response, which might differ 
+            from the registry's url, e.g. after a redirect.
+
+            Args:
+                endpoint_response -- the decoded response from the endpoint
+                response -- the response object
         """
-        repo_endpoint = self._registry_config["url"] + "/v2/_catalog"
+        next_link = response.links.get("next")
+        if next_link is None:
+            return None
+        return urllib.parse.urljoin(response.url, next_link["url"])
 
-        try:
-            response = requests.get(repo_endpoint, timeout=1)
-        except Exception as e:
-            self.user_output.error(str(e))
-        else:
-            if response.status_code == requests.codes.ok:
-                try:
-                    return response.json()["repositories"]
-                except requests.exceptions.JSONDecodeError as e:
-                    self.user_output.error("Invalid JSON format in response. " + str(e))
-                except Exception as e:
-                    self.user_output.error(str(e))
-            else:
-                self.user_output.error("Error in communication with the registry. Failed to retrieve the repositories. Response status code: " + str(response.status_code))
+    def _get_tool_image_endpoint_url(self, repo: str, tag: str) -> str:
+        """ Get the Docker Registry specific endpoint url of the tool image's manifest.
+            
+            Args:
+                repo -- the repository of the tool image
+                tag -- the tag of the tool image
+        """
+        return self._registry_config["url"] + "/v2/" + repo.split("/", 1)[1] + "/manifests/" + tag
 
-        self.user_output.msg("Skipping registry: " + self._registry_config["name"])
-        return []
+    def _get_digest_from_response(self, response: "requests.Response") -> str | None:
+        """ Get the manifest digest from the Docker-Content-Digest header.
 
-    def _list_repos_in_registry(self) -> Generator:
-        """ Generator function for listing the repos. """
-        for repo_name in self._search():
-            repo = self._registry_config["name"] + '/' + repo_name
-            yield "Loading image data from: " + repo
-            self._list_tags(repo)
+            Args:
+                response -- the response of the tool image endpoint
+        """
+        return response.headers.get("Docker-Content-Digest")
+
+    def _get_distribution_url(self) -> str:
+        """ Get the url of the registry, that serves the Registry HTTP API V2 itself."""
+        return self._registry_config["url"]
+
+    def _get_distribution_repo(self, repo: str) -> str:
+        """ Get the name of the repository in the Registry HTTP API V2.
+
+            Args:
+                repo -- the repository prefixed with the registry's name
+        """
+        return repo.split("/", 1)[1]
+
+    def _get_repo_endpoint_url(self) -> str:
+        """ Get the Docker Registry specific endpoint url to list the repositories."""
+        return self._registry_config["url"] + "/v2/_catalog?n=" + str(self._page_size)
+
+    def _get_repos(self, endpoint_response: dict) -> list[str]:
+        """ Get the repositories from the catalog response.
+
+            Args:
+                endpoint_response -- the response from the endpoint
+        """
+        return [self._registry_config["name"] + "/" + repo_name 
+                for repo_name in endpoint_response["repositories"] or []]
 
 class Registries(Core):
     """ Contains all configured registiries."""
-    def __init__(self, container_engine: ContainerEngine, config_file: ConfigFile) -> None:
+    def __init__(self, container_engine: ContainerEngine, config_file: ConfigFile,
+                 cache_file: RegistryCacheFile | None = None) -> None:
         """ Init the class by creating the registry instances.
             
             Args:
                 container_engine -- the container engine
                 config_file -- config file that contains the registry parameters
+                cache_file -- the registry cache (the cache is not used if None)
         """
         self._config_file = config_file
         self._container_engine = container_engine
+        self._cache_file = cache_file
         self.registries: list[Registry] = []
         for registry_config in config_file.registries:
             self._add_registry_instance(registry_config)
@@ -182,9 +853,11 @@ class Registries(Core):
                 registry_config -- registry config
             """
         if DockerHub._docker_hub_domain in registry_config["url"]:
-            self.registries.append(DockerHub(self._container_engine, registry_config))
+            self.registries.append(DockerHub(self._container_engine, registry_config, 
+                                             self._cache_file))
         else:
-            self.registries.append(DockerRegistry(self._container_engine, registry_config))
+            self.registries.append(DockerRegistry(self._container_engine, registry_config, 
+                                                  self._cache_file))
 
     def list_repos(self) -> list[str]:
         """ List the available repositories.
@@ -200,8 +873,91 @@ class Registries(Core):
                 self.user_output.error(str(e))
                 self.user_output.error("[red]Error: The " + registry._registry_config["name"] + " registry is not available.[/]")
 
+        if self._cache_file is not None:
+            self._cache_file.flush()
+
         return repo_list
 
+    def _group_by_registry(self, tool_images: Iterable[str]) -> Generator:
+        """ Generator function for grouping the tool images by the registry they belong to.
+
+            A tool image belongs to the registry whose name is the prefix of the tool image's 
+            repository. The registries without tool images are skipped.
+
+            Args:
+                tool_images -- the tool images in the repo:tag format
+        """
+        tool_images = list(tool_images)
+        for registry in self.registries:
+            registry_prefix = registry._registry_config["name"] + "/"
+            registry_tool_images = [tool_image for tool_image in tool_images 
+                                    if tool_image.startswith(registry_prefix)]
+            if registry_tool_images:
+                yield registry, registry_tool_images
+
+    def resolve_tool_images(self, tool_images: Iterable[str]) -> set[str]:
+        """ Check which of the tool images are available in the registries, without crawling them.
+
+            A tool image gets checked in the registry whose name is the prefix of the tool image's 
+            repository.
+
+            Args:
+                tool_images -- the tool images in the repo:tag format
+
+            Return with the available tool images.
+        """
+        available_tool_images: set[str] = set()
+
+        for registry, registry_tool_images in self._group_by_registry(tool_images):
+            try:
+                available_tool_images |= registry.resolve_tool_images(registry_tool_images)
+            except Exception as e:
+                self.user_output.error(str(e))
+                self.user_output.error("[red]Error: The " + registry._registry_config["name"] + " registry is not available.[/]")
+
+        return available_tool_images
+
+    def get_manifest_digests(self, tool_images: Iterable[str], 
+                             check_times: dict[str, float] | None = None) -> dict[str, str]:
+        """ Get the manifest digests of the tool images from the registries.
+
+            Args:
+                tool_images -- the tool images in the repo:tag format
+                check_times -- if set, the time of each tool image's check in seconds gets stored 
+                               in it
+
+            Return with the digests of the tool images that could be obtained.
+        """
+        digests: dict[str, str] = {}
+
+        for registry, registry_tool_images in self._group_by_registry(tool_images):
+            try:
+                digests.update(registry.get_manifest_digests(registry_tool_images, check_times))
+            except Exception as e:
+                self.user_output.error(str(e))
+                self.user_output.error("[red]Error: The " + registry._registry_config["name"] + " registry is not available.[/]")
+
+        return digests
+
+    def get_image_layers(self, tool_images: Iterable[str]) -> dict[str, list[dict]]:
+        """ Get the layers of the tool images from the registries.
+
+            Args:
+                tool_images -- the tool images in the repo:tag format
+
+            Return with the layers of the tool images that could be obtained.
+        """
+        image_layers: dict[str, list[dict]] = {}
+
+        for registry, registry_tool_images in self._group_by_registry(tool_images):
+            try:
+                image_layers.update(registry.get_image_layers(registry_tool_images))
+            except Exception as e:
+                self.user_output.error(str(e))
+                self.user_output.error("[red]Error: The " + registry._registry_config["name"] + " registry is not available.[/]")
+
+        return image_layers
+
     def add_registry(self, registry_config: dict) -> None:
         """ Add a new registry.
         
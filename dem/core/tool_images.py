@@ -5,15 +5,73 @@ from dem.core.exceptions import RegistryError
 from dem.core.container_engine import ContainerEngine
 from dem.core.registry import Registries
 
+def split_tool_image(tool_image: str) -> tuple[str, str]:
+    """ Split the tool image to repository and tag.
+    
+        The repository may contain a registry with port number, so only the last colon counts, 
+        if it is not part of the registry address.
+
+        Args:
+            tool_image -- the tool image in the repo:tag format
+
+        Return with the repository and the tag. The tag is empty if the tool image has none.
+    """
+    repo, separator, tag = tool_image.rpartition(":")
+    if not separator or "/" in tag:
+        return tool_image, ""
+    return repo, tag
+
 class BaseToolImages():
     """ Base class for the tool images. 
     
         Do not instantiate it directly!
+
+        Besides the list of the tool images, an index is kept to make the membership tests and the
+        tag lookups O(1). The index gets rebuilt whenever the elements are set.
     """
     def __init__(self) -> None:
         """ Init the class. """
         self.elements = []
 
+    @property
+    def elements(self) -> list[str]:
+        """ The tool images in the repo:tag format."""
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: list[str]) -> None:
+        """ Set the tool images and rebuild the index.
+        
+            Args:
+                elements -- the tool images in the repo:tag format
+        """
+        self._elements = elements
+        self._index: set[str] = set()
+        self._repo_tags: dict[str, list[str]] = {}
+
+        for tool_image in elements:
+            self._index.add(tool_image)
+            repo, tag = split_tool_image(tool_image)
+            self._repo_tags.setdefault(repo, []).append(tag)
+
+    def __contains__(self, tool_image: str) -> bool:
+        """ Check whether the tool image is available.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+        """
+        return tool_image in self._index
+
+    def get_tags(self, repo: str) -> list[str]:
+        """ Get the available tags of the repository.
+
+            Args:
+                repo -- name of the repository
+
+            Return with the list of the tags. The list is empty if the repo is not available.
+        """
+        return self._repo_tags.get(repo, [])
+
 class LocalToolImages(BaseToolImages):
     """ Local tool images."""
     def __init__(self, container_engine: ContainerEngine) -> None:
@@ -41,8 +99,22 @@ class RegistryToolImages(BaseToolImages):
         super().__init__()
         self._registries = registries
 
-    def update(self) -> None:
-        """ Update the list of available tools in the registry using the registry interface."""
+    def update(self, tool_images: list[str] | None = None) -> None:
+        """ Update the list of available tools in the registry using the registry interface.
+
+            Args:
+                tool_images -- only check these tool images instead of crawling the registries 
+                               (the result is merged into the already known tool images)
+        """
+        if tool_images is not None:
+            available_tool_images = self._registries.resolve_tool_images(tool_images)
+            checked_tool_images = set(tool_images)
+            self.elements = [tool_image for tool_image in self.elements 
+                             if tool_image not in checked_tool_images] + \
+                            [tool_image for tool_image in dict.fromkeys(tool_images) 
+                             if tool_image in available_tool_images]
+            return
+
         try:
             self.elements = self._registries.list_repos()
         except RegistryError as e:
@@ -72,4 +144,35 @@ class ToolImages():
 
         if update_on_instantiation is True:
             self.local.update()
-            self.registry.update()
\ No newline at end of file
+            self.registry.update()
+
+    def get_tool_image_status(self, tool_image: str, local_only: bool = False) -> int:
+        """ Get the availability of the tool image.
+
+            Args:
+                tool_image -- the tool image in the repo:tag format
+                local_only -- don't take the registry tool images into account
+
+            Return with one of the LOCAL_ONLY, REGISTRY_ONLY, LOCAL_AND_REGISTRY or NOT_AVAILABLE.
+        """
+        is_local = tool_image in self.local
+        is_in_registry = (local_only is False) and (tool_image in self.registry)
+
+        if is_local and is_in_registry:
+            return self.LOCAL_AND_REGISTRY
+        elif is_local:
+            return self.LOCAL_ONLY
+        elif is_in_registry:
+            return self.REGISTRY_ONLY
+        else:
+            return self.NOT_AVAILABLE
+
+    def get_tool_image_statuses(self) -> dict[str, int]:
+        """ Get the combined view of the registry and local tool images.
+
+            The registry tool images come first, then the local only ones.
+
+            Return with the tool images mapped to their availabilities.
+        """
+        return {tool_image: self.get_tool_image_status(tool_image) 
+                for tool_image in dict.fromkeys([*self.registry.elements, *self.local.elements])}
\ No newline at end of file
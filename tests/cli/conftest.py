@@ -0,0 +1,19 @@
+"""Shared fixtures of the CLI command tests."""
+# tests/cli/conftest.py
+
+import pytest
+
+from dem.core.dev_env import DevEnv
+
+@pytest.fixture
+def cache_dev_env() -> DevEnv:
+    """ A Development Environment with cache volumes for two tool types."""
+    return DevEnv({
+        "name": "test_dev_env",
+        "installed": "True",
+        "tools": [],
+        "cache_volumes": {
+            "toolchain": {"ccache": "/root/.ccache"},
+            "build system": {"conan": "/root/.conan2"},
+        },
+    })
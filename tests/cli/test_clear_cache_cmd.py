@@ -0,0 +1,85 @@
+"""Tests for the clear-cache command."""
+# tests/cli/test_clear_cache_cmd.py
+
+# Unit under test:
+import dem.cli.main as main
+
+# Test framework
+from typer.testing import CliRunner
+from unittest.mock import patch, MagicMock
+
+from dem.core.dev_env import DevEnv
+
+## Global test variables
+runner = CliRunner()
+
+@patch("dem.cli.command.clear_cache_cmd.stdout.print")
+def test_clear_cache(mock_stdout_print: MagicMock, cache_dev_env: DevEnv):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = cache_dev_env
+    mock_platform.container_engine.remove_volumes.return_value = []
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["clear-cache", "test_dev_env"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.container_engine.remove_warm_containers.assert_called_once_with("test_dev_env")
+    mock_platform.container_engine.remove_volumes.assert_called_once_with([
+        "dem-cache-test_dev_env-ccache", "dem-cache-test_dev_env-conan"
+    ])
+    mock_stdout_print.assert_called_once_with("[green]The cache volumes have been cleared.[/]")
+
+@patch("dem.cli.command.clear_cache_cmd.stderr.print")
+def test_clear_cache_volume_failed(mock_stderr_print: MagicMock, cache_dev_env: DevEnv):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = cache_dev_env
+    mock_platform.container_engine.remove_volumes.return_value = ["dem-cache-test_dev_env-conan"]
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["clear-cache", "test_dev_env", "conan"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.container_engine.remove_volumes.assert_called_once_with([
+        "dem-cache-test_dev_env-conan"
+    ])
+    mock_stderr_print.assert_called_once_with("[red]Error: Failed to clear the cache volumes: dem-cache-test_dev_env-conan[/]")
+
+@patch("dem.cli.command.clear_cache_cmd.stderr.print")
+def test_clear_cache_unknown_volume(mock_stderr_print: MagicMock, cache_dev_env: DevEnv):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = cache_dev_env
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["clear-cache", "test_dev_env", "pip"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stderr_print.assert_called_once_with("[red]Error: The test_dev_env has no cache volume named pip.[/]")
+    mock_platform.container_engine.remove_warm_containers.assert_not_called()
+    mock_platform.container_engine.remove_volumes.assert_not_called()
+
+@patch("dem.cli.command.clear_cache_cmd.stderr.print")
+def test_clear_cache_unknown_dev_env(mock_stderr_print: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = None
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["clear-cache", "test_dev_env"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stderr_print.assert_called_once_with("[red]Error: Unknown Development Environment: test_dev_env[/]")
@@ -47,7 +47,7 @@ def test_execute_dev_env_not_available_in_catalog() -> None:
     main.platform = mock_platform
 
     mock_catalog = MagicMock()
-    mock_catalog.get_dev_env_by_name.return_value = None
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = None
     mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
 
     test_dev_env_name = "not existing env"
@@ -59,7 +59,7 @@ def test_execute_dev_env_not_available_in_catalog() -> None:
     assert runner_result.exit_code == 0
     assert "Error: The input Development Environment is not available." in runner_result.stderr
 
-    mock_catalog.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
 
 @patch("dem.cli.command.clone_cmd.handle_existing_local_dev_env")
 def test_execute_success(mock_handle_existing_local_dev_env: MagicMock) -> None:
@@ -69,7 +69,7 @@ def test_execute_success(mock_handle_existing_local_dev_env: MagicMock) -> None:
 
     mock_catalog = MagicMock()
     mock_catalog_dev_env = MagicMock()
-    mock_catalog.get_dev_env_by_name.return_value = mock_catalog_dev_env
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = mock_catalog_dev_env
     mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
     mock_local_dev_env = MagicMock()
     mock_platform.get_dev_env_by_name.return_value = mock_local_dev_env
@@ -83,7 +83,7 @@ def test_execute_success(mock_handle_existing_local_dev_env: MagicMock) -> None:
     assert runner_result.exit_code == 0
     assert "The Dev Env successfully cloned." in runner_result.stdout
 
-    mock_catalog.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
     mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
     mock_handle_existing_local_dev_env.assert_called_once_with(mock_platform, mock_local_dev_env)
     mock_platform.local_dev_envs.append.assert_called_once_with(mock_catalog_dev_env)
@@ -19,7 +19,7 @@ runner = CliRunner(mix_stderr=False)
 
 def test_get_tool_image_list():
     # Test setup
-    mock_tool_images = MagicMock()
+    mock_tool_images = create_cmd.ToolImages(MagicMock(), MagicMock(), False)
     mock_tool_images.registry.elements = [
         "local_and_registry_image",
         "registry_image",
@@ -0,0 +1,187 @@
+"""Tests for the gc command."""
+# tests/cli/test_gc_cmd.py
+
+# Unit under test:
+import dem.cli.main as main
+import dem.cli.command.gc_cmd as gc_cmd
+
+# Test framework
+import pytest
+from typer.testing import CliRunner
+from unittest.mock import patch, MagicMock
+
+from dem.core.exceptions import PlatformError
+
+## Global test variables
+runner = CliRunner()
+test_layers_size = 10 ** 10
+test_images = {"sha256:1": {"tags": ["test_image1:latest"], "size": 200000000}}
+
+@pytest.mark.parametrize("test_size, expected_size", [
+    ("1000", 1000),
+    ("500MB", 500 * 1000 ** 2),
+    ("1.5 GiB", int(1.5 * 1024 ** 3)),
+    ("20g", 20 * 1000 ** 3),
+])
+def test_parse_size(test_size: str, expected_size: int):
+    # Run unit under test and check expectations
+    assert gc_cmd.parse_size(test_size) == expected_size
+
+@pytest.mark.parametrize("test_size", ["", "MB", "10XB", "-1GB"])
+def test_parse_size_invalid(test_size: str):
+    # Run unit under test and check expectations
+    with pytest.raises(ValueError):
+        gc_cmd.parse_size(test_size)
+
+@patch("dem.cli.command.gc_cmd.stderr.print")
+def test_gc_no_limit(mock_stderr_print: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["gc"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stderr_print.assert_called_once_with("[red]Error: Set the disk budget or the minimum free space.[/]")
+    mock_platform.get_gc_candidates.assert_not_called()
+
+@patch("dem.cli.command.gc_cmd.stderr.print")
+def test_gc_invalid_size(mock_stderr_print: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["gc", "--budget", "many"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stderr_print.assert_called_once_with("[red]Error: Invalid size: many[/]")
+    mock_platform.get_gc_candidates.assert_not_called()
+
+@patch("dem.cli.command.gc_cmd.print_evictions")
+@patch("dem.cli.command.gc_cmd.stdout.print")
+def test_gc_dry_run(mock_stdout_print: MagicMock, mock_print_evictions: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    mock_platform.get_image_disk_usage.return_value = (test_layers_size, test_images)
+    test_evictions = [
+        {"tool_image": "test_image1:latest", "last_used": None, "size": 200000000},
+        {"tool_image": "test_image2:latest", "last_used": 1.0, "size": 100000000},
+    ]
+    mock_platform.select_gc_evictions.return_value = test_evictions
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["gc", "--budget", "10GB", "--min-free", "1GB", 
+                                                   "--dry-run"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.get_image_disk_usage.assert_called_once()
+    mock_platform.get_gc_candidates.assert_called_once_with(test_images)
+    mock_platform.select_gc_evictions.assert_called_once_with(mock_platform.get_gc_candidates.return_value,
+                                                              test_layers_size, test_images,
+                                                              10 * 1000 ** 3, 
+                                                              1000 ** 3)
+    mock_print_evictions.assert_called_once_with(test_evictions)
+    mock_stdout_print.assert_called_once_with("Would reclaim at least 300.0 MB.")
+    mock_platform.collect_garbage.assert_not_called()
+
+@patch("dem.cli.command.gc_cmd.print_evictions")
+@patch("dem.cli.command.gc_cmd.stderr.print")
+@patch("dem.cli.command.gc_cmd.stdout.print")
+def test_gc(mock_stdout_print: MagicMock, mock_stderr_print: MagicMock, 
+            mock_print_evictions: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    mock_platform.get_image_disk_usage.return_value = (test_layers_size, test_images)
+    test_evictions = [{"tool_image": "test_image1:latest", "last_used": None, "size": 200000000}]
+    mock_platform.select_gc_evictions.return_value = test_evictions
+    mock_platform.collect_garbage.return_value = []
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["gc", "--min-free", "1GB"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.select_gc_evictions.assert_called_once_with(mock_platform.get_gc_candidates.return_value,
+                                                              test_layers_size, test_images, None,
+                                                              1000 ** 3)
+    mock_platform.collect_garbage.assert_called_once_with(test_evictions)
+    mock_stdout_print.assert_called_once_with("[green]Reclaimed at least 200.0 MB.[/]")
+    mock_stderr_print.assert_not_called()
+
+@patch("dem.cli.command.gc_cmd.print_evictions")
+@patch("dem.cli.command.gc_cmd.stderr.print")
+def test_gc_removal_failed(mock_stderr_print: MagicMock, mock_print_evictions: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    mock_platform.get_image_disk_usage.return_value = (test_layers_size, test_images)
+    mock_platform.select_gc_evictions.return_value = [{"tool_image": "test_image1:latest", 
+                                                       "last_used": None, "size": 200}]
+    mock_platform.collect_garbage.return_value = ["test_image1:latest"]
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["gc", "--budget", "1GB"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stderr_print.assert_called_once_with("[red]Error: Failed to evict: test_image1:latest[/]")
+
+@patch("dem.cli.command.gc_cmd.stdout.print")
+def test_gc_nothing_to_evict(mock_stdout_print: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    mock_platform.get_image_disk_usage.return_value = (test_layers_size, test_images)
+    mock_platform.select_gc_evictions.return_value = []
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["gc", "--budget", "1GB"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stdout_print.assert_called_once_with("Nothing to evict.")
+    mock_platform.collect_garbage.assert_not_called()
+
+@patch("dem.cli.command.gc_cmd.stderr.print")
+def test_gc_platform_error(mock_stderr_print: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    mock_platform.get_image_disk_usage.return_value = (test_layers_size, test_images)
+    mock_platform.select_gc_evictions.side_effect = PlatformError("test_error")
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["gc", "--min-free", "1GB"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stderr_print.assert_called_once_with("[red]Error: Platform error: test_error[/]")
+
+@patch("dem.cli.command.gc_cmd.stdout.print")
+@patch("dem.cli.command.gc_cmd.Table")
+def test_print_evictions(mock_Table: MagicMock, mock_stdout_print: MagicMock):
+    # Test setup
+    mock_table = MagicMock()
+    mock_Table.return_value = mock_table
+    test_evictions = [{"tool_image": "test_image1:latest", "last_used": None, "size": 2000}]
+
+    # Run unit under test
+    gc_cmd.print_evictions(test_evictions)
+
+    # Check expectations
+    mock_table.add_row.assert_called_once_with("test_image1:latest", "unknown", "2.0 kB")
+    mock_stdout_print.assert_called_once_with(mock_table)
@@ -80,7 +80,8 @@ def test_info_local_dev_env_demo():
     assert runner_result.exit_code == 0
 
     mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
-    mock_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images)
+    mock_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images, 
+                                                                   update_tool_image_store=True)
 
     expected_tools = [
         ["build system", "axemsolutions/make_gnu_arm:latest", "Image is available locally and in the registry."],
@@ -141,7 +142,8 @@ def test_info_local_dev_env_nagy_cica_project():
     assert runner_result.exit_code == 0
 
     mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
-    fake_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images)
+    fake_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images, 
+                                                                   update_tool_image_store=True)
 
     expected_tools = [
         ["build system", "axemsolutions/bazel:latest", "[red]Error: Required image is not available![/]"],
@@ -158,7 +160,7 @@ def test_info_dev_env_invalid():
     main.platform = mock_platform
 
     mock_platform.get_dev_env_by_name.return_value = None
-    mock_platform.dev_env_catalogs.catalogs = []
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = None
 
     # Run unit under test
     test_dev_env_name = "not_existing_environment"
@@ -168,6 +170,7 @@ def test_info_dev_env_invalid():
     assert runner_result.exit_code == 0
 
     mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
 
     console = Console(file=io.StringIO())
     console.print("[red]Error: Unknown Development Environment: not_existing_environment[/]")
@@ -211,7 +214,7 @@ def test_info_org_dev_env():
             "image_version": "latest" 
         },
     ]
-    mock_catalog.get_dev_env_by_name.return_value = fake_dev_env
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = fake_dev_env
     def stub_check_image_availability(*args, **kwargs):
         for tool in fake_dev_env.tools:
             tool["image_status"] = ToolImages.REGISTRY_ONLY
@@ -226,8 +229,9 @@ def test_info_org_dev_env():
 
     mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
 
-    mock_catalog.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
-    fake_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    fake_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images, 
+                                                                   update_tool_image_store=True)
 
     expected_tools = [
         ["build system", "axemsolutions/cmake:latest", "Image is available in the registry."],
@@ -40,18 +40,40 @@ def test_install_dev_env_valid_name(mock_stdout_print):
     mock_platform = MagicMock()
     mock_platform.get_dev_env_by_name.return_value = fake_dev_env_to_install
     main.platform = mock_platform
+    main.Platform.update_tool_images_on_instantiation = True
 
     # Run unit under test
     runner_result = runner.invoke(main.typer_cli, ["install", fake_dev_env_to_install.name ], color=True)
 
     # Check expectations
     assert 0 == runner_result.exit_code
+    assert main.Platform.update_tool_images_on_instantiation is False
     
     mock_platform.get_dev_env_by_name.assert_called_once_with(fake_dev_env_to_install.name )
-    mock_platform.install_dev_env.assert_called_once_with(fake_dev_env_to_install)
+    mock_platform.install_dev_env.assert_called_once_with(fake_dev_env_to_install, False)
     mock_stdout_print.assert_called_once_with(f"[green]Successfully installed the {fake_dev_env_to_install.name}![/]")
 
 
+@patch("dem.cli.command.install_cmd.stdout.print")
+def test_install_dev_env_update_installed(mock_stdout_print):
+     # Test setup
+    fake_dev_env_to_install = MagicMock()
+    fake_dev_env_to_install.name = "dev_env"
+    fake_dev_env_to_install.is_installed = True
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = fake_dev_env_to_install
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["install", fake_dev_env_to_install.name, 
+                                                   "--update"], color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.install_dev_env.assert_called_once_with(fake_dev_env_to_install, True)
+    mock_stdout_print.assert_called_once_with(f"[green]Successfully installed the {fake_dev_env_to_install.name}![/]")
+
 @patch("dem.cli.command.install_cmd.stderr.print")
 def test_install_dev_env_already_installed(mock_stderr_print):
      # Test setup
@@ -91,3 +113,52 @@ def test_install_dev_env_valid_name_failed(mock_stderr_print):
     mock_platform.get_dev_env_by_name.assert_called_once_with(fake_dev_env_to_install.name )
     mock_stderr_print.assert_called_once_with(f"[red]Error: Platform error: {test_exception_text}[/]")
 
+
+@patch("dem.cli.command.install_cmd.print_install_plan")
+def test_install_dev_env_plan(mock_print_install_plan: MagicMock):
+    # Test setup
+    fake_dev_env_to_install = MagicMock()
+    fake_dev_env_to_install.is_installed = True
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = fake_dev_env_to_install
+    main.platform = mock_platform
+    test_dev_env_name = "dev_env"
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["install", test_dev_env_name, "--plan"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.get_install_plan.assert_called_once_with(fake_dev_env_to_install)
+    mock_print_install_plan.assert_called_once_with(mock_platform.get_install_plan.return_value)
+    mock_platform.install_dev_env.assert_not_called()
+
+@patch("dem.cli.command.install_cmd.stderr.print")
+@patch("dem.cli.command.install_cmd.stdout.print")
+@patch("dem.cli.command.install_cmd.Table")
+def test_print_install_plan(mock_Table: MagicMock, mock_stdout_print: MagicMock, 
+                            mock_stderr_print: MagicMock):
+    # Test setup
+    mock_table = MagicMock()
+    mock_Table.return_value = mock_table
+    mock_install_plan = MagicMock()
+    mock_install_plan.get_pull_order.return_value = ["axemsolutions/make_gnu_arm:latest"]
+    mock_install_plan.get_layer_count.return_value = 2
+    mock_install_plan.get_download_size.return_value = 500000000
+    mock_install_plan.get_shared_size.return_value = 100000000
+    mock_install_plan.unavailable_tool_images = ["axemsolutions/jlink:latest"]
+    mock_install_plan.download_size = 650000000
+    mock_install_plan.layers = {"sha256:1": {}, "sha256:2": {}, "sha256:3": {}}
+    mock_install_plan.shared_layer_count = 1
+    mock_install_plan.local_layer_count = 4
+
+    # Run unit under test
+    install_cmd.print_install_plan(mock_install_plan)
+
+    # Check expectations
+    mock_table.add_row.assert_called_once_with("axemsolutions/make_gnu_arm:latest", "2", "500.0 MB",
+                                               "100.0 MB")
+    mock_stderr_print.assert_called_once_with("[red]Error: The layers of axemsolutions/jlink:latest are not available.[/]")
+    mock_stdout_print.assert_any_call(mock_table)
+    mock_stdout_print.assert_any_call("Total download: 650.0 MB in 3 layers (1 shared by several tools, 4 already available locally)")
@@ -0,0 +1,97 @@
+"""Tests for the list-cache command."""
+# tests/cli/test_list_cache_cmd.py
+
+# Unit under test:
+import dem.cli.main as main
+
+# Test framework
+from typer.testing import CliRunner
+from unittest.mock import patch, MagicMock
+
+from dem.core.dev_env import DevEnv
+from dem.core.exceptions import ContainerEngineError
+from rich.table import Table
+
+## Global test variables
+runner = CliRunner()
+
+@patch("dem.cli.command.list_cache_cmd.stdout.print")
+def test_list_cache(mock_stdout_print: MagicMock, cache_dev_env: DevEnv):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = cache_dev_env
+    mock_platform.container_engine.get_volume_sizes.return_value = {
+        "dem-cache-test_dev_env-ccache": 1500000,
+        "dem-cache-test_dev_env-conan": None,
+    }
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["list-cache", "test_dev_env"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.get_dev_env_by_name.assert_called_once_with("test_dev_env")
+    mock_platform.container_engine.get_volume_sizes.assert_called_once_with([
+        "dem-cache-test_dev_env-ccache", "dem-cache-test_dev_env-conan"
+    ])
+    expected_table = Table()
+    expected_table.add_column("Tool type")
+    expected_table.add_column("Volume")
+    expected_table.add_column("Path")
+    expected_table.add_column("Size", justify="right")
+    expected_table.add_row("toolchain", "ccache", "/root/.ccache", "1.5 MB")
+    expected_table.add_row("build system", "conan", "/root/.conan2", "-")
+    actual_table = mock_stdout_print.call_args.args[0]
+    assert [column._cells for column in actual_table.columns] == \
+        [column._cells for column in expected_table.columns]
+
+@patch("dem.cli.command.list_cache_cmd.stdout.print")
+def test_list_cache_no_volumes(mock_stdout_print: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = DevEnv({"name": "test_dev_env", 
+                                                             "installed": "True", "tools": []})
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["list-cache", "test_dev_env"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stdout_print.assert_called_once_with("[yellow]The test_dev_env has no cache volumes.[/]")
+    mock_platform.container_engine.get_volume_sizes.assert_not_called()
+
+@patch("dem.cli.command.list_cache_cmd.stderr.print")
+def test_list_cache_unknown_dev_env(mock_stderr_print: MagicMock):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = None
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["list-cache", "test_dev_env"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stderr_print.assert_called_once_with("[red]Error: Unknown Development Environment: test_dev_env[/]")
+
+@patch("dem.cli.command.list_cache_cmd.stderr.print")
+def test_list_cache_ContainerEngineError(mock_stderr_print: MagicMock, cache_dev_env: DevEnv):
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = cache_dev_env
+    test_exception = ContainerEngineError("test")
+    mock_platform.container_engine.get_volume_sizes.side_effect = test_exception
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["list-cache", "test_dev_env"])
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_stderr_print.assert_called_once_with(f"[red]Error: {test_exception}[/]")
@@ -17,17 +17,14 @@ import importlib.metadata, typer
 # In order to test stdout and stderr separately, the stderr can't be mixed into the stdout.
 runner = CliRunner(mix_stderr=False)
 
-def test_autocomplete_dev_env_name():
+@patch("dem.cli.main.CompletionIndexFile")
+def test_autocomplete_dev_env_name(mock_CompletionIndexFile: MagicMock):
     # Test setup
-    mock_platform = MagicMock()
-    mock_dev_env = MagicMock()
-    mock_dev_env.name = "TeSt"
-    mock_platform.local_dev_envs = [
-        mock_dev_env
-    ]
-    main.platform = mock_platform
+    mock_completion_index_file = MagicMock()
+    mock_CompletionIndexFile.return_value = mock_completion_index_file
+    mock_completion_index_file.get_names.return_value = ["TeSt", "other"]
 
-    expected_completions = [mock_dev_env.name]
+    expected_completions = ["TeSt"]
 
     # Run unit under test
     actual_completions = []
@@ -37,16 +34,16 @@ def test_autocomplete_dev_env_name():
     # Check expectations
     assert expected_completions == actual_completions
 
-def test_autocomplete_cat_name():
+    mock_completion_index_file.get_names.assert_called_once_with("dev_envs")
+
+@patch("dem.cli.main.CompletionIndexFile")
+def test_autocomplete_cat_name(mock_CompletionIndexFile: MagicMock):
     # Test setup
-    mock_platform = MagicMock()
-    fake_catalog_config = {
-        "name": "test"
-    }
-    mock_platform.dev_env_catalogs.list_catalog_configs.return_value = [fake_catalog_config]
-    main.platform = mock_platform
+    mock_completion_index_file = MagicMock()
+    mock_CompletionIndexFile.return_value = mock_completion_index_file
+    mock_completion_index_file.get_names.return_value = ["test", "other"]
 
-    expected_completions = [fake_catalog_config["name"]]
+    expected_completions = ["test"]
 
     # Run unit under test
     actual_completions = []
@@ -56,18 +53,16 @@ def test_autocomplete_cat_name():
     # Check expectations
     assert expected_completions == actual_completions
 
-    mock_platform.dev_env_catalogs.list_catalog_configs.assert_called_once()
+    mock_completion_index_file.get_names.assert_called_once_with("catalogs")
 
-def test_autocomplete_reg_name():
+@patch("dem.cli.main.CompletionIndexFile")
+def test_autocomplete_reg_name(mock_CompletionIndexFile: MagicMock):
     # Test setup
-    mock_platform = MagicMock()
-    fake_registry_config = {
-        "name": "test"
-    }
-    mock_platform.registries.list_registry_configs.return_value = [fake_registry_config]
-    main.platform = mock_platform
+    mock_completion_index_file = MagicMock()
+    mock_CompletionIndexFile.return_value = mock_completion_index_file
+    mock_completion_index_file.get_names.return_value = ["test", "other"]
 
-    expected_completions = [fake_registry_config["name"]]
+    expected_completions = ["test"]
 
     # Run unit under test
     actual_completions = []
@@ -76,19 +71,36 @@ def test_autocomplete_reg_name():
 
     # Check expectations
     assert expected_completions == actual_completions
-    
-    mock_platform.registries.list_registry_configs.assert_called_once()
 
-def test_autocomplete_host_name():
+    mock_completion_index_file.get_names.assert_called_once_with("registries")
+
+@patch("dem.cli.main.CompletionIndexFile")
+def test_autocomplete_reg_name_empty_incomplete(mock_CompletionIndexFile: MagicMock):
     # Test setup
-    mock_platform = MagicMock()
-    fake_host_config = {
-        "name": "test"
-    }
-    mock_platform.hosts.list_configs.return_value = [fake_host_config]
-    main.platform = mock_platform
+    mock_completion_index_file = MagicMock()
+    mock_CompletionIndexFile.return_value = mock_completion_index_file
+    mock_completion_index_file.get_names.return_value = ["test", "other"]
+
+    expected_completions = ["test", "other"]
+
+    # Run unit under test
+    actual_completions = []
+    for result in main.autocomplete_reg_name(""):
+        actual_completions.append(result)
+
+    # Check expectations
+    assert expected_completions == actual_completions
+
+    mock_completion_index_file.get_names.assert_called_once_with("registries")
+
+@patch("dem.cli.main.CompletionIndexFile")
+def test_autocomplete_host_name(mock_CompletionIndexFile: MagicMock):
+    # Test setup
+    mock_completion_index_file = MagicMock()
+    mock_CompletionIndexFile.return_value = mock_completion_index_file
+    mock_completion_index_file.get_names.return_value = ["test", "other"]
 
-    expected_completions = [fake_host_config["name"]]
+    expected_completions = ["test"]
 
     # Run unit under test
     actual_completions = []
@@ -98,7 +110,7 @@ def test_autocomplete_host_name():
     # Check expectations
     assert expected_completions == actual_completions
 
-    mock_platform.hosts.list_configs.assert_called_once()
+    mock_completion_index_file.get_names.assert_called_once_with("hosts")
 
 @patch("dem.cli.main.__app_name__", "axem-dem")
 @patch("dem.cli.main.stdout.print")
@@ -142,6 +154,38 @@ def test_version_exit_raised(mock_importlib_metadata_version):
     with pytest.raises(typer.Exit):
         main._version_callback(True)
 
+@patch("dem.cli.command.list_reg_cmd.execute")
+@patch("dem.cli.main.Registry")
+def test_refresh(mock_Registry: MagicMock, mock_list_reg_cmd_execute: MagicMock) -> None:
+    # Test setup
+    mock_Registry.refresh_cache = False
+    main.platform = MagicMock()
+
+    # Run unit under test
+    result = runner.invoke(main.typer_cli, ["--refresh", "list-reg"])
+
+    # Check expectations
+    assert result.exit_code == 0
+    assert mock_Registry.refresh_cache is True
+
+    mock_list_reg_cmd_execute.assert_called_once_with(main.platform)
+
+@patch("dem.cli.command.list_cat_cmd.execute")
+@patch("dem.cli.main.DevEnvCatalog")
+def test_offline(mock_DevEnvCatalog: MagicMock, mock_list_cat_cmd_execute: MagicMock) -> None:
+    # Test setup
+    mock_DevEnvCatalog.offline = False
+    main.platform = MagicMock()
+
+    # Run unit under test
+    result = runner.invoke(main.typer_cli, ["--offline", "list-cat"])
+
+    # Check expectations
+    assert result.exit_code == 0
+    assert mock_DevEnvCatalog.offline is True
+
+    mock_list_cat_cmd_execute.assert_called_once_with(main.platform)
+
 def test_platform_not_initialized() -> None:
     # Test setup
     test_dev_env_name = "test_dev_env_name"
@@ -13,6 +13,8 @@ from unittest.mock import patch, MagicMock
 from rich.console import Console
 import io, typer
 
+from dem.core.dev_env import DevEnvList
+
 ## Global test variables
 
 # In order to test stdout and stderr separately, the stderr can't be mixed into the stdout.
@@ -20,7 +22,7 @@ runner = CliRunner(mix_stderr=False)
 
 def test_get_tool_image_list():
     # Test setup
-    mock_tool_images = MagicMock()
+    mock_tool_images = modify_cmd.ToolImages(MagicMock(), MagicMock(), False)
     mock_tool_images.registry.elements = [
         "local_and_registry_image",
         "registry_image",
@@ -82,7 +84,7 @@ def test_handle_user_confirm_save_as(mock_prompt):
     mock_platform.get_dev_env_by_name.return_value = None
     mock_dev_env_local = MagicMock()
     mock_dev_env_local.name = "fake dev env"
-    mock_platform.local_dev_envs = [mock_dev_env_local]
+    mock_platform.local_dev_envs = DevEnvList([mock_dev_env_local])
     
     # Run unit under test
     modify_cmd.handle_user_confirm("save as", mock_dev_env_local, mock_platform)
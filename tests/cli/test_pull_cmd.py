@@ -22,14 +22,14 @@ def test_dev_env_not_available_in_org():
     mock_platform = MagicMock()
     mock_catalog = MagicMock()
     mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
-    mock_catalog.get_dev_env_by_name.return_value = None
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = None
     main.platform = mock_platform
 
     # Run unit under test
     runner_result = runner.invoke(main.typer_cli, ["pull", "not existing env"], color=True)
 
     # Check expectations
-    mock_catalog.get_dev_env_by_name.assert_called_once_with("not existing env")
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with("not existing env")
 
     assert 0 == runner_result.exit_code
 
@@ -46,7 +46,7 @@ def test_dev_env_already_installed():
 
     mock_catalog_dev_env = MagicMock()
     mock_tools = MagicMock()
-    mock_catalog.get_dev_env_by_name.return_value = mock_catalog_dev_env
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = mock_catalog_dev_env
 
     mock_local_dev_env = MagicMock()
     mock_local_dev_env.name = "test_env"
@@ -72,10 +72,10 @@ def test_dev_env_already_installed():
     # Check expectations
     assert 0 == runner_result.exit_code
 
-    mock_catalog.get_dev_env_by_name.assert_called_once_with(test_env_name)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with(test_env_name)
 
     mock_platform.get_dev_env_by_name.assert_called_once_with(mock_catalog_dev_env.name)
-    mock_platform.install_dev_env.assert_called_once_with(mock_local_dev_env)
+    mock_platform.install_dev_env.assert_called_once_with(mock_local_dev_env, False)
     mock_local_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images, 
                                                                          update_tool_image_store=True)
 
@@ -93,7 +93,7 @@ def test_dev_env_installed_but_different():
     mock_catalog_dev_env = MagicMock()
     mock_tools = MagicMock()
     mock_catalog_dev_env.tools = mock_tools
-    mock_catalog.get_dev_env_by_name.return_value = mock_catalog_dev_env
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = mock_catalog_dev_env
 
     mock_local_dev_env = MagicMock()
     mock_local_dev_env.name = "test_env"
@@ -116,11 +116,11 @@ def test_dev_env_installed_but_different():
     assert 0 == runner_result.exit_code
     assert mock_local_dev_env.tools is mock_catalog_dev_env.tools
 
-    mock_catalog.get_dev_env_by_name.assert_called_once_with(test_env_name)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with(test_env_name)
 
     mock_platform.get_dev_env_by_name.assert_called_once_with(mock_catalog_dev_env.name)
     mock_platform.flush_descriptors.assert_called_once()
-    mock_platform.install_dev_env.assert_called_once_with(mock_local_dev_env)
+    mock_platform.install_dev_env.assert_called_once_with(mock_local_dev_env, False)
     mock_local_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images, 
                                                                          update_tool_image_store=True)
 
@@ -139,7 +139,7 @@ def test_dev_env_new_install(mock_DevEnv: MagicMock):
     mock_catalog_dev_env = MagicMock()
     mock_tools = MagicMock()
     mock_catalog_dev_env.tools = mock_tools
-    mock_catalog.get_dev_env_by_name.return_value = mock_catalog_dev_env
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = mock_catalog_dev_env
     mock_platform.get_dev_env_by_name.return_value = None
 
     mock_local_dev_env = MagicMock()
@@ -163,11 +163,11 @@ def test_dev_env_new_install(mock_DevEnv: MagicMock):
     assert 0 == runner_result.exit_code
     assert mock_local_dev_env in mock_platform.local_dev_envs
 
-    mock_catalog.get_dev_env_by_name.assert_called_once_with(test_env_name)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with(test_env_name)
     mock_platform.get_dev_env_by_name.assert_called_once_with(mock_catalog_dev_env.name)
     mock_DevEnv.assert_called_once_with(dev_env_to_copy=mock_catalog_dev_env)
     mock_platform.flush_descriptors.assert_called_once()
-    mock_platform.install_dev_env.assert_called_once_with(mock_local_dev_env)
+    mock_platform.install_dev_env.assert_called_once_with(mock_local_dev_env, False)
     mock_local_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images, 
                                                                          update_tool_image_store=True)
 
@@ -187,7 +187,7 @@ def test_execute_install_failed(mock_create_dev_env: MagicMock,
     mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
 
     mock_catalog_dev_env = MagicMock()
-    mock_catalog.get_dev_env_by_name.return_value = mock_catalog_dev_env
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = mock_catalog_dev_env
     mock_platform.get_dev_env_by_name.return_value = None
 
     mock_local_dev_env = MagicMock()
@@ -206,13 +206,13 @@ def test_execute_install_failed(mock_create_dev_env: MagicMock,
     # Check expectations
     assert 0 == runner_result.exit_code
 
-    mock_catalog.get_dev_env_by_name(test_env_name)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name(test_env_name)
     mock_platform.get_dev_env_by_name.assert_called_once_with(mock_catalog_dev_env.name)
     mock_create_dev_env.assert_called_once_with(mock_local_dev_env, mock_catalog_dev_env, 
                                                          mock_platform)
     mock_local_dev_env.check_image_availability.assert_called_once_with(mock_platform.tool_images, 
                                                                          update_tool_image_store=True)
-    mock_platform.install_dev_env.assert_called_once_with(mock_local_dev_env)
+    mock_platform.install_dev_env.assert_called_once_with(mock_local_dev_env, False)
     mock_stderr_print.assert_called_once_with("The installation failed.")
 
 @patch("dem.cli.command.pull_cmd.stderr.print")
@@ -237,7 +237,7 @@ def test_execute_dev_env_not_available_in_catalog(mock_stderr_print: MagicMock):
     # Test setup
     mock_platform = MagicMock()
     mock_catalog = MagicMock()
-    mock_catalog.get_dev_env_by_name.return_value = None
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.return_value = None
     mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
     main.platform = mock_platform
 
@@ -249,5 +249,5 @@ def test_execute_dev_env_not_available_in_catalog(mock_stderr_print: MagicMock):
     # Check expectations
     assert 0 == runner_result.exit_code
 
-    mock_catalog.get_dev_env_by_name.assert_called_once_with(test_env_name)
+    mock_platform.dev_env_catalogs.get_dev_env_by_name.assert_called_once_with(test_env_name)
     mock_stderr_print.assert_called_once_with("[red]Error: The input Development Environment is not available for the organization.[/]")
\ No newline at end of file
@@ -31,9 +31,10 @@ def test_rename_success():
 
     # Check expectations
     assert 0 == runner_result.exit_code
-    assert fake_dev_env_to_rename.name is new_dev_env_name
 
     fake_local_platform.get_dev_env_by_name.assert_called_once_with(original_dev_env_name)
+    fake_local_platform.local_dev_envs.rename.assert_called_once_with(fake_dev_env_to_rename, 
+                                                                      new_dev_env_name)
     fake_local_platform.flush_descriptors.assert_called_once()
 
 @patch("dem.cli.command.rename_cmd.stderr.print")
@@ -46,6 +46,7 @@ def test_handle_missing_tool_images_no_fix(mock_stderr_print, mock_confirm):
         "missing_tool_image_3",
     }
     mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = []
     mock_platform = MagicMock()
     mock_confirm.side_effect = Exception()
 
@@ -75,6 +76,7 @@ def test_handle_missing_tool_images_do_fix(mock_stderr_print, mock_confirm, mock
         "missing_tool_image_3",
     }
     mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = []
     mock_platform = MagicMock()
 
     # Run unit under test
@@ -102,26 +104,24 @@ def test_execute(mock_handle_missing_tool_images):
     test_args = ["run", test_dev_env_name, test_tool_type, test_workspace_path, test_command]
     
     mock_platform = MagicMock()
-    mock_platform.tool_images.local.elements = ["test_image_name:test_image_version"]
+    mock_platform.config_file.warm_containers = False
+    mock_platform.config_file.passthrough_output = True
+    mock_platform.container_engine.run.return_value = 0
+    mock_platform.is_dev_env_lock_valid.return_value = False
+    mock_platform.container_engine.resolve_local_images.return_value = {
+        "test_image_name:test_image_version"
+    }
     main.platform = mock_platform
     mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = []
+    mock_dev_env_local.get_tool_images.return_value = [
+        "test_image_name:test_image_version",
+        "missing_image_name:missing_image_version",
+    ]
     mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
 
     main.Platform.update_tool_images_on_instantiation = True
 
-    mock_dev_env_local.tools = [
-        {
-            "image_name": "test_image_name",
-            "image_version": "test_image_version",
-            "type": test_tool_type
-        },
-        {
-            "image_name": "missing_image_name",
-            "image_version": "missing_image_version",
-            "type": "missing_tool_type"
-        },
-    ]
-
     # Run unit under test
     runner_result = runner.invoke(main.typer_cli, test_args, color=True)
 
@@ -130,10 +130,191 @@ def test_execute(mock_handle_missing_tool_images):
     assert main.Platform.update_tool_images_on_instantiation is False
 
     mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
-    mock_platform.tool_images.local.update.assert_called_once()
+    mock_platform.container_engine.resolve_local_images.assert_called_once_with(
+        mock_dev_env_local.get_tool_images.return_value
+    )
+    mock_platform.tool_images.local.update.assert_not_called()
+    mock_platform.is_dev_env_lock_valid.assert_called_once_with(mock_dev_env_local)
 
     expected_missing_tool_image = {"missing_image_name:missing_image_version"}
     mock_handle_missing_tool_images.assert_called_once_with(expected_missing_tool_image, 
                                                             mock_dev_env_local, 
                                                             mock_platform)
-    mock_platform.container_engine.run.assert_called_once_with(test_args[2:])
\ No newline at end of file
+    mock_platform.record_tool_image_usage.assert_called_once_with(mock_dev_env_local.get_tool_images.return_value)
+    mock_platform.container_engine.run.assert_called_once_with(test_args[2:], passthrough=True,
+                                                               cache_volumes=mock_dev_env_local.get_cache_volume_mounts.return_value)
+
+@patch("dem.cli.command.run_cmd.handle_missing_tool_images")
+def test_execute_lock_valid(mock_handle_missing_tool_images: MagicMock):
+    # Test setup
+    test_dev_env_name = "test_dev_env_name"
+    test_args = ["run", test_dev_env_name, "test_command"]
+
+    mock_platform = MagicMock()
+    mock_platform.config_file.warm_containers = False
+    mock_platform.config_file.passthrough_output = True
+    mock_platform.container_engine.run.return_value = 0
+    mock_platform.is_dev_env_lock_valid.return_value = True
+    main.platform = mock_platform
+    mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = []
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, test_args, color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.is_dev_env_lock_valid.assert_called_once_with(mock_dev_env_local)
+    mock_platform.container_engine.resolve_local_images.assert_not_called()
+    mock_handle_missing_tool_images.assert_not_called()
+    mock_platform.lock_dev_env.assert_not_called()
+    mock_platform.flush_descriptors.assert_not_called()
+    mock_platform.container_engine.run.assert_called_once_with(test_args[2:], passthrough=True,
+                                                               cache_volumes=mock_dev_env_local.get_cache_volume_mounts.return_value)
+
+@patch("dem.cli.command.run_cmd.handle_missing_tool_images")
+def test_execute_relock(mock_handle_missing_tool_images: MagicMock):
+    # Test setup
+    test_dev_env_name = "test_dev_env_name"
+    test_args = ["run", test_dev_env_name, "test_command"]
+
+    mock_platform = MagicMock()
+    mock_platform.config_file.warm_containers = False
+    mock_platform.config_file.passthrough_output = True
+    mock_platform.container_engine.run.return_value = 0
+    mock_platform.is_dev_env_lock_valid.return_value = False
+    mock_platform.container_engine.resolve_local_images.return_value = {
+        "test_image_name:test_image_version"
+    }
+    main.platform = mock_platform
+    mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = []
+    mock_dev_env_local.get_tool_images.return_value = ["test_image_name:test_image_version"]
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, test_args, color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_handle_missing_tool_images.assert_not_called()
+    mock_platform.lock_dev_env.assert_called_once_with(mock_dev_env_local)
+    mock_platform.flush_descriptors.assert_called_once()
+    mock_platform.container_engine.run.assert_called_once_with(test_args[2:], passthrough=True,
+                                                               cache_volumes=mock_dev_env_local.get_cache_volume_mounts.return_value)
+    mock_platform.container_engine.run_warm.assert_not_called()
+
+@pytest.mark.parametrize("test_fresh_args, expected_fresh", [([], False), (["--fresh"], True)])
+def test_execute_warm(test_fresh_args: list[str], expected_fresh: bool) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env_name"
+    test_container_args = ["test_image", "test_command"]
+    test_idle_timeout = 600
+
+    mock_platform = MagicMock()
+    mock_platform.config_file.warm_containers = True
+    mock_platform.config_file.passthrough_output = True
+    mock_platform.config_file.warm_container_idle_timeout = test_idle_timeout
+    mock_platform.container_engine.run_warm.return_value = 0
+    mock_platform.is_dev_env_lock_valid.return_value = True
+    main.platform = mock_platform
+    mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = []
+    mock_dev_env_local.name = test_dev_env_name
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, 
+                                  ["run", *test_fresh_args, test_dev_env_name, *test_container_args], 
+                                  color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.record_tool_image_usage.assert_called_once_with(mock_dev_env_local.get_tool_images.return_value)
+    mock_platform.container_engine.run_warm.assert_called_once_with(test_container_args, 
+                                                                    test_dev_env_name,
+                                                                    test_idle_timeout, 
+                                                                    expected_fresh, 
+                                                                    passthrough=True,
+                                                                    cache_volumes=mock_dev_env_local.get_cache_volume_mounts.return_value)
+    mock_platform.container_engine.run.assert_not_called()
+
+def test_execute_exit_code() -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env_name"
+    test_args = ["run", test_dev_env_name, "test_image", "false"]
+
+    mock_platform = MagicMock()
+    mock_platform.config_file.warm_containers = False
+    mock_platform.config_file.passthrough_output = True
+    mock_platform.is_dev_env_lock_valid.return_value = True
+    mock_platform.container_engine.run.return_value = 2
+    main.platform = mock_platform
+    mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = []
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, test_args, color=True)
+
+    # Check expectations
+    assert 2 == runner_result.exit_code
+
+    mock_platform.container_engine.run.assert_called_once_with(test_args[2:], passthrough=True,
+                                                               cache_volumes=mock_dev_env_local.get_cache_volume_mounts.return_value)
+
+def test_execute_run_options() -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env_name"
+    test_args = ["run", test_dev_env_name, "--cpus", "4", "test_image", "make"]
+
+    mock_platform = MagicMock()
+    mock_platform.config_file.warm_containers = False
+    mock_platform.config_file.passthrough_output = True
+    mock_platform.is_dev_env_lock_valid.return_value = True
+    mock_platform.container_engine.run.return_value = 0
+    main.platform = mock_platform
+    mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = ["--cpus", "2", "--tmpfs", "/build"]
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, test_args, color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.container_engine.run.assert_called_once_with(["--cpus", "2", "--tmpfs", "/build",
+                                                                "--cpus", "4", "test_image", "make"], 
+                                                               passthrough=True,
+                                                               cache_volumes=mock_dev_env_local.get_cache_volume_mounts.return_value)
+
+@pytest.mark.parametrize("test_passthrough_output", [True, False])
+def test_execute_passthrough_output(test_passthrough_output: bool) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env_name"
+    test_args = ["run", test_dev_env_name, "test_image", "make"]
+
+    mock_platform = MagicMock()
+    mock_platform.config_file.warm_containers = False
+    mock_platform.config_file.passthrough_output = test_passthrough_output
+    mock_platform.is_dev_env_lock_valid.return_value = True
+    mock_platform.container_engine.run.return_value = 0
+    main.platform = mock_platform
+    mock_dev_env_local = MagicMock()
+    mock_dev_env_local.run_options = []
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, test_args, color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.container_engine.run.assert_called_once_with(test_args[2:], 
+                                                               passthrough=test_passthrough_output,
+                                                               cache_volumes=mock_dev_env_local.get_cache_volume_mounts.return_value)
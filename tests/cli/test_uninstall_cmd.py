@@ -46,7 +46,7 @@ def test_uninstall_dev_env_valid_name(mock_stdout_print):
     assert 0 == runner_result.exit_code
     
     mock_platform.get_dev_env_by_name.assert_called_once_with(fake_dev_env_to_uninstall.name )
-    mock_platform.uninstall_dev_env.assert_called_once_with(fake_dev_env_to_uninstall)
+    mock_platform.uninstall_dev_env.assert_called_once_with(fake_dev_env_to_uninstall, False)
     mock_stdout_print.assert_called_once_with(f"[green]Successfully deleted the {fake_dev_env_to_uninstall.name}![/]")
 
 @patch("dem.cli.command.uninstall_cmd.stderr.print")
@@ -87,4 +87,21 @@ def test_uninstall_dev_env_valid_name_failed(mock_stderr_print):
     assert 0 == runner_result.exit_code
     
     mock_platform.get_dev_env_by_name.assert_called_once_with(fake_dev_env_to_uninstall.name )
-    mock_stderr_print.assert_called_once_with(f"[red]Error: Platform error: {test_exception_text}[/]")
\ No newline at end of file
+    mock_stderr_print.assert_called_once_with(f"[red]Error: Platform error: {test_exception_text}[/]")
+@patch("dem.cli.command.uninstall_cmd.stdout.print")
+def test_uninstall_dev_env_prune(mock_stdout_print):
+    # Test setup
+    fake_dev_env_to_uninstall = MagicMock()
+    fake_dev_env_to_uninstall.is_installed = True
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = fake_dev_env_to_uninstall
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["uninstall", "dev_env", "--prune"], color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.uninstall_dev_env.assert_called_once_with(fake_dev_env_to_uninstall, True)
+    mock_stdout_print.assert_called_once_with("[green]Successfully deleted the dev_env![/]")
@@ -34,7 +34,7 @@ def test_PullProgressBar__update_progress_bar():
     pull_progress_bar._update_progress_bar(test_id, test_item, test_status)
 
     # Check expectations
-    assert pull_progress_bar.tasks[test_id] is test_task_id
+    assert pull_progress_bar.tasks[(None, test_id)] is test_task_id
 
     pull_progress_bar.progress.add_task.assert_called_once_with(str(test_id), id=test_id)
     pull_progress_bar.progress.update.assert_called_once_with(test_task_id, 
@@ -42,6 +42,54 @@ def test_PullProgressBar__update_progress_bar():
                                                               total=float(test_total),
                                                               completed=float(test_current))
 
+def test_PullProgressBar__update_progress_bar_multiple_images():
+    # Test setup
+    test_id = "test_id"
+    test_images = ["test_image1:latest", "test_image2:latest"]
+    test_task_ids = [0, 1]
+
+    pull_progress_bar = tui_user_output.PullProgressBar(MagicMock())
+    pull_progress_bar.progress = MagicMock()
+    pull_progress_bar.progress.add_task.side_effect = test_task_ids
+
+    for test_image in test_images:
+        test_item = {
+            "image": test_image,
+            "progressDetail": {
+                "current": 10,
+                "total": 100,
+            }
+        }
+
+        # Run unit under test
+        pull_progress_bar._update_progress_bar(test_id, test_item, "Downloading")
+
+    # Check expectations
+    for test_image, test_task_id in zip(test_images, test_task_ids):
+        assert pull_progress_bar.tasks[(test_image, test_id)] is test_task_id
+
+    pull_progress_bar.progress.add_task.assert_has_calls([
+        call(test_id, id=test_images[0] + " " + test_id),
+        call(test_id, id=test_images[1] + " " + test_id),
+    ])
+
+def test_PullProgressBar__process_image_no_progressDetail():
+    # Test setup
+    test_item = {
+        "status": "test_status",
+        "id": "test_id",
+        "image": "test_image:latest",
+    }
+
+    pull_progress_bar = tui_user_output.PullProgressBar(MagicMock())
+    pull_progress_bar.progress = MagicMock()
+
+    # Run unit under test
+    pull_progress_bar._process(test_item)
+
+    # Check expectations
+    pull_progress_bar.progress.console.print.assert_called_once_with("test_image:latest test_id: test_status")
+
 @patch.object(tui_user_output.PullProgressBar, "_update_progress_bar")
 def test_PullProgressBar__process(mock__update_progress_bar):
     # Test setup
@@ -8,14 +8,17 @@ import dem.core.container_engine as container_engine
 import pytest
 from unittest.mock import patch, MagicMock, call
 
+import time
+
 class mockImage:
-    def __init__(self, tags: list[str]) -> None:
+    def __init__(self, tags: list[str], id: str = "") -> None:
         self.tags = tags
+        self.id = id
 
 def _get_test_image_tags_as_images(test_image_tags):
     test_images = []
-    for test_image_tag in test_image_tags:
-        test_images.append(mockImage(test_image_tag))
+    for idx, test_image_tag in enumerate(test_image_tags):
+        test_images.append(mockImage(test_image_tag, "sha256:" + str(idx)))
     return test_images
 
 @patch("docker.from_env")
@@ -79,6 +82,384 @@ def test_get_local_tool_images_when_none_available(mock_docker_from_env):
     mock_docker_from_env.assert_called_once()
     fake_docker_client.images.list.assert_called_once()
 
+
+@patch("docker.from_env")
+def test_resolve_local_images(mock_docker_from_env: MagicMock):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_local_images = {"axemsolutions/cpputest:latest", "axemsolutions/stlink_org:latest"}
+    def stub_inspect_image(reference: str) -> dict:
+        if reference not in test_local_images:
+            raise container_engine.docker.errors.ImageNotFound(reference)
+        return {"Id": "sha256:" + reference}
+    mock_docker_client.api.inspect_image.side_effect = stub_inspect_image
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_images = test_container_engine.resolve_local_images([
+        "axemsolutions/cpputest:latest", 
+        "axemsolutions/make_gnu_arm:latest", 
+        "axemsolutions/stlink_org:latest",
+        "axemsolutions/cpputest:latest",
+    ])
+
+    # Check expectations
+    assert actual_images == test_local_images
+
+    assert mock_docker_client.api.inspect_image.call_count == 3
+    mock_docker_client.images.list.assert_not_called()
+
+@patch("docker.from_env")
+def test_resolve_local_images_empty(mock_docker_from_env: MagicMock):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_images = test_container_engine.resolve_local_images([])
+
+    # Check expectations
+    assert actual_images == set()
+
+    mock_docker_client.api.inspect_image.assert_not_called()
+
+@patch("docker.from_env")
+def test_get_local_image_ids_without_index(mock_docker_from_env: MagicMock):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    def stub_inspect_image(reference: str) -> dict:
+        if reference != "axemsolutions/cpputest:latest":
+            raise container_engine.docker.errors.ImageNotFound(reference)
+        return {"Id": "sha256:1"}
+    mock_docker_client.api.inspect_image.side_effect = stub_inspect_image
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_image_ids = test_container_engine.get_local_image_ids(["axemsolutions/cpputest:latest",
+                                                                  "axemsolutions/jlink:latest"])
+
+    # Check expectations
+    assert actual_image_ids == {"axemsolutions/cpputest:latest": "sha256:1"}
+
+@patch.object(container_engine.ContainerEngine, "_sync_local_image_index")
+@patch("docker.from_env")
+def test_get_local_image_ids_from_index(mock_docker_from_env: MagicMock, 
+                                        mock__sync_local_image_index: MagicMock):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock__sync_local_image_index.return_value = {
+        "sha256:1": ["axemsolutions/cpputest:latest", "axemsolutions/cpputest:v1.0.0"],
+        "sha256:2": ["axemsolutions/stlink_org:latest"],
+    }
+
+    test_container_engine = container_engine.ContainerEngine(MagicMock())
+
+    # Run unit under test
+    actual_image_ids = test_container_engine.get_local_image_ids(["axemsolutions/cpputest:v1.0.0",
+                                                                  "axemsolutions/jlink:latest"])
+
+    # Check expectations
+    assert actual_image_ids == {"axemsolutions/cpputest:v1.0.0": "sha256:1"}
+
+    mock__sync_local_image_index.assert_called_once()
+    mock_docker_client.api.inspect_image.assert_not_called()
+
+def test_get_chain_ids():
+    # Test setup
+    expected_chain_id2 = "sha256:" + container_engine.hashlib.sha256(b"sha256:1 sha256:2").hexdigest()
+    expected_chain_id3 = "sha256:" + container_engine.hashlib.sha256((expected_chain_id2 + " sha256:3").encode()).hexdigest()
+
+    # Run unit under test
+    actual_chain_ids = container_engine.get_chain_ids(["sha256:1", "sha256:2", "sha256:3"])
+
+    # Check expectations
+    assert actual_chain_ids == ["sha256:1", expected_chain_id2, expected_chain_id3]
+
+@patch("docker.from_env")
+def test_get_local_layer_chain_ids(mock_docker_from_env: MagicMock):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.images.return_value = ["sha256:10", "sha256:20", "sha256:30"]
+    test_inspect_results = {
+        "sha256:10": {"Id": "sha256:10", "RootFS": {"Layers": ["sha256:1", "sha256:2"]}},
+        "sha256:20": {"Id": "sha256:20", "RootFS": {"Layers": ["sha256:1"]}},
+    }
+    def stub_inspect_image(reference: str) -> dict:
+        if reference not in test_inspect_results:
+            raise container_engine.docker.errors.ImageNotFound(reference)
+        return test_inspect_results[reference]
+    mock_docker_client.api.inspect_image.side_effect = stub_inspect_image
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_chain_ids = test_container_engine.get_local_layer_chain_ids()
+
+    # Check expectations
+    assert actual_chain_ids == set(container_engine.get_chain_ids(["sha256:1", "sha256:2"]))
+
+    mock_docker_client.api.images.assert_called_once_with(quiet=True)
+
+@patch.object(container_engine.ContainerEngine, "_sync_local_image_index")
+@patch("docker.from_env")
+def test_get_local_layer_chain_ids_from_index(mock_docker_from_env: MagicMock, 
+                                              mock__sync_local_image_index: MagicMock):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock__sync_local_image_index.return_value = {"sha256:10": ["alpine:latest"]}
+    mock_docker_client.api.inspect_image.return_value = {"Id": "sha256:10", 
+                                                         "RootFS": {"Layers": ["sha256:1"]}}
+
+    test_container_engine = container_engine.ContainerEngine(MagicMock())
+
+    # Run unit under test
+    actual_chain_ids = test_container_engine.get_local_layer_chain_ids()
+
+    # Check expectations
+    assert actual_chain_ids == {"sha256:1"}
+
+    mock_docker_client.api.images.assert_not_called()
+    mock_docker_client.api.inspect_image.assert_called_once_with("sha256:10")
+
+@patch("docker.from_env")
+def test_get_repo_digests(mock_docker_from_env: MagicMock):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_inspect_results = {
+        "axemsolutions/cpputest:latest": {
+            "Id": "sha256:1", 
+            "RepoDigests": ["axemsolutions/cpputest@sha256:10"]
+        },
+        "local_image:latest": {"Id": "sha256:2", "RepoDigests": []},
+    }
+    def stub_inspect_image(reference: str) -> dict:
+        if reference not in test_inspect_results:
+            raise container_engine.docker.errors.ImageNotFound(reference)
+        return test_inspect_results[reference]
+    mock_docker_client.api.inspect_image.side_effect = stub_inspect_image
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_repo_digests = test_container_engine.get_repo_digests(["axemsolutions/cpputest:latest",
+                                                                  "local_image:latest",
+                                                                  "axemsolutions/jlink:latest"])
+
+    # Check expectations
+    assert actual_repo_digests == {
+        "axemsolutions/cpputest:latest": ["sha256:10"],
+        "local_image:latest": [],
+    }
+
+@patch("docker.from_env")
+def test_get_fingerprint(mock_docker_from_env: MagicMock):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.base_url = "test_base_url"
+    mock_docker_from_env.return_value = mock_docker_client
+    test_image_ids = {"b:latest": "sha256:2", "a:latest": "sha256:1"}
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_fingerprint = test_container_engine.get_fingerprint(test_image_ids)
+
+    # Check expectations
+    assert actual_fingerprint == test_container_engine.get_fingerprint(dict(reversed(test_image_ids.items())))
+    assert actual_fingerprint != test_container_engine.get_fingerprint({"b:latest": "sha256:3", 
+                                                                        "a:latest": "sha256:1"})
+    mock_docker_client.api.base_url = "other_base_url"
+    assert actual_fingerprint != test_container_engine.get_fingerprint(test_image_ids)
+
+@patch("time.time")
+@patch("docker.from_env")
+def test_get_local_tool_images_index_missing(mock_docker_from_env: MagicMock, mock_time: MagicMock):
+    # Test setup
+    mock_time.return_value = 1000
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.base_url = "test_base_url"
+    mock_docker_client.images.list.return_value = [
+        mockImage(["axemsolutions/cpputest:latest"], "sha256:1"),
+        mockImage([], "sha256:2"),
+    ]
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_local_image_index = MagicMock()
+    mock_local_image_index.deserialized = {}
+
+    # Run unit under test
+    test_container_engine = container_engine.ContainerEngine(mock_local_image_index)
+    actual_image_tags = test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert actual_image_tags == ["axemsolutions/cpputest:latest"]
+    assert mock_local_image_index.deserialized == {
+        "docker_host": "test_base_url",
+        "synced_at": 1000,
+        "built_at": 1000,
+        "images": {"sha256:1": ["axemsolutions/cpputest:latest"]},
+    }
+
+    mock_docker_client.events.assert_not_called()
+    mock_docker_client.images.list.assert_called_once()
+    mock_local_image_index.flush.assert_called_once()
+
+@patch("time.time")
+@patch("docker.from_env")
+def test_get_local_tool_images_index_events(mock_docker_from_env: MagicMock, mock_time: MagicMock):
+    # Test setup
+    mock_time.return_value = 2000
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.base_url = "test_base_url"
+    mock_docker_client.events.return_value = iter([
+        {"Action": "pull", "Actor": {"ID": "axemsolutions/cpputest:latest"}},
+        {"Action": "untag", "Actor": {"ID": "sha256:1"}},
+        {"Action": "delete", "Actor": {"ID": "sha256:1"}},
+        {"Action": "delete", "Actor": {"ID": "sha256:2"}},
+        {"Action": "save", "Actor": {"ID": "sha256:3"}},
+    ])
+    def stub_images_get(reference: str):
+        if reference == "axemsolutions/cpputest:latest":
+            return mockImage(["axemsolutions/cpputest:latest"], "sha256:4")
+        raise container_engine.docker.errors.ImageNotFound(reference)
+    mock_docker_client.images.get.side_effect = stub_images_get
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_local_image_index = MagicMock()
+    mock_local_image_index.deserialized = {
+        "docker_host": "test_base_url",
+        "synced_at": 1000,
+        "built_at": 1000,
+        "images": {
+            "sha256:1": ["axemsolutions/cpputest:latest"],
+            "sha256:2": ["axemsolutions/stlink_org:latest"],
+            "sha256:3": ["axemsolutions/make_gnu_arm:latest"],
+        },
+    }
+
+    # Run unit under test
+    test_container_engine = container_engine.ContainerEngine(mock_local_image_index)
+    actual_image_tags = test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert sorted(actual_image_tags) == ["axemsolutions/cpputest:latest", 
+                                         "axemsolutions/make_gnu_arm:latest"]
+    assert mock_local_image_index.deserialized["synced_at"] == 2000
+    assert mock_local_image_index.deserialized["built_at"] == 1000
+
+    mock_docker_client.events.assert_called_once_with(since=1000, until=2000, 
+                                                      filters={"type": "image"}, decode=True)
+    mock_docker_client.images.list.assert_not_called()
+    mock_docker_client.images.get.assert_has_calls([call("axemsolutions/cpputest:latest"), 
+                                                    call("sha256:1"), call("sha256:2")])
+    assert mock_docker_client.images.get.call_count == 3
+    mock_local_image_index.flush.assert_called_once()
+
+@patch("time.time")
+@patch("docker.from_env")
+def test_get_local_tool_images_index_no_events(mock_docker_from_env: MagicMock, 
+                                               mock_time: MagicMock):
+    # Test setup
+    mock_time.return_value = 2000
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.base_url = "test_base_url"
+    mock_docker_client.events.return_value = iter([])
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_local_image_index = MagicMock()
+    mock_local_image_index.deserialized = {
+        "docker_host": "test_base_url",
+        "synced_at": 1000,
+        "built_at": 1000,
+        "images": {
+            "sha256:1": ["axemsolutions/cpputest:latest"],
+        },
+    }
+
+    # Run unit under test
+    test_container_engine = container_engine.ContainerEngine(mock_local_image_index)
+    actual_image_tags = test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert actual_image_tags == ["axemsolutions/cpputest:latest"]
+    assert mock_local_image_index.deserialized["synced_at"] == 1000
+
+    mock_docker_client.events.assert_called_once_with(since=1000, until=2000, 
+                                                      filters={"type": "image"}, decode=True)
+    mock_docker_client.images.list.assert_not_called()
+    mock_local_image_index.flush.assert_not_called()
+
+@pytest.mark.parametrize("test_index_update", [
+    {"docker_host": "other_base_url"},
+    {"built_at": 0},
+    {"synced_at": "invalid"},
+])
+@patch("time.time")
+@patch("docker.from_env")
+def test_get_local_tool_images_index_rebuilt(mock_docker_from_env: MagicMock, mock_time: MagicMock,
+                                             test_index_update: dict):
+    # Test setup
+    mock_time.return_value = 100000
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.base_url = "test_base_url"
+    mock_docker_client.images.list.return_value = [mockImage(["alpine:latest"], "sha256:5")]
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_local_image_index = MagicMock()
+    mock_local_image_index.deserialized = {
+        "docker_host": "test_base_url",
+        "synced_at": 99000,
+        "built_at": 99000,
+        "images": {"sha256:1": ["axemsolutions/cpputest:latest"]},
+    }
+    mock_local_image_index.deserialized.update(test_index_update)
+
+    # Run unit under test
+    test_container_engine = container_engine.ContainerEngine(mock_local_image_index)
+    actual_image_tags = test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert actual_image_tags == ["alpine:latest"]
+
+    mock_docker_client.events.assert_not_called()
+    mock_docker_client.images.list.assert_called_once()
+
+@patch("time.time")
+@patch("docker.from_env")
+def test_get_local_tool_images_index_lost_events(mock_docker_from_env: MagicMock, 
+                                                 mock_time: MagicMock):
+    # Test setup
+    mock_time.return_value = 2000
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.base_url = "test_base_url"
+    mock_docker_client.events.return_value = iter([{"Action": "tag", "Actor": {"ID": "sha256:1"}}] * 
+                                                  container_engine.ContainerEngine._event_buffer_size)
+    mock_docker_client.images.list.return_value = [mockImage(["alpine:latest"], "sha256:5")]
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_local_image_index = MagicMock()
+    mock_local_image_index.deserialized = {
+        "docker_host": "test_base_url",
+        "synced_at": 1000,
+        "built_at": 1000,
+        "images": {"sha256:1": ["axemsolutions/cpputest:latest"]},
+    }
+
+    # Run unit under test
+    test_container_engine = container_engine.ContainerEngine(mock_local_image_index)
+    actual_image_tags = test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert actual_image_tags == ["alpine:latest"]
+
+    mock_docker_client.images.get.assert_not_called()
+    mock_docker_client.images.list.assert_called_once()
+
 @patch.object(container_engine.Core, "user_output")
 @patch("dem.core.container_engine.docker.from_env")
 def test_pull(mock_docker_from_env, mock_user_output):
@@ -100,6 +481,111 @@ def test_pull(mock_docker_from_env, mock_user_output):
                                                         decode=True)
     mock_user_output.progress_generator.assert_called_once_with(mock_response)
 
+class StubPullStream():
+    """ Imitates the stream returned by the pull API call."""
+    def __init__(self, items: list[dict]) -> None:
+        self.items = items
+        self.is_closed = False
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def close(self) -> None:
+        self.is_closed = True
+
+@patch.object(container_engine.Core, "user_output")
+@patch("dem.core.container_engine.docker.from_env")
+def test_pull_images(mock_docker_from_env, mock_user_output):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_images_to_pull = ["test_image1:latest", "test_image2:latest"]
+    test_streams = {
+        test_image: StubPullStream([
+            {"status": "Pulling fs layer", "id": "layer1"},
+            {"status": "Downloading", "id": "layer1", "progressDetail": {"current": 1, "total": 2}},
+        ])
+        for test_image in test_images_to_pull
+    }
+    mock_docker_client.api.pull.side_effect = lambda image, stream, decode: test_streams[image]
+
+    actual_items = []
+    mock_user_output.progress_generator.side_effect = lambda generator: actual_items.extend(generator)
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_pull_times = {}
+    test_container_engine.pull_images(test_images_to_pull, 2, actual_pull_times)
+
+    # Check expectations
+    assert len(actual_items) == 4
+    assert set(actual_pull_times) == set(test_images_to_pull)
+    for test_image in test_images_to_pull:
+        image_items = [item for item in actual_items if item["image"] == test_image]
+        assert [item["status"] for item in image_items] == ["Pulling fs layer", "Downloading"]
+        assert test_streams[test_image].is_closed is True
+
+    mock_docker_client.api.pull.assert_has_calls([
+        call(test_image, stream=True, decode=True) for test_image in test_images_to_pull
+    ], any_order=True)
+
+@patch.object(container_engine.Core, "user_output")
+@patch("dem.core.container_engine.docker.from_env")
+def test_pull_images_failure(mock_docker_from_env, mock_user_output):
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_images_to_pull = ["test_image1:latest", "test_image2:latest", "test_image3:latest"]
+    test_error = "manifest unknown"
+    mock_docker_client.api.pull.return_value = StubPullStream([{"error": test_error}])
+    mock_user_output.progress_generator.side_effect = lambda generator: list(generator)
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        # Only one pull can run at a time, so the failure of the first cancels the others.
+        test_container_engine.pull_images(test_images_to_pull, 1)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: " + \
+        test_images_to_pull[0] + ": " + test_error
+
+    mock_docker_client.api.pull.assert_called_once_with(test_images_to_pull[0], stream=True, 
+                                                        decode=True)
+
+class SlowStubPullStream(StubPullStream):
+    """ Imitates a long running pull."""
+    def __iter__(self):
+        for item in self.items:
+            time.sleep(0.01)
+            yield dict(item)
+
+@patch("dem.core.container_engine.docker.from_env")
+def test_get_parallel_pull_progress_closed(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_images_to_pull = ["test_image1:latest", "test_image2:latest", "test_image3:latest"]
+    test_stream = SlowStubPullStream([{"status": "Downloading", "id": "layer1"}] * 500)
+    mock_docker_client.api.pull.return_value = test_stream
+
+    test_container_engine = container_engine.ContainerEngine()
+    progress = test_container_engine._get_parallel_pull_progress(test_images_to_pull, 1)
+    next(progress)
+
+    # Run unit under test
+    start = time.monotonic()
+    progress.close()
+
+    # Check expectations
+    # The running pull gets stopped and the waiting ones don't start.
+    assert time.monotonic() - start < 1
+    assert test_stream.is_closed
+    mock_docker_client.api.pull.assert_called_once_with(test_images_to_pull[0], stream=True, 
+                                                        decode=True)
+
 @patch.object(container_engine.Core, "user_output")
 @patch("docker.from_env")
 def test_run(mock_from_env, mock_user_output):
@@ -184,6 +670,157 @@ def test_run_d(mock_from_env):
                                                               stderr=True, 
                                                               detach=True)
 
+@patch("dem.core.container_engine.sys")
+@patch("docker.from_env")
+def test_run_passthrough(mock_from_env: MagicMock, mock_sys: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = ["--rm", "--name", "test_name", "test_image:latest", "make all"]
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_container = MagicMock()
+    mock_docker_client.containers.run.return_value = mock_container
+    mock_container.attach.return_value = [
+        (b"out_1\nout_", None),
+        (None, b"err_1\n"),
+        (b"2\n", None),
+    ]
+    mock_container.wait.return_value = {"StatusCode": 2}
+    mock_stdout_buffer = mock_sys.stdout.buffer
+    mock_stderr_buffer = mock_sys.stderr.buffer
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_exit_code = test_container_engine.run(test_container_arguments, passthrough=True)
+
+    # Check expectations
+    assert actual_exit_code == 2
+
+    mock_docker_client.containers.run.assert_called_once_with("test_image:latest", 
+                                                              command="make all", 
+                                                              auto_remove=False, 
+                                                              privileged=False,
+                                                              volumes=[],
+                                                              ports={},
+                                                              name="test_name",
+                                                              stderr=True, 
+                                                              detach=True)
+    mock_container.attach.assert_called_once_with(stdout=True, stderr=True, stream=True, 
+                                                  logs=True, demux=True)
+    mock_stdout_buffer.write.assert_has_calls([call(b"out_1\nout_"), call(b"2\n")])
+    mock_stderr_buffer.write.assert_called_once_with(b"err_1\n")
+    mock_stdout_buffer.flush.assert_called()
+    mock_stderr_buffer.flush.assert_called()
+    mock_container.remove.assert_called_once_with(force=True)
+
+@patch.dict("dem.core.container_engine.os.environ", {"HOST_VAR": "host_value"})
+@patch("docker.from_env")
+def test_run_resource_options(mock_from_env: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = [
+        "--cpus", "2.5", "--cpuset-cpus=0-3", "-m", "4g", "--memory-swap", "8g", 
+        "--shm-size", "1g", "--tmpfs", "/build:rw,size=2g", "--tmpfs", "/tmp", 
+        "-e", "VAR=value", "--env", "HOST_VAR", "-e", "MISSING_VAR", "-w", "/src", "--ulimit", "nofile=1024:4096", 
+        "--pids-limit", "512", "--network", "host", "-d", "test_image:latest", "make"
+    ]
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    test_container_engine.run(test_container_arguments)
+
+    # Check expectations
+    mock_docker_client.containers.run.assert_called_once_with("test_image:latest", 
+                                                              command="make", 
+                                                              auto_remove=False, 
+                                                              privileged=False,
+                                                              volumes=[],
+                                                              ports={},
+                                                              name="",
+                                                              stderr=True, 
+                                                              detach=True,
+                                                              nano_cpus=2500000000,
+                                                              cpuset_cpus="0-3",
+                                                              mem_limit="4g",
+                                                              memswap_limit="8g",
+                                                              shm_size="1g",
+                                                              tmpfs={
+                                                                  "/build": "rw,size=2g",
+                                                                  "/tmp": ""
+                                                              },
+                                                              environment=[
+                                                                  "VAR=value", 
+                                                                  "HOST_VAR=host_value"
+                                                              ],
+                                                              working_dir="/src",
+                                                              ulimits=[{
+                                                                  "name": "nofile", 
+                                                                  "soft": 1024, 
+                                                                  "hard": 4096
+                                                              }],
+                                                              pids_limit=512,
+                                                              network_mode="host")
+
+@patch.dict("dem.core.container_engine.os.environ", clear=True)
+@patch("docker.from_env")
+def test_run_unset_host_env(mock_from_env: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = ["-e", "MISSING_VAR", "--env=OTHER_MISSING_VAR", "-d", 
+                                "test_image:latest"]
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    test_container_engine.run(test_container_arguments)
+
+    # Check expectations
+    assert "environment" not in mock_docker_client.containers.run.call_args.kwargs
+
+@patch("docker.from_env")
+def test_run_invalid_resource_option(mock_from_env: MagicMock) -> None:
+    # Test setup
+    mock_from_env.return_value = MagicMock()
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.run(["--cpus", "many", "test_image:latest"])
+
+    # Check expectations
+    assert "The option --cpus has invalid argument: many" in str(exported_exception_info.value)
+
+@patch("docker.from_env")
+def test_run_cache_volumes(mock_from_env: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = ["-d", "-v", "/host_conan:/root/.conan2", "test_image", "make"]
+    test_cache_volumes = {
+        "test_image:latest": {
+            "dem-cache-test_dev_env-ccache": "/root/.ccache",
+            "dem-cache-test_dev_env-conan": "/root/.conan2",
+        },
+        "test_other_image:latest": {
+            "dem-cache-test_dev_env-pip": "/root/.cache/pip",
+        },
+    }
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    test_container_engine.run(test_container_arguments, cache_volumes=test_cache_volumes)
+
+    # Check expectations
+    assert mock_docker_client.containers.run.call_args.kwargs["volumes"] == [
+        "/host_conan:/root/.conan2",
+        "dem-cache-test_dev_env-ccache:/root/.ccache",
+    ]
+
 @patch("docker.from_env")
 def test_run_ValueError(mock_from_env):
     # Test setup
@@ -238,6 +875,253 @@ def test_run_StopIteration(mock_from_env):
         # Check expectations
         assert str(exported_exception_info) =="Invalid input parameter!"
 
+def get_mock_warm_containers_file(deserialized: dict) -> MagicMock:
+    mock_warm_containers_file = MagicMock()
+    mock_warm_containers_file.deserialized = deserialized
+    return mock_warm_containers_file
+
+@patch("dem.core.container_engine.time.time")
+@patch.object(container_engine.Core, "user_output")
+@patch("docker.from_env")
+def test_run_warm_new_container(mock_from_env: MagicMock, mock_user_output: MagicMock,
+                                mock_time: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = ["-v", "/src:/src", "test_image:latest", "make -j 'all tests'"]
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.containers.create.return_value.id = "test_container_id"
+    mock_docker_client.containers.create.return_value.status = "running"
+    mock_docker_client.api.inspect_image.return_value = {
+        "Config": {"Entrypoint": ["/entrypoint.sh"], "Cmd": ["bash"]}
+    }
+    mock_docker_client.api.exec_create.return_value = {"Id": "test_exec_id"}
+    mock_docker_client.api.exec_start.return_value = [b"log_line_1\n", b"log_line_2\n"]
+    mock_time.return_value = 1000.0
+
+    mock_warm_containers_file = get_mock_warm_containers_file({})
+    test_container_engine = container_engine.ContainerEngine(warm_containers_file=mock_warm_containers_file)
+    test_key = test_container_engine._get_warm_container_key("test_dev_env", 
+        test_container_engine._parse_run_arguments(test_container_arguments))
+
+    # Run unit under test
+    test_container_engine.run_warm(test_container_arguments, "test_dev_env", 900)
+
+    # Check expectations
+    mock_docker_client.containers.create.assert_called_once_with("test_image:latest",
+                                                                 entrypoint=["sh", "-c", 
+                                                                             container_engine.ContainerEngine._warm_container_keepalive,
+                                                                             "dem-keepalive", 
+                                                                             "900", "10"],
+                                                                 auto_remove=True,
+                                                                 privileged=False,
+                                                                 volumes=["/src:/src"],
+                                                                 ports={},
+                                                                 labels={"dem.dev_env": "test_dev_env",
+                                                                         "dem.warm_key": test_key})
+    mock_docker_client.containers.create.return_value.start.assert_called_once()
+    mock_docker_client.api.exec_create.assert_called_once_with("test_container_id",
+                                                               ["/entrypoint.sh", "make", "-j", 
+                                                                "all tests"],
+                                                               environment=None, workdir=None)
+    mock_docker_client.api.exec_start.assert_called_once_with("test_exec_id", stream=True)
+    mock_user_output.msg.assert_has_calls([call("log_line_1"), call("log_line_2")])
+    assert mock_warm_containers_file.deserialized == {
+        test_key: {"id": "test_container_id", "last_used": 1000.0}
+    }
+    assert mock_warm_containers_file.flush.call_count == 2
+
+@patch("dem.core.container_engine.time.time")
+@patch("docker.from_env")
+def test_run_warm_reuse(mock_from_env: MagicMock, mock_time: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = ["-d", "-e", "VAR=value", "-w", "/src", "test_image:latest"]
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.api.inspect_container.return_value = {"State": {"Running": True}}
+    mock_docker_client.api.inspect_image.return_value = {"Config": {"Entrypoint": None, 
+                                                                    "Cmd": ["bash"]}}
+    mock_docker_client.api.exec_create.return_value = {"Id": "test_exec_id"}
+    mock_time.return_value = 1000.0
+
+    test_container_engine = container_engine.ContainerEngine()
+    test_key = test_container_engine._get_warm_container_key("test_dev_env", 
+        test_container_engine._parse_run_arguments(test_container_arguments))
+    mock_warm_containers_file = get_mock_warm_containers_file({
+        test_key: {"id": "test_container_id", "last_used": 500.0}
+    })
+    test_container_engine._warm_containers_file = mock_warm_containers_file
+
+    # Run unit under test
+    test_container_engine.run_warm(test_container_arguments, "test_dev_env", 900)
+
+    # Check expectations
+    mock_docker_client.containers.create.assert_not_called()
+    mock_docker_client.api.remove_container.assert_not_called()
+    mock_docker_client.api.exec_create.assert_called_once_with("test_container_id", ["bash"],
+                                                               environment=["VAR=value"],
+                                                               workdir="/src")
+    mock_docker_client.api.exec_start.assert_called_once_with("test_exec_id", detach=True)
+    assert mock_warm_containers_file.deserialized[test_key]["last_used"] == 1000.0
+
+@patch("dem.core.container_engine.sys")
+@patch("dem.core.container_engine.time.time")
+@patch("docker.from_env")
+def test_run_warm_passthrough(mock_from_env: MagicMock, mock_time: MagicMock, 
+                              mock_sys: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = ["test_image:latest", "make"]
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.api.inspect_container.return_value = {"State": {"Running": True}}
+    mock_docker_client.api.inspect_image.return_value = {"Config": {}}
+    mock_docker_client.api.exec_create.return_value = {"Id": "test_exec_id"}
+    mock_docker_client.api.exec_start.return_value = [(b"out", None), (None, b"err")]
+    mock_docker_client.api.exec_inspect.return_value = {"ExitCode": 1}
+    mock_time.return_value = 1000.0
+
+    test_container_engine = container_engine.ContainerEngine()
+    test_key = test_container_engine._get_warm_container_key("test_dev_env", 
+        test_container_engine._parse_run_arguments(test_container_arguments))
+    test_container_engine._warm_containers_file = get_mock_warm_containers_file({
+        test_key: {"id": "test_container_id", "last_used": 500.0}
+    })
+
+    # Run unit under test
+    actual_exit_code = test_container_engine.run_warm(test_container_arguments, "test_dev_env", 
+                                                      900, passthrough=True)
+
+    # Check expectations
+    assert actual_exit_code == 1
+
+    mock_docker_client.api.exec_start.assert_called_once_with("test_exec_id", stream=True, 
+                                                              demux=True)
+    mock_sys.stdout.buffer.write.assert_called_once_with(b"out")
+    mock_sys.stderr.buffer.write.assert_called_once_with(b"err")
+    mock_docker_client.api.exec_inspect.assert_called_once_with("test_exec_id")
+
+@patch("dem.core.container_engine.time.time")
+@patch("docker.from_env")
+def test_run_warm_fresh(mock_from_env: MagicMock, mock_time: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = ["test_image:latest", "ls"]
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.containers.create.return_value.id = "test_new_container_id"
+    mock_docker_client.containers.create.return_value.status = "running"
+    mock_docker_client.api.inspect_image.return_value = {"Config": {}}
+    mock_docker_client.api.exec_start.return_value = []
+    mock_time.return_value = 1000.0
+
+    test_container_engine = container_engine.ContainerEngine()
+    test_key = test_container_engine._get_warm_container_key("test_dev_env", 
+        test_container_engine._parse_run_arguments(test_container_arguments))
+    mock_warm_containers_file = get_mock_warm_containers_file({
+        test_key: {"id": "test_container_id", "last_used": 500.0}
+    })
+    test_container_engine._warm_containers_file = mock_warm_containers_file
+
+    # Run unit under test
+    test_container_engine.run_warm(test_container_arguments, "test_dev_env", 900, fresh=True)
+
+    # Check expectations
+    mock_docker_client.api.remove_container.assert_called_once_with("test_container_id", force=True)
+    mock_docker_client.containers.create.assert_called_once()
+    assert mock_warm_containers_file.deserialized[test_key]["id"] == "test_new_container_id"
+
+@pytest.mark.parametrize("test_start_error, test_status", [
+    (True, "created"),
+    (False, "exited"),
+])
+@patch.object(container_engine.ContainerEngine, "run")
+@patch.object(container_engine.ContainerEngine, "user_output")
+@patch("dem.core.container_engine.time.time")
+@patch("docker.from_env")
+def test_run_warm_start_failed(mock_from_env: MagicMock, mock_time: MagicMock, 
+                               mock_user_output: MagicMock, mock_run: MagicMock, 
+                               test_start_error: bool, test_status: str) -> None:
+    # Test setup
+    test_container_arguments = ["test_image:latest", "ls"]
+    test_cache_volumes = {"test_image:latest": {"test_volume": "/cache"}}
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_container = mock_docker_client.containers.create.return_value
+    mock_container.id = "test_container_id"
+    mock_container.status = test_status
+    if test_start_error:
+        mock_container.start.side_effect = container_engine.docker.errors.APIError("test_error")
+    mock_run.return_value = 2
+    mock_time.return_value = 1000.0
+
+    mock_warm_containers_file = get_mock_warm_containers_file({})
+    test_container_engine = container_engine.ContainerEngine(warm_containers_file=mock_warm_containers_file)
+
+    # Run unit under test
+    actual_exit_code = test_container_engine.run_warm(test_container_arguments, "test_dev_env", 
+                                                      900, passthrough=True, 
+                                                      cache_volumes=test_cache_volumes)
+
+    # Check expectations
+    assert actual_exit_code == 2
+    assert mock_warm_containers_file.deserialized == {}
+
+    mock_docker_client.api.remove_container.assert_called_once_with("test_container_id", force=True)
+    mock_docker_client.api.exec_create.assert_not_called()
+    mock_user_output.msg.assert_called_once_with("[yellow]The warm container couldn't be started, the image needs the sh and sleep commands. The container is run without a warm container.[/]")
+    mock_run.assert_called_once_with(test_container_arguments, True, test_cache_volumes)
+
+@patch.object(container_engine.ContainerEngine, "user_output")
+@patch("dem.core.container_engine.time.time")
+@patch("docker.from_env")
+def test_run_warm_ignored_options(mock_from_env: MagicMock, mock_time: MagicMock, 
+                                  mock_user_output: MagicMock) -> None:
+    # Test setup
+    test_container_arguments = ["--rm", "--name", "test_name", "-d", "test_image:latest"]
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.api.inspect_container.return_value = {"State": {"Running": True}}
+    mock_docker_client.api.inspect_image.return_value = {"Config": {}}
+    mock_docker_client.api.exec_create.return_value = {"Id": "test_exec_id"}
+    mock_time.return_value = 1000.0
+
+    test_container_engine = container_engine.ContainerEngine()
+    test_key = test_container_engine._get_warm_container_key("test_dev_env", 
+        test_container_engine._parse_run_arguments(test_container_arguments))
+    test_container_engine._warm_containers_file = get_mock_warm_containers_file({
+        test_key: {"id": "test_container_id", "last_used": 500.0}
+    })
+
+    # Run unit under test
+    test_container_engine.run_warm(test_container_arguments, "test_dev_env", 900)
+
+    # Check expectations
+    mock_user_output.msg.assert_called_once_with("[yellow]The --name and --rm options are ignored by the warm containers.[/]")
+    mock_docker_client.api.exec_start.assert_called_once_with("test_exec_id", detach=True)
+
+@patch("docker.from_env")
+def test_reap_idle_warm_containers(mock_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.api.inspect_container.side_effect = lambda container_id: {
+        "idle_id": {"ExecIDs": None},
+        "busy_id": {"ExecIDs": ["test_exec_id"]},
+    }[container_id]
+    mock_docker_client.api.exec_inspect.return_value = {"Running": True}
+
+    mock_warm_containers_file = get_mock_warm_containers_file({
+        "idle": {"id": "idle_id", "last_used": 0.0},
+        "busy": {"id": "busy_id", "last_used": 0.0},
+        "recent": {"id": "recent_id", "last_used": 950.0},
+    })
+    test_container_engine = container_engine.ContainerEngine(warm_containers_file=mock_warm_containers_file)
+
+    # Run unit under test
+    test_container_engine._reap_idle_warm_containers(100, 1000.0)
+
+    # Check expectations
+    assert list(mock_warm_containers_file.deserialized) == ["busy", "recent"]
+    mock_docker_client.api.remove_container.assert_called_once_with("idle_id", force=True)
+
 @patch.object(container_engine.ContainerEngine, "user_output")
 @patch("docker.from_env")
 def test_remove(mock_from_env: MagicMock, mock_user_output: MagicMock) -> None:
@@ -256,6 +1140,61 @@ def test_remove(mock_from_env: MagicMock, mock_user_output: MagicMock) -> None:
     mock_docker_client.images.remove.assert_called_once_with(test_image_to_remove)
     mock_user_output.msg.assert_called_once_with(f"[green]Successfully removed the {test_image_to_remove}![/]\n")
 
+@patch.object(container_engine.ContainerEngine, "remove")
+@patch("docker.from_env")
+def test_remove_images(mock_from_env: MagicMock, mock_remove: MagicMock) -> None:
+    # Test setup
+    def stub_remove(image: str) -> None:
+        if image == "test_image2:latest":
+            raise container_engine.ContainerEngineError("")
+    mock_remove.side_effect = stub_remove
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_failed_images = test_container_engine.remove_images(["test_image1:latest", 
+                                                                "test_image2:latest",
+                                                                "test_image3:latest"])
+
+    # Check expectations
+    assert actual_failed_images == ["test_image2:latest"]
+
+    mock_remove.assert_has_calls([call("test_image1:latest"), call("test_image2:latest"), 
+                                  call("test_image3:latest")], any_order=True)
+
+@patch("docker.from_env")
+def test_prune_images(mock_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.images.prune.return_value = {"ImagesDeleted": None, "SpaceReclaimed": 100}
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_space_reclaimed = test_container_engine.prune_images()
+
+    # Check expectations
+    assert actual_space_reclaimed == 100
+
+    mock_docker_client.images.prune.assert_called_once_with(filters={"dangling": True})
+
+@patch("docker.from_env")
+def test_prune_images_APIError(mock_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.images.prune.side_effect = container_engine.docker.errors.APIError("test_error")
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.prune_images()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Failed to prune the dangling images: test_error"
+
 @patch.object(container_engine.ContainerEngine, "user_output")
 @patch("docker.from_env")
 def test_remove_ImageNotFound(mock_from_env: MagicMock, mock_user_output: MagicMock) -> None:
@@ -297,28 +1236,140 @@ def test_remove_APIError(mock_from_env: MagicMock, mock_user_output: MagicMock)
         mock_user_output.error.assert_called_once_with(f"[red]Error: The {test_image_to_remove} is used by a container. Unable to remove it.[/]\n")
 
 @patch("docker.from_env")
-def test_search(mock_from_env):
+def test_get_image_disk_usage(mock_from_env: MagicMock) -> None:
     # Test setup
     mock_docker_client = MagicMock()
     mock_from_env.return_value = mock_docker_client
-    test_registry = "test_registry"
-    test_repositories = [
-        {
-            "name": "repo1"
-        },
-        {
-            "name": "repo2"
-        },
-    ]
-    mock_docker_client.images.search.return_value = test_repositories
+    mock_docker_client.df.return_value = {
+        "LayersSize": 1000,
+        "Images": [
+            {"Id": "sha256:1", "RepoTags": ["axemsolutions/cpputest:latest"], "Size": 300, 
+             "SharedSize": 100},
+            {"Id": "sha256:2", "RepoTags": ["axemsolutions/jlink:latest", "jlink:latest"], 
+             "Size": 200, "SharedSize": 0},
+            {"Id": "sha256:3", "RepoTags": None, "Size": 50, "SharedSize": 0},
+            {"Id": "sha256:4", "RepoTags": ["axemsolutions/stlink_org:latest"], "Size": 400, 
+             "SharedSize": -1},
+        ]
+    }
 
     test_container_engine = container_engine.ContainerEngine()
 
     # Run unit under test
-    actual_registry_image_list = test_container_engine.search(test_registry)
+    actual_layers_size, actual_images = test_container_engine.get_image_disk_usage()
 
     # Check expectations
-    mock_docker_client.images.search.assert_called_once_with(test_registry)
+    assert actual_layers_size == 1000
+    assert actual_images == {
+        "sha256:1": {"tags": ["axemsolutions/cpputest:latest"], "size": 200},
+        "sha256:2": {"tags": ["axemsolutions/jlink:latest", "jlink:latest"], "size": 200},
+        "sha256:4": {"tags": ["axemsolutions/stlink_org:latest"], "size": 400},
+    }
 
-    expected_registry_image_list = ["repo1", "repo2"]
-    assert actual_registry_image_list == expected_registry_image_list
\ No newline at end of file
+@patch("dem.core.container_engine.shutil.disk_usage")
+@patch("docker.from_env")
+def test_get_free_space(mock_from_env: MagicMock, mock_disk_usage: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.info.return_value = {"DockerRootDir": "/var/lib/docker"}
+    mock_disk_usage.return_value.free = 5000
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_free_space = test_container_engine.get_free_space()
+
+    # Check expectations
+    assert actual_free_space == 5000
+
+    mock_disk_usage.assert_called_once_with("/var/lib/docker")
+
+@patch("dem.core.container_engine.shutil.disk_usage")
+@patch("docker.from_env")
+def test_get_free_space_remote_daemon(mock_from_env: MagicMock, mock_disk_usage: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.info.return_value = {"DockerRootDir": "/var/lib/docker"}
+    mock_disk_usage.side_effect = FileNotFoundError("test_error")
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.get_free_space()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Failed to get the free space of the container engine's storage: test_error"
+
+@patch("docker.from_env")
+def test_get_volume_sizes(mock_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_docker_client.df.return_value = {
+        "Volumes": [
+            {"Name": "test_volume_1", "UsageData": {"Size": 1000, "RefCount": 0}},
+            {"Name": "test_volume_2", "UsageData": {"Size": -1, "RefCount": 0}},
+            {"Name": "test_other_volume", "UsageData": {"Size": 5000, "RefCount": 1}},
+        ]
+    }
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_volume_sizes = test_container_engine.get_volume_sizes(["test_volume_1", "test_volume_2",
+                                                                  "test_missing_volume"])
+
+    # Check expectations
+    assert actual_volume_sizes == {
+        "test_volume_1": 1000,
+        "test_volume_2": None,
+        "test_missing_volume": None,
+    }
+
+@patch.object(container_engine.ContainerEngine, "user_output")
+@patch("docker.from_env")
+def test_remove_volumes(mock_from_env: MagicMock, mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    test_exception = container_engine.docker.errors.APIError("volume is in use")
+    def stub_remove_volume(volume_name: str) -> None:
+        if volume_name == "test_missing_volume":
+            raise container_engine.docker.errors.NotFound("not found")
+        if volume_name == "test_used_volume":
+            raise test_exception
+    mock_docker_client.api.remove_volume.side_effect = stub_remove_volume
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_failed_volume_names = test_container_engine.remove_volumes(["test_volume", 
+                                                                       "test_missing_volume",
+                                                                       "test_used_volume"])
+
+    # Check expectations
+    assert actual_failed_volume_names == ["test_used_volume"]
+
+    mock_user_output.error.assert_called_once_with(f"[red]Error: Unable to remove the test_used_volume: {test_exception}[/]\n")
+
+@patch("docker.from_env")
+def test_remove_warm_containers(mock_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_from_env.return_value = mock_docker_client
+    mock_container = MagicMock()
+    mock_container.id = "test_container_id"
+    mock_docker_client.containers.list.return_value = [mock_container]
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    test_container_engine.remove_warm_containers("test_dev_env")
+
+    # Check expectations
+    mock_docker_client.containers.list.assert_called_once_with(all=True, 
+                                                               filters={"label": "dem.dev_env=test_dev_env"})
+    mock_docker_client.api.remove_container.assert_called_once_with("test_container_id", force=True)
@@ -5,20 +5,29 @@
 import dem.core.data_management as data_management
 
 # Test framework
+import pytest
 from unittest.mock import patch, MagicMock, call
 
 import json.decoder
 
+## Test fixtures
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """ Keep the json files and the class attributes set by the tests out of the tree."""
+    monkeypatch.setattr(data_management.BaseJSON, "_config_dir", str(tmp_path))
+    monkeypatch.setattr(data_management.BaseJSON, "_path", "")
+    return str(tmp_path)
+
 ## Test cases
 
 @patch("dem.core.data_management.open")
-@patch("dem.core.data_management.json.load")
-def test_BaseJSON_existing_json(mock_json_load: MagicMock, mock_open: MagicMock):
+def test_BaseJSON_existing_json(mock_open: MagicMock):
     # Test setup
     fake_opened_file = MagicMock()
     mock_open.return_value = fake_opened_file
-    expected_deserialized_json = MagicMock()
-    mock_json_load.return_value = expected_deserialized_json
+    test_content = '{"test_key": "test_value"}'
+    fake_opened_file.read.return_value = test_content
 
     test_path = "test_path"
     data_management.BaseJSON._path = test_path
@@ -28,10 +37,11 @@ def test_BaseJSON_existing_json(mock_json_load: MagicMock, mock_open: MagicMock)
 
     # Check expectations
     mock_open.assert_called_once_with(test_path, "r")
-    mock_json_load.assert_called_once_with(fake_opened_file)
+    fake_opened_file.read.assert_called_once()
     fake_opened_file.close.assert_called_once()
 
-    assert base_json.deserialized is expected_deserialized_json
+    assert base_json.deserialized == {"test_key": "test_value"}
+    assert base_json._content_hash == data_management.BaseJSON._get_content_hash(test_content)
 
 @patch("dem.core.data_management.open")
 @patch("dem.core.data_management.json.loads")
@@ -39,13 +49,13 @@ def test_BaseJSON_existing_json(mock_json_load: MagicMock, mock_open: MagicMock)
 @patch("dem.core.data_management.os.makedirs")
 def test_dev_env_json_read_FileNotFounderror(mock_os_makedirs: MagicMock, 
                                              mock_os_path_exists: MagicMock, 
-                                             mock_json_loads: MagicMock, 
+                                             mock_json_loadss: MagicMock, 
                                              mock_open: MagicMock):
     # Test setup
     fake_opened_file = MagicMock()
     mock_open.side_effect = [FileNotFoundError, fake_opened_file]
     expected_deserialized_json = MagicMock()
-    mock_json_loads.return_value = expected_deserialized_json
+    mock_json_loadss.return_value = expected_deserialized_json
     mock_os_path_exists.return_value = False
 
     test_default_json = "test_empty_json"
@@ -67,19 +77,19 @@ def test_dev_env_json_read_FileNotFounderror(mock_os_makedirs: MagicMock,
     mock_os_path_exists.assert_called_once()
     mock_os_makedirs.assert_called_once_with(base_json._config_dir)
     
-    mock_json_loads.assert_called_once_with(test_default_json)
+    mock_json_loadss.assert_called_once_with(test_default_json)
 
     assert base_json.deserialized is expected_deserialized_json
 
 @patch.object(data_management.BaseJSON, "_create_default_json")
 @patch("dem.core.data_management.open")
-@patch("dem.core.data_management.json.load")
-def test_dev_env_json_read_JSONDecodeError(mock_json_load: MagicMock, mock_open: MagicMock, 
+@patch("dem.core.data_management.json.loads")
+def test_dev_env_json_read_JSONDecodeError(mock_json_loadss: MagicMock, mock_open: MagicMock, 
                                            mock_create_default_json: MagicMock):
     # Test setup
     fake_opened_file = MagicMock()
     mock_open.return_value = fake_opened_file
-    mock_json_load.side_effect = json.decoder.JSONDecodeError("dummy_msg", "dummy_doc", 0)
+    mock_json_loadss.side_effect = json.decoder.JSONDecodeError("dummy_msg", "dummy_doc", 0)
 
     mock_deserialized = MagicMock()
     mock_create_default_json.return_value = mock_deserialized
@@ -91,7 +101,7 @@ def test_dev_env_json_read_JSONDecodeError(mock_json_load: MagicMock, mock_open:
 
     # Check expectations
     mock_open.assert_called_once_with(base_json._path, "r")
-    mock_json_load.assert_called_once_with(fake_opened_file)
+    mock_json_loadss.assert_called_once_with(fake_opened_file.read.return_value)
 
     base_json.user_output.get_confirm.assert_called_once_with("[red]Error: invalid json format.[/]", 
                                                               "Restore the original json file?")
@@ -100,24 +110,97 @@ def test_dev_env_json_read_JSONDecodeError(mock_json_load: MagicMock, mock_open:
     assert base_json.deserialized is mock_deserialized
 
 @patch.object(data_management.BaseJSON, "update", MagicMock())
+@patch("dem.core.data_management.os.replace")
+@patch("dem.core.data_management.os.fsync")
+@patch("dem.core.data_management.os.getpid")
 @patch("dem.core.data_management.open")
-@patch("dem.core.data_management.json.dump")
-def test_dev_env_json_write(mock_json_dump: MagicMock, mock_open: MagicMock):
+def test_dev_env_json_write(mock_open: MagicMock, mock_getpid: MagicMock, mock_fsync: MagicMock, 
+                            mock_replace: MagicMock):
     # Test setup
-    mock_opened_file = MagicMock()
-    mock_open.return_value = mock_opened_file
-    fake_json_deserialized = MagicMock()
+    mock_tmp_file = MagicMock()
+    mock_open.return_value.__enter__.return_value = mock_tmp_file
+    mock_getpid.return_value = 42
+    test_deserialized = {"test_key": "test_value"}
 
     base_json = data_management.BaseJSON()
-    base_json.deserialized = fake_json_deserialized
+    base_json._path = "test_path"
+    base_json.deserialized = test_deserialized
 
     # Run unit under test
     base_json.flush()
 
     # Check expectations
-    mock_open.assert_called_once_with(base_json._path, "w")
-    mock_json_dump.assert_called_once_with(fake_json_deserialized, mock_opened_file, indent=4)
-    mock_opened_file.close.assert_called_once()
+    expected_content = json.dumps(test_deserialized, indent=4)
+    mock_open.assert_called_once_with("test_path.42.tmp", "w")
+    mock_tmp_file.write.assert_called_once_with(expected_content)
+    mock_fsync.assert_called_once_with(mock_tmp_file.fileno.return_value)
+    mock_replace.assert_called_once_with("test_path.42.tmp", "test_path")
+
+    assert base_json._content_hash == data_management.BaseJSON._get_content_hash(expected_content)
+
+@patch.object(data_management.BaseJSON, "update", MagicMock())
+@patch("dem.core.data_management.os.replace")
+@patch("dem.core.data_management.open")
+def test_dev_env_json_write_unchanged(mock_open: MagicMock, mock_replace: MagicMock):
+    # Test setup
+    test_deserialized = {"test_key": "test_value"}
+
+    base_json = data_management.BaseJSON()
+    base_json.deserialized = test_deserialized
+    base_json._content_hash = data_management.BaseJSON._get_content_hash(json.dumps(test_deserialized, 
+                                                                                    indent=4))
+
+    # Run unit under test
+    base_json.flush()
+
+    # Check expectations
+    mock_open.assert_not_called()
+    mock_replace.assert_not_called()
+
+@patch.object(data_management.BaseJSON, "update", MagicMock())
+@patch("dem.core.data_management.os.remove")
+@patch("dem.core.data_management.os.path.exists")
+@patch("dem.core.data_management.os.replace")
+@patch("dem.core.data_management.open")
+def test_dev_env_json_write_failure(mock_open: MagicMock, mock_replace: MagicMock, 
+                                    mock_exists: MagicMock, mock_remove: MagicMock):
+    # Test setup
+    mock_open.return_value.__enter__.return_value.write.side_effect = OSError("No space left")
+    mock_exists.return_value = True
+
+    base_json = data_management.BaseJSON()
+    base_json._path = "test_path"
+    base_json.deserialized = {"test_key": "test_value"}
+
+    # Run unit under test
+    with pytest.raises(OSError):
+        base_json.flush()
+
+    # Check expectations
+    mock_replace.assert_not_called()
+    mock_remove.assert_called_once_with(mock_open.call_args.args[0])
+
+    assert base_json._content_hash is None
+
+@patch("dem.core.data_management.fcntl.flock")
+@patch("dem.core.data_management.os.makedirs")
+@patch("dem.core.data_management.open")
+@patch.object(data_management.BaseJSON, "update", MagicMock())
+def test_BaseJSON_lock(mock_open: MagicMock, mock_makedirs: MagicMock, mock_flock: MagicMock):
+    # Test setup
+    mock_lock_file = MagicMock()
+    mock_open.return_value.__enter__.return_value = mock_lock_file
+
+    base_json = data_management.BaseJSON()
+    base_json._path = "test_path"
+
+    # Run unit under test
+    with base_json.lock():
+        mock_flock.assert_called_once_with(mock_lock_file, data_management.fcntl.LOCK_EX)
+
+    # Check expectations
+    mock_open.assert_called_once_with("test_path.lock", "a")
+    mock_flock.assert_called_with(mock_lock_file, data_management.fcntl.LOCK_UN)
 
 @patch("dem.core.data_management.PurePath")
 @patch.object(data_management.BaseJSON, "__init__")
@@ -126,8 +209,7 @@ def test_LocalDevEnvJSON(mock___init__: MagicMock, mock_PurePath: MagicMock):
     mock_pure_path = MagicMock()
     mock_PurePath.return_value = mock_pure_path
 
-    test_path = "test_path"
-    data_management.BaseJSON._config_dir = test_path
+    test_path = data_management.BaseJSON._config_dir
 
     # Run unit under test
     local_dev_env_json = data_management.LocalDevEnvJSON()
@@ -151,8 +233,7 @@ def test_ConfigFile(mock_PurePath: MagicMock):
     mock_pure_path = MagicMock()
     mock_PurePath.return_value = mock_pure_path
 
-    test_path = "test_path"
-    data_management.BaseJSON._config_dir = test_path
+    test_path = data_management.BaseJSON._config_dir
 
     mock_registries = MagicMock()
     mock_catalogs = MagicMock()
@@ -161,10 +242,10 @@ def test_ConfigFile(mock_PurePath: MagicMock):
         self.deserialized["registries"] = mock_registries
         self.deserialized["catalogs"] = mock_catalogs
         self.deserialized["hosts"] = mock_hosts
-    data_management.BaseJSON.update = stub_update
 
     # Run unit under test
-    local_dev_env_json = data_management.ConfigFile()
+    with patch.object(data_management.BaseJSON, "update", stub_update):
+        local_dev_env_json = data_management.ConfigFile()
 
     # Check expectations
     assert local_dev_env_json._path is mock_pure_path
@@ -180,11 +261,279 @@ def test_ConfigFile(mock_PurePath: MagicMock):
             "name": "axem",
             "url": "https://axemsolutions.io/dem/dev_env_org.json"
         }
-    ]
+    ],
     "hosts": []
 }"""
     assert local_dev_env_json.registries is mock_registries
     assert local_dev_env_json.catalogs is mock_catalogs
     assert local_dev_env_json.hosts is mock_hosts
+    assert local_dev_env_json.warm_containers is False
+    assert local_dev_env_json.warm_container_idle_timeout == 900
+    assert local_dev_env_json.passthrough_output is True
+    assert local_dev_env_json.max_parallel_pulls == data_management.ConfigFile._default_max_parallel_pulls
+
+    mock_PurePath.assert_called_once_with(test_path + "/config.json")
+
+@patch("dem.core.data_management.PurePath")
+@patch("dem.core.data_management.open")
+@patch("dem.core.data_management.json.loads")
+def test_RegistryCacheFile(mock_json_loads: MagicMock, mock_open: MagicMock, 
+                           mock_PurePath: MagicMock):
+    # Test setup
+    mock_open.return_value.__enter__.return_value.read.return_value = "{}"
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+    mock_deserialized = MagicMock()
+    mock_json_loads.return_value = mock_deserialized
+
+    test_path = data_management.BaseJSON._config_dir
+
+    # Run unit under test
+    registry_cache_file = data_management.RegistryCacheFile()
+
+    # Check expectations
+    assert registry_cache_file._path is mock_pure_path
+    assert registry_cache_file._default_json == "{}"
+    assert registry_cache_file.deserialized is mock_deserialized
+
+    mock_PurePath.assert_called_once_with(test_path + "/registry_cache.json")
+    mock_open.assert_called_once_with(mock_pure_path, "r")
+
+@patch.object(data_management.BaseJSON, "_create_default_json")
+@patch("dem.core.data_management.open")
+@patch("dem.core.data_management.json.loads")
+def test_RegistryCacheFile_invalid_json(mock_json_loads: MagicMock, mock_open: MagicMock, 
+                                        mock__create_default_json: MagicMock):
+    # Test setup
+    mock_open.return_value.__enter__.return_value.read.return_value = "{}"
+    mock_json_loads.side_effect = json.decoder.JSONDecodeError("dummy_msg", "dummy_doc", 0)
+    mock_user_output = MagicMock()
+    data_management.BaseJSON.user_output = mock_user_output
+    mock_deserialized = MagicMock()
+    mock__create_default_json.return_value = mock_deserialized
+
+    # Run unit under test
+    registry_cache_file = data_management.RegistryCacheFile()
+
+    # Check expectations
+    assert registry_cache_file.deserialized is mock_deserialized
+
+    mock__create_default_json.assert_called_once()
+    mock_user_output.get_confirm.assert_not_called()
+
+@patch("dem.core.data_management.PurePath")
+@patch("dem.core.data_management.open")
+@patch("dem.core.data_management.json.loads")
+def test_CompletionIndexFile(mock_json_loads: MagicMock, mock_open: MagicMock, 
+                             mock_PurePath: MagicMock):
+    # Test setup
+    mock_open.return_value.__enter__.return_value.read.return_value = "{}"
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+    mock_json_loads.return_value = {
+        "dev_envs": ["test_dev_env"]
+    }
+
+    test_path = data_management.BaseJSON._config_dir
+
+    # Run unit under test
+    completion_index_file = data_management.CompletionIndexFile()
+
+    # Check expectations
+    assert completion_index_file._path is mock_pure_path
+    assert completion_index_file.get_names("dev_envs") == ["test_dev_env"]
+    assert completion_index_file.get_names("hosts") == []
+
+    mock_PurePath.assert_called_once_with(test_path + "/completion_index.json")
+    mock_open.assert_called_once_with(mock_pure_path, "r")
+
+@patch.object(data_management.CompletionIndexFile, "flush")
+@patch("dem.core.data_management.ConfigFile")
+@patch("dem.core.data_management.LocalDevEnvJSON")
+@patch("dem.core.data_management.open")
+def test_CompletionIndexFile_rebuild(mock_open: MagicMock, mock_LocalDevEnvJSON: MagicMock, 
+                                     mock_ConfigFile: MagicMock, mock_flush: MagicMock):
+    # Test setup
+    mock_open.side_effect = FileNotFoundError()
+    mock_LocalDevEnvJSON.return_value.deserialized = {
+        "development_environments": [{"name": "test_dev_env"}]
+    }
+    mock_ConfigFile.return_value.deserialized = {
+        "registries": [{"name": "test_reg", "url": "test_url"}],
+        "catalogs": [{"name": "test_cat", "url": "test_url"}],
+    }
+
+    # Run unit under test
+    completion_index_file = data_management.CompletionIndexFile()
+
+    # Check expectations
+    assert completion_index_file.deserialized == {
+        "dev_envs": ["test_dev_env"],
+        "registries": ["test_reg"],
+        "catalogs": ["test_cat"],
+        "hosts": []
+    }
+
+    mock_flush.assert_called_once()
+
+@patch.object(data_management.CompletionIndexFile, "flush")
+@patch("dem.core.data_management.ConfigFile")
+@patch("dem.core.data_management.LocalDevEnvJSON")
+def test_CompletionIndexFile_rebuild_invalid_source(mock_LocalDevEnvJSON: MagicMock, 
+                                                    mock_ConfigFile: MagicMock, 
+                                                    mock_flush: MagicMock, tmp_path):
+    # Test setup
+    (tmp_path / "dev_env.json").write_text("{invalid")
+    mock_ConfigFile.return_value.deserialized = {
+        "registries": [{"name": "test_reg", "url": "test_url"}],
+    }
+
+    # Run unit under test
+    # In completion mode there is no user output to ask the user with.
+    with patch.object(data_management.BaseJSON, "_config_dir", str(tmp_path)), \
+         patch.object(data_management.BaseJSON, "user_output", None):
+        completion_index_file = data_management.CompletionIndexFile()
+
+    # Check expectations
+    assert completion_index_file.get_names("dev_envs") == []
+    assert completion_index_file.get_names("registries") == ["test_reg"]
+    assert (tmp_path / "dev_env.json").read_text() == "{invalid"
+
+    mock_LocalDevEnvJSON.assert_not_called()
+    mock_flush.assert_not_called()
+
+@patch.object(data_management.BaseJSON, "flush")
+@patch("dem.core.data_management.CompletionIndexFile")
+@patch.object(data_management.BaseJSON, "__init__", MagicMock(return_value=None))
+def test_LocalDevEnvJSON_flush(mock_CompletionIndexFile: MagicMock, mock_flush: MagicMock):
+    # Test setup
+    mock_completion_index_file = MagicMock()
+    mock_CompletionIndexFile.return_value = mock_completion_index_file
+    local_dev_env_json = data_management.LocalDevEnvJSON()
+    local_dev_env_json.deserialized = MagicMock()
+
+    # Run unit under test
+    local_dev_env_json.flush()
+
+    # Check expectations
+    mock_flush.assert_called_once()
+    mock_completion_index_file.index_dev_env_json.assert_called_once_with(local_dev_env_json.deserialized)
+    mock_completion_index_file.flush.assert_called_once()
+
+@patch.object(data_management.BaseJSON, "flush")
+@patch("dem.core.data_management.CompletionIndexFile")
+@patch.object(data_management.BaseJSON, "__init__", MagicMock(return_value=None))
+def test_ConfigFile_flush(mock_CompletionIndexFile: MagicMock, mock_flush: MagicMock):
+    # Test setup
+    mock_completion_index_file = MagicMock()
+    mock_CompletionIndexFile.return_value = mock_completion_index_file
+    config_file = data_management.ConfigFile.__new__(data_management.ConfigFile)
+    config_file.deserialized = MagicMock()
+
+    # Run unit under test
+    config_file.flush()
+
+    # Check expectations
+    mock_flush.assert_called_once()
+    mock_completion_index_file.index_config.assert_called_once_with(config_file.deserialized)
+    mock_completion_index_file.flush.assert_called_once()
+
+@patch.object(data_management.BaseJSON, "_create_default_json")
+@patch("dem.core.data_management.PurePath")
+@patch("dem.core.data_management.open")
+def test_CatalogCacheFile(mock_open: MagicMock, mock_PurePath: MagicMock, 
+                          mock__create_default_json: MagicMock):
+    # Test setup
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+    mock_open.side_effect = FileNotFoundError()
+    mock_deserialized = MagicMock()
+    mock__create_default_json.return_value = mock_deserialized
+
+    test_path = data_management.BaseJSON._config_dir
+
+    # Run unit under test
+    catalog_cache_file = data_management.CatalogCacheFile()
+
+    # Check expectations
+    assert catalog_cache_file._path is mock_pure_path
+    assert catalog_cache_file._default_json == "{}"
+    assert catalog_cache_file.deserialized is mock_deserialized
+
+    mock_PurePath.assert_called_once_with(test_path + "/catalog_cache.json")
+    mock__create_default_json.assert_called_once()
+
+@patch.object(data_management.BaseJSON, "_create_default_json")
+@patch("dem.core.data_management.PurePath")
+@patch("dem.core.data_management.open")
+def test_LocalImageIndexFile(mock_open: MagicMock, mock_PurePath: MagicMock, 
+                             mock__create_default_json: MagicMock):
+    # Test setup
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+    mock_open.side_effect = FileNotFoundError()
+    mock_deserialized = MagicMock()
+    mock__create_default_json.return_value = mock_deserialized
+
+    test_path = data_management.BaseJSON._config_dir
+
+    # Run unit under test
+    local_image_index_file = data_management.LocalImageIndexFile()
+
+    # Check expectations
+    assert local_image_index_file._path is mock_pure_path
+    assert local_image_index_file._default_json == "{}"
+    assert local_image_index_file.deserialized is mock_deserialized
+
+    mock_PurePath.assert_called_once_with(test_path + "/local_image_index.json")
+    mock__create_default_json.assert_called_once()
+
+@patch.object(data_management.BaseJSON, "_create_default_json")
+@patch("dem.core.data_management.PurePath")
+@patch("dem.core.data_management.open")
+def test_ToolImageUsageFile_invalid_json(mock_open: MagicMock, mock_PurePath: MagicMock, 
+                                         mock__create_default_json: MagicMock):
+    # Test setup
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+    mock_open.return_value.__enter__.return_value.read.return_value = "{invalid"
+    mock_deserialized = MagicMock()
+    mock__create_default_json.return_value = mock_deserialized
+
+    test_path = data_management.BaseJSON._config_dir
+
+    # Run unit under test
+    tool_image_usage_file = data_management.ToolImageUsageFile()
+
+    # Check expectations
+    assert tool_image_usage_file._path is mock_pure_path
+    assert tool_image_usage_file._default_json == "{}"
+    assert tool_image_usage_file.deserialized is mock_deserialized
+
+    mock_PurePath.assert_called_once_with(test_path + "/tool_image_usage.json")
+    mock__create_default_json.assert_called_once()
+
+@patch.object(data_management.BaseJSON, "_create_default_json")
+@patch("dem.core.data_management.PurePath")
+@patch("dem.core.data_management.open")
+def test_WarmContainersFile_missing(mock_open: MagicMock, mock_PurePath: MagicMock, 
+                                   mock__create_default_json: MagicMock):
+    # Test setup
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+    mock_open.side_effect = FileNotFoundError()
+    mock_deserialized = MagicMock()
+    mock__create_default_json.return_value = mock_deserialized
+
+    test_path = data_management.BaseJSON._config_dir
+
+    # Run unit under test
+    warm_containers_file = data_management.WarmContainersFile()
+
+    # Check expectations
+    assert warm_containers_file._path is mock_pure_path
+    assert warm_containers_file._default_json == "{}"
+    assert warm_containers_file.deserialized is mock_deserialized
 
-    mock_PurePath.assert_called_once_with(test_path + "/config.json")
\ No newline at end of file
+    mock_PurePath.assert_called_once_with(test_path + "/warm_containers.json")
+    mock__create_default_json.assert_called_once()
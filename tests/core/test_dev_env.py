@@ -9,6 +9,13 @@ from unittest.mock import MagicMock, patch
 
 from typing import Any
 
+def _create_tool_images() -> dev_env.ToolImages:
+    """ Create a ToolImages instance with mocked update methods."""
+    tool_images = dev_env.ToolImages(MagicMock(), MagicMock(), False)
+    tool_images.local.update = MagicMock()
+    tool_images.registry.update = MagicMock()
+    return tool_images
+
 def test_DevEnv():
     # Test setup
     test_descriptor = {
@@ -61,7 +68,7 @@ def test_DevEnv_check_image_availability():
             },
         ]
     }
-    mock_tool_images = MagicMock()
+    mock_tool_images = _create_tool_images()
     mock_tool_images.local.elements = [
         "test_image_name1:test_image_tag1",
         "test_image_name2:test_image_tag2"
@@ -88,7 +95,12 @@ def test_DevEnv_check_image_availability():
 
     
     mock_tool_images.local.update.assert_called_once()
-    mock_tool_images.registry.update.assert_called_once()
+    mock_tool_images.registry.update.assert_called_once_with([
+        "test_image_name1:test_image_tag1",
+        "test_image_name2:test_image_tag2",
+        "test_image_name3:test_image_tag3",
+        "test_image_name4:test_image_tag4",
+    ])
 
 
 def test_DevEnv_check_image_availability_local_only():
@@ -115,7 +127,7 @@ def test_DevEnv_check_image_availability_local_only():
             },
         ]
     }
-    mock_tool_images = MagicMock()
+    mock_tool_images = _create_tool_images()
     mock_tool_images.local.elements = [
         "test_image_name1:test_image_tag1",
         "test_image_name2:test_image_tag2"
@@ -163,7 +175,7 @@ def test_DevEnv_get_registry_only_tool_images() -> None:
             },
         ]
     }
-    mock_tool_images = MagicMock()
+    mock_tool_images = _create_tool_images()
     mock_tool_images.local.elements = [
         "test_image_name1:test_image_tag1",
         "test_image_name2:test_image_tag2"
@@ -280,6 +292,87 @@ def test_DevEnv_get_deserialized_omit_is_installed() -> None:
     del test_descriptor["installed"]
     assert test_descriptor == actual_deserialized_dev_env
 
+def test_DevEnv_get_deserialized_lock() -> None:
+    # Test setup
+    test_lock = {
+        "digests": {"test_image_name1:test_image_tag1": "sha256:1"},
+        "fingerprint": "test_fingerprint",
+    }
+    test_descriptor: dict[str, Any] = {
+        "name": "test_name",
+        "installed": "True",
+        "tools": [
+            {
+                "image_name": "test_image_name1",
+                "image_version": "test_image_tag1"
+            },
+        ],
+        "lock": test_lock,
+    }
+    test_dev_env = dev_env.DevEnv(test_descriptor)
+
+    # Run unit under test
+    actual_deserialized_dev_env: dict[str, Any] = test_dev_env.get_deserialized()
+    actual_exported_dev_env: dict[str, Any] = test_dev_env.get_deserialized(True)
+
+    # Check expectations
+    assert test_dev_env.lock == test_lock
+    assert actual_deserialized_dev_env == test_descriptor
+    assert "lock" not in actual_exported_dev_env
+    assert dev_env.DevEnv(dev_env_to_copy=test_dev_env).lock is None
+
+def test_DevEnv_get_deserialized_run_options() -> None:
+    # Test setup
+    test_run_options = ["--cpus", "4", "--tmpfs", "/build"]
+    test_descriptor: dict[str, Any] = {
+        "name": "test_name",
+        "installed": "False",
+        "tools": [],
+        "run_options": test_run_options,
+    }
+    test_dev_env = dev_env.DevEnv(test_descriptor)
+
+    # Run unit under test
+    actual_deserialized_dev_env: dict[str, Any] = test_dev_env.get_deserialized()
+    actual_exported_dev_env: dict[str, Any] = test_dev_env.get_deserialized(True)
+
+    # Check expectations
+    assert test_dev_env.run_options == test_run_options
+    assert actual_deserialized_dev_env == test_descriptor
+    assert actual_exported_dev_env["run_options"] == test_run_options
+    assert dev_env.DevEnv(dev_env_to_copy=test_dev_env).run_options == test_run_options
+
+def test_DevEnv_get_cache_volume_mounts() -> None:
+    # Test setup
+    test_cache_volumes = {
+        "toolchain": {"ccache": "/root/.ccache"},
+        "build system": {"conan": "/root/.conan2"},
+    }
+    test_descriptor: dict[str, Any] = {
+        "name": "test dev/env",
+        "installed": "True",
+        "tools": [
+            {"type": "toolchain", "image_name": "test_gcc", "image_version": "13"},
+            {"type": "build system", "image_name": "test_cmake", "image_version": "latest"},
+            {"type": "debugger", "image_name": "test_gdb", "image_version": "latest"},
+        ],
+        "cache_volumes": test_cache_volumes,
+    }
+    test_dev_env = dev_env.DevEnv(test_descriptor)
+
+    # Run unit under test
+    actual_cache_volume_mounts = test_dev_env.get_cache_volume_mounts()
+
+    # Check expectations
+    assert actual_cache_volume_mounts == {
+        "test_gcc:13": {"dem-cache-test_dev_env-ccache": "/root/.ccache"},
+        "test_cmake:latest": {"dem-cache-test_dev_env-conan": "/root/.conan2"},
+        "test_gdb:latest": {},
+    }
+    assert test_dev_env.get_deserialized()["cache_volumes"] == test_cache_volumes
+    assert test_dev_env.get_deserialized(True)["cache_volumes"] == test_cache_volumes
+    assert dev_env.DevEnv(dev_env_to_copy=test_dev_env).cache_volumes == test_cache_volumes
+
 @patch("dem.core.dev_env.open")
 @patch("dem.core.dev_env.json.dump")
 @patch.object(dev_env.DevEnv, "get_deserialized")
@@ -305,4 +398,168 @@ def test_DevEnv_export(mock___init__: MagicMock, mock_get_deserialized: MagicMoc
     # Check expectations
     mock_open.assert_called_once_with(test_path, "w")
     mock_get_deserialized.assert_called_once_with(True)
-    mock_json_dump.assert_called_once_with(mock_deser, mock_file, indent=4)
\ No newline at end of file
+    mock_json_dump.assert_called_once_with(mock_deser, mock_file, indent=4)
+def _create_dev_env(name: str) -> dev_env.DevEnv:
+    return dev_env.DevEnv(descriptor={"name": name, "tools": [], "installed": "False"})
+
+def test_DevEnvList_get_by_name() -> None:
+    # Test setup
+    test_dev_envs = [_create_dev_env(f"test_dev_env_{i}") for i in range(3)]
+
+    # Run unit under test
+    test_dev_env_list = dev_env.DevEnvList(test_dev_envs)
+
+    # Check expectations
+    assert test_dev_env_list == test_dev_envs
+    for test_dev_env in test_dev_envs:
+        assert test_dev_env_list.get_by_name(test_dev_env.name) is test_dev_env
+    assert test_dev_env_list.get_by_name("missing_dev_env") is None
+
+def test_DevEnvList_append_remove() -> None:
+    # Test setup
+    test_dev_env_list = dev_env.DevEnvList()
+    test_dev_env = _create_dev_env("test_dev_env")
+    test_duplicate_dev_env = _create_dev_env("test_dev_env")
+
+    # Run unit under test
+    test_dev_env_list.append(test_dev_env)
+    test_dev_env_list.append(test_duplicate_dev_env)
+
+    # Check expectations
+    assert test_dev_env_list.get_by_name("test_dev_env") is test_dev_env
+
+    # Run unit under test
+    test_dev_env_list.remove(test_dev_env)
+
+    # Check expectations
+    assert test_dev_env_list.get_by_name("test_dev_env") is test_duplicate_dev_env
+
+    # Run unit under test
+    test_dev_env_list.pop()
+
+    # Check expectations
+    assert test_dev_env_list.get_by_name("test_dev_env") is None
+
+def test_DevEnvList_rename() -> None:
+    # Test setup
+    test_dev_env = _create_dev_env("test_dev_env")
+    test_dev_env_list = dev_env.DevEnvList([test_dev_env])
+
+    # Run unit under test
+    test_dev_env_list.rename(test_dev_env, "new_name")
+
+    # Check expectations
+    assert test_dev_env.name == "new_name"
+    assert test_dev_env_list.get_by_name("new_name") is test_dev_env
+    assert test_dev_env_list.get_by_name("test_dev_env") is None
+
+def test_DevEnvList_direct_rename() -> None:
+    # Test setup
+    test_dev_env = _create_dev_env("test_dev_env")
+    test_dev_env_list = dev_env.DevEnvList([test_dev_env])
+
+    # Run unit under test
+    test_dev_env.name = "new_name"
+
+    # Check expectations
+    assert test_dev_env_list.get_by_name("test_dev_env") is None
+    assert test_dev_env_list.get_by_name("new_name") is test_dev_env
+
+def test_DevEnvList_direct_rename_new_name_first() -> None:
+    # Test setup
+    test_dev_env = _create_dev_env("test_dev_env")
+    test_dev_env_list = dev_env.DevEnvList([test_dev_env])
+
+    # Run unit under test
+    test_dev_env.name = "new_name"
+
+    # Check expectations
+    assert test_dev_env_list.get_by_name("new_name") is test_dev_env
+    assert test_dev_env_list.get_by_name("test_dev_env") is None
+
+def test_DevEnvList_item_operations() -> None:
+    # Test setup
+    test_dev_envs = [_create_dev_env(f"test_dev_env_{i}") for i in range(3)]
+    test_dev_env_list = dev_env.DevEnvList(test_dev_envs[:2])
+    test_new_dev_env = _create_dev_env("test_new_dev_env")
+
+    # Run unit under test
+    test_dev_env_list[0] = test_new_dev_env
+    del test_dev_env_list[1]
+    test_dev_env_list += [test_dev_envs[2]]
+    test_dev_env_list.insert(0, test_dev_envs[1])
+
+    # Check expectations
+    assert test_dev_env_list == [test_dev_envs[1], test_new_dev_env, test_dev_envs[2]]
+    assert test_dev_env_list.get_by_name("test_dev_env_0") is None
+    for test_dev_env in test_dev_env_list:
+        assert test_dev_env_list.get_by_name(test_dev_env.name) is test_dev_env
+
+def _create_installed_dev_env(name: str, tool_images: list[str]) -> dev_env.DevEnv:
+    return dev_env.DevEnv(descriptor={
+        "name": name, 
+        "tools": [{"image_name": tool_image.split(":")[0], "image_version": tool_image.split(":")[1]}
+                  for tool_image in tool_images],
+        "installed": "True"
+    })
+
+def test_DevEnvList_reference_counts() -> None:
+    # Test setup
+    test_dev_env1 = _create_installed_dev_env("test_dev_env1", ["axemsolutions/cpputest:latest", 
+                                                                "axemsolutions/jlink:latest"])
+    test_dev_env2 = _create_installed_dev_env("test_dev_env2", ["axemsolutions/cpputest:latest"])
+    test_not_installed_dev_env = _create_dev_env("test_dev_env3")
+    test_not_installed_dev_env.tools = [{"image_name": "axemsolutions/jlink", "image_version": "latest"}]
+
+    # Run unit under test
+    test_dev_env_list = dev_env.DevEnvList([test_dev_env1, test_dev_env2, test_not_installed_dev_env])
+
+    # Check expectations
+    assert test_dev_env_list.get_reference_count("axemsolutions/cpputest:latest") == 2
+    assert test_dev_env_list.get_reference_count("axemsolutions/jlink:latest") == 1
+    assert test_dev_env_list.get_unreferenced_tool_images(test_dev_env1) == ["axemsolutions/jlink:latest"]
+    assert test_dev_env_list.get_unreferenced_tool_images(test_not_installed_dev_env) == []
+
+    # Run unit under test
+    test_dev_env_list.remove(test_dev_env2)
+
+    # Check expectations
+    assert test_dev_env_list.get_unreferenced_tool_images(test_dev_env1) == ["axemsolutions/cpputest:latest",
+                                                                             "axemsolutions/jlink:latest"]
+
+    # Run unit under test
+    test_dev_env1.is_installed = False
+    test_dev_env_list.update_references(test_dev_env1)
+
+    # Check expectations
+    assert test_dev_env_list.get_reference_count("axemsolutions/cpputest:latest") == 0
+    assert test_dev_env_list.get_reference_count("axemsolutions/jlink:latest") == 0
+
+    # Run unit under test
+    test_not_installed_dev_env.is_installed = True
+    test_dev_env_list.update_references(test_not_installed_dev_env)
+    test_dev_env_list.update_references(test_dev_env2)
+
+    # Check expectations
+    assert test_dev_env_list.get_reference_count("axemsolutions/jlink:latest") == 1
+    assert test_dev_env_list.get_reference_count("axemsolutions/cpputest:latest") == 0
+
+def test_DevEnvList_reference_counts_item_operations() -> None:
+    # Test setup
+    test_dev_env1 = _create_installed_dev_env("test_dev_env1", ["axemsolutions/cpputest:latest"])
+    test_dev_env2 = _create_installed_dev_env("test_dev_env2", ["axemsolutions/cpputest:latest"])
+    test_dev_env_list = dev_env.DevEnvList([test_dev_env1])
+
+    # Run unit under test
+    test_dev_env_list[0] = test_dev_env2
+    test_dev_env_list.insert(0, test_dev_env1)
+
+    # Check expectations
+    assert test_dev_env_list.get_reference_count("axemsolutions/cpputest:latest") == 2
+
+    # Run unit under test
+    del test_dev_env_list[0]
+    test_dev_env_list.pop()
+
+    # Check expectations
+    assert test_dev_env_list.get_reference_count("axemsolutions/cpputest:latest") == 0
@@ -5,21 +5,26 @@
 import dem.core.dev_env_catalog as dev_env_catalog
 
 # Test framework
+import pytest
 from unittest.mock import patch, MagicMock, call
 
+from typing import Any
+import json.decoder
+
 @patch("dem.core.dev_env_catalog.DevEnv")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog(mock_requests: MagicMock, mock_DevEnv: MagicMock):
+def test_DevEnvCatalog(mock_DevEnv: MagicMock):
     # Test setup
+    mock_session = MagicMock()
     mock_response = MagicMock()
-    mock_requests.get.return_value = mock_response
-    test_dev_env_descriptors = [MagicMock()] * 5
+    mock_session.get.return_value = mock_response
+    mock_response.status_code = dev_env_catalog.requests.codes.ok
+    test_dev_env_descriptors = [{"name": f"test_dev_env_{i}"} for i in range(5)]
     mock_json = {
         "development_environments": test_dev_env_descriptors
     }
     mock_response.json.return_value = mock_json
 
-    test_dev_envs = [MagicMock()] * 5
+    test_dev_envs = [MagicMock() for _ in range(5)]
     mock_DevEnv.side_effect = test_dev_envs
     
     test_url = "test_url"
@@ -27,18 +32,282 @@ def test_DevEnvCatalog(mock_requests: MagicMock, mock_DevEnv: MagicMock):
         "url": test_url
     }
 
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config, mock_session)
+
     # Run unit under test
-    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config)
+    test_dev_env_catalog.update()
 
     # Check expectations
+    mock_DevEnv.assert_not_called()
+
     assert test_dev_env_catalog.dev_envs == test_dev_envs
 
-    mock_requests.get.assert_called_once_with(test_url, timeout=1)
+    mock_session.get.assert_called_once_with(test_url, headers={},
+                                             timeout=dev_env_catalog.DevEnvCatalog._default_timeout)
     mock_response.json.assert_called_once()
 
     calls = [call(descriptor=test_dev_env_descriptor) for test_dev_env_descriptor in test_dev_env_descriptors]
     mock_DevEnv.assert_has_calls(calls)
 
+@patch("dem.core.dev_env_catalog.time.time")
+@patch("dem.core.dev_env_catalog.DevEnv")
+def test_DevEnvCatalog_update_store_snapshot(mock_DevEnv: MagicMock, mock_time: MagicMock):
+    # Test setup
+    mock_session = MagicMock()
+    mock_response = MagicMock()
+    mock_session.get.return_value = mock_response
+    mock_response.status_code = dev_env_catalog.requests.codes.ok
+    mock_response.headers = {"ETag": "test_etag"}
+    test_catalog = {
+        "development_environments": [{"name": "test_dev_env"}]
+    }
+    mock_response.json.return_value = test_catalog
+    mock_time.return_value = 42.0
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {}
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url"}, mock_session, 
+                                                         mock_cache_file)
+
+    # Run unit under test
+    test_dev_env_catalog.update()
+
+    # Check expectations
+    assert mock_cache_file.deserialized == {
+        "test_url": {
+            "catalog": test_catalog,
+            "etag": "test_etag",
+            "fetched_at": 42.0
+        }
+    }
+    assert test_dev_env_catalog.get_dev_env_by_name("test_dev_env") is mock_DevEnv.return_value
+
+    mock_session.get.assert_called_once_with("test_url", headers={},
+                                             timeout=dev_env_catalog.DevEnvCatalog._default_timeout)
+
+@patch("dem.core.dev_env_catalog.DevEnv")
+def test_DevEnvCatalog_update_not_modified(mock_DevEnv: MagicMock):
+    # Test setup
+    mock_session = MagicMock()
+    mock_response = MagicMock()
+    mock_session.get.return_value = mock_response
+    mock_response.status_code = dev_env_catalog.requests.codes.not_modified
+    test_catalog = {
+        "development_environments": [{"name": "test_dev_env"}]
+    }
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        "test_url": {
+            "catalog": test_catalog,
+            "etag": "test_etag",
+            "fetched_at": 0.0
+        }
+    }
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url"}, mock_session, 
+                                                         mock_cache_file)
+
+    # Run unit under test
+    test_dev_env_catalog.update()
+
+    # Check expectations
+    assert test_dev_env_catalog.dev_envs == [mock_DevEnv.return_value]
+    assert mock_cache_file.deserialized["test_url"]["fetched_at"] > 0.0
+
+    mock_session.get.assert_called_once_with("test_url", headers={"If-None-Match": "test_etag"},
+                                             timeout=dev_env_catalog.DevEnvCatalog._default_timeout)
+    mock_response.json.assert_not_called()
+    mock_DevEnv.assert_called_once_with(descriptor=test_catalog["development_environments"][0])
+
+@patch("dem.core.dev_env_catalog.DevEnv")
+def test_DevEnvCatalog_update_unreachable_use_snapshot(mock_DevEnv: MagicMock):
+    # Test setup
+    mock_session = MagicMock()
+    mock_session.get.side_effect = dev_env_catalog.requests.exceptions.ConnectionError()
+    test_catalog = {
+        "development_environments": [{"name": "test_dev_env"}]
+    }
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        "test_url": {
+            "catalog": test_catalog,
+            "etag": None,
+            "fetched_at": 0.0
+        }
+    }
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url", "retries": 0}, 
+                                                         mock_session, mock_cache_file)
+
+    # Run unit under test
+    test_dev_env_catalog.update()
+
+    # Check expectations
+    assert test_dev_env_catalog.get_dev_env_by_name("test_dev_env") is mock_DevEnv.return_value
+    assert test_dev_env_catalog.get_dev_env_by_name("missing_dev_env") is None
+    assert mock_cache_file.deserialized["test_url"]["fetched_at"] == 0.0
+
+    mock_session.get.assert_called_once_with("test_url", headers={},
+                                             timeout=dev_env_catalog.DevEnvCatalog._default_timeout)
+
+@pytest.mark.parametrize("test_status_code, test_json", [
+    (404, {"development_environments": []}),
+    (500, None),
+    (200, {"portal": "login"}),
+    (200, json.decoder.JSONDecodeError("Expecting value", "<html>", 0)),
+])
+def test_DevEnvCatalog_update_invalid_response_use_snapshot(test_status_code: int, 
+                                                            test_json: Any) -> None:
+    # Test setup
+    mock_session = MagicMock()
+    mock_response = MagicMock()
+    mock_session.get.return_value = mock_response
+    mock_response.status_code = test_status_code
+    if isinstance(test_json, Exception):
+        mock_response.json.side_effect = test_json
+    else:
+        mock_response.json.return_value = test_json
+    test_snapshot = {
+        "catalog": {"development_environments": [{"name": "test_dev_env"}]},
+        "etag": "test_etag",
+        "fetched_at": 1.0,
+    }
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {"test_url": test_snapshot}
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url"}, mock_session,
+                                                         mock_cache_file)
+
+    # Run unit under test
+    test_dev_env_catalog.update()
+
+    # Check expectations
+    assert test_dev_env_catalog.get_dev_env_names() == ["test_dev_env"]
+    assert mock_cache_file.deserialized == {"test_url": test_snapshot}
+    assert test_snapshot["fetched_at"] == 1.0
+
+def test_DevEnvCatalog_update_invalid_response_no_snapshot() -> None:
+    # Test setup
+    mock_session = MagicMock()
+    mock_session.get.return_value.status_code = 404
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url"}, mock_session)
+
+    # Run unit under test
+    with pytest.raises(dev_env_catalog.CatalogError) as exported_exception_info:
+        test_dev_env_catalog.update()
+
+    # Check expectations
+    assert "The test_url catalog is not available." in str(exported_exception_info.value)
+
+def test_DevEnvCatalog_update_unreachable_no_snapshot():
+    # Test setup
+    mock_session = MagicMock()
+    mock_session.get.side_effect = dev_env_catalog.requests.exceptions.ConnectionError()
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url", "retries": 0}, 
+                                                         mock_session)
+
+    # Run unit under test
+    with pytest.raises(dev_env_catalog.CatalogError) as exported_exception_info:
+        test_dev_env_catalog.update()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Error: The test_url catalog is not available."
+
+@patch.object(dev_env_catalog.DevEnvCatalog, "offline", True)
+@patch("dem.core.dev_env_catalog.DevEnv")
+def test_DevEnvCatalog_update_offline(mock_DevEnv: MagicMock):
+    # Test setup
+    mock_session = MagicMock()
+    test_catalog = {
+        "development_environments": [{"name": "test_dev_env"}]
+    }
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        "test_url": {
+            "catalog": test_catalog,
+            "etag": "test_etag",
+            "fetched_at": 0.0
+        }
+    }
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url"}, mock_session, 
+                                                         mock_cache_file)
+
+    # Run unit under test
+    test_dev_env_catalog.update()
+
+    # Check expectations
+    assert test_dev_env_catalog.dev_envs == [mock_DevEnv.return_value]
+
+    mock_session.get.assert_not_called()
+
+@patch.object(dev_env_catalog.DevEnvCatalog, "offline", True)
+def test_DevEnvCatalog_update_offline_no_snapshot():
+    # Test setup
+    mock_session = MagicMock()
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {}
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url"}, mock_session, 
+                                                         mock_cache_file)
+
+    # Run unit under test
+    with pytest.raises(dev_env_catalog.CatalogError) as exported_exception_info:
+        test_dev_env_catalog.update()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Error: No snapshot of the test_url catalog is available in offline mode."
+
+    mock_session.get.assert_not_called()
+
+@patch("dem.core.dev_env_catalog.DevEnv")
+def test_DevEnvCatalog_update_retry(mock_DevEnv: MagicMock):
+    # Test setup
+    mock_session = MagicMock()
+    mock_response = MagicMock()
+    mock_response.status_code = dev_env_catalog.requests.codes.ok
+    mock_response.json.return_value = {
+        "development_environments": []
+    }
+    mock_session.get.side_effect = [dev_env_catalog.requests.exceptions.Timeout(), 
+                                    dev_env_catalog.requests.exceptions.ConnectionError(),
+                                    mock_response]
+    test_catalog_config = {
+        "url": "test_url",
+        "timeout": 5,
+        "retries": 2
+    }
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config, mock_session)
+
+    # Run unit under test
+    test_dev_env_catalog.update()
+
+    # Check expectations
+    assert test_dev_env_catalog.dev_envs == []
+
+    mock_session.get.assert_has_calls([call("test_url", headers={}, timeout=5)] * 3)
+
+def test_DevEnvCatalog_update_retries_exhausted():
+    # Test setup
+    mock_session = MagicMock()
+    mock_session.get.side_effect = dev_env_catalog.requests.exceptions.Timeout("test_timeout")
+    test_catalog_config = {
+        "url": "test_url",
+        "retries": 1
+    }
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config, mock_session)
+
+    # Run unit under test
+    with pytest.raises(dev_env_catalog.CatalogError):
+        test_dev_env_catalog.update()
+
+    # Check expectations
+    assert mock_session.get.call_count == 2
+
 @patch.object(dev_env_catalog.DevEnvCatalog, "__init__")
 def test_DevEnvCatalog_get_dev_env_by_name(mock___init__: MagicMock):
     # Test setup
@@ -59,8 +328,9 @@ def test_DevEnvCatalog_get_dev_env_by_name(mock___init__: MagicMock):
     assert actual_dev_env is test_dev_envs[expected_dev_env_index]
     mock___init__.assert_called_once()
 
+@patch("dem.core.dev_env_catalog.requests")
 @patch("dem.core.dev_env_catalog.DevEnvCatalog")
-def test_DevEnvCatalogs(mock_DevEnvCatalog: MagicMock):
+def test_DevEnvCatalogs(mock_DevEnvCatalog: MagicMock, mock_requests: MagicMock):
     # Test setup
     mock_config_file = MagicMock()
     mock_config_file.catalogs = [
@@ -82,11 +352,49 @@ def test_DevEnvCatalogs(mock_DevEnvCatalog: MagicMock):
 
     calls = []
     for test_catalog in mock_config_file.catalogs:
-        calls.append(call(test_catalog))
+        calls.append(call(test_catalog, mock_requests.Session.return_value, None))
     mock_DevEnvCatalog.assert_has_calls(calls)
 
+@patch("dem.core.dev_env_catalog.requests")
+@patch.object(dev_env_catalog.Core, "user_output")
+@patch("dem.core.dev_env_catalog.DevEnvCatalog")
+def test_DevEnvCatalogs_failing_catalog(mock_DevEnvCatalog: MagicMock, mock_user_output: MagicMock,
+                                        mock_requests: MagicMock):
+    # Test setup
+    mock_config_file = MagicMock()
+    mock_config_file.catalogs = [
+        {
+            "url": "test_url_1"
+        },
+        {
+            "url": "test_url_2"
+        },
+        {
+            "url": "test_url_3"
+        }
+    ]
+    mock_dev_env_catalogs = [MagicMock(), MagicMock(), MagicMock()]
+    test_exception_text = "test_exception_text"
+    mock_dev_env_catalogs[1].update.side_effect = Exception(test_exception_text)
+    mock_DevEnvCatalog.side_effect = mock_dev_env_catalogs
+
+    # Run unit under test
+    test_dev_env_catalogs = dev_env_catalog.DevEnvCatalogs(mock_config_file)
+
+    # Check expectations
+    assert test_dev_env_catalogs.catalogs == [mock_dev_env_catalogs[0], mock_dev_env_catalogs[2]]
+
+    for mock_dev_env_catalog in mock_dev_env_catalogs:
+        mock_dev_env_catalog.update.assert_called_once()
+    mock_user_output.error.assert_has_calls([
+        call(test_exception_text),
+        call("Error: Couldn't add this Development Environment Catalog.")
+    ])
+    mock_requests.adapters.HTTPAdapter.assert_called_once_with(pool_maxsize=dev_env_catalog.DevEnvCatalogs._max_workers)
+
+@patch("dem.core.dev_env_catalog.requests")
 @patch("dem.core.dev_env_catalog.DevEnvCatalog")
-def test_DevEnvCatalogs_add_catalog(mock_DevEnvCatalog: MagicMock):
+def test_DevEnvCatalogs_add_catalog(mock_DevEnvCatalog: MagicMock, mock_requests: MagicMock):
     # Test setup
     mock_config_file = MagicMock()
     test_default_catalogs = [
@@ -120,16 +428,18 @@ def test_DevEnvCatalogs_add_catalog(mock_DevEnvCatalog: MagicMock):
 
     calls = []
     for test_catalog in test_default_catalogs:
-        calls.append(call(test_catalog))
-    calls.append(call(expected_catalog_config_to_be_added))
+        calls.append(call(test_catalog, mock_requests.Session.return_value, None))
+    calls.append(call(expected_catalog_config_to_be_added, mock_requests.Session.return_value, None))
 
-    mock_DevEnvCatalog.assert_has_calls(calls)
+    assert mock_DevEnvCatalog.call_args_list == calls
+    expected_catalog_to_be_added.update.assert_called_once()
     mock_config_file.flush.assert_called_once()
 
+@patch("dem.core.dev_env_catalog.requests")
 @patch.object(dev_env_catalog.Core, "user_output")
 @patch("dem.core.dev_env_catalog.DevEnvCatalog")
 def test_DevEnvCatalogs_add_catalog_exception(mock_DevEnvCatalog: MagicMock, 
-                                              mock_user_output: MagicMock):
+                                              mock_user_output: MagicMock, mock_requests: MagicMock):
     # Test setup
     mock_config_file = MagicMock()
     mock_config_file.catalogs = []
@@ -146,15 +456,17 @@ def test_DevEnvCatalogs_add_catalog_exception(mock_DevEnvCatalog: MagicMock,
     test_dev_env_catalogs.add_catalog(expected_catalog_config_to_be_added)
 
     # Check expectations
-    mock_DevEnvCatalog.assert_called_once_with(expected_catalog_config_to_be_added)
+    mock_DevEnvCatalog.assert_called_once_with(expected_catalog_config_to_be_added, 
+                                               mock_requests.Session.return_value, None)
     calls = [
         call(test_exception_text),
         call("Error: Couldn't add this Development Environment Catalog.")
     ]
     mock_user_output.error.assert_has_calls(calls)
 
+@patch("dem.core.dev_env_catalog.requests")
 @patch("dem.core.dev_env_catalog.DevEnvCatalog")
-def test_DevEnvCatalogs_list_catalog_configs(mock_DevEnvCatalog: MagicMock):
+def test_DevEnvCatalogs_list_catalog_configs(mock_DevEnvCatalog: MagicMock, mock_requests: MagicMock):
     # Test setup
     mock_config_file = MagicMock()
     mock_config_file.catalogs = [
@@ -178,11 +490,12 @@ def test_DevEnvCatalogs_list_catalog_configs(mock_DevEnvCatalog: MagicMock):
 
     calls = []
     for test_catalog in mock_config_file.catalogs:
-        calls.append(call(test_catalog))
+        calls.append(call(test_catalog, mock_requests.Session.return_value, None))
     mock_DevEnvCatalog.assert_has_calls(calls)
 
+@patch("dem.core.dev_env_catalog.requests")
 @patch("dem.core.dev_env_catalog.DevEnvCatalog")
-def test_DevEnvCatalogs_delete_catalog(mock_DevEnvCatalog: MagicMock):
+def test_DevEnvCatalogs_delete_catalog(mock_DevEnvCatalog: MagicMock, mock_requests: MagicMock):
     # Test setup
     mock_config_file = MagicMock()
     catalog_config_to_delete = {
@@ -210,6 +523,103 @@ def test_DevEnvCatalogs_delete_catalog(mock_DevEnvCatalog: MagicMock):
 
     calls = []
     for test_catalog in mock_config_file.catalogs:
-        calls.append(call(test_catalog))
+        calls.append(call(test_catalog, mock_requests.Session.return_value, None))
     mock_DevEnvCatalog.assert_has_calls(calls)
-    mock_config_file.flush.assert_called_once()
\ No newline at end of file
+    mock_config_file.flush.assert_called_once()
+@patch("dem.core.dev_env_catalog.requests")
+@patch("dem.core.dev_env_catalog.DevEnvCatalog")
+def test_DevEnvCatalogs_cache_file(mock_DevEnvCatalog: MagicMock, mock_requests: MagicMock):
+    # Test setup
+    mock_config_file = MagicMock()
+    catalog_config_to_delete = {
+        "url": "test_url_1"
+    }
+    mock_config_file.catalogs = [
+        catalog_config_to_delete
+    ]
+    mock_DevEnvCatalog.offline = False
+    mock_dev_env_catalog = MagicMock()
+    mock_dev_env_catalog.config = catalog_config_to_delete
+    mock_DevEnvCatalog.return_value = mock_dev_env_catalog
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        "test_url_1": {}
+    }
+
+    test_dev_env_catalogs = dev_env_catalog.DevEnvCatalogs(mock_config_file, mock_cache_file)
+
+    # Run unit under test
+    test_dev_env_catalogs.delete_catalog(catalog_config_to_delete)
+
+    # Check expectations
+    assert mock_cache_file.deserialized == {}
+
+    mock_DevEnvCatalog.assert_called_once_with(catalog_config_to_delete, 
+                                               mock_requests.Session.return_value, mock_cache_file)
+    assert mock_cache_file.flush.call_count == 2
+
+@patch("dem.core.dev_env_catalog.requests")
+@patch("dem.core.dev_env_catalog.DevEnvCatalog")
+def test_DevEnvCatalogs_get_dev_env_by_name(mock_DevEnvCatalog: MagicMock, 
+                                            mock_requests: MagicMock):
+    # Test setup
+    mock_config_file = MagicMock()
+    mock_config_file.catalogs = [
+        {
+            "url": "test_url_1"
+        },
+        {
+            "url": "test_url_2"
+        }
+    ]
+    mock_dev_env_catalogs = [MagicMock(), MagicMock()]
+    mock_dev_env_catalogs[0].get_dev_env_names.return_value = ["test_dev_env_1", "test_shared"]
+    mock_dev_env_catalogs[1].get_dev_env_names.return_value = ["test_shared", "test_dev_env_2"]
+    for mock_dev_env_catalog, test_catalog_config in zip(mock_dev_env_catalogs, 
+                                                         mock_config_file.catalogs):
+        mock_dev_env_catalog.config = test_catalog_config
+    mock_DevEnvCatalog.side_effect = mock_dev_env_catalogs
+
+    test_dev_env_catalogs = dev_env_catalog.DevEnvCatalogs(mock_config_file)
+
+    # Run unit under test
+    actual_dev_env_2 = test_dev_env_catalogs.get_dev_env_by_name("test_dev_env_2")
+    actual_shared = test_dev_env_catalogs.get_dev_env_by_name("test_shared")
+    actual_missing = test_dev_env_catalogs.get_dev_env_by_name("missing_dev_env")
+
+    # Check expectations
+    assert actual_dev_env_2 is mock_dev_env_catalogs[1].get_dev_env_by_name.return_value
+    assert actual_shared is mock_dev_env_catalogs[0].get_dev_env_by_name.return_value
+    assert actual_missing is None
+
+    mock_dev_env_catalogs[0].get_dev_env_names.assert_called_once()
+    mock_dev_env_catalogs[1].get_dev_env_names.assert_called_once()
+    mock_dev_env_catalogs[0].get_dev_env_by_name.assert_called_once_with("test_shared")
+    mock_dev_env_catalogs[1].get_dev_env_by_name.assert_called_once_with("test_dev_env_2")
+
+    # Run unit under test
+    test_dev_env_catalogs.delete_catalog(mock_config_file.catalogs[0])
+
+    # Check expectations
+    assert test_dev_env_catalogs.get_dev_env_by_name("test_shared") is \
+        mock_dev_env_catalogs[1].get_dev_env_by_name.return_value
+
+@patch("dem.core.dev_env_catalog.DevEnv")
+def test_DevEnvCatalog_get_dev_env_names(mock_DevEnv: MagicMock):
+    # Test setup
+    mock_session = MagicMock()
+    mock_session.get.return_value.status_code = dev_env_catalog.requests.codes.ok
+    mock_session.get.return_value.json.return_value = {
+        "development_environments": [{"name": "test_dev_env_1"}, {"name": "test_dev_env_2"}]
+    }
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog({"url": "test_url"}, mock_session)
+    test_dev_env_catalog.update()
+
+    # Run unit under test
+    actual_dev_env_names = test_dev_env_catalog.get_dev_env_names()
+
+    # Check expectations
+    assert actual_dev_env_names == ["test_dev_env_1", "test_dev_env_2"]
+
+    mock_DevEnv.assert_not_called()
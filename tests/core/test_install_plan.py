@@ -0,0 +1,74 @@
+"""Unit tests for the install plan."""
+# tests/core/test_install_plan.py
+
+# Unit under test:
+import dem.core.install_plan as install_plan
+
+# Test framework
+import pytest
+
+from dem.core.container_engine import get_chain_ids
+
+def _create_layers(layers: list[tuple[str, int]]) -> list[dict]:
+    return [{"digest": "sha256:blob_" + name, "size": size, "diff_id": "sha256:diff_" + name} 
+            for name, size in layers]
+
+def test_InstallPlan():
+    # Test setup
+    test_image_layers = {
+        "axemsolutions/cpputest:latest": _create_layers([("base", 100), ("cpputest", 50)]),
+        "axemsolutions/make_gnu_arm:latest": _create_layers([("base", 100), ("gnu_arm", 400)]),
+        "axemsolutions/jlink:latest": _create_layers([("local", 300), ("jlink", 20)]),
+    }
+    test_local_chain_ids = set(get_chain_ids(["sha256:diff_local"]))
+
+    # Run unit under test
+    test_install_plan = install_plan.InstallPlan(test_image_layers, test_local_chain_ids, 
+                                                 ["axemsolutions/stlink:latest"])
+
+    # Check expectations
+    assert test_install_plan.download_size == 100 + 50 + 400 + 20
+    assert test_install_plan.shared_layer_count == 1
+    assert test_install_plan.local_layer_count == 1
+    assert test_install_plan.unavailable_tool_images == ["axemsolutions/stlink:latest"]
+
+    assert test_install_plan.get_layer_count("axemsolutions/cpputest:latest") == 2
+    assert test_install_plan.get_layer_count("axemsolutions/jlink:latest") == 1
+    assert test_install_plan.get_download_size("axemsolutions/make_gnu_arm:latest") == 500
+    assert test_install_plan.get_shared_size("axemsolutions/make_gnu_arm:latest") == 100
+    assert test_install_plan.get_shared_size("axemsolutions/jlink:latest") == 0
+
+    assert test_install_plan.get_pull_order() == ["axemsolutions/make_gnu_arm:latest",
+                                                  "axemsolutions/cpputest:latest",
+                                                  "axemsolutions/jlink:latest"]
+
+def test_InstallPlan_layer_on_different_base():
+    # Test setup
+    test_image_layers = {
+        "axemsolutions/cpputest:latest": _create_layers([("other_base", 100), ("shared", 50)]),
+    }
+    # The same layer is available locally, but on top of a different base layer.
+    test_local_chain_ids = set(get_chain_ids(["sha256:diff_base", "sha256:diff_shared"]))
+
+    # Run unit under test
+    test_install_plan = install_plan.InstallPlan(test_image_layers, test_local_chain_ids)
+
+    # Check expectations
+    assert test_install_plan.download_size == 150
+    assert test_install_plan.local_layer_count == 0
+    assert test_install_plan.unavailable_tool_images == []
+
+def test_InstallPlan_shared_local_layer():
+    # Test setup
+    test_image_layers = {
+        "axemsolutions/cpputest:latest": _create_layers([("base", 100), ("cpputest", 50)]),
+        "axemsolutions/make_gnu_arm:latest": _create_layers([("base", 100), ("gnu_arm", 400)]),
+    }
+    test_local_chain_ids = set(get_chain_ids(["sha256:diff_base"]))
+
+    # Run unit under test
+    test_install_plan = install_plan.InstallPlan(test_image_layers, test_local_chain_ids)
+
+    # Check expectations
+    assert test_install_plan.download_size == 50 + 400
+    assert test_install_plan.local_layer_count == 1
@@ -3,6 +3,7 @@
 
 # Unit under test:
 import dem.core.platform as platform
+import dem.core.data_management as data_management
 
 # Test framework
 import pytest
@@ -10,6 +11,7 @@ from unittest.mock import patch, MagicMock, call
 
 from dem.core.exceptions import InvalidDevEnvJson
 from typing import Any
+import json
 
 @patch("dem.core.platform.DevEnv")
 @patch("dem.core.platform.LocalDevEnvJSON")
@@ -35,11 +37,14 @@ def test_Platform_creation(mock_LocalDevEnvJSON: MagicMock, mock_DevEnv: MagicMo
     test_platform = platform.Platform()
 
     # Check expectations
-    mock_LocalDevEnvJSON.assert_called_once()
-    mock_DevEnv.assert_called_once_with(descriptor=test_dev_env_descriptor)
+    mock_LocalDevEnvJSON.assert_not_called()
 
     assert test_platform.local_dev_envs[0] is mock_dev_env
     assert test_platform.version == mock_local_dev_env_json.deserialized["version"]
+    assert test_platform.dev_env_json is mock_local_dev_env_json
+
+    mock_LocalDevEnvJSON.assert_called_once()
+    mock_DevEnv.assert_called_once_with(descriptor=test_dev_env_descriptor)
 
 @patch("dem.core.platform.LocalDevEnvJSON")
 def test_Platfrom_invalid_version_expect_error(mock_LocalDevEnvJSON: MagicMock) -> None:
@@ -54,7 +59,7 @@ def test_Platfrom_invalid_version_expect_error(mock_LocalDevEnvJSON: MagicMock)
 
     # Run unit under test
     with pytest.raises(InvalidDevEnvJson) as exported_exception_info:
-        platform.Platform()
+        platform.Platform().local_dev_envs
 
     # Check expectations
     excepted_error_message = "Error in dev_env.json: The dev_env.json version v1.0 is not supported."
@@ -90,11 +95,19 @@ def test_Platform_tool_images(mock___init__: MagicMock, mock_ToolImages: MagicMo
     mock_ToolImages.assert_called_once_with(mock_container_engine, mock_registries, 
                                             test_update_tool_images_on_instantiation)
 
+@patch("dem.core.platform.WarmContainersFile")
+@patch("dem.core.platform.LocalImageIndexFile")
 @patch("dem.core.platform.ContainerEngine")
 @patch.object(platform.Platform, "__init__")
-def test_Platform_container_engine(mock___init__: MagicMock, mock_ContainerEngine: MagicMock) -> None:
+def test_Platform_container_engine(mock___init__: MagicMock, mock_ContainerEngine: MagicMock,
+                                   mock_LocalImageIndexFile: MagicMock, 
+                                   mock_WarmContainersFile: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
+    mock_local_image_index = MagicMock()
+    mock_LocalImageIndexFile.return_value = mock_local_image_index
+    mock_warm_containers_file = MagicMock()
+    mock_WarmContainersFile.return_value = mock_warm_containers_file
 
     test_platform = platform.Platform()
     test_platform._container_engine = None
@@ -110,11 +123,15 @@ def test_Platform_container_engine(mock___init__: MagicMock, mock_ContainerEngin
     assert test_platform._container_engine is mock_container_engine
 
     mock___init__.assert_called_once()
-    mock_ContainerEngine.assert_called_once()
+    mock_LocalImageIndexFile.assert_called_once()
+    mock_WarmContainersFile.assert_called_once()
+    mock_ContainerEngine.assert_called_once_with(mock_local_image_index, mock_warm_containers_file)
 
+@patch("dem.core.platform.RegistryCacheFile")
 @patch("dem.core.platform.Registries")
 @patch.object(platform.Platform, "__init__")
-def test_Platform_registries(mock___init__: MagicMock, mock_Registries: MagicMock) -> None:
+def test_Platform_registries(mock___init__: MagicMock, mock_Registries: MagicMock, 
+                             mock_RegistryCacheFile: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
 
@@ -137,7 +154,8 @@ def test_Platform_registries(mock___init__: MagicMock, mock_Registries: MagicMoc
     assert test_platform._registries is mock_registries
 
     mock___init__.assert_called_once()
-    mock_Registries.assert_called_once_with(mock_container_engine, mock_config_file)
+    mock_Registries.assert_called_once_with(mock_container_engine, mock_config_file,
+                                            mock_RegistryCacheFile.return_value)
 
 @patch("dem.core.platform.ConfigFile")
 @patch.object(platform.Platform, "__init__")
@@ -161,9 +179,11 @@ def test_Platform_config_file(mock___init__: MagicMock, mock_ConfigFile: MagicMo
     mock___init__.assert_called_once()
     mock_ConfigFile.assert_called_once()
 
+@patch("dem.core.platform.CatalogCacheFile")
 @patch("dem.core.platform.DevEnvCatalogs")
 @patch.object(platform.Platform, "__init__")
-def test_Platform_dev_env_catalogs(mock___init__: MagicMock, mock_DevEnvCatalogs: MagicMock) -> None:
+def test_Platform_dev_env_catalogs(mock___init__: MagicMock, mock_DevEnvCatalogs: MagicMock, 
+                                   mock_CatalogCacheFile: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
 
@@ -184,7 +204,9 @@ def test_Platform_dev_env_catalogs(mock___init__: MagicMock, mock_DevEnvCatalogs
     assert test_platform._dev_env_catalogs is mock_dev_env_catalogs
 
     mock___init__.assert_called_once()
-    mock_DevEnvCatalogs.assert_called_once_with(mock_config_file)
+    mock_CatalogCacheFile.assert_called_once()
+    mock_DevEnvCatalogs.assert_called_once_with(mock_config_file, 
+                                                mock_CatalogCacheFile.return_value)
 
 @patch("dem.core.platform.Hosts")
 @patch.object(platform.Platform, "__init__")
@@ -292,24 +314,32 @@ def test_Platform_get_dev_env_by_name_no_match(mock___init__: MagicMock) -> None
 
     mock___init__.assert_called_once()
 
+@patch.object(platform.Platform, "record_tool_image_usage")
+@patch.object(platform.Platform, "_order_pulls", side_effect=lambda dev_env, tool_images: tool_images)
 @patch.object(platform.Platform, "flush_descriptors")
+@patch.object(platform.Platform, "config_file")
 @patch.object(platform.Platform, "tool_images")
 @patch.object(platform.Platform, "container_engine")
 @patch.object(platform.Platform, "user_output")
 @patch.object(platform.Platform, "__init__")
 def test_Platform_install_dev_env_succes(mock___init__: MagicMock, mock_user_input: MagicMock, 
                                   mock_container_engine: MagicMock, mock_tool_images,
-                                  mock_flush_descriptors: MagicMock) -> None:
+                                  mock_config_file: MagicMock,
+                                  mock_flush_descriptors: MagicMock,
+                                  mock__order_pulls: MagicMock,
+                                  mock_record_tool_image_usage: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
    
 
     test_dev_env = MagicMock()    
-    test_registry_only_tool_images: list[str] = ["test_image_name1:test_image_version1", 
-                                                 "test_image_name2:test_image_version2"]
+    test_registry_only_tool_images: set[str] = {"test_image_name2:test_image_version2", 
+                                                "test_image_name1:test_image_version1"}
     test_dev_env.get_registry_only_tool_images.return_value = test_registry_only_tool_images
+    mock_config_file.max_parallel_pulls = 2
 
     test_platform = platform.Platform()
+    test_platform.local_dev_envs = [test_dev_env]
 
     # Run unit under test
     test_platform.install_dev_env(test_dev_env)
@@ -317,98 +347,328 @@ def test_Platform_install_dev_env_succes(mock___init__: MagicMock, mock_user_inp
     # Check expectations
     mock___init__.assert_called_once()
 
-    test_dev_env.get_registry_only_tool_images.assert_called_once_with(mock_tool_images, False)
-    mock_user_input.msg.assert_has_calls([
-        call(f"\nPulling image {test_registry_only_tool_images[0]}", is_title=True),
-        call(f"\nPulling image {test_registry_only_tool_images[1]}", is_title=True)
-    ])
-    mock_container_engine.pull.assert_has_calls([
-        call(test_registry_only_tool_images[0]),
-        call(test_registry_only_tool_images[1])
-    ])
+    expected_tool_images = ["test_image_name1:test_image_version1", 
+                            "test_image_name2:test_image_version2"]
+    test_dev_env.get_registry_only_tool_images.assert_called_once_with(mock_tool_images, True)
+    mock_user_input.msg.assert_called_once_with(f"\nPulling images: {', '.join(expected_tool_images)}", 
+                                                is_title=True)
+    mock__order_pulls.assert_called_once_with(test_dev_env, expected_tool_images)
+    mock_container_engine.pull_images.assert_called_once_with(expected_tool_images, 
+                                                              mock_config_file.max_parallel_pulls,
+                                                              {})
+    mock_flush_descriptors.assert_called_once()
+    mock_record_tool_image_usage.assert_called_once_with(test_dev_env.get_tool_images.return_value)
+    assert test_dev_env.is_installed == "True"
+    assert test_dev_env.lock == {
+        "digests": mock_container_engine.get_local_image_ids.return_value,
+        "fingerprint": mock_container_engine.get_fingerprint.return_value,
+    }
+
+@patch.object(platform.Platform, "record_tool_image_usage")
+@patch.object(platform.Platform, "flush_descriptors")
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "tool_images")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_install_dev_env_nothing_to_pull(mock___init__: MagicMock, 
+                                                  mock_user_input: MagicMock, 
+                                                  mock_container_engine: MagicMock, 
+                                                  mock_tool_images, mock_config_file: MagicMock,
+                                                  mock_flush_descriptors: MagicMock,
+                                                  mock_record_tool_image_usage: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = MagicMock()    
+    test_dev_env.get_registry_only_tool_images.return_value = set()
+
+    test_platform = platform.Platform()
+    test_platform.local_dev_envs = [test_dev_env]
+
+    # Run unit under test
+    test_platform.install_dev_env(test_dev_env)
+
+    # Check expectations
+    mock_user_input.msg.assert_not_called()
+    mock_container_engine.pull_images.assert_not_called()
     mock_flush_descriptors.assert_called_once()
 
+@patch.object(platform.Platform, "_order_pulls", side_effect=lambda dev_env, tool_images: tool_images)
+@patch.object(platform.Platform, "flush_descriptors")
+@patch.object(platform.Platform, "config_file")
 @patch.object(platform.Platform, "tool_images")
 @patch.object(platform.Platform, "container_engine")
 @patch.object(platform.Platform, "user_output")
 @patch.object(platform.Platform, "__init__")
 def test_Platform_install_dev_env_failure(mock___init__: MagicMock, mock_user_output: MagicMock,
-                                            mock_container_engine: MagicMock,mock_tool_images) -> None:
+                                          mock_container_engine: MagicMock, mock_tool_images,
+                                          mock_config_file: MagicMock, 
+                                          mock_flush_descriptors: MagicMock,
+                                          mock__order_pulls: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
-   
 
     test_dev_env = MagicMock()    
-    test_registry_only_tool_images: list[str] = ["test_image_name1:test_image_version1", 
-                                                 "test_image_name2:test_image_version2"]
+    test_registry_only_tool_images: set[str] = {"test_image_name1:test_image_version1", 
+                                                "test_image_name2:test_image_version2"}
     test_dev_env.get_registry_only_tool_images.return_value = test_registry_only_tool_images
 
     test_platform = platform.Platform()
     
-    mock_container_engine.pull.side_effect = platform.ContainerEngineError("")
+    test_exception_text = "test_exception_text"
+    mock_container_engine.pull_images.side_effect = platform.ContainerEngineError(test_exception_text)
 
     # Run unit under test
     with pytest.raises(platform.PlatformError) as exported_exception_info:
         test_platform.install_dev_env(test_dev_env)
 
-        # Check expectations
-        mock___init__.assert_called_once()
+    # Check expectations
+    mock___init__.assert_called_once()
 
-        assert str(exported_exception_info) == "Platform error: Dev Env install failed."
-        
+    assert str(exported_exception_info.value) == "Platform error: Dev Env install failed."
+    mock_user_output.error.assert_called_once_with("Container engine error: " + test_exception_text)
+    mock_flush_descriptors.assert_not_called()
 
+@patch.object(platform.Platform, "record_tool_image_usage")
+@patch.object(platform.Platform, "_order_pulls", side_effect=lambda dev_env, tool_images: tool_images)
+@patch.object(platform.Platform, "lock_dev_env")
 @patch.object(platform.Platform, "flush_descriptors")
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "registries")
 @patch.object(platform.Platform, "container_engine")
 @patch.object(platform.Platform, "user_output")
 @patch.object(platform.Platform, "__init__")
-def test_Platform_uninstall_dev_env_success(mock___init__: MagicMock, mock_user_output: MagicMock,
-                                            mock_container_engine: MagicMock, 
-                                            mock_flush_descriptors: MagicMock) -> None:
+def test_Platform_install_dev_env_update(mock___init__: MagicMock, mock_user_output: MagicMock, 
+                                         mock_container_engine: MagicMock, 
+                                         mock_registries: MagicMock, mock_config_file: MagicMock,
+                                         mock_flush_descriptors: MagicMock,
+                                         mock_lock_dev_env: MagicMock,
+                                         mock__order_pulls: MagicMock,
+                                         mock_record_tool_image_usage: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
+    test_tool_images = [
+        "axemsolutions/cpputest:latest",
+        "axemsolutions/make_gnu_arm:latest",
+        "axemsolutions/stlink_org:latest",
+        "alpine:latest",
+        "missing:latest",
+    ]
+    test_dev_env = MagicMock()
+    test_dev_env.get_tool_images.return_value = test_tool_images
+    def stub_get_manifest_digests(tool_images: list[str], check_times: dict[str, float]):
+        check_times.update({tool_image: 0.5 for tool_image in tool_images})
+        return {
+            "axemsolutions/cpputest:latest": "sha256:1",
+            "axemsolutions/make_gnu_arm:latest": "sha256:2",
+            "axemsolutions/stlink_org:latest": "sha256:3",
+        }
+    mock_registries.get_manifest_digests.side_effect = stub_get_manifest_digests
+    mock_container_engine.get_repo_digests.return_value = {
+        "axemsolutions/cpputest:latest": ["sha256:1"],
+        "axemsolutions/make_gnu_arm:latest": ["sha256:0"],
+        "alpine:latest": [],
+    }
+    def stub_pull_images(tool_images: list[str], max_workers: int, pull_times: dict[str, float]):
+        pull_times.update({tool_image: 2.0 for tool_image in tool_images})
+    mock_container_engine.pull_images.side_effect = stub_pull_images
 
     test_platform = platform.Platform()
+    test_platform.local_dev_envs = [test_dev_env]
+
+    # Run unit under test
+    test_platform.install_dev_env(test_dev_env, update=True)
+
+    # Check expectations
+    assert test_dev_env.is_installed == "True"
+
+    test_dev_env.get_registry_only_tool_images.assert_not_called()
+    mock_registries.get_manifest_digests.assert_called_once_with(test_tool_images, 
+                                                                 {tool_image: 0.5 for tool_image 
+                                                                  in test_tool_images})
+    mock_container_engine.get_repo_digests.assert_called_once_with(test_tool_images)
+    mock_container_engine.pull_images.assert_called_once_with(["axemsolutions/make_gnu_arm:latest",
+                                                               "axemsolutions/stlink_org:latest"],
+                                                              mock_config_file.max_parallel_pulls,
+                                                              {"axemsolutions/make_gnu_arm:latest": 2.0,
+                                                               "axemsolutions/stlink_org:latest": 2.0})
+    mock_user_output.msg.assert_has_calls([
+        call("axemsolutions/cpputest:latest: up to date (checked in 0.50s)"),
+        call("axemsolutions/make_gnu_arm:latest: updated (checked in 0.50s, pulled in 2.00s)"),
+        call("axemsolutions/stlink_org:latest: pulled (checked in 0.50s, pulled in 2.00s)"),
+        call("alpine:latest: not checked, the digest is not available in the registries (checked in 0.50s)"),
+        call("missing:latest: [red]not available locally or in the registries[/] (checked in 0.50s)"),
+    ])
+    mock_lock_dev_env.assert_called_once_with(test_dev_env)
+    mock_flush_descriptors.assert_called_once()
+
+@patch("dem.core.platform.InstallPlan")
+@patch.object(platform.Platform, "registries")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_install_plan(mock___init__: MagicMock, mock_container_engine: MagicMock,
+                                   mock_registries: MagicMock, mock_InstallPlan: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    test_dev_env = MagicMock()
+    test_dev_env.get_tool_images.return_value = ["axemsolutions/cpputest:latest", 
+                                                 "axemsolutions/make_gnu_arm:latest",
+                                                 "axemsolutions/jlink:latest"]
+    mock_container_engine.resolve_local_images.return_value = {"axemsolutions/cpputest:latest"}
+    test_image_layers = {"axemsolutions/make_gnu_arm:latest": []}
+    mock_registries.get_image_layers.return_value = test_image_layers
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_install_plan = test_platform.get_install_plan(test_dev_env)
+
+    # Check expectations
+    assert actual_install_plan is mock_InstallPlan.return_value
+
+    mock_container_engine.resolve_local_images.assert_called_once_with(test_dev_env.get_tool_images.return_value)
+    mock_registries.get_image_layers.assert_called_once_with(["axemsolutions/make_gnu_arm:latest",
+                                                              "axemsolutions/jlink:latest"])
+    mock_container_engine.get_local_layer_chain_ids.assert_called_once_with()
+    mock_InstallPlan.assert_called_once_with(test_image_layers, 
+                                             mock_container_engine.get_local_layer_chain_ids.return_value,
+                                             ["axemsolutions/jlink:latest"])
+
+@patch.object(platform.Platform, "get_install_plan")
+@patch.object(platform.Platform, "__init__")
+def test_Platform__order_pulls(mock___init__: MagicMock, mock_get_install_plan: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    test_dev_env = MagicMock()
+    test_tool_images = ["axemsolutions/cpputest:latest", "axemsolutions/jlink:latest", 
+                        "axemsolutions/make_gnu_arm:latest"]
+    mock_install_plan = MagicMock()
+    mock_install_plan.get_pull_order.return_value = ["axemsolutions/make_gnu_arm:latest",
+                                                     "axemsolutions/cpputest:latest"]
+    mock_install_plan.unavailable_tool_images = ["axemsolutions/jlink:latest"]
+    mock_get_install_plan.return_value = mock_install_plan
+
+    test_platform = platform.Platform()
+    test_platform._config_file = MagicMock()
+    test_platform._config_file.max_parallel_pulls = 2
+
+    # Run unit under test
+    actual_tool_images = test_platform._order_pulls(test_dev_env, test_tool_images)
+
+    # Check expectations
+    assert actual_tool_images == ["axemsolutions/make_gnu_arm:latest", 
+                                  "axemsolutions/cpputest:latest", "axemsolutions/jlink:latest"]
+
+    mock_get_install_plan.assert_called_once_with(test_dev_env, test_tool_images)
+
+@patch.object(platform.Platform, "get_install_plan")
+@patch.object(platform.Platform, "__init__")
+def test_Platform__order_pulls_all_started_at_once(mock___init__: MagicMock, 
+                                                   mock_get_install_plan: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    test_tool_images = ["axemsolutions/cpputest:latest", "axemsolutions/jlink:latest"]
+
+    test_platform = platform.Platform()
+    test_platform._config_file = MagicMock()
+    test_platform._config_file.max_parallel_pulls = 2
+
+    # Run unit under test
+    actual_tool_images = test_platform._order_pulls(MagicMock(), test_tool_images)
+
+    # Check expectations
+    assert actual_tool_images == test_tool_images
+
+    mock_get_install_plan.assert_not_called()
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_lock_dev_env(mock___init__: MagicMock, mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    test_image_ids = {"test_image_name:test_image_version": "sha256:1"}
+    mock_container_engine.get_local_image_ids.return_value = test_image_ids
+    test_fingerprint = "test_fingerprint"
+    mock_container_engine.get_fingerprint.return_value = test_fingerprint
+    test_dev_env = MagicMock()
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    test_platform.lock_dev_env(test_dev_env)
+
+    # Check expectations
+    assert test_dev_env.lock == {
+        "digests": test_image_ids,
+        "fingerprint": test_fingerprint,
+    }
+
+    mock_container_engine.get_local_image_ids.assert_called_once_with(test_dev_env.get_tool_images.return_value)
+    mock_container_engine.get_fingerprint.assert_called_once_with(test_image_ids)
+
+@pytest.mark.parametrize("test_lock, test_fingerprint, expected_result", [
+    (None, "test_fingerprint", False),
+    ({"digests": {"test_image_name:test_image_version": "sha256:1"}, 
+      "fingerprint": "test_fingerprint"}, "test_fingerprint", True),
+    ({"digests": {"test_image_name:test_image_version": "sha256:1"}, 
+      "fingerprint": "test_fingerprint"}, "other_fingerprint", False),
+    ({"digests": {"other_image_name:test_image_version": "sha256:1"}, 
+      "fingerprint": "test_fingerprint"}, "test_fingerprint", False),
+])
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_is_dev_env_lock_valid(mock___init__: MagicMock, mock_container_engine: MagicMock,
+                                        test_lock: dict | None, test_fingerprint: str,
+                                        expected_result: bool) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_fingerprint.return_value = test_fingerprint
+    test_dev_env = platform.DevEnv({
+        "name": "test_name",
+        "installed": "True",
+        "tools": [{"image_name": "test_image_name", "image_version": "test_image_version"}],
+        "lock": test_lock,
+    })
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_result = test_platform.is_dev_env_lock_valid(test_dev_env)
+
+    # Check expectations
+    assert actual_result is expected_result
+
+def _create_uninstall_test_dev_envs() -> tuple[MagicMock, MagicMock, MagicMock]:
     mock_dev_env1 = MagicMock()
-    mock_dev_env2 = MagicMock()
-    mock_dev_env_to_uninstall = MagicMock()
-    test_platform.local_dev_envs = [
-        mock_dev_env1, mock_dev_env2, mock_dev_env_to_uninstall
-    ]
-    mock_dev_env1.tools = [
-        {
-            "image_name": "test_image_name1",
-            "image_version": "test_image_version1"
-        },
-        {
-            "image_name": "test_image_name2",
-            "image_version": "test_image_version2"
-        }
-    ]
+    mock_dev_env1.get_tool_images.return_value = ["test_image_name1:test_image_version1",
+                                                  "test_image_name2:test_image_version2"]
     mock_dev_env1.is_installed = True
-    mock_dev_env2.tools = [
-        {
-            "image_name": "test_image_name3",
-            "image_version": "test_image_version3"
-        }
-    ]
+    mock_dev_env2 = MagicMock()
+    mock_dev_env2.get_tool_images.return_value = ["test_image_name3:test_image_version3"]
     mock_dev_env2.is_installed = True
-    mock_dev_env_to_uninstall.tools = [
-        {
-            "image_name": "test_image_name1",
-            "image_version": "test_image_version1"
-        },
-        {
-            "image_name": "test_image_name3",
-            "image_version": "test_image_version3"
-        },
-        {
-            "image_name": "test_image_name4",
-            "image_version": "test_image_version4"
-        }
-    ]
+    mock_dev_env_to_uninstall = MagicMock()
+    mock_dev_env_to_uninstall.get_tool_images.return_value = ["test_image_name1:test_image_version1",
+                                                              "test_image_name3:test_image_version3",
+                                                              "test_image_name4:test_image_version4"]
     mock_dev_env_to_uninstall.is_installed = True
+    return mock_dev_env1, mock_dev_env2, mock_dev_env_to_uninstall
 
-    mock_container_engine.remove.return_value = True
+@patch.object(platform.Platform, "flush_descriptors")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_uninstall_dev_env_success(mock___init__: MagicMock, mock_user_output: MagicMock,
+                                            mock_container_engine: MagicMock, 
+                                            mock_flush_descriptors: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_platform = platform.Platform()
+    mock_dev_env1, mock_dev_env2, mock_dev_env_to_uninstall = _create_uninstall_test_dev_envs()
+    test_platform.local_dev_envs = [mock_dev_env1, mock_dev_env2, mock_dev_env_to_uninstall]
+
+    mock_container_engine.remove_images.return_value = []
 
     # Run unit under test
     test_platform.uninstall_dev_env(mock_dev_env_to_uninstall)
@@ -417,80 +677,295 @@ def test_Platform_uninstall_dev_env_success(mock___init__: MagicMock, mock_user_
     mock___init__.assert_called_once()
 
     assert mock_dev_env_to_uninstall.is_installed == False
+    assert mock_dev_env_to_uninstall.lock is None
+    assert test_platform.local_dev_envs.get_reference_count("test_image_name1:test_image_version1") == 1
+    assert test_platform.local_dev_envs.get_reference_count("test_image_name4:test_image_version4") == 0
 
     mock_user_output.msg.assert_has_calls([
         call(f"\nThe tool image [bold]test_image_name1:test_image_version1[/bold] is required by another Development Environment. It won't be deleted."),
         call(f"\nThe tool image [bold]test_image_name3:test_image_version3[/bold] is required by another Development Environment. It won't be deleted."),
     ])
-    mock_container_engine.remove.asssert_called_once_with("test_image_name4:test_image_version4")
+    mock_container_engine.remove_images.assert_called_once_with(["test_image_name4:test_image_version4"])
+    mock_container_engine.prune_images.assert_not_called()
     mock_flush_descriptors.assert_called_once()
 
+@patch.object(platform.Platform, "flush_descriptors")
 @patch.object(platform.Platform, "container_engine")
 @patch.object(platform.Platform, "user_output")
 @patch.object(platform.Platform, "__init__")
-def test_Platform_uninstall_dev_env_failure(mock___init__: MagicMock, mock_user_output: MagicMock,
-                                            mock_container_engine: MagicMock) -> None:
+def test_Platform_uninstall_dev_env_prune(mock___init__: MagicMock, mock_user_output: MagicMock,
+                                          mock_container_engine: MagicMock, 
+                                          mock_flush_descriptors: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
 
     test_platform = platform.Platform()
-    mock_dev_env1 = MagicMock()
-    mock_dev_env2 = MagicMock()
     mock_dev_env_to_uninstall = MagicMock()
-    test_platform.local_dev_envs = [
-        mock_dev_env1, mock_dev_env2, mock_dev_env_to_uninstall
+    mock_dev_env_to_uninstall.get_tool_images.return_value = ["test_image_name1:test_image_version1"]
+    mock_dev_env_to_uninstall.is_installed = True
+    test_platform.local_dev_envs = [mock_dev_env_to_uninstall]
+
+    mock_container_engine.remove_images.return_value = []
+    mock_container_engine.prune_images.return_value = 12500000
+
+    # Run unit under test
+    test_platform.uninstall_dev_env(mock_dev_env_to_uninstall, True)
+
+    # Check expectations
+    mock_container_engine.remove_images.assert_called_once_with(["test_image_name1:test_image_version1"])
+    mock_container_engine.prune_images.assert_called_once()
+    mock_user_output.msg.assert_called_once_with("\nPruned the dangling images. Reclaimed 12.5 MB.")
+    mock_flush_descriptors.assert_called_once()
+
+@patch.object(platform.Platform, "flush_descriptors")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_uninstall_dev_env_failure(mock___init__: MagicMock, mock_user_output: MagicMock,
+                                            mock_container_engine: MagicMock,
+                                            mock_flush_descriptors: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_platform = platform.Platform()
+    mock_dev_env1, mock_dev_env2, mock_dev_env_to_uninstall = _create_uninstall_test_dev_envs()
+    test_platform.local_dev_envs = [mock_dev_env1, mock_dev_env2, mock_dev_env_to_uninstall]
+
+    mock_container_engine.remove_images.return_value = ["test_image_name4:test_image_version4"]
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.uninstall_dev_env(mock_dev_env_to_uninstall)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: Dev Env uninstall failed."
+    assert mock_dev_env_to_uninstall.is_installed == True
+    assert test_platform.local_dev_envs.get_reference_count("test_image_name4:test_image_version4") == 1
+
+    mock_container_engine.remove_images.assert_called_once_with(["test_image_name4:test_image_version4"])
+    mock_flush_descriptors.assert_not_called()
+
+@patch("dem.core.platform.time.time")
+@patch.object(platform.Platform, "tool_image_usage")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_record_tool_image_usage(mock___init__: MagicMock, mock_tool_image_usage: MagicMock,
+                                          mock_time: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_tool_image_usage.deserialized = {"axemsolutions/cpputest:latest": 1.0}
+    mock_time.return_value = 10000.0
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    test_platform.record_tool_image_usage(["axemsolutions/cpputest:latest", 
+                                           "axemsolutions/jlink:latest"])
+
+    # Check expectations
+    assert mock_tool_image_usage.deserialized == {
+        "axemsolutions/cpputest:latest": 10000.0,
+        "axemsolutions/jlink:latest": 10000.0,
+    }
+
+    mock_tool_image_usage.lock.assert_called_once()
+    mock_tool_image_usage.update.assert_called_once()
+    mock_tool_image_usage.flush.assert_called_once()
+
+@patch("dem.core.platform.time.time")
+@patch.object(platform.Platform, "tool_image_usage")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_record_tool_image_usage_recent(mock___init__: MagicMock, 
+                                                 mock_tool_image_usage: MagicMock,
+                                                 mock_time: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_tool_image_usage.deserialized = {"axemsolutions/cpputest:latest": 1.0}
+    mock_time.return_value = 61.0
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    test_platform.record_tool_image_usage(["axemsolutions/cpputest:latest"])
+
+    # Check expectations
+    assert mock_tool_image_usage.deserialized == {"axemsolutions/cpputest:latest": 1.0}
+
+    mock_tool_image_usage.lock.assert_not_called()
+    mock_tool_image_usage.flush.assert_not_called()
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_image_disk_usage_error(mock___init__: MagicMock, 
+                                             mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_image_disk_usage.side_effect = platform.ContainerEngineError("test_error")
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.get_image_disk_usage()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: Container engine error: test_error"
+
+@patch.object(platform.Platform, "tool_image_usage")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_gc_candidates(mock___init__: MagicMock, 
+                                    mock_tool_image_usage: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_tool_image_usage.deserialized = {
+        "axemsolutions/cpputest:latest": 3.0,
+        "axemsolutions/jlink:latest": 2.0,
+        "axemsolutions/removed:latest": 1.0,
+    }
+    test_images = {
+        "sha256:1": {"tags": ["axemsolutions/cpputest:latest"], "size": 100},
+        "sha256:2": {"tags": ["axemsolutions/jlink:latest"], "size": 200},
+        "sha256:3": {"tags": ["axemsolutions/make_gnu_arm:latest", "make_gnu_arm:latest"], 
+                     "size": 300},
+        "sha256:4": {"tags": ["axemsolutions/stlink_org:latest"], "size": 400},
+        "sha256:5": {"tags": ["user_image:latest"], "size": 500},
+    }
+    mock_installed_dev_env = MagicMock()
+    mock_installed_dev_env.is_installed = True
+    mock_installed_dev_env.get_tool_images.return_value = ["axemsolutions/jlink:latest"]
+    mock_dev_env = MagicMock()
+    mock_dev_env.is_installed = False
+    mock_dev_env.get_tool_images.return_value = ["axemsolutions/make_gnu_arm:latest"]
+
+    test_platform = platform.Platform()
+    test_platform.local_dev_envs = [mock_installed_dev_env, mock_dev_env]
+
+    # Run unit under test
+    actual_candidates = test_platform.get_gc_candidates(test_images)
+
+    # Check expectations
+    assert actual_candidates == [
+        {"tool_image": "axemsolutions/make_gnu_arm:latest", "last_used": None, 
+         "image_id": "sha256:3"},
+        {"tool_image": "axemsolutions/cpputest:latest", "last_used": 3.0, "image_id": "sha256:1"},
     ]
-    mock_dev_env1.tools = [
-        {
-            "image_name": "test_image_name1",
-            "image_version": "test_image_version1"
-        },
-        {
-            "image_name": "test_image_name2",
-            "image_version": "test_image_version2"
-        }
+
+@pytest.mark.parametrize("test_budget, test_min_free, expected_eviction_count", [
+    (None, None, 0),
+    (1000, None, 0),
+    (850, None, 1),
+    (700, None, 2),
+    (100, None, 3),
+    (None, 5100, 1),
+    (800, 5400, 3),
+])
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_select_gc_evictions(mock___init__: MagicMock, mock_container_engine: MagicMock,
+                                      test_budget: int | None, test_min_free: int | None,
+                                      expected_eviction_count: int) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_free_space.return_value = 5000
+    test_images = {
+        "sha256:1": {"tags": ["test_image1:latest"], "size": 200},
+        "sha256:2": {"tags": ["test_image2:latest"], "size": 100},
+        "sha256:3": {"tags": ["test_image3:latest"], "size": 300},
+    }
+    test_candidates = [
+        {"tool_image": "test_image1:latest", "last_used": None, "image_id": "sha256:1"},
+        {"tool_image": "test_image2:latest", "last_used": 1.0, "image_id": "sha256:2"},
+        {"tool_image": "test_image3:latest", "last_used": 2.0, "image_id": "sha256:3"},
     ]
-    mock_dev_env1.is_installed = True
-    mock_dev_env2.tools = [
-        {
-            "image_name": "test_image_name3",
-            "image_version": "test_image_version3"
-        }
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_evictions = test_platform.select_gc_evictions(test_candidates, 1000, test_images, 
+                                                         test_budget, test_min_free)
+
+    # Check expectations
+    assert actual_evictions == [
+        candidate | {"size": test_images[candidate["image_id"]]["size"]}
+        for candidate in test_candidates[:expected_eviction_count]
     ]
-    mock_dev_env2.is_installed = True
-    mock_dev_env_to_uninstall.tools = [
-        {
-            "image_name": "test_image_name1",
-            "image_version": "test_image_version1"
-        },
-        {
-            "image_name": "test_image_name3",
-            "image_version": "test_image_version3"
-        },
-        {
-            "image_name": "test_image_name4",
-            "image_version": "test_image_version4"
-        }
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_select_gc_evictions_multiple_tags(mock___init__: MagicMock, 
+                                                    mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    test_images = {
+        "sha256:1": {"tags": ["test_image1:latest", "test_image1:1.0"], "size": 200},
+        "sha256:2": {"tags": ["test_image2:latest", "user_image:latest"], "size": 100},
+        "sha256:3": {"tags": ["test_image3:latest"], "size": 300},
+    }
+    test_candidates = [
+        {"tool_image": "test_image1:latest", "last_used": None, "image_id": "sha256:1"},
+        {"tool_image": "test_image2:latest", "last_used": 1.0, "image_id": "sha256:2"},
+        {"tool_image": "test_image1:1.0", "last_used": 2.0, "image_id": "sha256:1"},
+        {"tool_image": "test_image3:latest", "last_used": 3.0, "image_id": "sha256:3"},
+    ]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_evictions = test_platform.select_gc_evictions(test_candidates, 1000, test_images, 
+                                                         budget=700)
+
+    # Check expectations
+    assert actual_evictions == [
+        test_candidates[0] | {"size": 0},
+        test_candidates[1] | {"size": 0},
+        test_candidates[2] | {"size": 200},
+        test_candidates[3] | {"size": 300},
     ]
-    mock_dev_env_to_uninstall.is_installed = True
 
-    mock_container_engine.remove.side_effect = platform.ContainerEngineError("")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_select_gc_evictions_no_free_space(mock___init__: MagicMock, 
+                                                    mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_free_space.side_effect = platform.ContainerEngineError("test_error")
+
+    test_platform = platform.Platform()
 
     # Run unit under test
     with pytest.raises(platform.PlatformError) as exported_exception_info:
-        test_platform.uninstall_dev_env(mock_dev_env_to_uninstall)
+        test_platform.select_gc_evictions([], 1000, {}, None, 100)
 
-        # Check expectations
-        mock___init__.assert_called_once()
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: Container engine error: test_error"
 
-        assert str(exported_exception_info) == "Platform error: Dev Env uninstall failed."
-        assert mock_dev_env_to_uninstall.is_installed == True
+@patch.object(platform.Platform, "tool_image_usage")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_collect_garbage(mock___init__: MagicMock, mock_container_engine: MagicMock,
+                                  mock_tool_image_usage: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.remove_images.return_value = ["test_image2:latest"]
+    mock_tool_image_usage.deserialized = {"test_image1:latest": 1.0, "test_image2:latest": 2.0,
+                                          "test_image3:latest": 3.0}
+    test_evictions = [
+        {"tool_image": "test_image1:latest", "last_used": 1.0, "size": 200},
+        {"tool_image": "test_image2:latest", "last_used": 2.0, "size": 100},
+    ]
 
-        mock_user_output.msg.assert_has_calls([
-            call(f"\nThe tool image [bold]test_image_name1:test_image_version1[/bold] is required by another Development Environment. It won't be deleted."),
-            call(f"\nThe tool image [bold]test_image_name3:test_image_version3[/bold] is required by another Development Environment. It won't be deleted."),
-        ])
-        mock_container_engine.remove.asssert_called_once_with("test_image_name4:test_image_version4")
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_failed_tool_images = test_platform.collect_garbage(test_evictions)
+
+    # Check expectations
+    assert actual_failed_tool_images == ["test_image2:latest"]
+    assert mock_tool_image_usage.deserialized == {"test_image2:latest": 2.0, 
+                                                  "test_image3:latest": 3.0}
+
+    mock_container_engine.remove_images.assert_called_once_with(["test_image1:latest", 
+                                                                 "test_image2:latest"])
+    mock_tool_image_usage.flush.assert_called_once()
 
 @patch.object(platform.Platform, "get_deserialized")
 @patch.object(platform.Platform, "__init__")
@@ -501,6 +976,7 @@ def test_Platform_flush_descriptors(mock___init__: MagicMock,
 
     test_platform = platform.Platform()
     test_platform.dev_env_json = MagicMock()
+    test_platform._flushed_descriptors = None
 
     mock_deserialized = MagicMock()
     mock_get_deserialized.return_value = mock_deserialized
@@ -512,10 +988,49 @@ def test_Platform_flush_descriptors(mock___init__: MagicMock,
     mock___init__.assert_called_once()
 
     mock_get_deserialized.assert_called_once()
+    test_platform.dev_env_json.lock.assert_called_once()
+    test_platform.dev_env_json.lock.return_value.__enter__.assert_called_once()
+    test_platform.dev_env_json.lock.return_value.__exit__.assert_called_once()
+    test_platform.dev_env_json.update.assert_called_once()
     test_platform.dev_env_json.flush.assert_called_once()
 
     assert test_platform.dev_env_json.deserialized == mock_deserialized
 
+def test_Platform_flush_descriptors_parallel(tmp_path) -> None:
+    # Test setup
+    test_descriptors = {
+        "version": "0.1",
+        "development_environments": [
+            {"name": "test_dev_env_1", "installed": "False", "tools": []},
+            {"name": "test_dev_env_2", "installed": "False", "tools": []},
+            {"name": "test_dev_env_3", "installed": "False", "tools": []},
+        ]
+    }
+    (tmp_path / "dev_env.json").write_text(json.dumps(test_descriptors))
+
+    # The completion index and the config files are kept in the tmp dir too.
+    with patch.object(data_management.BaseJSON, "_config_dir", str(tmp_path)), \
+         patch.object(platform, "__supported_dev_env_major_version__", 0):
+        test_platform_1 = platform.Platform()
+        test_platform_2 = platform.Platform()
+        test_platform_1.get_dev_env_by_name("test_dev_env_1").is_installed = True
+        test_platform_2.get_dev_env_by_name("test_dev_env_2").is_installed = True
+        test_platform_2.local_dev_envs.remove(test_platform_2.get_dev_env_by_name("test_dev_env_3"))
+
+        # Run unit under test
+        test_platform_1.flush_descriptors()
+        test_platform_2.flush_descriptors()
+
+    # Check expectations
+    actual_descriptors = json.loads((tmp_path / "dev_env.json").read_text())
+    assert actual_descriptors == {
+        "version": "0.1",
+        "development_environments": [
+            {"name": "test_dev_env_1", "installed": "True", "tools": []},
+            {"name": "test_dev_env_2", "installed": "True", "tools": []},
+        ]
+    }
+
 @patch("dem.core.platform.os.path.exists")
 @patch("dem.core.platform.os.path.isdir")
 @patch.object(platform.Core, "user_output")
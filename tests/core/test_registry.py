@@ -8,27 +8,43 @@ import dem.core.registry as registry
 import pytest
 from unittest.mock import patch, MagicMock, call, PropertyMock
 
-import requests
+import requests, threading, time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator
 
 class HelperRegistry(registry.Registry):
     """ The registry.Registry is an abstract base class, so it is not possible to directly 
         instantiate. The HelperRegistry class only acts as a helper for testing.
     """
-    def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
-        return super()._append_repo_with_tag(endpoint_response, repo)
+    def _get_repo_with_tags(self, endpoint_response: dict, repo: str) -> list[str]:
+        return super()._get_repo_with_tags(endpoint_response, repo)
     
     def _get_tag_endpoint_url(self, repo_name: str) -> str:
         return super()._get_tag_endpoint_url(repo_name)
     
-    def _list_repos_in_registry(self) -> Generator:
-        return super()._list_repos_in_registry()
+    def _get_repo_endpoint_url(self) -> str:
+        return super()._get_repo_endpoint_url()
 
-@patch.object(registry.Registry, "_append_repo_with_tag")
+    def _get_repos(self, endpoint_response: dict) -> list[str]:
+        return super()._get_repos(endpoint_response)
+
+    def _get_tool_image_endpoint_url(self, repo: str, tag: str) -> str:
+        return super()._get_tool_image_endpoint_url(repo, tag)
+
+    def _get_digest_from_response(self, response) -> str | None:
+        return super()._get_digest_from_response(response)
+
+    def _get_distribution_url(self) -> str:
+        return super()._get_distribution_url()
+
+    def _get_distribution_repo(self, repo: str) -> str:
+        return super()._get_distribution_repo(repo)
+
+@patch.object(registry.Registry, "_get_repo_with_tags")
 @patch.object(registry.Registry, "_get_tag_endpoint_url")
-@patch("dem.core.registry.requests.get")
+@patch("dem.core.registry.requests.Session.get")
 def test_Registry__list_tags(mock_requests_get: MagicMock, mock__get_tag_endpoint_url: MagicMock,
-                             mock__append_repo_with_tag: MagicMock):
+                             mock__get_repo_with_tags: MagicMock):
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {}
@@ -41,21 +57,25 @@ def test_Registry__list_tags(mock_requests_get: MagicMock, mock__get_tag_endpoin
     mock_requests_get.return_value = mock_response
     test_tag_endpoint_url = "test_tag_endpoint_url"
     mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
+    test_repo_with_tags = [test_repo + ":latest"]
+    mock__get_repo_with_tags.return_value = test_repo_with_tags
 
     test_registry = HelperRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    test_registry._list_tags(test_repo)
+    actual_repo_with_tags = test_registry._list_tags(test_repo)
 
     # Check expectations
+    assert actual_repo_with_tags == test_repo_with_tags
+
     mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=1)
+    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, headers={}, timeout=1)
     mock_response.json.assert_called_once()
-    mock__append_repo_with_tag.assert_called_once_with(test_endpoint_response, test_repo)
+    mock__get_repo_with_tags.assert_called_once_with(test_endpoint_response, test_repo)
 
 @patch.object(registry.Core, "user_output")
 @patch.object(registry.Registry, "_get_tag_endpoint_url")
-@patch("dem.core.registry.requests.get")
+@patch("dem.core.registry.requests.Session.get")
 def test_Registry__list_tags_MissingSchema(mock_requests_get: MagicMock, 
                                            mock__get_tag_endpoint_url: MagicMock,
                                            mock_user_output: MagicMock):
@@ -72,17 +92,19 @@ def test_Registry__list_tags_MissingSchema(mock_requests_get: MagicMock,
     test_registry = HelperRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    test_registry._list_tags(test_repo)
+    actual_repo_with_tags = test_registry._list_tags(test_repo)
 
     # Check expectations
+    assert actual_repo_with_tags == []
+
     mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=1)
+    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, headers={}, timeout=1)
     mock_user_output.error.assert_called_once_with(test_exception_text)
     mock_user_output.msg.assert_called_once_with("Skipping repository: " + test_repo)
 
 @patch.object(registry.Core, "user_output")
 @patch.object(registry.Registry, "_get_tag_endpoint_url")
-@patch("dem.core.registry.requests.get")
+@patch("dem.core.registry.requests.Session.get")
 def test_Registry__list_tags_invalid_status(mock_requests_get: MagicMock, 
                                             mock__get_tag_endpoint_url: MagicMock,
                                             mock_user_output: MagicMock):
@@ -100,14 +122,236 @@ def test_Registry__list_tags_invalid_status(mock_requests_get: MagicMock,
     test_registry = HelperRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    test_registry._list_tags(test_repo)
+    actual_repo_with_tags = test_registry._list_tags(test_repo)
 
     # Check expectations
+    assert actual_repo_with_tags == []
+
     mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=1)
+    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, headers={}, timeout=1)
     mock_user_output.error.assert_called_once_with("Error in communication with the registry. Failed to retrieve tags. Response status code: " + str(mock_response.status_code))
     mock_user_output.msg.assert_called_once_with("Skipping repository: " + test_repo)
 
+@patch.object(registry.Registry, "_get_repo_with_tags")
+@patch.object(registry.Registry, "_get_tag_endpoint_url")
+@patch("dem.core.registry.requests.Session.get")
+def test_Registry__list_tags_conditional_request(mock_requests_get: MagicMock, 
+                                                 mock__get_tag_endpoint_url: MagicMock,
+                                                 mock__get_repo_with_tags: MagicMock):
+    # Test setup
+    test_repo = "test_repo"
+    test_cached_repo = {
+        "tags": [test_repo + ":latest"],
+        "etag": "test_etag",
+        "last_modified": "test_last_modified",
+    }
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.not_modified
+    mock_requests_get.return_value = mock_response
+    test_tag_endpoint_url = "test_tag_endpoint_url"
+    mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
+
+    test_registry = HelperRegistry(MagicMock(), {})
+    test_registry._cached_repos = {
+        test_repo: test_cached_repo
+    }
+
+    # Run unit under test
+    actual_repo_with_tags = test_registry._list_tags(test_repo)
+
+    # Check expectations
+    assert actual_repo_with_tags is test_cached_repo["tags"]
+    assert test_registry._crawled_repos[test_repo] is test_cached_repo
+
+    expected_headers = {
+        "If-None-Match": test_cached_repo["etag"],
+        "If-Modified-Since": test_cached_repo["last_modified"],
+    }
+    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, headers=expected_headers, 
+                                              timeout=1)
+    mock_response.json.assert_not_called()
+    mock__get_repo_with_tags.assert_not_called()
+
+@patch.object(registry.Registry, "_get_repo_with_tags")
+@patch.object(registry.Registry, "_get_tag_endpoint_url")
+@patch("dem.core.registry.requests.Session.get")
+def test_Registry__list_tags_save_validators(mock_requests_get: MagicMock, 
+                                             mock__get_tag_endpoint_url: MagicMock,
+                                             mock__get_repo_with_tags: MagicMock):
+    # Test setup
+    test_repo = "test_repo"
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_response.headers = {
+        "ETag": "test_etag",
+        "Last-Modified": "test_last_modified",
+    }
+    mock_requests_get.return_value = mock_response
+    test_repo_with_tags = [test_repo + ":latest"]
+    mock__get_repo_with_tags.return_value = test_repo_with_tags
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    test_registry._list_tags(test_repo)
+
+    # Check expectations
+    assert test_registry._crawled_repos[test_repo] == {
+        "tags": test_repo_with_tags,
+        "etag": mock_response.headers["ETag"],
+        "last_modified": mock_response.headers["Last-Modified"],
+    }
+
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_list_repos_in_registry")
+def test_Registry_repos_from_cache(mock__list_repos_in_registry: MagicMock, 
+                                   mock_user_output: MagicMock):
+    # Test setup
+    test_registry_config = {
+        "name": "test_registry_name",
+        "url": "test_url",
+    }
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        test_registry_config["name"]: {
+            "url": test_registry_config["url"],
+            "settings": {"tag_filter": None, "max_tags_per_repo": None},
+            "timestamp": time.time(),
+            "repos": {
+                "test_repo1": {"tags": ["test_repo1:latest", "test_repo1:v1.0.0"]},
+                "test_repo2": {"tags": ["test_repo2:latest"]},
+            }
+        }
+    }
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config, mock_cache_file)
+
+    # Run unit under test
+    actual_repos = test_registry.repos
+
+    # Check expectations
+    assert actual_repos == ["test_repo1:latest", "test_repo1:v1.0.0", "test_repo2:latest"]
+
+    mock__list_repos_in_registry.assert_not_called()
+    mock_user_output.status_generator.assert_not_called()
+
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_list_repos_in_registry")
+def test_Registry_repos_expired_cache(mock__list_repos_in_registry: MagicMock, 
+                                      mock_user_output: MagicMock):
+    # Test setup
+    test_registry_config = {
+        "name": "test_registry_name",
+        "url": "test_url",
+        "cache_ttl": 10,
+    }
+    test_cached_repos = {
+        "test_repo1": {"tags": ["test_repo1:latest"], "etag": "test_etag"},
+    }
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        test_registry_config["name"]: {
+            "url": test_registry_config["url"],
+            "settings": {"tag_filter": None, "max_tags_per_repo": None},
+            "timestamp": time.time() - 20,
+            "repos": test_cached_repos
+        }
+    }
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config, mock_cache_file)
+    test_crawled_repo = {"tags": ["test_repo1:v1.0.0"], "etag": "test_new_etag"}
+    def stub_status_generator(generator):
+        assert test_registry._cached_repos is test_cached_repos
+        test_registry._crawled_repos["test_repo1"] = test_crawled_repo
+        test_registry._repos.extend(test_crawled_repo["tags"])
+    mock_user_output.status_generator.side_effect = stub_status_generator
+
+    # Run unit under test
+    actual_repos = test_registry.repos
+
+    # Check expectations
+    assert actual_repos == test_crawled_repo["tags"]
+
+    actual_cache_entry = mock_cache_file.deserialized[test_registry_config["name"]]
+    assert actual_cache_entry["url"] == test_registry_config["url"]
+    assert actual_cache_entry["settings"] == {"tag_filter": None, "max_tags_per_repo": None}
+    assert actual_cache_entry["repos"] == {"test_repo1": test_crawled_repo}
+    assert time.time() - actual_cache_entry["timestamp"] < 10
+
+    mock__list_repos_in_registry.assert_called_once()
+
+@pytest.mark.parametrize("test_registry_config_update", [
+    {"tag_filter": "v*"},
+    {"max_tags_per_repo": 10},
+])
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_list_repos_in_registry")
+def test_Registry_repos_cache_other_settings(mock__list_repos_in_registry: MagicMock, 
+                                             mock_user_output: MagicMock,
+                                             test_registry_config_update: dict):
+    # Test setup
+    test_registry_config = {
+        "name": "test_registry_name",
+        "url": "test_url",
+    } | test_registry_config_update
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        test_registry_config["name"]: {
+            "url": test_registry_config["url"],
+            "settings": {"tag_filter": None, "max_tags_per_repo": None},
+            "timestamp": time.time(),
+            "repos": {
+                "test_repo1": {"tags": ["test_repo1:latest"], "etag": "test_etag"},
+            }
+        }
+    }
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config, mock_cache_file)
+
+    # Run unit under test
+    actual_repos = test_registry.repos
+
+    # Check expectations
+    assert actual_repos == []
+    assert test_registry._cached_repos == {}
+
+    mock__list_repos_in_registry.assert_called_once()
+    mock_user_output.status_generator.assert_called_once()
+
+@patch.object(registry.Registry, "refresh_cache", True)
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_list_repos_in_registry")
+def test_Registry_repos_refresh_cache(mock__list_repos_in_registry: MagicMock, 
+                                      mock_user_output: MagicMock):
+    # Test setup
+    test_registry_config = {
+        "name": "test_registry_name",
+        "url": "test_url",
+    }
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        test_registry_config["name"]: {
+            "url": test_registry_config["url"],
+            "settings": {"tag_filter": None, "max_tags_per_repo": None},
+            "timestamp": time.time(),
+            "repos": {
+                "test_repo1": {"tags": ["test_repo1:latest"]},
+            }
+        }
+    }
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config, mock_cache_file)
+
+    # Run unit under test
+    actual_repos = test_registry.repos
+
+    # Check expectations
+    assert actual_repos == []
+    assert test_registry._cached_repos == {}
+
+    mock__list_repos_in_registry.assert_called_once()
+    mock_user_output.status_generator.assert_called_once()
+
 @patch.object(registry.Core, "user_output")
 @patch.object(registry.Registry, "_list_repos_in_registry")
 def test_Registry_repos(mock__list_repos_in_registry: MagicMock, mock_user_output: MagicMock):
@@ -115,24 +359,66 @@ def test_Registry_repos(mock__list_repos_in_registry: MagicMock, mock_user_outpu
     mock_container_engine = MagicMock()
     test_registry_config = {}
 
-    mock__repos = MagicMock()
-
     mock_generator = MagicMock()
     mock__list_repos_in_registry.return_value = mock_generator
 
     test_registry = HelperRegistry(mock_container_engine, test_registry_config)
-    test_registry._repos = mock__repos
+    test_registry._repos = ["outdated_repo:latest"]
 
     # Run unit under test
     actual_repos = test_registry.repos
 
     # Check expectations
-    assert actual_repos is mock__repos
+    assert actual_repos == []
 
     mock__list_repos_in_registry.assert_called_once()
     mock_user_output.status_generator.assert_called_once_with(mock_generator)
 
-def test_DockerHub__append_repo_with_tag():
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_concurrently(mock__list_tags: MagicMock):
+    # Test setup
+    mock_container_engine = MagicMock()
+    test_registry_config = {
+        "max_workers": 4
+    }
+    test_repos = ["test_repo" + str(idx) for idx in range(10)]
+
+    def stub_list_tags(repo: str) -> list[str]:
+        # The first repos respond the slowest.
+        time.sleep(0.001 * (len(test_repos) - test_repos.index(repo)))
+        return [repo + ":latest", repo + ":v1.0.0"]
+    mock__list_tags.side_effect = stub_list_tags
+
+    test_registry = HelperRegistry(mock_container_engine, test_registry_config)
+
+    # Run unit under test
+    actual_items = []
+    repo_counts = []
+    for item in test_registry._list_tags_concurrently(test_repos):
+        actual_items.append(item)
+        repo_counts.append(len(test_registry._repos))
+
+    # Check expectations
+    assert test_registry._max_workers == test_registry_config["max_workers"]
+    assert sorted(actual_items) == sorted(["Loading image data from: " + test_repo 
+                                           for test_repo in test_repos])
+
+    expected_repos = []
+    for test_repo in test_repos:
+        expected_repos.extend([test_repo + ":latest", test_repo + ":v1.0.0"])
+    assert test_registry._repos == expected_repos
+    # The repo list only grows while the tags arrive, it is not rebuilt at the end.
+    assert repo_counts == sorted(repo_counts)
+    assert repo_counts[-1] == len(expected_repos)
+
+def test_Registry_default_max_workers():
+    # Run unit under test
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Check expectations
+    assert test_registry._max_workers == registry.Registry._default_max_workers
+
+def test_DockerHub__get_repo_with_tags():
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {}
@@ -152,13 +438,13 @@ def test_DockerHub__append_repo_with_tag():
     test_docker_hub = registry.DockerHub(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    test_docker_hub._append_repo_with_tag(test_endpoint_response, test_repo)
+    actual_repos = test_docker_hub._get_repo_with_tags(test_endpoint_response, test_repo)
 
     # Check expectations
     expected_repos = []
     for test_result in test_endpoint_response["results"]:
         expected_repos.append(test_repo + ":" + test_result["name"])
-    assert expected_repos == test_docker_hub._repos
+    assert expected_repos == actual_repos
 
 def test_DockerHub__get_tag_endpoint_url():
     # Test setup
@@ -175,11 +461,105 @@ def test_DockerHub__get_tag_endpoint_url():
     actual_endpoint_url = test_docker_hub._get_tag_endpoint_url(test_repo)
 
     # Check expectations
-    expected_endpoint_url = test_registry_config["url"] + "/v2/repositories/" + test_repo + "/tags/"
+    expected_endpoint_url = test_registry_config["url"] + "/v2/repositories/" + test_repo + "/tags/?page_size=100"
     assert expected_endpoint_url == actual_endpoint_url
 
+def test_DockerHub__get_next_page_url():
+    # Test setup
+    test_docker_hub = registry.DockerHub(MagicMock(), {"url": "test_url"})
+    test_next_page_url = "test_url/v2/repositories/registry/test_repo/tags/?page=2&page_size=100"
+
+    # Run unit under test and check expectations
+    assert test_docker_hub._get_next_page_url({"next": test_next_page_url}, MagicMock()) == test_next_page_url
+    assert test_docker_hub._get_next_page_url({"next": None}, MagicMock()) is None
+
+@patch("dem.core.registry.requests.Session.get")
+def test_DockerHub__list_tags_pagination(mock_requests_get: MagicMock):
+    # Test setup
+    test_repo = "axemsolutions/cpputest"
+    test_pages = [
+        {"next": "page2", "results": [{"name": "latest"}, {"name": "v1.0.0"}]},
+        {"next": "page3", "results": [{"name": "v0.9.0"}]},
+        {"next": None, "results": [{"name": "v0.8.0"}]},
+    ]
+    mock_responses = []
+    for test_page in test_pages:
+        mock_response = MagicMock()
+        mock_response.status_code = requests.codes.ok
+        mock_response.json.return_value = test_page
+        mock_response.headers = {"ETag": "test_etag"}
+        mock_responses.append(mock_response)
+    mock_requests_get.side_effect = mock_responses
+
+    test_docker_hub = registry.DockerHub(MagicMock(), {"url": "test_url"})
+
+    # Run unit under test
+    actual_repo_with_tags = test_docker_hub._list_tags(test_repo)
+
+    # Check expectations
+    assert actual_repo_with_tags == [test_repo + ":latest", test_repo + ":v1.0.0", 
+                                     test_repo + ":v0.9.0", test_repo + ":v0.8.0"]
+    assert test_docker_hub._crawled_repos[test_repo]["etag"] == "test_etag"
+
+    mock_requests_get.assert_has_calls([
+        call("test_url/v2/repositories/" + test_repo + "/tags/?page_size=100", headers={}, timeout=1),
+        call("page2", timeout=1),
+        call("page3", timeout=1),
+    ], any_order=True)
+
+@patch("dem.core.registry.requests.Session.get")
+def test_DockerHub__list_tags_tag_filter_and_limit(mock_requests_get: MagicMock):
+    # Test setup
+    test_repo = "axemsolutions/cpputest"
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_response.json.return_value = {
+        "next": "page2", 
+        "results": [{"name": "latest"}, {"name": "v1.0.0"}, {"name": "v0.9.0"}, {"name": "v0.8.0"}]
+    }
+    mock_requests_get.return_value = mock_response
+
+    test_docker_hub = registry.DockerHub(MagicMock(), {"url": "test_url", "tag_filter": "v*", 
+                                                       "max_tags_per_repo": 2})
+
+    # Run unit under test
+    actual_repo_with_tags = test_docker_hub._list_tags(test_repo)
+
+    # Check expectations
+    assert actual_repo_with_tags == [test_repo + ":v1.0.0", test_repo + ":v0.9.0"]
+
+    # The limit has been reached on the first page, so the next page is not requested.
+    mock_requests_get.assert_called_once()
+
+@patch.object(registry.Core, "user_output")
+@patch("dem.core.registry.requests.Session.get")
+def test_DockerHub__list_tags_missing_page(mock_requests_get: MagicMock, 
+                                           mock_user_output: MagicMock):
+    # Test setup
+    test_repo = "axemsolutions/cpputest"
+    mock_first_response = MagicMock()
+    mock_first_response.status_code = requests.codes.ok
+    mock_first_response.json.return_value = {"next": "page2", "results": [{"name": "latest"}]}
+    mock_first_response.headers = {"ETag": "test_etag"}
+    mock_second_response = MagicMock()
+    mock_second_response.status_code = requests.codes.internal_server_error
+    mock_requests_get.side_effect = [mock_first_response, mock_second_response]
+
+    test_docker_hub = registry.DockerHub(MagicMock(), {"url": "test_url"})
+
+    # Run unit under test
+    actual_repo_with_tags = test_docker_hub._list_tags(test_repo)
+
+    # Check expectations
+    assert actual_repo_with_tags == [test_repo + ":latest"]
+    # The incomplete tag list must not be revalidated with the ETag of the first page.
+    assert test_docker_hub._crawled_repos[test_repo]["etag"] is None
+
+    mock_user_output.error.assert_called_once_with("Error in communication with the registry. Failed to retrieve tags. Response status code: " + str(requests.codes.internal_server_error))
+
 @patch.object(registry.DockerHub, "_list_tags")
-def test_DockerHub__list_repos_in_registry(mock__list_tags: MagicMock):
+@patch.object(registry.DockerHub, "_search")
+def test_DockerHub__list_repos_in_registry(mock__search: MagicMock, mock__list_tags: MagicMock):
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {
@@ -190,25 +570,85 @@ def test_DockerHub__list_repos_in_registry(mock__list_tags: MagicMock):
         test_registry_config["name"] + "/test_repo2",
     ]
 
-    mock_container_engine.search.return_value = test_repos
+    mock__search.return_value = iter(test_repos)
+    mock__list_tags.side_effect = lambda repo: [repo + ":latest"]
 
     test_docker_hub = registry.DockerHub(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    generator = test_docker_hub._list_repos_in_registry()
+    actual_items = list(test_docker_hub._list_repos_in_registry())
 
     # Check expectations
-    calls = []
-    for idx, item in enumerate(generator):
-        expected_item = "Loading image data from: " + test_repos[idx]
-        assert expected_item == item
+    expected_items = ["Loading image data from: " + test_repo for test_repo in test_repos]
+    assert sorted(expected_items) == sorted(actual_items)
+    assert test_docker_hub._repos == [test_repo + ":latest" for test_repo in test_repos]
 
-        calls.append(call(test_repos[idx]))
+    mock__search.assert_called_once()
+    mock_container_engine.assert_not_called()
+    mock__list_tags.assert_has_calls([call(test_repo) for test_repo in test_repos], 
+                                     any_order=True)
+
+@patch("dem.core.registry.requests.Session.get")
+def test_DockerHub__search(mock_requests_get: MagicMock):
+    # Test setup
+    test_registry_config = {
+        "name": "axemsolutions",
+        "url": "https://registry.hub.docker.com",
+    }
+    mock_first_response = MagicMock()
+    mock_first_response.status_code = requests.codes.ok
+    mock_first_response.json.return_value = {
+        "next": "test_next_page_url",
+        "results": [{"name": "cpputest"}, {"name": "make_gnu_arm"}],
+    }
+    mock_second_response = MagicMock()
+    mock_second_response.status_code = requests.codes.ok
+    mock_second_response.json.return_value = {
+        "next": None,
+        "results": [{"name": "stlink_org"}],
+    }
+    mock_requests_get.side_effect = [mock_first_response, mock_second_response]
 
-    mock_container_engine.search.assert_called_once_with(test_registry_config["name"])
-    mock__list_tags.assert_has_calls(calls)
+    test_docker_hub = registry.DockerHub(MagicMock(), test_registry_config)
 
-def test_DockerRegistry__append_repo_with_tag():
+    # Run unit under test
+    actual_repos = list(test_docker_hub._search())
+
+    # Check expectations
+    assert actual_repos == ["axemsolutions/cpputest", "axemsolutions/make_gnu_arm", 
+                            "axemsolutions/stlink_org"]
+
+    mock_requests_get.assert_has_calls([
+        call("https://registry.hub.docker.com/v2/repositories/axemsolutions/?page_size=100", 
+             timeout=1),
+        call("test_next_page_url", timeout=1),
+    ])
+
+@patch.object(registry.DockerHub, "user_output")
+@patch("dem.core.registry.requests.Session.get")
+def test_DockerHub__search_invalid_status_code(mock_requests_get: MagicMock, 
+                                               mock_user_output: MagicMock):
+    # Test setup
+    test_registry_config = {
+        "name": "axemsolutions",
+        "url": "https://registry.hub.docker.com",
+    }
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.not_found
+    mock_requests_get.return_value = mock_response
+
+    test_docker_hub = registry.DockerHub(MagicMock(), test_registry_config)
+
+    # Run unit under test
+    actual_repos = list(test_docker_hub._search())
+
+    # Check expectations
+    assert actual_repos == []
+
+    mock_user_output.error.assert_called_once_with("Error in communication with the registry. Failed to retrieve the repositories. Response status code: " + str(requests.codes.not_found))
+    mock_user_output.msg.assert_called_once_with("Skipping registry: " + test_registry_config["name"])
+
+def test_DockerRegistry__get_repo_with_tags():
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {}
@@ -221,11 +661,11 @@ def test_DockerRegistry__append_repo_with_tag():
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    test_docker_registry._append_repo_with_tag(test_endpoint_response, test_repo)
+    actual_repos = test_docker_registry._get_repo_with_tags(test_endpoint_response, test_repo)
 
     # Check expectations
     expected_repos = [test_repo + ":" + test_result for test_result in test_endpoint_response["tags"]]
-    assert expected_repos == test_docker_registry._repos
+    assert expected_repos == actual_repos
 
 def test_DockerRegistry__get_tag_endpoint_url():
     # Test setup
@@ -242,9 +682,93 @@ def test_DockerRegistry__get_tag_endpoint_url():
     actual_endpoint_url = test_docker_registry._get_tag_endpoint_url(test_repo)
 
     # Check expectations
-    expected_endpoint_url = test_registry_config["url"] + "/v2/" + test_repo.split("/")[1] + "/tags/list"
+    expected_endpoint_url = test_registry_config["url"] + "/v2/" + test_repo.split("/")[1] + "/tags/list?n=100"
     assert expected_endpoint_url == actual_endpoint_url
 
+def test_DockerRegistry__get_tag_endpoint_url_nested_repo_and_page_size():
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "test_url", 
+                                                                 "page_size": 500})
+
+    # Run unit under test
+    actual_endpoint_url = test_docker_registry._get_tag_endpoint_url("registry/team/test_repo")
+
+    # Check expectations
+    assert actual_endpoint_url == "test_url/v2/team/test_repo/tags/list?n=500"
+
+def test_DockerRegistry__get_cache_settings():
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "test_url", 
+                                                                 "page_size": 500,
+                                                                 "tag_filter": "v*"})
+
+    # Run unit under test
+    actual_cache_settings = test_docker_registry._get_cache_settings()
+
+    # Check expectations
+    assert actual_cache_settings == {"tag_filter": "v*", "max_tags_per_repo": None, 
+                                     "page_size": 500}
+
+def test_DockerRegistry__get_next_page_url():
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "http://localhost:5000"})
+    mock_response = MagicMock()
+    mock_response.url = "http://localhost:5000/v2/_catalog?n=100"
+    mock_response.links = {"next": {"url": "/v2/_catalog?last=test_repo2&n=100", "rel": "next"}}
+    mock_redirected_response = MagicMock()
+    mock_redirected_response.url = "https://mirror.example.com/v2/_catalog?n=100"
+    mock_redirected_response.links = {"next": {"url": "/v2/_catalog?last=test_repo2&n=100", 
+                                               "rel": "next"}}
+    mock_last_response = MagicMock()
+    mock_last_response.links = {}
+
+    # Run unit under test and check expectations
+    assert test_docker_registry._get_next_page_url({}, mock_response) == "http://localhost:5000/v2/_catalog?last=test_repo2&n=100"
+    assert test_docker_registry._get_next_page_url({}, mock_redirected_response) == "https://mirror.example.com/v2/_catalog?last=test_repo2&n=100"
+    assert test_docker_registry._get_next_page_url({}, mock_last_response) is None
+
+def test_DockerRegistry__get_repo_with_tags_null_tags():
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "test_url"})
+
+    # Run unit under test
+    actual_repo_with_tags = test_docker_registry._get_repo_with_tags({"tags": None}, "test_repo")
+
+    # Check expectations
+    assert actual_repo_with_tags == []
+
+@patch("dem.core.registry.requests.Session.get")
+def test_DockerRegistry__search_pagination(mock_requests_get: MagicMock):
+    # Test setup
+    test_registry_config = {
+        "name": "test_name",
+        "url": "http://localhost:5000",
+        "page_size": 2,
+    }
+    mock_first_response = MagicMock()
+    mock_first_response.status_code = requests.codes.ok
+    mock_first_response.json.return_value = {"repositories": ["test_repo1", "test_repo2"]}
+    mock_first_response.url = "http://localhost:5000/v2/_catalog?n=2"
+    mock_first_response.links = {"next": {"url": "/v2/_catalog?last=test_repo2&n=2"}}
+    mock_second_response = MagicMock()
+    mock_second_response.status_code = requests.codes.ok
+    mock_second_response.json.return_value = {"repositories": ["test_repo3"]}
+    mock_second_response.links = {}
+    mock_requests_get.side_effect = [mock_first_response, mock_second_response]
+
+    test_docker_registry = registry.DockerRegistry(MagicMock(), test_registry_config)
+
+    # Run unit under test
+    test_search = test_docker_registry._search()
+
+    # Check expectations
+    assert next(test_search) == "test_name/test_repo1"
+    # The next page is only requested when the repos of the first page have been consumed.
+    mock_requests_get.assert_called_once_with("http://localhost:5000/v2/_catalog?n=2", timeout=1)
+    assert list(test_search) == ["test_name/test_repo2", "test_name/test_repo3"]
+
+    mock_requests_get.assert_called_with("http://localhost:5000/v2/_catalog?last=test_repo2&n=2", timeout=1)
+
 @patch.object(registry.DockerRegistry, "_list_tags")
 @patch.object(registry.DockerRegistry, "_search")
 def test_DockerRegistry__list_repos_in_registry(mock__search: MagicMock, mock__list_tags: MagicMock):
@@ -258,30 +782,33 @@ def test_DockerRegistry__list_repos_in_registry(mock__search: MagicMock, mock__l
         "test_repo2",
     ]
 
-    mock__search.return_value = test_repo_names
+    mock__search.return_value = [test_registry_config["name"] + "/" + test_repo_name 
+                                 for test_repo_name in test_repo_names]
+    mock__list_tags.side_effect = lambda repo: [repo + ":latest"]
 
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    generator = test_docker_registry._list_repos_in_registry()
+    actual_items = list(test_docker_registry._list_repos_in_registry())
 
     # Check expectations
-    calls = []
-    for idx, item in enumerate(generator):
-        expected_repo = test_registry_config["name"] + "/" + test_repo_names[idx]
-        expected_item = "Loading image data from: " + expected_repo
-        assert expected_item == item
-
-        calls.append(call(expected_repo))
+    expected_repos = [test_registry_config["name"] + "/" + test_repo_name 
+                      for test_repo_name in test_repo_names]
+    expected_items = ["Loading image data from: " + expected_repo for expected_repo in expected_repos]
+    assert sorted(expected_items) == sorted(actual_items)
+    assert test_docker_registry._repos == [expected_repo + ":latest" 
+                                           for expected_repo in expected_repos]
 
     mock__search.assert_called_once()
-    mock__list_tags.assert_has_calls(calls)
+    mock__list_tags.assert_has_calls([call(expected_repo) for expected_repo in expected_repos],
+                                     any_order=True)
 
-@patch("dem.core.registry.requests.get")
+@patch("dem.core.registry.requests.Session.get")
 def test_DockerRegistry__search(mock_requests_get: MagicMock):
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {
+        "name": "test_name",
         "url": "test_url"
     }
     test_response = {
@@ -294,21 +821,22 @@ def test_DockerRegistry__search(mock_requests_get: MagicMock):
     mock_response = MagicMock()
     mock_response.status_code = registry.requests.codes.ok
     mock_response.json.return_value = test_response
+    mock_response.links = {}
     mock_requests_get.return_value = mock_response
 
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
-    assert actual_repo_names is test_response["repositories"]
+    assert actual_repo_names == ["test_name/" + test_repo for test_repo in test_response["repositories"]]
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", timeout=1)
+    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog?n=100", timeout=1)
     mock_response.json.assert_called_once()
 
 @patch.object(registry.DockerRegistry, "user_output")
-@patch("dem.core.registry.requests.get")
+@patch("dem.core.registry.requests.Session.get")
 def test_DockerRegistry__search_requests_get_exception(mock_requests_get: MagicMock, mock_user_output: MagicMock):
     # Test setup
     mock_container_engine = MagicMock()
@@ -322,17 +850,17 @@ def test_DockerRegistry__search_requests_get_exception(mock_requests_get: MagicM
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
     assert actual_repo_names == []
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", timeout=1)
+    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog?n=100", timeout=1)
     mock_user_output.error(str(mock_requests_get.side_effect))
     mock_user_output.msg("Skipping registry: " + test_registry_config["name"])
 
 @patch.object(registry.DockerRegistry, "user_output")
-@patch("dem.core.registry.requests.get")
+@patch("dem.core.registry.requests.Session.get")
 def test_DockerRegistry__search_invalid_status_code(mock_requests_get: MagicMock, mock_user_output: MagicMock):
     # Test setup
     mock_container_engine = MagicMock()
@@ -348,17 +876,17 @@ def test_DockerRegistry__search_invalid_status_code(mock_requests_get: MagicMock
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
     assert actual_repo_names == []
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", timeout=1)
+    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog?n=100", timeout=1)
     mock_user_output.error("Error in communication with the registry. Failed to retrieve the repositories. Response status code: " + str(mock_response.status_code))
     mock_user_output.msg("Skipping registry: " + test_registry_config["name"])
 
 @patch.object(registry.DockerRegistry, "user_output")
-@patch("dem.core.registry.requests.get")
+@patch("dem.core.registry.requests.Session.get")
 def test_DockerRegistry__search_json_decode_exception(mock_requests_get: MagicMock, 
                                                       mock_user_output: MagicMock):
     # Test setup
@@ -376,18 +904,18 @@ def test_DockerRegistry__search_json_decode_exception(mock_requests_get: MagicMo
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
     assert actual_repo_names == []
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", timeout=1)
+    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog?n=100", timeout=1)
     mock_response.json.assert_called_once()
     mock_user_output.error("Invalid JSON format in response. " + str(mock_response.json.side_effect))
     mock_user_output.msg("Skipping registry: " + test_registry_config["name"])
 
 @patch.object(registry.DockerRegistry, "user_output")
-@patch("dem.core.registry.requests.get")
+@patch("dem.core.registry.requests.Session.get")
 def test_DockerRegistry__search_json_generic_exception(mock_requests_get: MagicMock, 
                                                        mock_user_output: MagicMock):
     # Test setup
@@ -405,16 +933,273 @@ def test_DockerRegistry__search_json_generic_exception(mock_requests_get: MagicM
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
     
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
     assert actual_repo_names == []
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", timeout=1)
+    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog?n=100", timeout=1)
     mock_response.json.assert_called_once()
     mock_user_output.error(str(mock_response.json.side_effect))
     mock_user_output.msg("Skipping registry: " + test_registry_config["name"])
 
+@patch.object(registry.Registry, "_get_tool_image_endpoint_url")
+@patch.object(registry.requests.Session, "request")
+def test_Registry__is_tool_image_available(mock_requests_request: MagicMock, 
+                                           mock__get_tool_image_endpoint_url: MagicMock):
+    # Test setup
+    test_endpoint_url = "test_endpoint_url"
+    mock__get_tool_image_endpoint_url.return_value = test_endpoint_url
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_requests_request.return_value = mock_response
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_result = test_registry._is_tool_image_available("localhost:5000/test_repo:v1.0.0")
+
+    # Check expectations
+    assert actual_result is True
+
+    mock__get_tool_image_endpoint_url.assert_called_once_with("localhost:5000/test_repo", "v1.0.0")
+    mock_requests_request.assert_called_once_with("GET", test_endpoint_url, headers={}, timeout=1)
+
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_get_tool_image_endpoint_url")
+@patch.object(registry.requests.Session, "request")
+def test_Registry__is_tool_image_available_not_found(mock_requests_request: MagicMock, 
+                                                     mock__get_tool_image_endpoint_url: MagicMock,
+                                                     mock_user_output: MagicMock):
+    # Test setup
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.not_found
+    mock_requests_request.return_value = mock_response
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_result = test_registry._is_tool_image_available("test_repo:latest")
+
+    # Check expectations
+    assert actual_result is False
+
+    mock_user_output.error.assert_not_called()
+
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_get_tool_image_endpoint_url")
+@patch.object(registry.requests.Session, "request")
+def test_Registry__is_tool_image_available_invalid_status(mock_requests_request: MagicMock, 
+                                                          mock__get_tool_image_endpoint_url: MagicMock,
+                                                          mock_user_output: MagicMock):
+    # Test setup
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.unauthorized
+    mock_requests_request.return_value = mock_response
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_result = test_registry._is_tool_image_available("test_repo:latest")
+
+    # Check expectations
+    assert actual_result is False
+
+    mock_user_output.error.assert_called_once_with("Error in communication with the registry. Failed to check test_repo:latest. Response status code: " + str(requests.codes.unauthorized))
+
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_get_tool_image_endpoint_url")
+@patch.object(registry.requests.Session, "request")
+def test_Registry__is_tool_image_available_exception(mock_requests_request: MagicMock, 
+                                                     mock__get_tool_image_endpoint_url: MagicMock,
+                                                     mock_user_output: MagicMock):
+    # Test setup
+    test_exception_text = "test_exception_text"
+    mock_requests_request.side_effect = Exception(test_exception_text)
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_result = test_registry._is_tool_image_available("test_repo:latest")
+
+    # Check expectations
+    assert actual_result is False
+
+    mock_user_output.error.assert_called_once_with(test_exception_text)
+
+@patch.object(registry.Registry, "_is_tool_image_available")
+def test_Registry_resolve_tool_images(mock__is_tool_image_available: MagicMock):
+    # Test setup
+    test_tool_images = ["test_repo1:latest", "test_repo2:latest", "test_repo1:latest"]
+    mock__is_tool_image_available.side_effect = lambda tool_image: tool_image == "test_repo1:latest"
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_tool_images = test_registry.resolve_tool_images(test_tool_images)
+
+    # Check expectations
+    assert actual_tool_images == {"test_repo1:latest"}
+
+    assert mock__is_tool_image_available.call_count == 2
+
+@patch.object(registry.Registry, "_is_tool_image_available")
+def test_Registry_resolve_tool_images_from_cache(mock__is_tool_image_available: MagicMock):
+    # Test setup
+    test_registry_config = {
+        "name": "test_registry_name",
+        "url": "test_url",
+    }
+    mock_cache_file = MagicMock()
+    mock_cache_file.deserialized = {
+        test_registry_config["name"]: {
+            "url": test_registry_config["url"],
+            "settings": {"tag_filter": None, "max_tags_per_repo": None},
+            "timestamp": time.time(),
+            "repos": {
+                "test_repo1": {"tags": ["test_repo1:latest", "test_repo1:v1.0.0"]},
+            }
+        }
+    }
+    mock__is_tool_image_available.return_value = True
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config, mock_cache_file)
+
+    # Run unit under test
+    actual_tool_images = test_registry.resolve_tool_images(["test_repo1:latest", 
+                                                            "test_repo1:v2.0.0", 
+                                                            "test_repo2:latest"])
+
+    # Check expectations
+    assert actual_tool_images == {"test_repo1:latest", "test_repo2:latest"}
+
+    mock__is_tool_image_available.assert_called_once_with("test_repo2:latest")
+
+@patch.object(registry.Registry, "_get_digest_from_response")
+@patch.object(registry.Registry, "_request_tool_image")
+def test_Registry_get_manifest_digests(mock__request_tool_image: MagicMock, 
+                                       mock__get_digest_from_response: MagicMock):
+    # Test setup
+    mock_response = MagicMock()
+    mock__request_tool_image.side_effect = lambda tool_image: mock_response if tool_image == "test_repo1:latest" else None
+    mock__get_digest_from_response.return_value = "sha256:1"
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_check_times = {}
+    actual_digests = test_registry.get_manifest_digests(["test_repo1:latest", "test_repo2:latest"],
+                                                        actual_check_times)
+
+    # Check expectations
+    assert actual_digests == {"test_repo1:latest": "sha256:1"}
+    assert set(actual_check_times) == {"test_repo1:latest", "test_repo2:latest"}
+
+    mock__get_digest_from_response.assert_called_once_with(mock_response)
+
+def test_DockerHub__get_digest_from_response():
+    # Test setup
+    test_docker_hub = registry.DockerHub(MagicMock(), {"name": "axemsolutions", 
+                                                       "url": "https://registry.hub.docker.com"})
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"name": "latest", "digest": "sha256:1"}
+
+    # Run unit under test and check expectations
+    assert test_docker_hub._get_digest_from_response(mock_response) == "sha256:1"
+
+def test_DockerRegistry__get_digest_from_response():
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"name": "localhost:5000", 
+                                                                 "url": "http://localhost:5000"})
+    mock_response = MagicMock()
+    mock_response.headers = {"Docker-Content-Digest": "sha256:1"}
+
+    # Run unit under test and check expectations
+    assert test_docker_registry._get_digest_from_response(mock_response) == "sha256:1"
+
+@patch.object(registry.Registries, "user_output")
+@patch.object(registry.Registries, "__init__")
+def test_Registries_get_manifest_digests(mock___init__: MagicMock, mock_user_output: MagicMock):
+    # Test setup
+    mock___init__.return_value = None
+
+    mock_registry1 = MagicMock()
+    mock_registry1._registry_config = {"name": "axemsolutions"}
+    mock_registry1.get_manifest_digests.return_value = {"axemsolutions/cpputest:latest": "sha256:1"}
+    mock_registry2 = MagicMock()
+    mock_registry2._registry_config = {"name": "localhost:5000"}
+
+    test_registries = registry.Registries(MagicMock(), MagicMock())
+    test_registries.registries = [mock_registry1, mock_registry2]
+
+    # Run unit under test
+    actual_digests = test_registries.get_manifest_digests(["axemsolutions/cpputest:latest", 
+                                                          "alpine:latest"])
+
+    # Check expectations
+    assert actual_digests == {"axemsolutions/cpputest:latest": "sha256:1"}
+
+    mock_registry1.get_manifest_digests.assert_called_once_with(["axemsolutions/cpputest:latest"], 
+                                                                None)
+    mock_registry2.get_manifest_digests.assert_not_called()
+
+def test_DockerHub__get_tool_image_endpoint_url():
+    # Test setup
+    test_docker_hub = registry.DockerHub(MagicMock(), {"name": "axemsolutions", 
+                                                       "url": "https://registry.hub.docker.com"})
+
+    # Run unit under test
+    actual_url = test_docker_hub._get_tool_image_endpoint_url("axemsolutions/cpputest", "latest")
+
+    # Check expectations
+    assert actual_url == "https://registry.hub.docker.com/v2/repositories/axemsolutions/cpputest/tags/latest"
+
+def test_DockerRegistry__get_tool_image_endpoint_url():
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"name": "localhost:5000", 
+                                                                 "url": "http://localhost:5000"})
+
+    # Run unit under test
+    actual_url = test_docker_registry._get_tool_image_endpoint_url("localhost:5000/team/cpputest", 
+                                                                   "v1.0.0")
+
+    # Check expectations
+    assert actual_url == "http://localhost:5000/v2/team/cpputest/manifests/v1.0.0"
+    assert test_docker_registry._tool_image_request_method == "HEAD"
+
+@patch.object(registry.Registries, "user_output")
+@patch.object(registry.Registries, "__init__")
+def test_Registries_resolve_tool_images(mock___init__: MagicMock, mock_user_output: MagicMock):
+    # Test setup
+    mock___init__.return_value = None
+
+    mock_registry1 = MagicMock()
+    mock_registry1._registry_config = {"name": "axemsolutions"}
+    mock_registry1.resolve_tool_images.return_value = {"axemsolutions/cpputest:latest"}
+    mock_registry2 = MagicMock()
+    mock_registry2._registry_config = {"name": "localhost:5000"}
+    mock_registry2.resolve_tool_images.side_effect = Exception("test_exception_text")
+    mock_registry3 = MagicMock()
+    mock_registry3._registry_config = {"name": "unused"}
+
+    test_registries = registry.Registries(MagicMock(), MagicMock())
+    test_registries.registries = [mock_registry1, mock_registry2, mock_registry3]
+
+    # Run unit under test
+    actual_tool_images = test_registries.resolve_tool_images(["axemsolutions/cpputest:latest", 
+                                                             "localhost:5000/jlink:latest"])
+
+    # Check expectations
+    assert actual_tool_images == {"axemsolutions/cpputest:latest"}
+
+    mock_registry1.resolve_tool_images.assert_called_once_with(["axemsolutions/cpputest:latest"])
+    mock_registry2.resolve_tool_images.assert_called_once_with(["localhost:5000/jlink:latest"])
+    mock_registry3.resolve_tool_images.assert_not_called()
+    mock_user_output.error.assert_has_calls([
+        call("test_exception_text"),
+        call("[red]Error: The localhost:5000 registry is not available.[/]")
+    ])
+
 @patch("dem.core.registry.DockerRegistry")
 @patch("dem.core.registry.DockerHub")
 def test_Registries(mock_DockerHub: MagicMock, mock_DockerRegistry: MagicMock):
@@ -447,8 +1232,10 @@ def test_Registries(mock_DockerHub: MagicMock, mock_DockerRegistry: MagicMock):
     assert mock_docker_hub in test_registries.registries
     assert mock_docker_registry in test_registries.registries
 
-    mock_DockerHub.assert_called_once_with(mock_container_engine, mock_config_file.registries[0])
-    mock_DockerRegistry.assert_called_once_with(mock_container_engine, mock_config_file.registries[1])
+    mock_DockerHub.assert_called_once_with(mock_container_engine, mock_config_file.registries[0], 
+                                           None)
+    mock_DockerRegistry.assert_called_once_with(mock_container_engine, 
+                                                mock_config_file.registries[1], None)
 
 @patch("dem.core.registry.DockerRegistry")
 @patch("dem.core.registry.DockerHub")
@@ -489,6 +1276,30 @@ def test_Registries_list_repos(mock_DockerHub: MagicMock, mock_DockerRegistry: M
     expected_repos = [*test_repos * 2]
     assert expected_repos == actual_repos
 
+@patch("dem.core.registry.DockerHub")
+def test_Registries_list_repos_flush_cache(mock_DockerHub: MagicMock):
+    # Test setup
+    mock_config_file = MagicMock()
+    mock_config_file.registries = [
+        {
+            "name": "registry_config1",
+            "url": "registry.hub.docker.com"
+        }
+    ]
+    mock_cache_file = MagicMock()
+    mock_DockerHub._docker_hub_domain = "registry.hub.docker.com"
+    mock_DockerHub.return_value.repos = ["test_repo1"]
+
+    test_registries = registry.Registries(MagicMock(), mock_config_file, mock_cache_file)
+
+    # Run unit under test
+    actual_repos = test_registries.list_repos()
+
+    # Check expectations
+    assert actual_repos == ["test_repo1"]
+
+    mock_cache_file.flush.assert_called_once()
+
 @patch.object(registry.Registries, "user_output")
 @patch.object(registry.Registries, "__init__")
 def test_Registries_list_repos_handle_exception(mock___init__: MagicMock, 
@@ -510,6 +1321,7 @@ def test_Registries_list_repos_handle_exception(mock___init__: MagicMock,
 
     test_registries = registry.Registries(MagicMock(), MagicMock())
     test_registries.registries = [StubRegistry()]
+    test_registries._cache_file = None
 
     # Run unit under test
     test_registries.list_repos()
@@ -581,4 +1393,226 @@ def test_delete_registry():
     assert not mock_config_file.registries
     assert not test_registries.registries
 
-    mock_config_file.flush.assert_called_once()
\ No newline at end of file
+    mock_config_file.flush.assert_called_once()
+
+@patch("dem.core.registry.requests.Session.get")
+def test_Registry__distribution_get_bearer_token(mock_requests_get: MagicMock):
+    # Test setup
+    mock_unauthorized_response = MagicMock()
+    mock_unauthorized_response.status_code = requests.codes.unauthorized
+    mock_unauthorized_response.headers = {
+        "WWW-Authenticate": 'Bearer realm="https://auth.docker.io/token",service="registry.docker.io",scope="repository:axemsolutions/cpputest:pull"'
+    }
+    mock_token_response = MagicMock()
+    mock_token_response.json.return_value = {"token": "test_token"}
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_response.headers = {}
+    mock_requests_get.side_effect = [mock_unauthorized_response, mock_token_response, 
+                                     mock_response, mock_response]
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_responses = [test_registry._distribution_get("test_url1", "axemsolutions/cpputest"),
+                        test_registry._distribution_get("test_url2", "axemsolutions/cpputest")]
+
+    # Check expectations
+    assert actual_responses == [mock_response, mock_response]
+
+    mock_requests_get.assert_has_calls([
+        call("test_url1", headers={}, timeout=10),
+        call("https://auth.docker.io/token", 
+             params={"service": "registry.docker.io", 
+                     "scope": "repository:axemsolutions/cpputest:pull"}, timeout=10),
+        call("test_url1", headers={"Authorization": "Bearer test_token"}, timeout=10),
+        call("test_url2", headers={"Authorization": "Bearer test_token"}, timeout=10),
+    ])
+
+@patch("dem.core.registry.requests.Session.get")
+def test_Registry__get_bearer_token_concurrent(mock_requests_get: MagicMock):
+    # Test setup
+    test_challenge = 'Bearer realm="https://auth.docker.io/token",service="registry.docker.io",scope="repository:axemsolutions/cpputest:pull"'
+    token_requested = threading.Event()
+    release_token = threading.Event()
+    def stub_get(url: str, **kwargs):
+        token_requested.set()
+        release_token.wait(5)
+        mock_token_response = MagicMock()
+        mock_token_response.json.return_value = {"token": "test_token"}
+        return mock_token_response
+    mock_requests_get.side_effect = stub_get
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first_token = executor.submit(test_registry._get_bearer_token, test_challenge)
+        token_requested.wait(5)
+        second_token = executor.submit(test_registry._get_bearer_token, test_challenge)
+        release_token.set()
+        actual_tokens = [first_token.result(), second_token.result()]
+
+    # Check expectations
+    assert actual_tokens == ["test_token", "test_token"]
+    mock_requests_get.assert_called_once()
+
+@patch("dem.core.registry.requests.Session.get")
+def test_Registry__get_bearer_token_rejected(mock_requests_get: MagicMock):
+    # Test setup
+    test_challenge = 'Bearer realm="https://auth.docker.io/token",scope="repository:test_repo:pull"'
+    mock_token_response = MagicMock()
+    mock_token_response.json.return_value = {"access_token": "test_new_token"}
+    mock_requests_get.return_value = mock_token_response
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+    test_registry._scope_bearer_tokens["repository:test_repo:pull"] = "test_expired_token"
+
+    # Run unit under test
+    actual_token = test_registry._get_bearer_token(test_challenge, "test_expired_token")
+
+    # Check expectations
+    assert actual_token == "test_new_token"
+    mock_requests_get.assert_called_once_with("https://auth.docker.io/token", 
+                                              params={"scope": "repository:test_repo:pull"}, 
+                                              timeout=10)
+
+@patch.object(registry.Registry, "_distribution_get")
+@patch.object(registry.Registry, "_get_distribution_repo")
+@patch.object(registry.Registry, "_get_distribution_url")
+@patch("dem.core.registry.platform.machine")
+def test_Registry__get_image_layers_manifest_list(mock_machine: MagicMock, 
+                                                  mock__get_distribution_url: MagicMock,
+                                                  mock__get_distribution_repo: MagicMock,
+                                                  mock__distribution_get: MagicMock):
+    # Test setup
+    mock_machine.return_value = "aarch64"
+    mock__get_distribution_url.return_value = "https://test_url"
+    mock__get_distribution_repo.return_value = "test_repo"
+
+    mock_manifest_list_response = MagicMock()
+    mock_manifest_list_response.json.return_value = {
+        "mediaType": "application/vnd.oci.image.index.v1+json",
+        "manifests": [
+            {"digest": "sha256:amd64", "platform": {"os": "linux", "architecture": "amd64"}},
+            {"digest": "sha256:arm64", "platform": {"os": "linux", "architecture": "arm64"}},
+        ]
+    }
+    mock_manifest_response = MagicMock()
+    mock_manifest_response.json.return_value = {
+        "mediaType": "application/vnd.oci.image.manifest.v1+json",
+        "config": {"digest": "sha256:config"},
+        "layers": [
+            {"digest": "sha256:layer1", "size": 100},
+            {"digest": "sha256:layer2", "size": 200},
+        ]
+    }
+    mock_config_response = MagicMock()
+    mock_config_response.json.return_value = {
+        "rootfs": {"type": "layers", "diff_ids": ["sha256:diff1", "sha256:diff2"]}
+    }
+    mock__distribution_get.side_effect = [mock_manifest_list_response, mock_manifest_response, 
+                                          mock_config_response]
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_layers = test_registry._get_image_layers("test_name/test_repo:latest")
+
+    # Check expectations
+    assert actual_layers == [
+        {"digest": "sha256:layer1", "size": 100, "diff_id": "sha256:diff1"},
+        {"digest": "sha256:layer2", "size": 200, "diff_id": "sha256:diff2"},
+    ]
+
+    mock__get_distribution_repo.assert_called_once_with("test_name/test_repo")
+    expected_headers = {"Accept": ", ".join(registry.Registry._manifest_media_types)}
+    mock__distribution_get.assert_has_calls([
+        call("https://test_url/v2/test_repo/manifests/latest", "test_repo", expected_headers),
+        call("https://test_url/v2/test_repo/manifests/sha256:arm64", "test_repo", expected_headers),
+        call("https://test_url/v2/test_repo/blobs/sha256:config", "test_repo"),
+    ])
+
+@patch.object(registry.Registry, "user_output")
+@patch.object(registry.Registry, "_distribution_get")
+def test_Registry__get_image_layers_exception(mock__distribution_get: MagicMock, 
+                                              mock_user_output: MagicMock):
+    # Test setup
+    mock__distribution_get.side_effect = requests.HTTPError("test_error")
+
+    test_registry = registry.DockerRegistry(MagicMock(), {"name": "localhost:5000", 
+                                                          "url": "http://localhost:5000"})
+
+    # Run unit under test
+    actual_layers = test_registry._get_image_layers("localhost:5000/test_repo:latest")
+
+    # Check expectations
+    assert actual_layers is None
+
+    mock__distribution_get.assert_called_once_with(
+        "http://localhost:5000/v2/test_repo/manifests/latest", "test_repo", 
+        {"Accept": ", ".join(registry.Registry._manifest_media_types)})
+    mock_user_output.error.assert_called_once_with("Failed to get the layers of localhost:5000/test_repo:latest: test_error")
+
+@patch.object(registry.Registry, "_get_image_layers")
+def test_Registry_get_image_layers(mock__get_image_layers: MagicMock):
+    # Test setup
+    test_layers = [{"digest": "sha256:layer1", "size": 100, "diff_id": "sha256:diff1"}]
+    mock__get_image_layers.side_effect = lambda tool_image: test_layers if tool_image == "test_repo1:latest" else None
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_name", "url": "test_url"})
+
+    # Run unit under test
+    actual_image_layers = test_registry.get_image_layers(["test_repo1:latest", "test_repo2:latest"])
+
+    # Check expectations
+    assert actual_image_layers == {"test_repo1:latest": test_layers}
+
+def test_DockerHub__get_distribution_url_and_repo():
+    # Test setup
+    test_docker_hub = registry.DockerHub(MagicMock(), {"name": "axemsolutions", 
+                                                       "url": "https://registry.hub.docker.com"})
+
+    # Run unit under test and check expectations
+    assert test_docker_hub._get_distribution_url() == "https://registry-1.docker.io"
+    assert test_docker_hub._get_distribution_repo("axemsolutions/cpputest") == "axemsolutions/cpputest"
+
+def test_DockerRegistry__get_distribution_url_and_repo():
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"name": "localhost:5000", 
+                                                                 "url": "http://localhost:5000"})
+
+    # Run unit under test and check expectations
+    assert test_docker_registry._get_distribution_url() == "http://localhost:5000"
+    assert test_docker_registry._get_distribution_repo("localhost:5000/nested/repo") == "nested/repo"
+
+@patch.object(registry.Registries, "user_output")
+@patch.object(registry.Registries, "__init__")
+def test_Registries_get_image_layers(mock___init__: MagicMock, mock_user_output: MagicMock):
+    # Test setup
+    mock___init__.return_value = None
+
+    test_layers = [{"digest": "sha256:layer1", "size": 100, "diff_id": "sha256:diff1"}]
+    mock_registry1 = MagicMock()
+    mock_registry1._registry_config = {"name": "axemsolutions"}
+    mock_registry1.get_image_layers.return_value = {"axemsolutions/cpputest:latest": test_layers}
+    mock_registry2 = MagicMock()
+    mock_registry2._registry_config = {"name": "localhost:5000"}
+    mock_registry2.get_image_layers.side_effect = Exception("test_exception")
+
+    test_registries = registry.Registries(MagicMock(), MagicMock())
+    test_registries.registries = [mock_registry1, mock_registry2]
+
+    # Run unit under test
+    actual_image_layers = test_registries.get_image_layers(["axemsolutions/cpputest:latest", 
+                                                            "localhost:5000/test:latest"])
+
+    # Check expectations
+    assert actual_image_layers == {"axemsolutions/cpputest:latest": test_layers}
+
+    mock_registry1.get_image_layers.assert_called_once_with(["axemsolutions/cpputest:latest"])
+    mock_registry2.get_image_layers.assert_called_once_with(["localhost:5000/test:latest"])
+    mock_user_output.error.assert_has_calls([
+        call("test_exception"),
+        call("[red]Error: The localhost:5000 registry is not available.[/]"),
+    ])
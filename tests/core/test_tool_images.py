@@ -52,6 +52,42 @@ def test_RegistryToolImages_RegistryError():
         test_registries.list_repos.assert_called_once()
         assert not registry_tool_images.elements
 
+def test_RegistryToolImages_targeted_update():
+    # Test setup
+    test_registries = MagicMock()
+    test_registries.list_repos.return_value = [
+        "axemsolutions/make_gnu_arm:latest",
+        "axemsolutions/cpputest:latest",
+        "axemsolutions/stlink_org:latest",
+    ]
+    test_registries.resolve_tool_images.return_value = {
+        "axemsolutions/stlink_org:latest",
+        "axemsolutions/jlink:latest",
+    }
+    test_tool_images = [
+        "axemsolutions/cpputest:latest",
+        "axemsolutions/stlink_org:latest",
+        "axemsolutions/jlink:latest",
+    ]
+
+    registry_tool_images = tool_images.RegistryToolImages(test_registries)
+    registry_tool_images.update()
+
+    # Run unit under test
+    registry_tool_images.update(test_tool_images)
+
+    # Check expectations
+    assert registry_tool_images.elements == [
+        "axemsolutions/make_gnu_arm:latest",
+        "axemsolutions/stlink_org:latest",
+        "axemsolutions/jlink:latest",
+    ]
+    assert "axemsolutions/cpputest:latest" not in registry_tool_images
+    assert "axemsolutions/jlink:latest" in registry_tool_images
+
+    test_registries.list_repos.assert_called_once()
+    test_registries.resolve_tool_images.assert_called_once_with(test_tool_images)
+
 @patch("dem.core.tool_images.RegistryToolImages")
 @patch("dem.core.tool_images.LocalToolImages")
 def test_ToolImages(mock_LocalToolImages: MagicMock, mock_RegistryToolImages: MagicMock):
@@ -74,4 +110,85 @@ def test_ToolImages(mock_LocalToolImages: MagicMock, mock_RegistryToolImages: Ma
     mock_registry_tool_images.update.assert_called_once()
 
     assert tool_images_obj.local is mock_local_tool_images
-    assert tool_images_obj.registry is mock_registry_tool_images
\ No newline at end of file
+    assert tool_images_obj.registry is mock_registry_tool_images
+def test_split_tool_image():
+    # Test setup
+    test_tool_images = {
+        "axemsolutions/make_gnu_arm:latest": ("axemsolutions/make_gnu_arm", "latest"),
+        "192.168.1.1:5000/make_gnu_arm:v1.0.0": ("192.168.1.1:5000/make_gnu_arm", "v1.0.0"),
+        "192.168.1.1:5000/make_gnu_arm": ("192.168.1.1:5000/make_gnu_arm", ""),
+        "ubuntu": ("ubuntu", ""),
+    }
+
+    for test_tool_image, expected_result in test_tool_images.items():
+        # Run unit under test
+        actual_result = tool_images.split_tool_image(test_tool_image)
+
+        # Check expectations
+        assert expected_result == actual_result
+
+def test_BaseToolImages_index():
+    # Test setup
+    test_elements = [
+        "axemsolutions/make_gnu_arm:latest",
+        "axemsolutions/make_gnu_arm:v1.0.0",
+        "axemsolutions/cpputest:latest",
+    ]
+
+    base_tool_images = tool_images.BaseToolImages()
+
+    # Run unit under test
+    base_tool_images.elements = test_elements
+
+    # Check expectations
+    assert base_tool_images.elements is test_elements
+    for test_element in test_elements:
+        assert test_element in base_tool_images
+    assert "axemsolutions/cpputest:v1.0.0" not in base_tool_images
+    assert base_tool_images.get_tags("axemsolutions/make_gnu_arm") == ["latest", "v1.0.0"]
+    assert base_tool_images.get_tags("axemsolutions/not_existing") == []
+
+def test_ToolImages_get_tool_image_status():
+    # Test setup
+    tool_images_obj = tool_images.ToolImages(MagicMock(), MagicMock(), False)
+    tool_images_obj.local.elements = ["local_image:latest", "local_and_registry_image:latest"]
+    tool_images_obj.registry.elements = ["registry_image:latest", "local_and_registry_image:latest"]
+
+    test_tool_images = {
+        "local_image:latest": tool_images.ToolImages.LOCAL_ONLY,
+        "registry_image:latest": tool_images.ToolImages.REGISTRY_ONLY,
+        "local_and_registry_image:latest": tool_images.ToolImages.LOCAL_AND_REGISTRY,
+        "not_available_image:latest": tool_images.ToolImages.NOT_AVAILABLE,
+    }
+
+    for test_tool_image, expected_status in test_tool_images.items():
+        # Run unit under test
+        actual_status = tool_images_obj.get_tool_image_status(test_tool_image)
+
+        # Check expectations
+        assert expected_status == actual_status
+
+    # Run unit under test
+    actual_status = tool_images_obj.get_tool_image_status("local_and_registry_image:latest", 
+                                                          local_only=True)
+
+    # Check expectations
+    assert tool_images.ToolImages.LOCAL_ONLY == actual_status
+
+def test_ToolImages_get_tool_image_statuses():
+    # Test setup
+    tool_images_obj = tool_images.ToolImages(MagicMock(), MagicMock(), False)
+    tool_images_obj.local.elements = ["local_image:latest", "local_and_registry_image:latest"]
+    tool_images_obj.registry.elements = ["local_and_registry_image:latest", "registry_image:latest"]
+
+    # Run unit under test
+    actual_statuses = tool_images_obj.get_tool_image_statuses()
+
+    # Check expectations
+    expected_statuses = {
+        "local_and_registry_image:latest": tool_images.ToolImages.LOCAL_AND_REGISTRY,
+        "registry_image:latest": tool_images.ToolImages.REGISTRY_ONLY,
+        "local_image:latest": tool_images.ToolImages.LOCAL_ONLY,
+    }
+    assert expected_statuses == actual_statuses
+    assert list(expected_statuses) == list(actual_statuses)
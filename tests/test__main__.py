@@ -243,4 +243,21 @@ def test_cli_ContainerEngineError(mock_Platform: MagicMock, mock_cli_main: Magic
     mock_TUIUserOutput.assert_called_once()
     mock_Core.set_user_output.assert_called_once_with(mock_tui_user_output)
     mock_cli_main.typer_cli.assert_called_once_with(prog_name=__command__)
-    mock_stderr_print.assert_called_once_with("[red]Container engine error: " + test_exception_text + "[/]")
\ No newline at end of file
+    mock_stderr_print.assert_called_once_with("[red]Container engine error: " + test_exception_text + "[/]")
+
+
+@patch.dict("dem.__main__.os.environ", {"_DEM_COMPLETE": "bash_complete"})
+@patch("dem.__main__.TUIUserOutput")
+@patch("dem.__main__.Core")
+@patch("dem.__main__.dem.cli.main")
+@patch("dem.__main__.Platform")
+def test_cli_completion_mode(mock_Platform: MagicMock, mock_cli_main: MagicMock, mock_Core: MagicMock, 
+                             mock_TUIUserOutput: MagicMock) -> None:
+    # Run unit under test
+    __main__.main()
+
+    # Check expectations
+    mock_Platform.assert_not_called()
+    mock_TUIUserOutput.assert_not_called()
+    mock_Core.set_user_output.assert_not_called()
+    mock_cli_main.typer_cli.assert_called_once_with(prog_name=__command__)
@@ -0,0 +1,43 @@
+"""Startup benchmark of the CLI app."""
+# tests/test_import_time.py
+
+import pathlib, subprocess, sys
+
+# The cold-start import time budget of the dem.__main__ module in microseconds: about 1.5 times the
+# measured import time (about 240 ms, down from about 390 ms before the heavy imports got deferred),
+# so a regression towards the old startup time fails the test.
+import_time_budget_us = 360000
+
+# These must only be imported when a command actually needs them.
+deferred_modules = ["docker", "requests", "readchar", "dem.cli.command"]
+
+def get_import_times() -> dict[str, int]:
+    """ Import the CLI app in a fresh interpreter and return the cumulative import time of each
+        module in microseconds.
+    """
+    completed_process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import dem.__main__"],
+                                       cwd=pathlib.Path(__file__).parents[1], capture_output=True,
+                                       text=True, check=True)
+    import_times = {}
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+def test_deferred_modules_not_imported_at_startup() -> None:
+    # Run unit under test
+    import_times = get_import_times()
+
+    # Check expectations
+    for deferred_module in deferred_modules:
+        assert deferred_module not in import_times
+
+def test_import_time_within_budget() -> None:
+    # Run unit under test
+    best_import_time = min(get_import_times()["dem.__main__"] for _ in range(3))
+
+    # Check expectations
+    assert best_import_time < import_time_budget_us, \
+        f"dem.__main__ took {best_import_time} us to import, the budget is {import_time_budget_us} us"